@@ -0,0 +1,364 @@
+"""Headless frame-time benchmark for Super Blob
+
+Runs the game with SDL's dummy video driver and times uncapped frames, then
+steps the same scenario on a headless Simulation without drawing.
+Usage: python superblob_bench.py [frames]
+       python superblob_bench.py [frames] --scenarios [NAME ...] [--json PATH] [--draw-stats] [--profile PATH]
+
+--scenarios runs scripted, seeded scenarios (all of them unless names are given)
+and reports frames/sec and per-frame percentiles of each as JSON, so builds can
+be compared on the same machine. --draw-stats runs every scenario a second time
+with the draw-call counters on and adds their numbers to the report. --profile PATH
+samples the scenario frames with the sampling profiler and writes collapsed stacks.
+       python superblob_bench.py --leaks LEVELS [--leak-window N] [--leak-interval N] [--json PATH]
+
+--leaks plays through LEVELS levels headless with the tracemalloc leak detector on
+and reports the lines that kept growing across level transitions.
+"""
+import os
+import sys
+import time
+import json
+import random
+import argparse
+import platform
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+os.environ.setdefault("SUPERBLOB_SEED", "1")  # Menus and levels repeat exactly from run to run
+os.environ.setdefault("SUPERBLOB_DRAW_STATS", "1")  # So the game's fonts are made countable
+
+import pygame
+import superblob_game as game
+from superblob_sim import Simulation, FRAME_MS
+from superblob_debris import DebrisPiece, DebrisPool, DebrisArrays, np
+
+# Every benchmarked frame stands for exactly one simulation step, however long it took to draw
+game.timestep["frame_ms"] = FRAME_MS
+# Timed frames run without the draw-call counters; count_draw_calls() puts them back
+game.draw_counter.uninstall()
+
+def start_level(world, level_num, seed=1):
+    """Put the game straight into the playing state of a world and level (seeded run)"""
+    game.current_world = world
+    game.reset_game(seed)
+    game.level = level_num
+    game.retry_level()
+    game.game_state = "playing"
+
+def keep_flying(sim=None):
+    """Relaunch the blob whenever it lands and keep power topped up, so frames stay comparable"""
+    sim = sim or game.sim
+    sim.power = sim.max_power
+    if not sim.flying:
+        sim.blob_vel_x, sim.blob_vel_y = 2, -14
+        sim.flying = True
+        sim.can_catch = True
+
+def time_frames(frames, step=None):
+    """Run and time a number of uncapped frames; returns frame times in milliseconds"""
+    times = []
+    for _ in range(frames):
+        if step:
+            step()
+        start = time.perf_counter()
+        game.run_frame()
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+def summarize(times):
+    """Mean and percentiles of a list of frame times"""
+    ordered = sorted(times)
+    def percentile(p):
+        return ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))]
+    mean = sum(times) / len(times)
+    return {
+        "frames": len(times),
+        "mean_ms": mean,
+        "p50_ms": percentile(50),
+        "p95_ms": percentile(95),
+        "p99_ms": percentile(99),
+        "max_ms": ordered[-1],
+        "fps": 1000 / mean if mean else 0.0
+    }
+
+def compare_dirty_rects(frames):
+    """Time the same playing scenario with full-frame and dirty-rect rendering"""
+    results = {}
+    for label, enabled in [("full_frame", False), ("dirty_rects", True)]:
+        game.dirty_rects_enabled = enabled
+        start_level("city", 12)
+        time_frames(30, keep_flying)  # Warm up the render caches
+        results[label] = summarize(time_frames(frames, keep_flying))
+    return results
+
+def time_simulation(steps, num_mini_blobs=6, character="SUPERBLOB"):
+    """Step the same scenario headless, without drawing; returns steps per second"""
+    sim = Simulation(game.WIDTH, game.HEIGHT, seed=1)
+    sim.set_character(next(char for char in game.characters if char["name"] == character))
+    sim.retry_level("city", 12, num_mini_blobs)
+    start = time.perf_counter()
+    for _ in range(steps):
+        keep_flying(sim)
+        sim.step()
+    return steps / (time.perf_counter() - start)
+
+def make_debris_pieces(count, as_dicts):
+    """Debris pieces with the fields the game uses - as plain dicts (the old layout) or DebrisPiece"""
+    pieces = []
+    for i in range(count):
+        fields = {"x": i % 800, "y": i % 600, "w": 20, "h": 20, "vel_x": 1.5, "vel_y": -4.0,
+                  "rotation": 0.0, "rot_speed": 3.0, "prev_x": 0, "prev_y": 0, "kind": "building"}
+        if as_dicts:
+            pieces.append(fields)
+        else:
+            piece = DebrisPiece()
+            for key, value in fields.items():
+                setattr(piece, key, value)
+            pieces.append(piece)
+    return pieces
+
+def compare_entity_layouts(count=10000, rounds=20):
+    """Per-frame update cost and memory per debris piece, dicts vs __slots__ classes"""
+    results = {}
+    for label, as_dicts in [("dict", True), ("slots", False)]:
+        tracemalloc.start()
+        pieces = make_debris_pieces(count, as_dicts)
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        # The same work as DebrisPool.update
+        start = time.perf_counter()
+        for _ in range(rounds):
+            if as_dicts:
+                for piece in pieces:
+                    piece["prev_x"] = piece["x"]
+                    piece["prev_y"] = piece["y"]
+                    piece["vel_y"] += 0.5
+                    piece["x"] += piece["vel_x"]
+                    piece["y"] += piece["vel_y"]
+                    piece["rotation"] += piece["rot_speed"]
+            else:
+                for piece in pieces:
+                    piece.prev_x = piece.x
+                    piece.prev_y = piece.y
+                    piece.vel_y += 0.5
+                    piece.x += piece.vel_x
+                    piece.y += piece.vel_y
+                    piece.rotation += piece.rot_speed
+        elapsed = time.perf_counter() - start
+        results[label] = {"ns_per_update": elapsed / (count * rounds) * 1e9, "bytes_each": memory / count}
+    return results
+
+def compare_debris_engines(pieces=500, rounds=10, steps=40):
+    """Per-frame cost of a boss smash that breaks into many pieces, object pool vs NumPy arrays"""
+    engines = [("pool", DebrisPool)]
+    if np is not None:
+        engines.append(("numpy", DebrisArrays))
+    results = {}
+    for label, engine_class in engines:
+        debris = engine_class(pieces, game.sim.gravity, game.HEIGHT)
+        debris.seed(random.Random(1))
+        elapsed = 0.0
+        for _ in range(rounds):
+            debris.emit(650, 250, 100, 350, pieces, "boss")
+            # What the game does with debris every frame: step, remember positions, draw
+            start = time.perf_counter()
+            for _ in range(steps):
+                debris.remember_positions()
+                debris.update()
+                debris.rects(0.5)
+            elapsed += time.perf_counter() - start
+        results[label] = elapsed / (rounds * steps) * 1e6
+    return results
+
+def show_screen(state, world="city", level_num=1):
+    """Put the game on a screen other than playing (with a level behind it for the comic)"""
+    start_level(world, level_num)
+    game.game_state = state
+
+def smash_boss():
+    """Keep smashing the boss - fly into it, and put the level back up once its debris has fallen"""
+    game.game_state = "playing"  # Stay on the level instead of going on to the comic
+    sim = game.sim
+    boss = sim.buildings[-1]
+    if not boss.alive and not len(sim.debris):
+        game.retry_level()
+        boss = sim.buildings[-1]
+    sim.power = sim.max_power
+    if boss.alive and not sim.flying:
+        sim.blob_x, sim.blob_y = boss.x - 150, boss.y + boss.h / 2
+        sim.prev_blob_x, sim.prev_blob_y = sim.blob_x, sim.blob_y
+        sim.blob_vel_x, sim.blob_vel_y = 15, -3
+        sim.flying = True
+        sim.can_catch = True
+
+# Scripted scenarios: name -> (setup, called before every frame or None)
+# Every scenario starts from the same seed, so runs of one build repeat frame for frame
+SCENARIOS = {
+    "city_1_idle": (lambda: start_level("city", 1), None),
+    "city_12_gate": (lambda: start_level("city", 12), keep_flying),  # The gate opens and closes as it runs
+    "village_10_gas": (lambda: start_level("village", 10), keep_flying),  # 4 gas clouds
+    "forest_20_snakes": (lambda: start_level("forest", 20), keep_flying),  # Giant snakes (212px)
+    "boss_smash": (lambda: start_level("city", 12), smash_boss),
+    "comic_panel": (lambda: show_screen("comic_panel"), None),
+    "menu": (lambda: show_screen("menu"), None),
+    "character_select": (lambda: show_screen("character_select"), None)
+}
+
+def run_scenario(name, frames, warmup=30):
+    """Time one scenario's uncapped frames; frame time summary plus mean ms per frame phase"""
+    setup, step = SCENARIOS[name]
+    setup()
+    time_frames(warmup, step)  # Warm up the render caches
+    game.frame_timer.set_enabled(True)
+    result = summarize(time_frames(frames, step))
+    phases = game.frame_timer.summary()["phases"]
+    game.frame_timer.set_enabled(False)
+    result["phase_mean_ms"] = {phase: stats["mean_ms"] for phase, stats in phases.items()}
+    result["game_state"] = game.game_state
+    return result
+
+def count_draw_calls(name, frames, warmup=30):
+    """Replay one scenario from the start with the draw-call counters on; returns their summary"""
+    setup, step = SCENARIOS[name]
+    setup()
+    time_frames(warmup, step)
+    game.draw_counter.reset()
+    game.draw_counter.install(pygame)
+    time_frames(frames, step)
+    game.draw_counter.uninstall()
+    return game.draw_counter.summary()
+
+def run_scenarios(names, frames, draw_stats=False):
+    """Run scenarios in order; returns the JSON report"""
+    report = {
+        "frames": frames,
+        "dirty_rects": game.dirty_rects_enabled,
+        "seed": os.environ["SUPERBLOB_SEED"],
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "numpy": np.__version__ if np is not None else None,
+        "machine": platform.platform(),
+        "scenarios": {}
+    }
+    for name in names:
+        report["scenarios"][name] = run_scenario(name, frames)
+        if draw_stats:
+            report["scenarios"][name]["draw_calls"] = count_draw_calls(name, frames)
+    return report
+
+# Levels played in each world before a new run starts there (also keeps levels from growing forever)
+SOAK_RUN_LEVELS = 12
+
+def soak_levels(levels, frames_per_level=20, window=10, interval=1):
+    """Play through levels with the leak detector on; returns its summary
+
+    Runs go through the worlds in turn, each level is played for a few frames,
+    every third one is retried first, and the comic is shown between levels - so
+    reset_game, retry_level and advance_level all take their snapshots.
+    """
+    detector = game.leak_detector
+    detector.window, detector.interval = window, interval
+    detector.log = lambda line: print(line, file=sys.stderr)
+    detector.start()
+    worlds = ["city", "village", "forest"]
+    start_level(worlds[0], 1)
+    for n in range(levels):
+        time_frames(frames_per_level, keep_flying)
+        if n % 3 == 2:
+            game.retry_level()
+            time_frames(frames_per_level, keep_flying)
+        game.game_state = "comic_panel"
+        time_frames(5)
+        if game.level >= SOAK_RUN_LEVELS:
+            game.current_world = worlds[(worlds.index(game.current_world) + 1) % len(worlds)]
+            game.reset_game()
+        else:
+            game.advance_level()
+        game.game_state = "playing"
+    summary = dict(detector.summary(), levels=levels, window=window, interval=interval)
+    detector.stop()
+    return summary
+
+def parse_args(argv):
+    """Command line options"""
+    parser = argparse.ArgumentParser(description="Headless frame-time benchmark for Super Blob")
+    parser.add_argument("frames", nargs="?", type=int, default=600, help="frames timed per measurement")
+    parser.add_argument("--scenarios", nargs="*", metavar="NAME", choices=list(SCENARIOS),
+                        help="run scripted scenarios (all if no names are given) and report JSON")
+    parser.add_argument("--json", metavar="PATH", help="write the scenario report to PATH instead of stdout")
+    parser.add_argument("--dirty-rects", action="store_true", help="run the scenarios with dirty-rect rendering")
+    parser.add_argument("--draw-stats", action="store_true",
+                        help="add draw calls and surface allocations per frame to the scenario report")
+    parser.add_argument("--profile", metavar="PATH",
+                        help="sample the scenarios with the sampling profiler and write collapsed stacks to PATH")
+    parser.add_argument("--leaks", type=int, metavar="LEVELS",
+                        help="play LEVELS levels with the leak detector on and report lines that kept growing")
+    parser.add_argument("--leak-window", type=int, default=10, metavar="N",
+                        help="flag lines that grew at each of N snapshots in a row (default 10)")
+    parser.add_argument("--leak-interval", type=int, default=1, metavar="N",
+                        help="snapshot every N-th level transition (default 1)")
+    return parser.parse_args(argv)
+
+def main():
+    args = parse_args(sys.argv[1:])
+    frames = args.frames
+    if args.leaks:
+        report = soak_levels(args.leaks, window=args.leak_window, interval=args.leak_interval)
+        if args.json:
+            with open(args.json, "w") as f:
+                json.dump(report, f, indent=2)
+            print(f"Leak check results written to {args.json}")
+        else:
+            print(json.dumps(report, indent=2))
+        return
+    if args.scenarios is not None:
+        game.dirty_rects_enabled = args.dirty_rects
+        if args.profile:
+            game.profiler.start()
+        report = run_scenarios(args.scenarios or list(SCENARIOS), frames, args.draw_stats)
+        if args.profile:
+            game.profiler.stop()
+            game.profiler.write(args.profile)
+            print(f"Profile ({game.profiler.samples} samples) written to {args.profile}", file=sys.stderr)
+        if args.json:
+            with open(args.json, "w") as f:
+                json.dump(report, f, indent=2)
+            print(f"Scenario results written to {args.json}")
+        else:
+            print(json.dumps(report, indent=2))
+        return
+
+    results = compare_dirty_rects(frames)
+    print(f"{'mode':<12} {'mean ms':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'fps':>8}")
+    for label, stats in results.items():
+        print(f"{label:<12} {stats['mean_ms']:8.3f} {stats['p50_ms']:8.3f} {stats['p95_ms']:8.3f} "
+              f"{stats['p99_ms']:8.3f} {stats['fps']:8.1f}")
+    speedup = results["full_frame"]["mean_ms"] / results["dirty_rects"]["mean_ms"]
+    print(f"dirty rects: {speedup:.2f}x mean frame time vs full frame")
+    print(f"static layer rebuilds: {game.static_layer['rebuilds']}")
+    debris = game.cache_stats()["debris"]
+    print(f"debris: {debris['live']} live, {debris['pooled']} pooled, peak {debris['peak']}, "
+          f"{debris['reused']}/{debris['spawned']} pieces reused")
+    timestep = game.cache_stats()["timestep"]
+    print(f"timestep: {timestep['steps']} steps in {timestep['frames']} frames, "
+          f"{timestep['idle_frames']} idle, {timestep['dropped_steps']} dropped")
+    steps_per_second = time_simulation(frames * 10)
+    print(f"headless simulation: {steps_per_second:,.0f} steps/s ({steps_per_second / 60:,.0f}x real time)")
+    # Stress - thousands of mini blobs (collision queries go through the spatial grid)
+    steps_per_second = time_simulation(frames, num_mini_blobs=5000)
+    print(f"stress (5000 mini blobs): {steps_per_second:,.0f} steps/s")
+    steps_per_second = time_simulation(frames, num_mini_blobs=5000, character="RICHARD")
+    print(f"stress (5000 mini blobs, magnet): {steps_per_second:,.0f} steps/s")
+    layouts = compare_entity_layouts()
+    print("entities: " + ", ".join(f"{label} {stats['ns_per_update']:.0f} ns/update {stats['bytes_each']:.0f} B each"
+                                   for label, stats in layouts.items()))
+    engines = compare_debris_engines()
+    print("debris engines (500 piece boss smash): " +
+          ", ".join(f"{label} {micros:.0f} us/frame" for label, micros in engines.items()))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+"""Falling debris of destroyed buildings for Super Blob
+
+Two engines with the same interface. DebrisArrays keeps every piece as a row of
+preallocated NumPy arrays (struct of arrays) with a free list of rows, and moves all
+of them with a handful of array operations. DebrisPool recycles DebrisPiece objects
+one by one and is used when NumPy is not installed. Nothing here touches pygame.
+"""
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional - debris falls back to DebrisPool without it
+    np = None
+
+DEBRIS_KINDS = ("boss", "tree", "building")  # What a piece was part of (the renderer picks its color)
+
+class DebrisPiece:
+    """Falling piece of a destroyed building (recycled through DebrisPool)"""
+    __slots__ = ("x", "y", "w", "h", "vel_x", "vel_y", "rotation", "rot_speed", "prev_x", "prev_y", "kind")
+
+class DebrisPool:
+    """Debris as a list of DebrisPiece objects - fallen pieces are recycled instead of piling up"""
+    engine = "pool"
+
+    def __init__(self, capacity, gravity, height):
+        self.capacity = capacity  # Oldest pieces are recycled first when this many are falling
+        self.gravity = gravity
+        self.floor = height + 50  # Pieces below this are off screen for good
+        self.rng = None  # Set with seed()
+        self.pieces = []  # Live pieces, oldest first
+        self.pool = []  # Recycled pieces waiting to be reused
+        self.stats = {"spawned": 0, "reused": 0, "culled": 0, "evicted": 0, "updated": 0, "peak": 0}
+
+    def __len__(self):
+        return len(self.pieces)
+
+    def seed(self, rng):
+        """Draw new pieces from the given random.Random"""
+        self.rng = rng
+
+    def pooled(self):
+        """Number of recycled pieces waiting to be reused"""
+        return len(self.pool)
+
+    def emit(self, x, y, w, h, count, kind):
+        """Break the box (x, y, w, h) into count pieces flying off in random directions"""
+        rng = self.rng
+        for i in range(count):
+            if self.pool:
+                piece = self.pool.pop()
+                self.stats["reused"] += 1
+            else:
+                piece = DebrisPiece()
+            piece.x = x + rng.randint(0, w)
+            piece.y = y + rng.randint(0, h)
+            piece.w = rng.randint(15, 35)
+            piece.h = rng.randint(15, 35)
+            piece.vel_x = rng.uniform(-4, 4)
+            piece.vel_y = rng.uniform(-8, -2)
+            piece.rotation = rng.uniform(0, 360)
+            piece.rot_speed = rng.uniform(-10, 10)
+            piece.prev_x, piece.prev_y = piece.x, piece.y
+            piece.kind = kind
+            self.pieces.append(piece)
+            self.stats["spawned"] += 1
+
+        # Cap live debris - recycle the oldest pieces first
+        overflow = len(self.pieces) - self.capacity
+        if overflow > 0:
+            self.pool.extend(self.pieces[:overflow])
+            del self.pieces[:overflow]
+            self.stats["evicted"] += overflow
+        self.stats["peak"] = max(self.stats["peak"], len(self.pieces))
+
+    def update(self):
+        """Move every live piece one step and recycle the ones that have fallen off screen"""
+        for piece in self.pieces:
+            piece.vel_y += self.gravity
+            piece.x += piece.vel_x
+            piece.y += piece.vel_y
+            piece.rotation += piece.rot_speed
+        self.stats["updated"] = len(self.pieces)
+
+        # Pieces only ever fall once they are below the screen, so they can be dropped for good
+        if any(piece.y >= self.floor for piece in self.pieces):
+            falling = []
+            for piece in self.pieces:
+                if piece.y < self.floor:
+                    falling.append(piece)
+                else:
+                    self.pool.append(piece)
+                    self.stats["culled"] += 1
+            self.pieces[:] = falling
+
+    def clear(self):
+        """Recycle every live piece (new level)"""
+        self.pool.extend(self.pieces)
+        self.pieces.clear()
+
+    def remember_positions(self):
+        """Keep the current positions (drawing interpolates from them)"""
+        for piece in self.pieces:
+            piece.prev_x = piece.x
+            piece.prev_y = piece.y
+
+    def rects(self, alpha=1.0):
+        """(x, y, w, h, kind) of every live piece, oldest first, alpha of the way through the last step"""
+        return [(int(piece.prev_x + (piece.x - piece.prev_x) * alpha),
+                 int(piece.prev_y + (piece.y - piece.prev_y) * alpha),
+                 piece.w, piece.h, piece.kind) for piece in self.pieces]
+
+class DebrisArrays:
+    """Debris as rows of preallocated NumPy arrays - all pieces move in a few array operations"""
+    engine = "numpy"
+
+    def __init__(self, capacity, gravity, height):
+        self.capacity = capacity  # Rows available - the oldest pieces are recycled first when all are used
+        self.gravity = gravity
+        self.floor = height + 50  # Pieces below this are off screen for good
+        self.rng = None  # numpy Generator, set with seed()
+
+        # One array per field, one row per piece
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.prev_x = np.zeros(capacity)
+        self.prev_y = np.zeros(capacity)
+        self.vel_x = np.zeros(capacity)
+        self.vel_y = np.zeros(capacity)
+        self.rotation = np.zeros(capacity)
+        self.rot_speed = np.zeros(capacity)
+        self.w = np.zeros(capacity, dtype=np.int32)
+        self.h = np.zeros(capacity, dtype=np.int32)
+        self.kind = np.zeros(capacity, dtype=np.int8)  # Index into DEBRIS_KINDS
+        self.order = np.zeros(capacity, dtype=np.int64)  # Spawn order - oldest pieces are evicted first
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.used = np.zeros(capacity, dtype=bool)  # Rows that held a piece before (for the reused count)
+
+        self.free = list(range(capacity - 1, -1, -1))  # Free rows, taken from the end
+        self.next_order = 0
+        self.live = 0
+        self.stats = {"spawned": 0, "reused": 0, "culled": 0, "evicted": 0, "updated": 0, "peak": 0}
+
+    def __len__(self):
+        return self.live
+
+    def seed(self, rng):
+        """Draw new pieces from a NumPy generator seeded from the given random.Random"""
+        self.rng = np.random.default_rng(rng.getrandbits(64))
+
+    def pooled(self):
+        """Number of free rows that held a piece before"""
+        return int(np.count_nonzero(self.used & ~self.alive))
+
+    def release(self, rows):
+        """Mark rows dead and hand them back to the free list"""
+        self.alive[rows] = False
+        self.free.extend(rows.tolist())
+        self.live -= len(rows)
+
+    def emit(self, x, y, w, h, count, kind):
+        """Break the box (x, y, w, h) into count pieces flying off in random directions"""
+        count = min(count, self.capacity)
+
+        # Not enough free rows - recycle the oldest live pieces first
+        shortage = count - len(self.free)
+        if shortage > 0:
+            live_rows = np.flatnonzero(self.alive)
+            oldest = live_rows[np.argsort(self.order[live_rows], kind="stable")[:shortage]]
+            self.release(oldest)
+            self.stats["evicted"] += shortage
+
+        rows = np.array(self.free[-count:][::-1], dtype=np.intp)
+        del self.free[-count:]
+
+        rng = self.rng
+        self.x[rows] = x + rng.integers(0, w, count, endpoint=True)
+        self.y[rows] = y + rng.integers(0, h, count, endpoint=True)
+        self.w[rows] = rng.integers(15, 35, count, endpoint=True)
+        self.h[rows] = rng.integers(15, 35, count, endpoint=True)
+        self.vel_x[rows] = rng.uniform(-4, 4, count)
+        self.vel_y[rows] = rng.uniform(-8, -2, count)
+        self.rotation[rows] = rng.uniform(0, 360, count)
+        self.rot_speed[rows] = rng.uniform(-10, 10, count)
+        self.prev_x[rows] = self.x[rows]
+        self.prev_y[rows] = self.y[rows]
+        self.kind[rows] = DEBRIS_KINDS.index(kind)
+        self.order[rows] = np.arange(self.next_order, self.next_order + count)
+        self.next_order += count
+        self.alive[rows] = True
+
+        self.stats["reused"] += int(np.count_nonzero(self.used[rows]))
+        self.used[rows] = True
+        self.live += count
+        self.stats["spawned"] += count
+        self.stats["peak"] = max(self.stats["peak"], self.live)
+
+    def update(self):
+        """Move every live piece one step and free the rows of the ones that have fallen off screen"""
+        self.stats["updated"] = self.live
+        if not self.live:
+            return
+        alive = self.alive
+        np.add(self.vel_y, self.gravity, out=self.vel_y, where=alive)
+        np.add(self.x, self.vel_x, out=self.x, where=alive)
+        np.add(self.y, self.vel_y, out=self.y, where=alive)
+        np.add(self.rotation, self.rot_speed, out=self.rotation, where=alive)
+
+        # Free every fallen piece in one go
+        fallen = np.flatnonzero(alive & (self.y >= self.floor))
+        if len(fallen):
+            self.release(fallen)
+            self.stats["culled"] += len(fallen)
+
+    def clear(self):
+        """Free every row (new level)"""
+        self.release(np.flatnonzero(self.alive))
+
+    def remember_positions(self):
+        """Keep the current positions (drawing interpolates from them)"""
+        np.copyto(self.prev_x, self.x)
+        np.copyto(self.prev_y, self.y)
+
+    def rects(self, alpha=1.0):
+        """(x, y, w, h, kind) of every live piece, oldest first, alpha of the way through the last step"""
+        if not self.live:
+            return []
+        rows = np.flatnonzero(self.alive)
+        rows = rows[np.argsort(self.order[rows], kind="stable")]
+        xs = self.prev_x[rows] + (self.x[rows] - self.prev_x[rows]) * alpha
+        ys = self.prev_y[rows] + (self.y[rows] - self.prev_y[rows]) * alpha
+        kinds = [DEBRIS_KINDS[kind] for kind in self.kind[rows].tolist()]
+        return list(zip(xs.astype(int).tolist(), ys.astype(int).tolist(),
+                        self.w[rows].tolist(), self.h[rows].tolist(), kinds))
+
+def make_debris(capacity, gravity, height):
+    """The NumPy debris engine when NumPy is installed, the object pool otherwise"""
+    if np is not None:
+        return DebrisArrays(capacity, gravity, height)
+    return DebrisPool(capacity, gravity, height)
@@ -1,9 +1,30 @@
 import pygame
+import copy
 import math
-import random
+import os
+import time
+from collections import OrderedDict
+from superblob_sim import Simulation, FRAME_MS, make_rng, new_seed
+from superblob_perf import PhaseTimer, DrawCounter, LeakDetector, StackSampler
 
 pygame.init()
 
+# Draw-call counters (SUPERBLOB_DRAW_STATS=1) - installed before the first font or surface
+# is made, so every one of them is counted
+draw_counter = DrawCounter()
+if os.environ.get("SUPERBLOB_DRAW_STATS") == "1":
+    draw_counter.install(pygame)
+
+# Leak check (SUPERBLOB_LEAK_CHECK=1) - tracemalloc snapshots at every level transition, logging
+# what grew and flagging lines that keep growing. Started first thing so all of the game is traced
+leak_detector = LeakDetector()
+if os.environ.get("SUPERBLOB_LEAK_CHECK") == "1":
+    leak_detector.start()
+
+# Sampling profiler (SUPERBLOB_PROFILE=1, SUPERBLOB_PROFILE_HZ samples a second) - runs for the
+# whole session and writes collapsed stacks per game_state on exit, for flamegraph.pl or speedscope
+profiler = StackSampler(rate=int(os.environ.get("SUPERBLOB_PROFILE_HZ", "100")), get_context=lambda: game_state)
+
 # Screen setup
 WIDTH, HEIGHT = 800, 600
 screen = pygame.display.set_mode((WIDTH, HEIGHT))
@@ -27,6 +48,113 @@ GOLD = (255, 215, 0)
 BRIGHT_RED = (255, 0, 0)  # Actual red color for buttons
 BRIGHT_BLUE = (0, 100, 255)  # Actual blue color for buttons
 
+# Render caches
+class SurfaceCache:
+    """Size-bounded LRU cache of pre-rendered Surfaces with hit/miss counters"""
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.context = None  # Label lookups are counted under (the current game_state)
+        self.context_counts = {}  # context -> [hits, misses]
+
+    def get(self, key, render):
+        """Return the Surface cached under key, calling render() to build it on a miss"""
+        counts = self.context_counts.get(self.context)
+        if counts is None:
+            counts = self.context_counts[self.context] = [0, 0]
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.hits += 1
+            counts[0] += 1
+            self.entries.move_to_end(key)
+            return surface
+        self.misses += 1
+        counts[1] += 1
+        surface = render()
+        self.entries[key] = surface
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)  # Evict least recently used
+        return surface
+
+    def discard(self, key):
+        """Drop a single entry (no-op if it is not cached)"""
+        self.entries.pop(key, None)
+
+    def clear(self):
+        """Drop every entry (counters are kept)"""
+        self.entries.clear()
+
+    def stats(self):
+        """Return a dict with size and hit/miss counters"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+
+    def stats_by_context(self):
+        """Return hit/miss counters broken down by context (game_state)"""
+        result = {}
+        for context, (hits, misses) in self.context_counts.items():
+            result[context] = {
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": hits / (hits + misses) if hits + misses else 0.0
+            }
+        return result
+
+# Text cache - font rasterization is one of the most expensive pygame calls and most
+# labels are the same from frame to frame
+text_cache = SurfaceCache(max_entries=256)
+font_cache = {}  # size -> default font (creating a Font is expensive too)
+
+def get_font(size):
+    """Return the default font at the given size, creating it only once"""
+    if size not in font_cache:
+        font_cache[size] = pygame.font.Font(None, size)
+    return font_cache[size]
+
+def render_text(text_font, text, antialias, color):
+    """Render text through the shared cache (same arguments as Font.render), keyed by (font, text, color, antialias)"""
+    return text_cache.get((text_font, text, color, antialias),
+                          lambda: text_font.render(text, antialias, color))
+
+def cache_stats():
+    """Return the stats of every render cache (overall and per game_state), the debris pool, the timestep and the aim preview"""
+    return {
+        "text": dict(text_cache.stats(), by_state=text_cache.stats_by_context()),
+        "blob_sprites": dict(blob_sprite_cache.stats(), by_state=blob_sprite_cache.stats_by_context()),
+        "static_layer": {"rebuilds": static_layer["rebuilds"]},
+        "debris": dict(sim.debris.stats, live=len(sim.debris), pooled=sim.debris.pooled(), engine=sim.debris.engine),
+        "timestep": {key: timestep[key] for key in ("frames", "steps", "extra_steps", "idle_frames", "dropped_steps")},
+        "trajectory": {"computed": sim.preview["computed"], "reused": sim.preview["reused"]}
+    }
+
+def print_cache_stats():
+    """Print render cache hit rates per game_state"""
+    for name, stats in cache_stats().items():
+        if "hits" not in stats:
+            print(f"{name}: " + ", ".join(f"{key} {value}" for key, value in stats.items()))
+            continue
+        print(f"{name}: {stats['hits']} hits, {stats['misses']} misses "
+              f"({stats['hit_rate']:.1%}), {stats['entries']}/{stats['max_entries']} entries")
+        for state, counts in sorted(stats["by_state"].items(), key=lambda item: str(item[0])):
+            print(f"  {state}: {counts['hits']} hits, {counts['misses']} misses ({counts['hit_rate']:.1%})")
+
+def set_cache_context(context):
+    """Count cache lookups from now on under the given game_state"""
+    text_cache.context = context
+    blob_sprite_cache.context = context
+
+# Text rendered through the cache is charged to whoever called render_text
+draw_counter.passthrough.update({"render_text", "render_text.<locals>.<lambda>", "SurfaceCache.get"})
+
 # Game state
 game_state = "story_intro"  # "menu", "story_intro", "character_select", "world_select", "upgrades", "playing", "comic_panel", "level_failed", "villain_intro", "city_intro", "forest_intro"
 show_instructions = False  # Toggle for instructions dropdown
@@ -38,11 +166,6 @@ village_max_level = 1  # Track highest level reached in village
 village_unlocked = False  # Unlocked after beating city level 12
 forest_unlocked = False  # Unlocked after beating village level 10
 blobs_rescued = 0  # Total saved currency for unlocking characters
-blobs_collected_run = 0  # Blobs collected in current game run (for power increase)
-blobs_collected_level = 0  # Blobs collected in current level (for size increase)
-power = 100  # Power bar (0-100)
-max_power = 100
-power_drain_rate = 0.5  # Power lost per frame (slow drain)
 
 # Villain intro animation variables
 villain_x = -100  # Start off-screen left
@@ -117,417 +240,141 @@ characters = [
 ]
 selected_character = 0  # Index of selected character
 player_color = characters[0]["color"]
-can_pierce_buildings = characters[0]["can_pierce"]
-has_magnetic_ability = characters[0]["magnetic"]
+
+# Seeds - every run gets its own seed from the session stream; SUPERBLOB_SEED makes a whole
+# session (menus, levels, debris) reproducible from the same inputs
+session_seed = int(os.environ.get("SUPERBLOB_SEED") or new_seed())
+session_rng = make_rng(session_seed, "runs")
 
 # Menu animation blobs
+class MenuBlob:
+    """Blob bouncing around behind the menu"""
+    __slots__ = ("x", "y", "vel_x", "vel_y", "radius", "color")
+
+    def __init__(self, x, y, vel_x, vel_y, radius, color):
+        self.x = x
+        self.y = y
+        self.vel_x = vel_x
+        self.vel_y = vel_y
+        self.radius = radius
+        self.color = color
+
+menu_rng = make_rng(session_seed, "menu_blobs")
 menu_blobs = []
 for i in range(8):
-    menu_blobs.append({
-        "x": random.randint(100, WIDTH - 100),
-        "y": random.randint(100, HEIGHT - 100),
-        "vel_x": random.uniform(-2, 2),
-        "vel_y": random.uniform(-2, 2),
-        "radius": random.randint(15, 35),
-        "color": random.choice([BLUE, RED, PURPLE, GREEN, (180, 180, 182)])  # Richard's gray instead of orange
-    })
-
-# Blob properties
-blob_x, blob_y = 100, 450
-blob_radius = 20
-blob_vel_x, blob_vel_y = 0, 0
-dragging = False
-flying = False
-can_catch = False
-launch_x, launch_y = blob_x, blob_y
-gravity = 0.5
-bounce_damping = 0.7  # Energy loss on bounce
-
-# Mini blobs to rescue (x, y, radius, alive)
-mini_blobs = []
+    menu_blobs.append(MenuBlob(
+        x=menu_rng.randint(100, WIDTH - 100),
+        y=menu_rng.randint(100, HEIGHT - 100),
+        vel_x=menu_rng.uniform(-2, 2),
+        vel_y=menu_rng.uniform(-2, 2),
+        radius=menu_rng.randint(15, 35),
+        color=menu_rng.choice([BLUE, RED, PURPLE, GREEN, (180, 180, 182)])  # Richard's gray instead of orange
+    ))
 
 # Upgrade tracking
 mini_blob_upgrade_level = 0  # 0-4, each adds 1 mini blob (6 base + upgrades = max 10)
 mini_blob_upgrade_costs = [150, 300, 600, 1200]  # Costs for upgrades 1-4
 
-# Village gas clouds (moving hazards)
-gas_clouds = []
-
-# Forest snakes (deadly hazards on trees)
-snakes = []
-
-def spawn_snakes(trees, level_num=1):
-    """Create snakes on top of trees in forest - snakes grow bigger each level"""
-    snake_list = []
-    # Snakes grow 10 pixels bigger each level (12 base + 10 per level)
-    snake_radius = 12 + (level_num * 10)
-
-    for tree in trees:
-        if not tree.get("is_boss"):  # Don't put snakes on boss tree
-            # Snake sits much lower on tree - use visual coordinates if available
-            if "visual_x" in tree:
-                snake_x = tree["visual_x"] + tree["visual_w"] // 2
-                snake_y = tree["visual_y"] + 150  # Much lower down - near middle of tree
-            else:
-                snake_x = tree["x"] + tree["w"] // 2
-                snake_y = tree["y"] - 15
-
-            snake_list.append({
-                "x": snake_x,
-                "y": snake_y,
-                "r": snake_radius,
-                "tree_x": snake_x,  # Reference position for swaying
-                "sway_offset": random.randint(0, 360)  # For animation
-            })
-    return snake_list
-
-def spawn_mini_blobs():
-    """Create mini blobs scattered across the level (6 base + upgrades)"""
-    blobs = []
-    num_blobs = 6 + mini_blob_upgrade_level  # Base 6, can go up to 10
-    for i in range(num_blobs):
-        blobs.append({
-            "x": random.randint(250, 750),
-            "y": random.randint(150, 400),
-            "r": 8,
-            "alive": True
-        })
-    return blobs
-
-def spawn_gas_clouds(level_num):
-    """Create moving gas clouds for village levels - increases with level"""
-    clouds = []
-    # Start with 2 clouds, add 1 at level 5, add another at level 8
-    num_clouds = 2
-    if level_num >= 8:
-        num_clouds = 4
-    elif level_num >= 5:
-        num_clouds = 3
-
-    for i in range(num_clouds):
-        clouds.append({
-            "x": random.randint(200 + i * 150, 350 + i * 100),
-            "y": random.randint(150, 400),
-            "r": 25,
-            "vel_x": random.choice([-1, 1]) * random.uniform(0.8, 1.2),
-            "vel_y": random.choice([-1, 1]) * random.uniform(0.8, 1.2)
-        })
-    return clouds
-
-mini_blobs = spawn_mini_blobs()
-
-# Buildings (x, y, width, height, is_boss)
-buildings = []
-
-# Gate obstacle (for level 10+)
-gate = {
-    "x": 250,
-    "y": 0,  # Start from top of screen
-    "width": 30,
-    "height": 600,  # Full screen height
-    "open": False,
-    "timer": 0,
-    "open_duration": 120,  # Frames gate stays open
-    "close_duration": 90   # Frames gate stays closed
-}
-
-def create_level_buildings(level_num, world="city"):
-    """Create buildings for the level - last one is the boss"""
-    bldgs = []
-
-    if world == "village":
-        # Village has houses instead of skyscrapers (taller houses!)
-        if level_num <= 4:
-            # 2 taller houses
-            for i in range(2):
-                bldgs.append({
-                    "x": 350 + i * 150,
-                    "y": 380,  # Higher up (taller)
-                    "w": 80,
-                    "h": 220,  # Taller (was 180)
-                    "alive": True,
-                    "is_boss": False,
-                    "pieces": [],
-                    "hit_count": 0
-                })
-        elif level_num <= 9:
-            # 4 taller houses (was 3)
-            for i in range(4):
-                bldgs.append({
-                    "x": 280 + i * 100,
-                    "y": 380,  # Higher up (taller)
-                    "w": 80,
-                    "h": 220,  # Taller (was 180)
-                    "alive": True,
-                    "is_boss": False,
-                    "pieces": [],
-                    "hit_count": 0
-                })
-        else:
-            # Level 10+: 4 houses with varied heights
-            for i in range(4):
-                height = random.randint(220, 270)
-                y_pos = 600 - height
-                bldgs.append({
-                    "x": 280 + i * 100,
-                    "y": y_pos,
-                    "w": 80,
-                    "h": height,
-                    "alive": True,
-                    "is_boss": False,
-                    "pieces": [],
-                    "hit_count": 0
-                })
-
-        # Boss house (larger, taller)
-        bldgs.append({
-            "x": 650,
-            "y": 320,  # Higher up (taller)
-            "w": 120,
-            "h": 280,  # Taller (was 250)
-            "alive": True,
-            "is_boss": True,
-            "pieces": [],
-            "required_power": level_num * 15  # 15, 30, 45, 60, etc. (harder than city)
-        })
-        return bldgs
-
-    if world == "forest":
-        # Forest has trees - trunk-only collision boxes (narrower than visual)
-        if level_num <= 4:
-            # 2 trees (much taller and thicker)
-            for i in range(2):
-                bldgs.append({
-                    "x": 355 + i * 150,  # Centered on trunk
-                    "y": 350,  # Trunk starts lower (much taller tree)
-                    "w": 50,  # Trunk width - THICKER!
-                    "h": 250,  # Trunk height - MUCH TALLER!
-                    "alive": True,
-                    "is_boss": False,
-                    "pieces": [],
-                    "hit_count": 0,
-                    "visual_x": 340 + i * 150,  # Full tree visual position
-                    "visual_y": 150,  # Much higher up (taller tree)
-                    "visual_w": 80,  # Thicker visual tree
-                    "visual_h": 450  # Much taller tree
-                })
-        elif level_num <= 9:
-            # 5 trees (level 5+, much taller and thicker)
-            for i in range(5):
-                bldgs.append({
-                    "x": 255 + i * 90,  # Centered on trunk
-                    "y": 350,  # Trunk starts lower (much taller tree)
-                    "w": 50,  # Trunk width - THICKER!
-                    "h": 250,  # Trunk height - MUCH TALLER!
-                    "alive": True,
-                    "is_boss": False,
-                    "pieces": [],
-                    "hit_count": 0,
-                    "visual_x": 240 + i * 90,  # Full tree visual position
-                    "visual_y": 150,  # Much higher up (taller tree)
-                    "visual_w": 80,  # Thicker visual tree
-                    "visual_h": 450  # Much taller tree
-                })
-        else:
-            # Level 10+: 4 trees with varied heights (much taller and thicker)
-            for i in range(4):
-                visual_height = random.randint(450, 520)  # Much taller varied heights
-                visual_y_pos = 600 - visual_height
-                # Trunk is collision box - thicker and taller
-                trunk_h = 250  # Consistent tall trunk
-                trunk_y = 350  # Same as other levels
-                bldgs.append({
-                    "x": 295 + i * 100,  # Centered on trunk
-                    "y": trunk_y,
-                    "w": 50,  # Trunk width - THICKER!
-                    "h": trunk_h,  # Trunk height - TALLER!
-                    "alive": True,
-                    "is_boss": False,
-                    "pieces": [],
-                    "hit_count": 0,
-                    "visual_x": 280 + i * 100,
-                    "visual_y": visual_y_pos,
-                    "visual_w": 80,  # Thicker visual tree
-                    "visual_h": visual_height  # Much taller visual tree
-                })
-
-        # Boss tree (ancient tree - much larger trunk and SIGNIFICANTLY taller)
-        bldgs.append({
-            "x": 680,  # Centered on trunk
-            "y": 250,  # Trunk position (MUCH taller tree - starts higher)
-            "w": 60,  # Boss trunk width - THICKER!
-            "h": 350,  # Boss trunk height - SUPER TALL!
-            "alive": True,
-            "is_boss": True,
-            "pieces": [],
-            "required_power": level_num * 20,  # 20, 40, 60, 80, 100, etc.
-            "visual_x": 650,
-            "visual_y": 0,  # Much higher up - starts at top of screen!
-            "visual_w": 130,  # Thicker visual boss tree
-            "visual_h": 600  # SUPER tall boss tree visual - towers above others
-        })
-        return bldgs
-
-    # City buildings (original code)
-    # Regular buildings (can be destroyed by any hit)
-
-    if level_num <= 4:
-        # Levels 1-4: 2 buildings in a line
-        for i in range(2):
-            bldgs.append({
-                "x": 350 + i * 150,
-                "y": 350,
-                "w": 70,
-                "h": 250,
-                "alive": True,
-                "is_boss": False,
-                "pieces": [],
-                "hit_count": 0  # Track hits
-            })
-    elif level_num <= 9:
-        # Levels 5-9: 3 buildings in a line
-        for i in range(3):
-            bldgs.append({
-                "x": 300 + i * 120,
-                "y": 350,
-                "w": 70,
-                "h": 250,
-                "alive": True,
-                "is_boss": False,
-                "pieces": [],
-                "hit_count": 0
-            })
-    else:
-        # Level 10+: 3 buildings with varied heights and positions
-        num_obstacles = 3
-        for i in range(num_obstacles):
-            height = random.randint(200, 300)
-            y_pos = 600 - height
-            x_spacing = (600 - 350) // (num_obstacles + 1)
-            bldgs.append({
-                "x": 350 + (i + 1) * x_spacing - 35,
-                "y": y_pos,
-                "w": 70,
-                "h": height,
-                "alive": True,
-                "is_boss": False,
-                "pieces": [],
-                "hit_count": 0
-            })
-
-    # Boss building (taller, wider, different color)
-    bldgs.append({
-        "x": 650,
-        "y": 250,
-        "w": 100,
-        "h": 350,
-        "alive": True,
-        "is_boss": True,
-        "pieces": [],
-        "required_power": level_num * 10  # 10, 20, 30, 40, etc.
-    })
-    return bldgs
-
-buildings = create_level_buildings(level, current_world)
-
-def draw_building(building, world="city"):
-    """Draw a building with windows and details"""
-    if not building["alive"]:
-        return
+# Playing-state game logic (blob, buildings, mini blobs, hazards, gate, power, debris) -
+# run_frame only feeds it input and draws it
+sim = Simulation(WIDTH, HEIGHT, seed=session_rng.randrange(2 ** 32))
+sim.retry_level(current_world, level, 6 + mini_blob_upgrade_level)
 
+def render_building(surface, building, world="city"):
+    """Draw a building with windows and details onto the given surface"""
     # FORCE forest to always draw trees
     if world == "forest":
         # Use visual coordinates for forest trees
-        if "visual_x" in building:
-            x, y, w, h = building["visual_x"], building["visual_y"], building["visual_w"], building["visual_h"]
+        if building.visual_x is not None:
+            x, y, w, h = building.visual_x, building.visual_y, building.visual_w, building.visual_h
         else:
-            x, y, w, h = building["x"], building["y"], building["w"], building["h"]
+            x, y, w, h = building.x, building.y, building.w, building.h
         # Draw trees
-        if building.get("is_boss"):
+        if building.is_boss:
             # Boss tree - ancient giant tree
             trunk_w = w * 0.4
             trunk_x = x + w // 2 - trunk_w // 2
 
             # Tree trunk (darker brown)
-            pygame.draw.rect(screen, (80, 50, 20), (trunk_x, y + h // 2, trunk_w, h // 2))
-            pygame.draw.rect(screen, BLACK, (trunk_x, y + h // 2, trunk_w, h // 2), 3)
+            pygame.draw.rect(surface, (80, 50, 20), (trunk_x, y + h // 2, trunk_w, h // 2))
+            pygame.draw.rect(surface, BLACK, (trunk_x, y + h // 2, trunk_w, h // 2), 3)
 
             # Bark texture
             for i in range(5):
                 bark_y = y + h // 2 + i * 20
-                pygame.draw.line(screen, (60, 40, 15), (trunk_x + 5, bark_y), (trunk_x + trunk_w - 5, bark_y + 10), 2)
+                pygame.draw.line(surface, (60, 40, 15), (trunk_x + 5, bark_y), (trunk_x + trunk_w - 5, bark_y + 10), 2)
 
             # Tree canopy (large layered circles)
             canopy_y = y + h // 3
-            pygame.draw.circle(screen, (30, 100, 30), (x + w // 2, canopy_y), w // 2)
-            pygame.draw.circle(screen, (35, 110, 35), (x + w // 2 - w // 3, canopy_y + 10), w // 3)
-            pygame.draw.circle(screen, (35, 110, 35), (x + w // 2 + w // 3, canopy_y + 10), w // 3)
-            pygame.draw.circle(screen, (40, 120, 40), (x + w // 2, canopy_y + 30), w // 2.5)
-            pygame.draw.circle(screen, BLACK, (x + w // 2, canopy_y), w // 2, 3)
+            pygame.draw.circle(surface, (30, 100, 30), (x + w // 2, canopy_y), w // 2)
+            pygame.draw.circle(surface, (35, 110, 35), (x + w // 2 - w // 3, canopy_y + 10), w // 3)
+            pygame.draw.circle(surface, (35, 110, 35), (x + w // 2 + w // 3, canopy_y + 10), w // 3)
+            pygame.draw.circle(surface, (40, 120, 40), (x + w // 2, canopy_y + 30), w // 2.5)
+            pygame.draw.circle(surface, BLACK, (x + w // 2, canopy_y), w // 2, 3)
         else:
             # Regular tree
             trunk_w = w * 0.5
             trunk_x = x + w // 2 - trunk_w // 2
 
             # Tree trunk
-            pygame.draw.rect(screen, (101, 67, 33), (trunk_x, y + h // 2, trunk_w, h // 2))
-            pygame.draw.rect(screen, BLACK, (trunk_x, y + h // 2, trunk_w, h // 2), 2)
+            pygame.draw.rect(surface, (101, 67, 33), (trunk_x, y + h // 2, trunk_w, h // 2))
+            pygame.draw.rect(surface, BLACK, (trunk_x, y + h // 2, trunk_w, h // 2), 2)
 
             # Bark lines
             for i in range(3):
                 bark_y = y + h // 2 + i * 25
-                pygame.draw.line(screen, (80, 50, 25), (trunk_x + 3, bark_y), (trunk_x + trunk_w - 3, bark_y + 8), 2)
+                pygame.draw.line(surface, (80, 50, 25), (trunk_x + 3, bark_y), (trunk_x + trunk_w - 3, bark_y + 8), 2)
 
             # Tree canopy (layered circles)
             canopy_y = y + h // 3
-            pygame.draw.circle(screen, (34, 100, 34), (x + w // 2, canopy_y), w // 2.2)
-            pygame.draw.circle(screen, (40, 110, 40), (x + w // 2 - w // 4, canopy_y + 8), w // 3.5)
-            pygame.draw.circle(screen, (40, 110, 40), (x + w // 2 + w // 4, canopy_y + 8), w // 3.5)
-            pygame.draw.circle(screen, BLACK, (x + w // 2, canopy_y), w // 2.2, 2)
+            pygame.draw.circle(surface, (34, 100, 34), (x + w // 2, canopy_y), w // 2.2)
+            pygame.draw.circle(surface, (40, 110, 40), (x + w // 2 - w // 4, canopy_y + 8), w // 3.5)
+            pygame.draw.circle(surface, (40, 110, 40), (x + w // 2 + w // 4, canopy_y + 8), w // 3.5)
+            pygame.draw.circle(surface, BLACK, (x + w // 2, canopy_y), w // 2.2, 2)
 
         # DONE drawing tree - return so we don't draw buildings
         return
 
     elif world == "village":
         # Draw village houses - use regular coordinates
-        x, y, w, h = building["x"], building["y"], building["w"], building["h"]
+        x, y, w, h = building.x, building.y, building.w, building.h
 
-        if building.get("is_boss"):
+        if building.is_boss:
             # Boss house - large brown house with red roof and details
             house_body_y = y + h // 3
             house_body_h = h * 2 // 3
 
             # Main house body with shading
-            pygame.draw.rect(screen, (139, 69, 19), (x, house_body_y, w, house_body_h))
+            pygame.draw.rect(surface, (139, 69, 19), (x, house_body_y, w, house_body_h))
             # Add darker left side for depth
-            pygame.draw.rect(screen, (100, 50, 10), (x, house_body_y, 8, house_body_h))
+            pygame.draw.rect(surface, (100, 50, 10), (x, house_body_y, 8, house_body_h))
             # Add lighter right side for depth
-            pygame.draw.rect(screen, (160, 85, 30), (x + w - 8, house_body_y, 8, house_body_h))
+            pygame.draw.rect(surface, (160, 85, 30), (x + w - 8, house_body_y, 8, house_body_h))
 
             # Red triangular roof with shading
             roof_points = [(x - 10, house_body_y), (x + w // 2, y), (x + w + 10, house_body_y)]
-            pygame.draw.polygon(screen, (180, 0, 0), roof_points)
+            pygame.draw.polygon(surface, (180, 0, 0), roof_points)
             # Roof ridge detail
-            pygame.draw.line(screen, (120, 0, 0), (x + w // 2, y), (x + w // 2, house_body_y), 3)
-            pygame.draw.polygon(screen, BLACK, roof_points, 3)
+            pygame.draw.line(surface, (120, 0, 0), (x + w // 2, y), (x + w // 2, house_body_y), 3)
+            pygame.draw.polygon(surface, BLACK, roof_points, 3)
 
             # Chimney
-            pygame.draw.rect(screen, (139, 69, 19), (x + w - 20, y + 20, 15, 30))
-            pygame.draw.rect(screen, BLACK, (x + w - 20, y + 20, 15, 30), 2)
-            pygame.draw.rect(screen, (80, 40, 10), (x + w - 18, y + 18, 11, 8))  # Chimney cap
+            pygame.draw.rect(surface, (139, 69, 19), (x + w - 20, y + 20, 15, 30))
+            pygame.draw.rect(surface, BLACK, (x + w - 20, y + 20, 15, 30), 2)
+            pygame.draw.rect(surface, (80, 40, 10), (x + w - 18, y + 18, 11, 8))  # Chimney cap
 
             # Door with details
             door_x = x + w // 2 - 15
             door_y = y + h - 50
-            pygame.draw.rect(screen, (101, 67, 33), (door_x, door_y, 30, 50))
-            pygame.draw.rect(screen, BLACK, (door_x, door_y, 30, 50), 2)
+            pygame.draw.rect(surface, (101, 67, 33), (door_x, door_y, 30, 50))
+            pygame.draw.rect(surface, BLACK, (door_x, door_y, 30, 50), 2)
             # Door panels
-            pygame.draw.rect(screen, (80, 50, 20), (door_x + 3, door_y + 3, 11, 20))
-            pygame.draw.rect(screen, (80, 50, 20), (door_x + 16, door_y + 3, 11, 20))
-            pygame.draw.rect(screen, (80, 50, 20), (door_x + 3, door_y + 27, 11, 20))
-            pygame.draw.rect(screen, (80, 50, 20), (door_x + 16, door_y + 27, 11, 20))
+            pygame.draw.rect(surface, (80, 50, 20), (door_x + 3, door_y + 3, 11, 20))
+            pygame.draw.rect(surface, (80, 50, 20), (door_x + 16, door_y + 3, 11, 20))
+            pygame.draw.rect(surface, (80, 50, 20), (door_x + 3, door_y + 27, 11, 20))
+            pygame.draw.rect(surface, (80, 50, 20), (door_x + 16, door_y + 27, 11, 20))
             # Doorknob
-            pygame.draw.circle(screen, (212, 175, 55), (door_x + 24, door_y + 30), 3)
+            pygame.draw.circle(surface, (212, 175, 55), (door_x + 24, door_y + 30), 3)
 
             # Windows with frames
             for row in range(2):
@@ -535,75 +382,75 @@ def draw_building(building, world="city"):
                     wx = x + 15 + col * 50
                     wy = house_body_y + 30 + row * 40
                     # Window with yellow glow
-                    pygame.draw.rect(screen, (255, 255, 200), (wx, wy, 25, 25))
-                    pygame.draw.rect(screen, (139, 69, 19), (wx - 2, wy - 2, 29, 29), 2)  # Frame
-                    pygame.draw.rect(screen, BLACK, (wx, wy, 25, 25), 2)
+                    pygame.draw.rect(surface, (255, 255, 200), (wx, wy, 25, 25))
+                    pygame.draw.rect(surface, (139, 69, 19), (wx - 2, wy - 2, 29, 29), 2)  # Frame
+                    pygame.draw.rect(surface, BLACK, (wx, wy, 25, 25), 2)
                     # Window panes
-                    pygame.draw.line(screen, (139, 69, 19), (wx + 12, wy), (wx + 12, wy + 25), 2)
-                    pygame.draw.line(screen, (139, 69, 19), (wx, wy + 12), (wx + 25, wy + 12), 2)
+                    pygame.draw.line(surface, (139, 69, 19), (wx + 12, wy), (wx + 12, wy + 25), 2)
+                    pygame.draw.line(surface, (139, 69, 19), (wx, wy + 12), (wx + 25, wy + 12), 2)
             # Outline
-            pygame.draw.rect(screen, BLACK, (x, house_body_y, w, house_body_h), 3)
+            pygame.draw.rect(surface, BLACK, (x, house_body_y, w, house_body_h), 3)
         else:
             # Regular house - smaller brown house with red roof and details
             house_body_y = y + h // 3
             house_body_h = h * 2 // 3
 
             # Main house body with shading
-            pygame.draw.rect(screen, (160, 82, 45), (x, house_body_y, w, house_body_h))
+            pygame.draw.rect(surface, (160, 82, 45), (x, house_body_y, w, house_body_h))
             # Darker left side
-            pygame.draw.rect(screen, (120, 60, 30), (x, house_body_y, 6, house_body_h))
+            pygame.draw.rect(surface, (120, 60, 30), (x, house_body_y, 6, house_body_h))
             # Lighter right side
-            pygame.draw.rect(screen, (180, 100, 55), (x + w - 6, house_body_y, 6, house_body_h))
+            pygame.draw.rect(surface, (180, 100, 55), (x + w - 6, house_body_y, 6, house_body_h))
 
             # Red triangular roof with ridge
             roof_points = [(x - 8, house_body_y), (x + w // 2, y), (x + w + 8, house_body_y)]
-            pygame.draw.polygon(screen, (200, 50, 50), roof_points)
-            pygame.draw.line(screen, (150, 30, 30), (x + w // 2, y), (x + w // 2, house_body_y), 2)
-            pygame.draw.polygon(screen, BLACK, roof_points, 2)
+            pygame.draw.polygon(surface, (200, 50, 50), roof_points)
+            pygame.draw.line(surface, (150, 30, 30), (x + w // 2, y), (x + w // 2, house_body_y), 2)
+            pygame.draw.polygon(surface, BLACK, roof_points, 2)
 
             # Door with panels
             door_x = x + w // 2 - 12
             door_y = y + h - 40
-            pygame.draw.rect(screen, (101, 67, 33), (door_x, door_y, 24, 40))
-            pygame.draw.rect(screen, BLACK, (door_x, door_y, 24, 40), 2)
+            pygame.draw.rect(surface, (101, 67, 33), (door_x, door_y, 24, 40))
+            pygame.draw.rect(surface, BLACK, (door_x, door_y, 24, 40), 2)
             # Door panels
-            pygame.draw.rect(screen, (80, 50, 20), (door_x + 2, door_y + 2, 9, 16))
-            pygame.draw.rect(screen, (80, 50, 20), (door_x + 13, door_y + 2, 9, 16))
-            pygame.draw.rect(screen, (80, 50, 20), (door_x + 2, door_y + 21, 9, 16))
-            pygame.draw.rect(screen, (80, 50, 20), (door_x + 13, door_y + 21, 9, 16))
+            pygame.draw.rect(surface, (80, 50, 20), (door_x + 2, door_y + 2, 9, 16))
+            pygame.draw.rect(surface, (80, 50, 20), (door_x + 13, door_y + 2, 9, 16))
+            pygame.draw.rect(surface, (80, 50, 20), (door_x + 2, door_y + 21, 9, 16))
+            pygame.draw.rect(surface, (80, 50, 20), (door_x + 13, door_y + 21, 9, 16))
             # Doorknob
-            pygame.draw.circle(screen, (212, 175, 55), (door_x + 19, door_y + 24), 2)
+            pygame.draw.circle(surface, (212, 175, 55), (door_x + 19, door_y + 24), 2)
 
             # Windows with frames and panes
             for col in range(2):
                 wx = x + 12 + col * 35
                 wy = house_body_y + 30
-                pygame.draw.rect(screen, (255, 255, 200), (wx, wy, 20, 20))
-                pygame.draw.rect(screen, (160, 82, 45), (wx - 2, wy - 2, 24, 24), 2)  # Frame
-                pygame.draw.rect(screen, BLACK, (wx, wy, 20, 20), 2)
+                pygame.draw.rect(surface, (255, 255, 200), (wx, wy, 20, 20))
+                pygame.draw.rect(surface, (160, 82, 45), (wx - 2, wy - 2, 24, 24), 2)  # Frame
+                pygame.draw.rect(surface, BLACK, (wx, wy, 20, 20), 2)
                 # Window panes
-                pygame.draw.line(screen, (160, 82, 45), (wx + 10, wy), (wx + 10, wy + 20), 2)
-                pygame.draw.line(screen, (160, 82, 45), (wx, wy + 10), (wx + 20, wy + 10), 2)
+                pygame.draw.line(surface, (160, 82, 45), (wx + 10, wy), (wx + 10, wy + 20), 2)
+                pygame.draw.line(surface, (160, 82, 45), (wx, wy + 10), (wx + 20, wy + 10), 2)
 
             # Outline
-            pygame.draw.rect(screen, BLACK, (x, house_body_y, w, house_body_h), 2)
+            pygame.draw.rect(surface, BLACK, (x, house_body_y, w, house_body_h), 2)
         return
 
     # City buildings - use regular coordinates
-    x, y, w, h = building["x"], building["y"], building["w"], building["h"]
+    x, y, w, h = building.x, building.y, building.w, building.h
 
-    if building.get("is_boss"):
+    if building.is_boss:
         # Boss building - golden skyscraper with extra details
         # Main building body
-        pygame.draw.rect(screen, GOLD, (x, y, w, h))
+        pygame.draw.rect(surface, GOLD, (x, y, w, h))
         # Darker gold accent on sides
-        pygame.draw.rect(screen, (200, 170, 0), (x, y, 8, h))
-        pygame.draw.rect(screen, (200, 170, 0), (x + w - 8, y, 8, h))
+        pygame.draw.rect(surface, (200, 170, 0), (x, y, 8, h))
+        pygame.draw.rect(surface, (200, 170, 0), (x + w - 8, y, 8, h))
 
         # Add decorative horizontal bands every few floors
         for band in range(int(h / 80)):
             band_y = y + 40 + band * 80
-            pygame.draw.rect(screen, (180, 150, 0), (x, band_y, w, 4))
+            pygame.draw.rect(surface, (180, 150, 0), (x, band_y, w, 4))
 
         # Windows pattern for boss
         for row in range(int(h / 25)):
@@ -611,29 +458,29 @@ def draw_building(building, world="city"):
                 win_x = x + 15 + col * 35
                 win_y = y + 15 + row * 25
                 if win_y + 15 < y + h:
-                    pygame.draw.rect(screen, (255, 255, 200), (win_x, win_y, 20, 15))
-                    pygame.draw.rect(screen, BLACK, (win_x, win_y, 20, 15), 1)
+                    pygame.draw.rect(surface, (255, 255, 200), (win_x, win_y, 20, 15))
+                    pygame.draw.rect(surface, BLACK, (win_x, win_y, 20, 15), 1)
                     # Window cross-bars for detail
-                    pygame.draw.line(screen, BLACK, (win_x + 10, win_y), (win_x + 10, win_y + 15), 1)
+                    pygame.draw.line(surface, BLACK, (win_x + 10, win_y), (win_x + 10, win_y + 15), 1)
 
         # Rooftop details - antenna and helipad
         # Antenna
-        pygame.draw.rect(screen, (150, 150, 150), (x + w // 2 - 2, y - 20, 4, 20))
-        pygame.draw.circle(screen, BRIGHT_RED, (int(x + w // 2), int(y - 20)), 4)
+        pygame.draw.rect(surface, (150, 150, 150), (x + w // 2 - 2, y - 20, 4, 20))
+        pygame.draw.circle(surface, BRIGHT_RED, (int(x + w // 2), int(y - 20)), 4)
         # Helipad marking
-        pygame.draw.circle(screen, (200, 180, 0), (int(x + w // 2), int(y + 15)), 12, 2)
+        pygame.draw.circle(surface, (200, 180, 0), (int(x + w // 2), int(y + 15)), 12, 2)
 
         # Building outline
-        pygame.draw.rect(screen, BLACK, (x, y, w, h), 3)
+        pygame.draw.rect(surface, BLACK, (x, y, w, h), 3)
     else:
         # Regular building with more details
         # Main body - gray with slight variation
         base_gray = (120, 120, 120)
-        pygame.draw.rect(screen, base_gray, (x, y, w, h))
+        pygame.draw.rect(surface, base_gray, (x, y, w, h))
         # Darker side for depth
-        pygame.draw.rect(screen, (80, 80, 80), (x, y, 6, h))
+        pygame.draw.rect(surface, (80, 80, 80), (x, y, 6, h))
         # Lighter highlight on other side
-        pygame.draw.rect(screen, (140, 140, 140), (x + w - 6, y, 6, h))
+        pygame.draw.rect(surface, (140, 140, 140), (x + w - 6, y, 6, h))
 
         # Windows pattern with more detail
         for row in range(int(h / 20)):
@@ -642,26 +489,76 @@ def draw_building(building, world="city"):
                 win_y = y + 10 + row * 20
                 if win_y + 12 < y + h:
                     # Lit window with gradient
-                    pygame.draw.rect(screen, (255, 255, 150), (win_x, win_y, 18, 12))
-                    pygame.draw.rect(screen, (60, 60, 60), (win_x, win_y, 18, 12), 1)
+                    pygame.draw.rect(surface, (255, 255, 150), (win_x, win_y, 18, 12))
+                    pygame.draw.rect(surface, (60, 60, 60), (win_x, win_y, 18, 12), 1)
                     # Window frame cross
-                    pygame.draw.line(screen, (60, 60, 60), (win_x + 9, win_y), (win_x + 9, win_y + 12), 1)
-                    pygame.draw.line(screen, (60, 60, 60), (win_x, win_y + 6), (win_x + 18, win_y + 6), 1)
+                    pygame.draw.line(surface, (60, 60, 60), (win_x + 9, win_y), (win_x + 9, win_y + 12), 1)
+                    pygame.draw.line(surface, (60, 60, 60), (win_x, win_y + 6), (win_x + 18, win_y + 6), 1)
 
         # Rooftop AC unit
         if h > 100:
-            pygame.draw.rect(screen, (100, 100, 100), (x + w // 2 - 8, y + 5, 16, 12))
-            pygame.draw.rect(screen, BLACK, (x + w // 2 - 8, y + 5, 16, 12), 1)
+            pygame.draw.rect(surface, (100, 100, 100), (x + w // 2 - 8, y + 5, 16, 12))
+            pygame.draw.rect(surface, BLACK, (x + w // 2 - 8, y + 5, 16, 12), 1)
             # AC vent lines
             for vent_line in range(3):
                 vent_y = y + 7 + vent_line * 3
-                pygame.draw.line(screen, (70, 70, 70), (x + w // 2 - 6, vent_y), (x + w // 2 + 6, vent_y), 1)
+                pygame.draw.line(surface, (70, 70, 70), (x + w // 2 - 6, vent_y), (x + w // 2 + 6, vent_y), 1)
 
         # Building outline
-        pygame.draw.rect(screen, BLACK, (x, y, w, h), 2)
+        pygame.draw.rect(surface, BLACK, (x, y, w, h), 2)
+
+# Building sprite cache - buildings never change shape while alive, so each one is
+# rendered once into its own sprite and dropped again when it is destroyed
+building_sprites = {}  # id(building) -> (building, world, sprite, blit position)
+BUILDING_SPRITE_PADDING = 30  # Room for roofs, antennas and canopies outside the hit box
 
-def draw_village_background():
-    """Draw a village countryside background"""
+def make_building_sprite(building, world):
+    """Render one building into a transparent sprite and return its cache entry"""
+    if world == "forest" and building.visual_x is not None:
+        x, y, w, h = building.visual_x, building.visual_y, building.visual_w, building.visual_h
+    else:
+        x, y, w, h = building.x, building.y, building.w, building.h
+    left = int(x) - BUILDING_SPRITE_PADDING
+    top = int(y) - BUILDING_SPRITE_PADDING
+    sprite = pygame.Surface((int(w) + BUILDING_SPRITE_PADDING * 2, int(h) + BUILDING_SPRITE_PADDING * 2), pygame.SRCALPHA)
+
+    # Draw a copy of the building shifted into sprite coordinates
+    local = copy.copy(building)
+    local.x = building.x - left
+    local.y = building.y - top
+    if building.visual_x is not None:
+        local.visual_x = building.visual_x - left
+        local.visual_y = building.visual_y - top
+    render_building(sprite, local, world)
+    return (building, world, sprite.convert_alpha(), (left, top))
+
+def prerender_buildings(bldgs, world):
+    """Render the sprites for a freshly created level (replaces the previous level's sprites)"""
+    building_sprites.clear()
+    for building in bldgs:
+        if building.alive:
+            building_sprites[id(building)] = make_building_sprite(building, world)
+
+def drop_building_sprite(building):
+    """Forget a building's sprite once it has been destroyed"""
+    building_sprites.pop(id(building), None)
+
+def draw_building(building, world="city", surface=None):
+    """Draw a building with windows and details (blits its cached sprite, onto the screen by default)"""
+    if not building.alive:
+        drop_building_sprite(building)
+        return
+    if surface is None:
+        surface = screen
+
+    entry = building_sprites.get(id(building))
+    if entry is None or entry[0] is not building or entry[1] != world:
+        entry = make_building_sprite(building, world)
+        building_sprites[id(building)] = entry
+    surface.blit(entry[2], entry[3])
+
+def draw_village_background(surface):
+    """Draw a village countryside background onto the given surface"""
     # Sky gradient - warmer colors
     sky_top = (135, 180, 235)  # Slightly darker blue
     sky_bottom = (200, 220, 255)  # Lighter blue
@@ -670,49 +567,49 @@ def draw_village_background():
         r = int(sky_top[0] + (sky_bottom[0] - sky_top[0]) * ratio)
         g = int(sky_top[1] + (sky_bottom[1] - sky_top[1]) * ratio)
         b = int(sky_top[2] + (sky_bottom[2] - sky_top[2]) * ratio)
-        pygame.draw.line(screen, (r, g, b), (0, i), (WIDTH, i))
+        pygame.draw.line(surface, (r, g, b), (0, i), (WIDTH, i))
 
     # Draw distant rolling hills
     hill_positions = [(150, HEIGHT // 2 - 20), (400, HEIGHT // 2 - 30), (650, HEIGHT // 2 - 15)]
     for hx, hy in hill_positions:
         # Create hill using ellipse
         hill_rect = pygame.Rect(hx - 100, hy, 200, 80)
-        pygame.draw.ellipse(screen, (50, 150, 50), hill_rect)
-        pygame.draw.ellipse(screen, (40, 120, 40), hill_rect, 2)
+        pygame.draw.ellipse(surface, (50, 150, 50), hill_rect)
+        pygame.draw.ellipse(surface, (40, 120, 40), hill_rect, 2)
 
     # Green grass ground
-    pygame.draw.rect(screen, (34, 139, 34), (0, HEIGHT // 2, WIDTH, HEIGHT // 2))
+    pygame.draw.rect(surface, (34, 139, 34), (0, HEIGHT // 2, WIDTH, HEIGHT // 2))
 
     # Add patches of darker grass for texture
     grass_patches = [(50, HEIGHT // 2 + 30), (250, HEIGHT // 2 + 50), (450, HEIGHT // 2 + 40),
                      (650, HEIGHT // 2 + 60), (750, HEIGHT // 2 + 35)]
     for gx, gy in grass_patches:
-        pygame.draw.ellipse(screen, (30, 120, 30), (gx, gy, 80, 30))
+        pygame.draw.ellipse(surface, (30, 120, 30), (gx, gy, 80, 30))
 
     # Draw a white picket fence in the background
     fence_y = HEIGHT // 2 + 20
     for fx in range(0, WIDTH, 30):
         # Fence post
-        pygame.draw.rect(screen, (245, 245, 245), (fx, fence_y, 8, 40))
-        pygame.draw.rect(screen, (200, 200, 200), (fx, fence_y, 8, 40), 1)
+        pygame.draw.rect(surface, (245, 245, 245), (fx, fence_y, 8, 40))
+        pygame.draw.rect(surface, (200, 200, 200), (fx, fence_y, 8, 40), 1)
         # Pointed top
         fence_top = [(fx, fence_y), (fx + 4, fence_y - 8), (fx + 8, fence_y)]
-        pygame.draw.polygon(screen, (245, 245, 245), fence_top)
-        pygame.draw.polygon(screen, (200, 200, 200), fence_top, 1)
+        pygame.draw.polygon(surface, (245, 245, 245), fence_top)
+        pygame.draw.polygon(surface, (200, 200, 200), fence_top, 1)
     # Horizontal fence bars
-    pygame.draw.rect(screen, (245, 245, 245), (0, fence_y + 10, WIDTH, 5))
-    pygame.draw.rect(screen, (245, 245, 245), (0, fence_y + 25, WIDTH, 5))
+    pygame.draw.rect(surface, (245, 245, 245), (0, fence_y + 10, WIDTH, 5))
+    pygame.draw.rect(surface, (245, 245, 245), (0, fence_y + 25, WIDTH, 5))
 
     # Draw simple background trees/bushes
     tree_positions = [(100, 300), (200, 320), (600, 310), (700, 295)]
     for tx, ty in tree_positions:
         # Tree trunk
-        pygame.draw.rect(screen, (101, 67, 33), (tx - 5, ty, 10, 40))
+        pygame.draw.rect(surface, (101, 67, 33), (tx - 5, ty, 10, 40))
         # Tree top (multiple circles for fuller look)
-        pygame.draw.circle(screen, (34, 100, 34), (tx, ty - 10), 25)
-        pygame.draw.circle(screen, (40, 110, 40), (tx - 12, ty - 5), 18)
-        pygame.draw.circle(screen, (40, 110, 40), (tx + 12, ty - 5), 18)
-        pygame.draw.circle(screen, BLACK, (tx, ty - 10), 25, 1)
+        pygame.draw.circle(surface, (34, 100, 34), (tx, ty - 10), 25)
+        pygame.draw.circle(surface, (40, 110, 40), (tx - 12, ty - 5), 18)
+        pygame.draw.circle(surface, (40, 110, 40), (tx + 12, ty - 5), 18)
+        pygame.draw.circle(surface, BLACK, (tx, ty - 10), 25, 1)
 
     # Add colorful flowers scattered in the grass
     flower_positions = [(150, HEIGHT // 2 + 80), (280, HEIGHT // 2 + 100), (420, HEIGHT // 2 + 90),
@@ -720,20 +617,20 @@ def draw_village_background():
     flower_colors = [(255, 100, 150), (255, 200, 50), (150, 100, 255), (255, 150, 100), (100, 200, 255)]
     for i, (fx, fy) in enumerate(flower_positions):
         # Stem
-        pygame.draw.line(screen, (50, 150, 50), (fx, fy), (fx, fy + 15), 2)
+        pygame.draw.line(surface, (50, 150, 50), (fx, fy), (fx, fy + 15), 2)
         # Flower petals (5 petals around center)
         petal_color = flower_colors[i % len(flower_colors)]
         for angle in range(0, 360, 72):
             rad = math.radians(angle)
             px = fx + int(6 * math.cos(rad))
             py = fy + int(6 * math.sin(rad))
-            pygame.draw.circle(screen, petal_color, (px, py), 4)
+            pygame.draw.circle(surface, petal_color, (px, py), 4)
         # Flower center
-        pygame.draw.circle(screen, (255, 220, 50), (fx, fy), 3)
-        pygame.draw.circle(screen, BLACK, (fx, fy), 3, 1)
+        pygame.draw.circle(surface, (255, 220, 50), (fx, fy), 3)
+        pygame.draw.circle(surface, BLACK, (fx, fy), 3, 1)
 
-def draw_forest_background():
-    """Draw a dense forest background"""
+def draw_forest_background(surface):
+    """Draw a dense forest background onto the given surface"""
     # Sky gradient - slightly greenish
     sky_top = (120, 160, 200)  # Greenish blue
     sky_bottom = (180, 210, 230)  # Lighter blue
@@ -742,40 +639,40 @@ def draw_forest_background():
         r = int(sky_top[0] + (sky_bottom[0] - sky_top[0]) * ratio)
         g = int(sky_top[1] + (sky_bottom[1] - sky_top[1]) * ratio)
         b = int(sky_top[2] + (sky_bottom[2] - sky_top[2]) * ratio)
-        pygame.draw.line(screen, (r, g, b), (0, i), (WIDTH, i))
+        pygame.draw.line(surface, (r, g, b), (0, i), (WIDTH, i))
 
     # Dark forest green ground
-    pygame.draw.rect(screen, (20, 80, 20), (0, HEIGHT // 2, WIDTH, HEIGHT // 2))
+    pygame.draw.rect(surface, (20, 80, 20), (0, HEIGHT // 2, WIDTH, HEIGHT // 2))
 
     # Add moss and forest floor texture
     moss_patches = [(80, HEIGHT // 2 + 20), (200, HEIGHT // 2 + 40), (350, HEIGHT // 2 + 30),
                     (500, HEIGHT // 2 + 50), (650, HEIGHT // 2 + 25), (750, HEIGHT // 2 + 45)]
     for mx, my in moss_patches:
-        pygame.draw.ellipse(screen, (15, 60, 15), (mx, my, 90, 35))
+        pygame.draw.ellipse(surface, (15, 60, 15), (mx, my, 90, 35))
 
     # Draw background trees (distant forest)
     bg_tree_positions = [(120, 280), (250, 290), (400, 275), (550, 285), (680, 270)]
     for tx, ty in bg_tree_positions:
         # Tree trunk
-        pygame.draw.rect(screen, (80, 50, 20), (tx - 8, ty, 16, 60))
+        pygame.draw.rect(surface, (80, 50, 20), (tx - 8, ty, 16, 60))
         # Tree canopy (layered circles for dense foliage)
-        pygame.draw.circle(screen, (30, 90, 30), (tx, ty - 10), 35)
-        pygame.draw.circle(screen, (35, 100, 35), (tx - 20, ty), 25)
-        pygame.draw.circle(screen, (35, 100, 35), (tx + 20, ty), 25)
-        pygame.draw.circle(screen, (40, 110, 40), (tx, ty + 10), 20)
-        pygame.draw.circle(screen, BLACK, (tx, ty - 10), 35, 1)
+        pygame.draw.circle(surface, (30, 90, 30), (tx, ty - 10), 35)
+        pygame.draw.circle(surface, (35, 100, 35), (tx - 20, ty), 25)
+        pygame.draw.circle(surface, (35, 100, 35), (tx + 20, ty), 25)
+        pygame.draw.circle(surface, (40, 110, 40), (tx, ty + 10), 20)
+        pygame.draw.circle(surface, BLACK, (tx, ty - 10), 35, 1)
 
     # Add some bushes on the ground
     bush_positions = [(150, HEIGHT // 2 + 70), (350, HEIGHT // 2 + 80), (600, HEIGHT // 2 + 75)]
     for bx, by in bush_positions:
         # Bush (cluster of circles)
-        pygame.draw.circle(screen, (25, 90, 25), (bx, by), 20)
-        pygame.draw.circle(screen, (25, 90, 25), (bx - 15, by + 5), 15)
-        pygame.draw.circle(screen, (25, 90, 25), (bx + 15, by + 5), 15)
-        pygame.draw.circle(screen, BLACK, (bx, by), 20, 1)
+        pygame.draw.circle(surface, (25, 90, 25), (bx, by), 20)
+        pygame.draw.circle(surface, (25, 90, 25), (bx - 15, by + 5), 15)
+        pygame.draw.circle(surface, (25, 90, 25), (bx + 15, by + 5), 15)
+        pygame.draw.circle(surface, BLACK, (bx, by), 20, 1)
 
-def draw_city_background():
-    """Draw a city skyline background"""
+def draw_city_background(surface):
+    """Draw a city skyline background onto the given surface"""
     # Sky gradient (simplified)
     sky_top = (135, 206, 235)  # Light blue
     sky_bottom = (200, 230, 255)  # Lighter blue
@@ -784,10 +681,10 @@ def draw_city_background():
         r = int(sky_top[0] + (sky_bottom[0] - sky_top[0]) * ratio)
         g = int(sky_top[1] + (sky_bottom[1] - sky_top[1]) * ratio)
         b = int(sky_top[2] + (sky_bottom[2] - sky_top[2]) * ratio)
-        pygame.draw.line(screen, (r, g, b), (0, i), (WIDTH, i))
+        pygame.draw.line(surface, (r, g, b), (0, i), (WIDTH, i))
 
     # Ground - lighter gray
-    pygame.draw.rect(screen, (160, 160, 160), (0, HEIGHT // 2, WIDTH, HEIGHT // 2))
+    pygame.draw.rect(surface, (160, 160, 160), (0, HEIGHT // 2, WIDTH, HEIGHT // 2))
 
     # Background buildings (distant)
     bg_buildings = [
@@ -800,17 +697,40 @@ def draw_city_background():
 
     for bx, by, bw, bh in bg_buildings:
         # Building body
-        pygame.draw.rect(screen, (90, 90, 110), (bx, by, bw, bh))
+        pygame.draw.rect(surface, (90, 90, 110), (bx, by, bw, bh))
         # Simple windows
         for row in range(int(bh / 25)):
             for col in range(2):
                 win_x = bx + 8 + col * 25
                 win_y = by + 10 + row * 25
                 if win_y + 8 < by + bh:
-                    pygame.draw.rect(screen, (180, 180, 100), (win_x, win_y, 15, 8))
+                    pygame.draw.rect(surface, (180, 180, 100), (win_x, win_y, 15, 8))
+
+# Background cache - the world background never changes during a level, so it is
+# drawn once into an off-screen Surface and blitted every frame after that
+background_cache = {"key": None, "surface": None}
+
+def get_world_background(world):
+    """Return the pre-rendered background for a world, rebuilding it only when the world or screen size changes"""
+    key = (world, WIDTH, HEIGHT)
+    if background_cache["key"] != key:
+        surface = pygame.Surface((WIDTH, HEIGHT)).convert()
+        if world == "village":
+            draw_village_background(surface)
+        elif world == "forest":
+            draw_forest_background(surface)
+        else:
+            draw_city_background(surface)
+        background_cache["key"] = key
+        background_cache["surface"] = surface
+    return background_cache["surface"]
 
-def draw_blob_with_cape(x, y, radius, color):
-    """Draw the Super Blob with a flowing cape"""
+def draw_world_background(world):
+    """Draw the cached world background with a single blit"""
+    screen.blit(get_world_background(world), (0, 0))
+
+def render_blob_with_cape(surface, x, y, radius, color):
+    """Draw the Super Blob with a flowing cape onto the given surface"""
 
     # Long blonde hair for Green Blob (drawn behind the body)
     if color == GREEN:
@@ -823,8 +743,8 @@ def draw_blob_with_cape(x, y, radius, color):
             (x - radius * 1.2, y + radius * 1.1),
             (x - radius * 0.7, y + radius * 0.6),
         ]
-        pygame.draw.polygon(screen, hair_color, left_hair)
-        pygame.draw.polygon(screen, BLACK, left_hair, 3)
+        pygame.draw.polygon(surface, hair_color, left_hair)
+        pygame.draw.polygon(surface, BLACK, left_hair, 3)
 
         # Right side long hair - made wider and longer
         right_hair = [
@@ -834,8 +754,8 @@ def draw_blob_with_cape(x, y, radius, color):
             (x + radius * 1.2, y + radius * 1.1),
             (x + radius * 0.7, y + radius * 0.6),
         ]
-        pygame.draw.polygon(screen, hair_color, right_hair)
-        pygame.draw.polygon(screen, BLACK, right_hair, 3)
+        pygame.draw.polygon(surface, hair_color, right_hair)
+        pygame.draw.polygon(surface, BLACK, right_hair, 3)
 
         # Top hair - made taller and wider
         top_hair = [
@@ -845,39 +765,39 @@ def draw_blob_with_cape(x, y, radius, color):
             (x + radius * 0.6, y - radius * 0.7),
             (x - radius * 0.6, y - radius * 0.7),
         ]
-        pygame.draw.polygon(screen, hair_color, top_hair)
-        pygame.draw.polygon(screen, BLACK, top_hair, 3)
+        pygame.draw.polygon(surface, hair_color, top_hair)
+        pygame.draw.polygon(surface, BLACK, top_hair, 3)
 
     # Short messy black hair for Purple Blob (drawn behind the body, but bangs drawn after body)
     elif color == PURPLE:
         hair_color = (30, 30, 30)  # Black hair
         # Draw multiple spiky tufts for messy hair (back layer)
         # Left tuft
-        pygame.draw.polygon(screen, hair_color, [
+        pygame.draw.polygon(surface, hair_color, [
             (x - radius * 0.6, y - radius * 0.7),
             (x - radius * 0.8, y - radius * 1.0),
             (x - radius * 0.4, y - radius * 0.8)
         ])
         # Center-left tuft
-        pygame.draw.polygon(screen, hair_color, [
+        pygame.draw.polygon(surface, hair_color, [
             (x - radius * 0.3, y - radius * 0.8),
             (x - radius * 0.3, y - radius * 1.1),
             (x - radius * 0.1, y - radius * 0.8)
         ])
         # Center tuft
-        pygame.draw.polygon(screen, hair_color, [
+        pygame.draw.polygon(surface, hair_color, [
             (x - radius * 0.1, y - radius * 0.8),
             (x, y - radius * 1.2),
             (x + radius * 0.1, y - radius * 0.8)
         ])
         # Center-right tuft
-        pygame.draw.polygon(screen, hair_color, [
+        pygame.draw.polygon(surface, hair_color, [
             (x + radius * 0.1, y - radius * 0.8),
             (x + radius * 0.3, y - radius * 1.1),
             (x + radius * 0.3, y - radius * 0.8)
         ])
         # Right tuft
-        pygame.draw.polygon(screen, hair_color, [
+        pygame.draw.polygon(surface, hair_color, [
             (x + radius * 0.4, y - radius * 0.8),
             (x + radius * 0.8, y - radius * 1.0),
             (x + radius * 0.6, y - radius * 0.7)
@@ -890,7 +810,7 @@ def draw_blob_with_cape(x, y, radius, color):
             [(x + radius * 0.1, y - radius * 0.8), (x + radius * 0.3, y - radius * 1.1), (x + radius * 0.3, y - radius * 0.8)],
             [(x + radius * 0.4, y - radius * 0.8), (x + radius * 0.8, y - radius * 1.0), (x + radius * 0.6, y - radius * 0.7)]
         ]:
-            pygame.draw.polygon(screen, BLACK, tuft, 2)
+            pygame.draw.polygon(surface, BLACK, tuft, 2)
 
     # Orange curly hair for Richard (gray blob with orange hair)
     elif color == (180, 180, 182):  # Richard's gray color
@@ -906,8 +826,8 @@ def draw_blob_with_cape(x, y, radius, color):
             (x + radius * 0.7, y - radius * 0.8, radius * 0.3),
         ]
         for curl_x, curl_y, curl_r in curl_positions:
-            pygame.draw.circle(screen, hair_color, (int(curl_x), int(curl_y)), int(curl_r))
-            pygame.draw.circle(screen, BLACK, (int(curl_x), int(curl_y)), int(curl_r), 2)
+            pygame.draw.circle(surface, hair_color, (int(curl_x), int(curl_y)), int(curl_r))
+            pygame.draw.circle(surface, BLACK, (int(curl_x), int(curl_y)), int(curl_r), 2)
 
         # Side curls
         left_curls = [
@@ -921,8 +841,8 @@ def draw_blob_with_cape(x, y, radius, color):
             (x + radius * 0.95, y, radius * 0.25),
         ]
         for curl_x, curl_y, curl_r in left_curls + right_curls:
-            pygame.draw.circle(screen, hair_color, (int(curl_x), int(curl_y)), int(curl_r))
-            pygame.draw.circle(screen, BLACK, (int(curl_x), int(curl_y)), int(curl_r), 2)
+            pygame.draw.circle(surface, hair_color, (int(curl_x), int(curl_y)), int(curl_r))
+            pygame.draw.circle(surface, BLACK, (int(curl_x), int(curl_y)), int(curl_r), 2)
 
     # Cape for non-Green, non-Purple, non-Orange blobs (drawn behind the blob)
     elif color != GREEN and color != PURPLE and color != (180, 180, 182):
@@ -943,20 +863,20 @@ def draw_blob_with_cape(x, y, radius, color):
         else:
             cape_color = (100, 100, 100)
 
-        pygame.draw.polygon(screen, cape_color, cape_points)
-        pygame.draw.polygon(screen, BLACK, cape_points, 2)
+        pygame.draw.polygon(surface, cape_color, cape_points)
+        pygame.draw.polygon(surface, BLACK, cape_points, 2)
 
         # Draw "SB" letters on cape for Blue Blob (Super Blob)
         if color == BLUE and radius >= 20:
             # Position SB letters in center of cape
             letter_y = int(y + radius * 0.8)
-            letter_font = pygame.font.Font(None, max(int(radius * 0.8), 20))
-            sb_text = letter_font.render("SB", True, RED)
-            screen.blit(sb_text, (int(x - sb_text.get_width() // 2), letter_y - sb_text.get_height() // 2))
+            letter_font = get_font(max(int(radius * 0.8), 20))
+            sb_text = render_text(letter_font, "SB", True, RED)
+            surface.blit(sb_text, (int(x - sb_text.get_width() // 2), letter_y - sb_text.get_height() // 2))
 
     # Main blob body
-    pygame.draw.circle(screen, color, (int(x), int(y)), radius)
-    pygame.draw.circle(screen, BLACK, (int(x), int(y)), radius, 2)
+    pygame.draw.circle(surface, color, (int(x), int(y)), radius)
+    pygame.draw.circle(surface, BLACK, (int(x), int(y)), radius, 2)
 
     # Face mask for Blue Blob (Super Blob)
     if color == BLUE:
@@ -965,183 +885,1685 @@ def draw_blob_with_cape(x, y, radius, color):
         mask_height = int(radius * 0.4)
         mask_rect = pygame.Rect(int(x - radius * 0.6), mask_y - mask_height // 2,
                                 int(radius * 1.2), mask_height)
-        pygame.draw.ellipse(screen, (255, 140, 0), mask_rect)
-        pygame.draw.ellipse(screen, BLACK, mask_rect, 2)
+        pygame.draw.ellipse(surface, (255, 140, 0), mask_rect)
+        pygame.draw.ellipse(surface, BLACK, mask_rect, 2)
 
         # Eyes with white circles and black pupils (like mini blobs in comic)
         eye_y = mask_y
         eye_size = max(3, int(radius * 0.18))
         pupil_size = max(2, int(radius * 0.12))
         # Left eye
-        pygame.draw.circle(screen, WHITE, (int(x - radius * 0.3), eye_y), eye_size)
-        pygame.draw.circle(screen, BLACK, (int(x - radius * 0.3), eye_y), pupil_size)
+        pygame.draw.circle(surface, WHITE, (int(x - radius * 0.3), eye_y), eye_size)
+        pygame.draw.circle(surface, BLACK, (int(x - radius * 0.3), eye_y), pupil_size)
         # Right eye
-        pygame.draw.circle(screen, WHITE, (int(x + radius * 0.3), eye_y), eye_size)
-        pygame.draw.circle(screen, BLACK, (int(x + radius * 0.3), eye_y), pupil_size)
+        pygame.draw.circle(surface, WHITE, (int(x + radius * 0.3), eye_y), eye_size)
+        pygame.draw.circle(surface, BLACK, (int(x + radius * 0.3), eye_y), pupil_size)
     elif color == RED:
         # Draw dark green rectangular mask across eyes (like Super Blob but square and green)
         mask_y = int(y - radius * 0.2)
         mask_height = int(radius * 0.4)
         mask_rect = pygame.Rect(int(x - radius * 0.6), mask_y - mask_height // 2,
                                 int(radius * 1.2), mask_height)
-        pygame.draw.rect(screen, (0, 100, 0), mask_rect)  # Dark green
-        pygame.draw.rect(screen, BLACK, mask_rect, 2)
+        pygame.draw.rect(surface, (0, 100, 0), mask_rect)  # Dark green
+        pygame.draw.rect(surface, BLACK, mask_rect, 2)
 
         # Eyes with white circles and black pupils (like mini blobs in comic)
         eye_y = mask_y
         eye_size = max(3, int(radius * 0.18))
         pupil_size = max(2, int(radius * 0.12))
         # Left eye
-        pygame.draw.circle(screen, WHITE, (int(x - radius * 0.3), eye_y), eye_size)
-        pygame.draw.circle(screen, BLACK, (int(x - radius * 0.3), eye_y), pupil_size)
+        pygame.draw.circle(surface, WHITE, (int(x - radius * 0.3), eye_y), eye_size)
+        pygame.draw.circle(surface, BLACK, (int(x - radius * 0.3), eye_y), pupil_size)
         # Right eye
-        pygame.draw.circle(screen, WHITE, (int(x + radius * 0.3), eye_y), eye_size)
-        pygame.draw.circle(screen, BLACK, (int(x + radius * 0.3), eye_y), pupil_size)
+        pygame.draw.circle(surface, WHITE, (int(x + radius * 0.3), eye_y), eye_size)
+        pygame.draw.circle(surface, BLACK, (int(x + radius * 0.3), eye_y), pupil_size)
     else:
         # Eyes with white circles and black pupils (like mini blobs in comic)
         eye_y = int(y - radius * 0.2)
         eye_size = max(3, int(radius * 0.18))
         pupil_size = max(2, int(radius * 0.12))
         # Left eye
-        pygame.draw.circle(screen, WHITE, (int(x - radius * 0.3), eye_y), eye_size)
-        pygame.draw.circle(screen, BLACK, (int(x - radius * 0.3), eye_y), pupil_size)
+        pygame.draw.circle(surface, WHITE, (int(x - radius * 0.3), eye_y), eye_size)
+        pygame.draw.circle(surface, BLACK, (int(x - radius * 0.3), eye_y), pupil_size)
         # Right eye
-        pygame.draw.circle(screen, WHITE, (int(x + radius * 0.3), eye_y), eye_size)
-        pygame.draw.circle(screen, BLACK, (int(x + radius * 0.3), eye_y), pupil_size)
+        pygame.draw.circle(surface, WHITE, (int(x + radius * 0.3), eye_y), eye_size)
+        pygame.draw.circle(surface, BLACK, (int(x + radius * 0.3), eye_y), pupil_size)
 
         # Glasses for Orange Blob (Richard)
         if color == (180, 180, 182):  # Orange Blob's gray color
             glasses_color = (50, 50, 50)  # Dark gray/black frames
             # Left lens (circle)
-            pygame.draw.circle(screen, glasses_color, (int(x - radius * 0.3), eye_y), int(eye_size * 1.4), 2)
+            pygame.draw.circle(surface, glasses_color, (int(x - radius * 0.3), eye_y), int(eye_size * 1.4), 2)
             # Right lens (circle)
-            pygame.draw.circle(screen, glasses_color, (int(x + radius * 0.3), eye_y), int(eye_size * 1.4), 2)
+            pygame.draw.circle(surface, glasses_color, (int(x + radius * 0.3), eye_y), int(eye_size * 1.4), 2)
             # Bridge connecting the lenses
-            pygame.draw.line(screen, glasses_color,
+            pygame.draw.line(surface, glasses_color,
                            (int(x - radius * 0.3 + eye_size * 1.4), eye_y),
                            (int(x + radius * 0.3 - eye_size * 1.4), eye_y), 2)
             # Left temple arm
-            pygame.draw.line(screen, glasses_color,
+            pygame.draw.line(surface, glasses_color,
                            (int(x - radius * 0.3 - eye_size * 1.4), eye_y),
                            (int(x - radius * 0.7), eye_y), 2)
             # Right temple arm
-            pygame.draw.line(screen, glasses_color,
+            pygame.draw.line(surface, glasses_color,
                            (int(x + radius * 0.3 + eye_size * 1.4), eye_y),
                            (int(x + radius * 0.7), eye_y), 2)
 
     # No additional hair drawn over eyes for Alex - just the spiky back hair
 
+# Blob sprite cache - characters are pre-rendered once per (color, radius)
+# Color identifies the character, radius only takes a handful of values
+blob_sprite_cache = SurfaceCache(max_entries=48)
+
+def make_blob_sprite(radius, color):
+    """Render a character into its own transparent sprite, centred on the middle pixel"""
+    # Hair curls reach 1.5x radius above and the cape 1.8x radius below the centre
+    half = int(math.ceil(radius * 1.9)) + 4
+    sprite = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+    render_blob_with_cape(sprite, half, half, radius, color)
+    return sprite.convert_alpha()
+
+def draw_blob_with_cape(x, y, radius, color, surface=None):
+    """Draw the Super Blob with a flowing cape (blits a cached sprite, onto the screen by default)"""
+    if surface is None:
+        surface = screen
+    sprite = blob_sprite_cache.get((color, radius), lambda: make_blob_sprite(radius, color))
+    half = sprite.get_width() // 2
+    surface.blit(sprite, (int(x) - half, int(y) - half))
+
+# Gas cloud textures - translucent circles built once per radius and reused every frame
+GAS_CLOUD_RADIUS = 25  # Every village gas cloud has this radius
+GAS_CLOUD_COLOR = (200, 180, 230, 80)
+gas_cloud_textures = {}
+
+def get_gas_cloud_texture(radius):
+    """Return the translucent gas cloud texture for a radius (built on first use)"""
+    texture = gas_cloud_textures.get(radius)
+    if texture is None:
+        texture = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(texture, GAS_CLOUD_COLOR, (radius, radius), radius)
+        gas_cloud_textures[radius] = texture
+    return texture
+
+def prerender_gas_clouds():
+    """Build the gas cloud textures for every size of the villain_intro growth animation"""
+    for radius in range(1, GAS_CLOUD_RADIUS + 1):
+        get_gas_cloud_texture(radius)
+
+def prerender_level():
+    """Build the sprites and textures of the level the simulation just set up"""
+    prerender_buildings(sim.buildings, current_world)
+    if current_world == "village":
+        prerender_gas_clouds()
+
 def retry_level():
     """Retry current level without losing progress"""
-    global power, buildings, mini_blobs, gate, gas_clouds, snakes, max_power
-    global blob_x, blob_y, blob_vel_x, blob_vel_y, flying, dragging, can_catch, collision_cooldown
-    global level, blobs_rescued, blobs_collected_run, blobs_collected_level, blob_radius
+    sim.retry_level(current_world, level, 6 + mini_blob_upgrade_level)
+    prerender_level()
+    leak_detector.check(f"retry_level, {current_world} level {level}")
 
-    # Keep level, blobs_rescued, blobs_collected_run, and blobs_collected_level (for size)
-    # Start at full health (based on blobs collected in this run)
-    max_power = 100 + (blobs_collected_run // 10) * 10
-    power = max_power
+def reset_game(seed=None):
+    """Reset game to initial state (start from level 1) - a new run with the next session seed"""
+    global level, player_color
 
-    buildings = create_level_buildings(level, current_world)
-    mini_blobs = spawn_mini_blobs()
+    if seed is None:
+        seed = session_rng.randrange(2 ** 32)
+    level = 1
+    # Apply selected character stats (with upgrades)
+    char = characters[selected_character]
+    sim.reset_run(current_world, char, 6 + mini_blob_upgrade_level, seed)
+    player_color = char["color"]
+    prerender_level()
+    leak_detector.check(f"reset_game, {current_world}")
+
+# Debris colors by what the piece broke off from
+DEBRIS_COLORS = {
+    "boss": GOLD,
+    "tree": (34, 100, 34),  # Green for forest tree debris
+    "building": (120, 120, 120)  # Gray for regular buildings
+}
 
-    # Spawn gas clouds for village
-    if current_world == "village":
-        gas_clouds = spawn_gas_clouds(level)
-    else:
-        gas_clouds = []
+def render_comic_panel(surface):
+    """Draw the level-complete comic (title, two story panels and the stats panel) onto the given surface"""
+    # Traditional comic book style with multiple panels - rotate designs
+    surface.fill((240, 240, 240))  # Light gray background
 
-    # Spawn snakes for forest
-    if current_world == "forest":
-        snakes = spawn_snakes(buildings, level)
-    else:
-        snakes = []
-
-    # Reset gate
-    gate["open"] = False
-    gate["timer"] = 0
-
-    blob_x, blob_y = 100, 450
-    blob_vel_x, blob_vel_y = 0, 0
-    flying = False
-    dragging = False
-    can_catch = False
-    collision_cooldown = 0
-
-def reset_game():
-    """Reset game to initial state (start from level 1)"""
-    global level, blobs_rescued, blobs_collected_run, blobs_collected_level, power, buildings, mini_blobs, gate, gas_clouds, snakes
-    global blob_x, blob_y, blob_vel_x, blob_vel_y, flying, dragging, can_catch, collision_cooldown
-    global power_drain_rate, bounce_damping, player_color, can_pierce_buildings, has_magnetic_ability
-    global villain_x, villain_y, villain_active, villain_frame, gas_spawn_points
+    # Comic title at top
+    title = render_text(font, "SUPER BLOB", True, BLACK)
+    surface.blit(title, (WIDTH//2 - title.get_width()//2, 20))
 
-    level = 1
-    blobs_collected_run = 0  # Reset run counter (currency stays)
-    blobs_collected_level = 0  # Reset level counter for size
-    power = 100
-    buildings = create_level_buildings(level, current_world)
-    mini_blobs = spawn_mini_blobs()
+    comic_variant = level % 8  # Rotate through 8 different comic styles
 
-    # Spawn gas clouds for village
+    # Different comics for village vs city
     if current_world == "village":
-        gas_clouds = spawn_gas_clouds(level)
-    else:
-        gas_clouds = []
+        # VILLAGE COMICS - countryside themed
+        if comic_variant == 0:
+            # Village Comic 1: "The village needs help!" / "I'll protect the houses!"
+            # Panel 1 - Mini blobs in front of village houses
+            panel1_rect = pygame.Rect(30, 80, 350, 220)
+            pygame.draw.rect(surface, (150, 220, 150), panel1_rect)  # Green background
+            pygame.draw.rect(surface, BLACK, panel1_rect, 5)
 
-    # Spawn snakes for forest
-    if current_world == "forest":
-        snakes = spawn_snakes(buildings, level)
-    else:
-        snakes = []
+            # Draw small village houses in background - cleaner design
+            for i in range(2):
+                hx = panel1_rect.x + 60 + i * 130
+                hy = panel1_rect.y + 110
+                # House body with shading
+                pygame.draw.rect(surface, (160, 82, 45), (hx, hy, 60, 55))
+                pygame.draw.rect(surface, BLACK, (hx, hy, 60, 55), 3)
+                # Clean triangular roof
+                roof = [(hx - 6, hy), (hx + 30, hy - 25), (hx + 66, hy)]
+                pygame.draw.polygon(surface, (200, 50, 50), roof)
+                pygame.draw.polygon(surface, BLACK, roof, 3)
+                # Door
+                pygame.draw.rect(surface, (101, 67, 33), (hx + 20, hy + 25, 20, 30))
+                pygame.draw.rect(surface, BLACK, (hx + 20, hy + 25, 20, 30), 2)
+                # Window
+                pygame.draw.rect(surface, (255, 255, 200), (hx + 8, hy + 15, 15, 15))
+                pygame.draw.rect(surface, BLACK, (hx + 8, hy + 15, 15, 15), 2)
+
+            # Mini blobs - cleaner with consistent style
+            for i in range(2):
+                mini_x = panel1_rect.x + 110 + i * 90
+                mini_y = panel1_rect.y + 170
+                # Body with outline
+                pygame.draw.circle(surface, PURPLE, (mini_x, mini_y), 22)
+                pygame.draw.circle(surface, BLACK, (mini_x, mini_y), 22, 3)
+                # Eyes - larger and cleaner
+                eye_size = 6
+                pupil_size = 4
+                # Left eye
+                pygame.draw.circle(surface, WHITE, (mini_x - 9, mini_y - 5), eye_size)
+                pygame.draw.circle(surface, BLACK, (mini_x - 9, mini_y - 5), eye_size, 1)
+                pygame.draw.circle(surface, BLACK, (mini_x - 9, mini_y - 5), pupil_size)
+                # Right eye
+                pygame.draw.circle(surface, WHITE, (mini_x + 9, mini_y - 5), eye_size)
+                pygame.draw.circle(surface, BLACK, (mini_x + 9, mini_y - 5), eye_size, 1)
+                pygame.draw.circle(surface, BLACK, (mini_x + 9, mini_y - 5), pupil_size)
+
+            # Cleaner speech bubble with rounded rect
+            bubble1_rect = pygame.Rect(panel1_rect.x + 35, panel1_rect.y + 22, 280, 55)
+            pygame.draw.ellipse(surface, WHITE, bubble1_rect)
+            pygame.draw.ellipse(surface, BLACK, bubble1_rect, 4)
+            help_text = render_text(small_font, "The village needs help!", True, BLACK)
+            surface.blit(help_text, (bubble1_rect.centerx - help_text.get_width()//2,
+                                    bubble1_rect.centery - help_text.get_height()//2))
 
-    # Reset gate
-    gate["open"] = False
-    gate["timer"] = 0
+            # Panel 2 - Hero ready
+            panel2_rect = pygame.Rect(420, 80, 350, 220)
+            pygame.draw.rect(surface, (255, 235, 200), panel2_rect)
+            pygame.draw.rect(surface, BLACK, panel2_rect, 5)
+            draw_blob_with_cape(panel2_rect.centerx, panel2_rect.centery + 20, 40, player_color, surface)
 
-    blob_x, blob_y = 100, 450
-    blob_vel_x, blob_vel_y = 0, 0
-    flying = False
-    dragging = False
-    can_catch = False
-    collision_cooldown = 0
+            bubble2_rect = pygame.Rect(panel2_rect.x + 50, panel2_rect.y + 20, 250, 70)
+            pygame.draw.ellipse(surface, WHITE, bubble2_rect)
+            pygame.draw.ellipse(surface, BLACK, bubble2_rect, 3)
+            save_text1 = render_text(tiny_font, "I'll protect", True, BLACK)
+            save_text2 = render_text(tiny_font, "the houses!", True, BLACK)
+            surface.blit(save_text1, (bubble2_rect.centerx - save_text1.get_width()//2, bubble2_rect.centery - 15))
+            surface.blit(save_text2, (bubble2_rect.centerx - save_text2.get_width()//2, bubble2_rect.centery + 10))
 
-    # Apply selected character stats (with upgrades)
-    char = characters[selected_character]
+        elif comic_variant == 1:
+            # Village Comic 2: "The gas cloud is dangerous!" / "I'll fly carefully!"
+            # Panel 1 - Gas cloud warning
+            panel1_rect = pygame.Rect(30, 80, 350, 220)
+            pygame.draw.rect(surface, (180, 200, 180), panel1_rect)
+            pygame.draw.rect(surface, BLACK, panel1_rect, 5)
+
+            # Draw gas cloud
+            gas_surface = pygame.Surface((80, 80), pygame.SRCALPHA)
+            pygame.draw.circle(gas_surface, (200, 180, 230, 150), (40, 40), 40)
+            surface.blit(gas_surface, (panel1_rect.centerx - 40, panel1_rect.centery - 20))
+            pygame.draw.circle(surface, (180, 160, 210, 200), (panel1_rect.centerx, panel1_rect.centery), 40, 3)
+
+            bubble1_rect = pygame.Rect(panel1_rect.x + 30, panel1_rect.y + 20, 290, 60)
+            pygame.draw.ellipse(surface, WHITE, bubble1_rect)
+            pygame.draw.ellipse(surface, BLACK, bubble1_rect, 3)
+            warn_text1 = render_text(tiny_font, "The gas cloud is", True, BLACK)
+            warn_text2 = render_text(tiny_font, "dangerous!", True, BLACK)
+            surface.blit(warn_text1, (bubble1_rect.centerx - warn_text1.get_width()//2, bubble1_rect.centery - 15))
+            surface.blit(warn_text2, (bubble1_rect.centerx - warn_text2.get_width()//2, bubble1_rect.centery + 10))
+
+            # Panel 2 - Determined hero
+            panel2_rect = pygame.Rect(420, 80, 350, 220)
+            pygame.draw.rect(surface, (200, 255, 200), panel2_rect)
+            pygame.draw.rect(surface, BLACK, panel2_rect, 5)
+            draw_blob_with_cape(panel2_rect.centerx, panel2_rect.centery + 30, 45, player_color, surface)
 
-    # Apply base stats
-    power_drain_rate = char["power_drain"]
-    bounce_damping = char["bounce"]
-    player_color = char["color"]
-    can_pierce_buildings = char["can_pierce"]
-    has_magnetic_ability = char["magnetic"]
-
-    # Apply upgrades if purchased
-    if char["upgraded"]:
-        if char["name"] == "ALEX":
-            bounce_damping = 0.95  # Even bouncier
-        elif char["name"] == "LUCY":
-            power_drain_rate = 0.15  # Super efficient
-        # RICHARD upgrade applied in gameplay code
-
-def create_debris(building):
-    """Create falling pieces when building is destroyed"""
-    pieces = []
-    piece_count = 12 if building.get("is_boss") else 8
-    for i in range(piece_count):
-        piece = {
-            "x": building["x"] + random.randint(0, building["w"]),
-            "y": building["y"] + random.randint(0, building["h"]),
-            "w": random.randint(15, 35),
-            "h": random.randint(15, 35),
-            "vel_x": random.uniform(-4, 4),
-            "vel_y": random.uniform(-8, -2),
-            "rotation": random.uniform(0, 360),
-            "rot_speed": random.uniform(-10, 10)
-        }
-        pieces.append(piece)
-    return pieces
+            bubble2_rect = pygame.Rect(panel2_rect.x + 50, panel2_rect.y + 20, 250, 60)
+            pygame.draw.ellipse(surface, WHITE, bubble2_rect)
+            pygame.draw.ellipse(surface, BLACK, bubble2_rect, 3)
+            careful_text = render_text(small_font, "I'll fly carefully!", True, BLACK)
+            surface.blit(careful_text, (bubble2_rect.centerx - careful_text.get_width()//2,
+                                      bubble2_rect.centery - careful_text.get_height()//2))
+
+        elif comic_variant == 2:
+            # Village Comic 3: "So many houses!" / "I can protect them all!"
+            panel1_rect = pygame.Rect(30, 80, 350, 220)
+            pygame.draw.rect(surface, (180, 220, 180), panel1_rect)
+            pygame.draw.rect(surface, BLACK, panel1_rect, 5)
+
+            # Draw multiple small houses - cleaner design
+            for i in range(4):
+                hx = panel1_rect.x + 35 + i * 72
+                hy = panel1_rect.y + 125
+                # House body
+                pygame.draw.rect(surface, (160, 82, 45), (hx, hy, 48, 45))
+                pygame.draw.rect(surface, BLACK, (hx, hy, 48, 45), 3)
+                # Clean triangular roof
+                roof = [(hx - 4, hy), (hx + 24, hy - 18), (hx + 52, hy)]
+                pygame.draw.polygon(surface, (200, 50, 50), roof)
+                pygame.draw.polygon(surface, BLACK, roof, 3)
+                # Door
+                pygame.draw.rect(surface, (101, 67, 33), (hx + 16, hy + 20, 16, 25))
+                pygame.draw.rect(surface, BLACK, (hx + 16, hy + 20, 16, 25), 2)
+                # Window
+                pygame.draw.rect(surface, (255, 255, 200), (hx + 6, hy + 12, 12, 12))
+                pygame.draw.rect(surface, BLACK, (hx + 6, hy + 12, 12, 12), 2)
+
+            bubble1_rect = pygame.Rect(panel1_rect.x + 40, panel1_rect.y + 20, 270, 50)
+            pygame.draw.ellipse(surface, WHITE, bubble1_rect)
+            pygame.draw.ellipse(surface, BLACK, bubble1_rect, 3)
+            houses_text = render_text(tiny_font, "So many houses!", True, BLACK)
+            surface.blit(houses_text, (bubble1_rect.centerx - houses_text.get_width()//2, bubble1_rect.centery - houses_text.get_height()//2))
+
+            # Panel 2
+            panel2_rect = pygame.Rect(420, 80, 350, 220)
+            pygame.draw.rect(surface, (255, 240, 200), panel2_rect)
+            pygame.draw.rect(surface, BLACK, panel2_rect, 5)
+            draw_blob_with_cape(panel2_rect.centerx, panel2_rect.centery + 30, 45, player_color, surface)
+
+            bubble2_rect = pygame.Rect(panel2_rect.x + 50, panel2_rect.y + 20, 250, 60)
+            pygame.draw.ellipse(surface, WHITE, bubble2_rect)
+            pygame.draw.ellipse(surface, BLACK, bubble2_rect, 3)
+            protect_text1 = render_text(tiny_font, "I can protect", True, BLACK)
+            protect_text2 = render_text(tiny_font, "them all!", True, BLACK)
+            surface.blit(protect_text1, (bubble2_rect.centerx - protect_text1.get_width()//2, bubble2_rect.centery - 15))
+            surface.blit(protect_text2, (bubble2_rect.centerx - protect_text2.get_width()//2, bubble2_rect.centery + 10))
+
+        elif comic_variant == 3:
+            # Village Comic 4: Mini blobs with countryside / "We believe in you!"
+            panel1_rect = pygame.Rect(30, 80, 350, 220)
+            pygame.draw.rect(surface, (200, 240, 200), panel1_rect)
+            pygame.draw.rect(surface, BLACK, panel1_rect, 5)
+
+            # Draw cleaner fence with horizontal bars
+            for i in range(7):
+                fx = panel1_rect.x + 40 + i * 45
+                fy = panel1_rect.y + 155
+                # Vertical post
+                pygame.draw.rect(surface, (139, 69, 19), (fx, fy, 10, 50))
+                pygame.draw.rect(surface, BLACK, (fx, fy, 10, 50), 2)
+            # Horizontal bars
+            pygame.draw.rect(surface, (139, 69, 19), (panel1_rect.x + 40, panel1_rect.y + 170, 280, 8))
+            pygame.draw.rect(surface, BLACK, (panel1_rect.x + 40, panel1_rect.y + 170, 280, 8), 2)
+            pygame.draw.rect(surface, (139, 69, 19), (panel1_rect.x + 40, panel1_rect.y + 190, 280, 8))
+            pygame.draw.rect(surface, BLACK, (panel1_rect.x + 40, panel1_rect.y + 190, 280, 8), 2)
+
+            # Mini blobs in front of fence
+            for i in range(2):
+                mini_x = panel1_rect.x + 120 + i * 80
+                mini_y = panel1_rect.y + 160
+                pygame.draw.circle(surface, PURPLE, (mini_x, mini_y), 20)
+                pygame.draw.circle(surface, BLACK, (mini_x, mini_y), 20, 2)
+                # Eyes
+                eye_size = 5
+                pupil_size = 3
+                pygame.draw.circle(surface, WHITE, (mini_x - 8, mini_y - 5), eye_size)
+                pygame.draw.circle(surface, BLACK, (mini_x - 8, mini_y - 5), pupil_size)
+                pygame.draw.circle(surface, WHITE, (mini_x + 8, mini_y - 5), eye_size)
+                pygame.draw.circle(surface, BLACK, (mini_x + 8, mini_y - 5), pupil_size)
+
+            bubble1_rect = pygame.Rect(panel1_rect.x + 60, panel1_rect.y + 30, 230, 60)
+            pygame.draw.ellipse(surface, WHITE, bubble1_rect)
+            pygame.draw.ellipse(surface, BLACK, bubble1_rect, 3)
+            believe_text = render_text(small_font, "We believe in you!", True, BLACK)
+            surface.blit(believe_text, (bubble1_rect.centerx - believe_text.get_width()//2, bubble1_rect.centery - believe_text.get_height()//2))
+
+            # Panel 2
+            panel2_rect = pygame.Rect(420, 80, 350, 220)
+            pygame.draw.rect(surface, (255, 245, 220), panel2_rect)
+            pygame.draw.rect(surface, BLACK, panel2_rect, 5)
+            draw_blob_with_cape(panel2_rect.centerx, panel2_rect.centery + 30, 45, player_color, surface)
+
+            bubble2_rect = pygame.Rect(panel2_rect.x + 50, panel2_rect.y + 20, 250, 60)
+            pygame.draw.ellipse(surface, WHITE, bubble2_rect)
+            pygame.draw.ellipse(surface, BLACK, bubble2_rect, 3)
+            thanks_text = render_text(small_font, "Thanks!", True, BLACK)
+            surface.blit(thanks_text, (bubble2_rect.centerx - thanks_text.get_width()//2, bubble2_rect.centery - thanks_text.get_height()//2))
+
+        elif comic_variant == 4:
+            # Village Comic 5: "You're doing great!" / "I won't give up!"
+            panel1_rect = pygame.Rect(30, 80, 350, 220)
+            pygame.draw.rect(surface, (220, 255, 220), panel1_rect)
+            pygame.draw.rect(surface, BLACK, panel1_rect, 5)
+
+            # Mini blob cheering
+            mini_x = panel1_rect.centerx
+            mini_y = panel1_rect.centery + 20
+            pygame.draw.circle(surface, PURPLE, (mini_x, mini_y), 25)
+            pygame.draw.circle(surface, BLACK, (mini_x, mini_y), 25, 2)
+            # Eyes
+            eye_size = 6
+            pupil_size = 4
+            pygame.draw.circle(surface, WHITE, (mini_x - 10, mini_y - 6), eye_size)
+            pygame.draw.circle(surface, BLACK, (mini_x - 10, mini_y - 6), pupil_size)
+            pygame.draw.circle(surface, WHITE, (mini_x + 10, mini_y - 6), eye_size)
+            pygame.draw.circle(surface, BLACK, (mini_x + 10, mini_y - 6), pupil_size)
+
+            bubble1_rect = pygame.Rect(panel1_rect.x + 60, panel1_rect.y + 30, 230, 60)
+            pygame.draw.ellipse(surface, WHITE, bubble1_rect)
+            pygame.draw.ellipse(surface, BLACK, bubble1_rect, 3)
+            great_text = render_text(small_font, "You're doing great!", True, BLACK)
+            surface.blit(great_text, (bubble1_rect.centerx - great_text.get_width()//2, bubble1_rect.centery - great_text.get_height()//2))
+
+            # Panel 2
+            panel2_rect = pygame.Rect(420, 80, 350, 220)
+            pygame.draw.rect(surface, (255, 240, 200), panel2_rect)
+            pygame.draw.rect(surface, BLACK, panel2_rect, 5)
+            draw_blob_with_cape(panel2_rect.centerx, panel2_rect.centery + 30, 45, player_color, surface)
+
+            bubble2_rect = pygame.Rect(panel2_rect.x + 50, panel2_rect.y + 20, 250, 60)
+            pygame.draw.ellipse(surface, WHITE, bubble2_rect)
+            pygame.draw.ellipse(surface, BLACK, bubble2_rect, 3)
+            wont_text = render_text(small_font, "I won't give up!", True, BLACK)
+            surface.blit(wont_text, (bubble2_rect.centerx - wont_text.get_width()//2, bubble2_rect.centery - wont_text.get_height()//2))
+
+        elif comic_variant == 5:
+            # Village Comic 6: "Look at that boss house!" / "I can do this!"
+            panel1_rect = pygame.Rect(30, 80, 350, 220)
+            pygame.draw.rect(surface, (180, 200, 220), panel1_rect)
+            pygame.draw.rect(surface, BLACK, panel1_rect, 5)
+
+            # Big boss house - cleaner design
+            hx = panel1_rect.centerx - 45
+            hy = panel1_rect.y + 90
+            # House body
+            pygame.draw.rect(surface, (139, 69, 19), (hx, hy, 90, 110))
+            pygame.draw.rect(surface, BLACK, (hx, hy, 90, 110), 4)
+            # Big red roof with clean lines
+            roof = [(hx - 12, hy), (hx + 45, hy - 45), (hx + 102, hy)]
+            pygame.draw.polygon(surface, (180, 0, 0), roof)
+            pygame.draw.polygon(surface, BLACK, roof, 4)
+            # Door
+            pygame.draw.rect(surface, (101, 67, 33), (hx + 30, hy + 60, 30, 50))
+            pygame.draw.rect(surface, BLACK, (hx + 30, hy + 60, 30, 50), 3)
+            # Windows
+            for row in range(2):
+                for col in range(2):
+                    wx = hx + 12 + col * 45
+                    wy = hy + 20 + row * 35
+                    pygame.draw.rect(surface, (255, 255, 200), (wx, wy, 20, 20))
+                    pygame.draw.rect(surface, BLACK, (wx, wy, 20, 20), 2)
+
+            bubble1_rect = pygame.Rect(panel1_rect.x + 40, panel1_rect.y + 20, 270, 50)
+            pygame.draw.ellipse(surface, WHITE, bubble1_rect)
+            pygame.draw.ellipse(surface, BLACK, bubble1_rect, 3)
+            boss_text = render_text(tiny_font, "Look at that boss house!", True, BLACK)
+            surface.blit(boss_text, (bubble1_rect.centerx - boss_text.get_width()//2, bubble1_rect.centery - boss_text.get_height()//2))
+
+            # Panel 2
+            panel2_rect = pygame.Rect(420, 80, 350, 220)
+            pygame.draw.rect(surface, (255, 250, 200), panel2_rect)
+            pygame.draw.rect(surface, BLACK, panel2_rect, 5)
+            draw_blob_with_cape(panel2_rect.centerx, panel2_rect.centery + 30, 45, player_color, surface)
+
+            bubble2_rect = pygame.Rect(panel2_rect.x + 50, panel2_rect.y + 20, 250, 60)
+            pygame.draw.ellipse(surface, WHITE, bubble2_rect)
+            pygame.draw.ellipse(surface, BLACK, bubble2_rect, 3)
+            can_text = render_text(small_font, "I can do this!", True, BLACK)
+            surface.blit(can_text, (bubble2_rect.centerx - can_text.get_width()//2, bubble2_rect.centery - can_text.get_height()//2))
+
+        elif comic_variant == 6:
+            # Village Comic 7: "More blobs to save!" / "Let's go!"
+            panel1_rect = pygame.Rect(30, 80, 350, 220)
+            pygame.draw.rect(surface, (200, 255, 200), panel1_rect)
+            pygame.draw.rect(surface, BLACK, panel1_rect, 5)
+
+            # Multiple mini blobs scattered
+            blob_positions = [(100, 130), (160, 150), (220, 140), (280, 135)]
+            for bx, by in blob_positions:
+                mini_x = panel1_rect.x + bx
+                mini_y = panel1_rect.y + by
+                pygame.draw.circle(surface, PURPLE, (mini_x, mini_y), 15)
+                pygame.draw.circle(surface, BLACK, (mini_x, mini_y), 15, 2)
+                # Eyes
+                eye_size = 4
+                pupil_size = 2
+                pygame.draw.circle(surface, WHITE, (mini_x - 6, mini_y - 4), eye_size)
+                pygame.draw.circle(surface, BLACK, (mini_x - 6, mini_y - 4), pupil_size)
+                pygame.draw.circle(surface, WHITE, (mini_x + 6, mini_y - 4), eye_size)
+                pygame.draw.circle(surface, BLACK, (mini_x + 6, mini_y - 4), pupil_size)
+
+            bubble1_rect = pygame.Rect(panel1_rect.x + 40, panel1_rect.y + 20, 270, 50)
+            pygame.draw.ellipse(surface, WHITE, bubble1_rect)
+            pygame.draw.ellipse(surface, BLACK, bubble1_rect, 3)
+            more_text = render_text(tiny_font, "More blobs to save!", True, BLACK)
+            surface.blit(more_text, (bubble1_rect.centerx - more_text.get_width()//2, bubble1_rect.centery - more_text.get_height()//2))
+
+            # Panel 2
+            panel2_rect = pygame.Rect(420, 80, 350, 220)
+            pygame.draw.rect(surface, (255, 255, 220), panel2_rect)
+            pygame.draw.rect(surface, BLACK, panel2_rect, 5)
+            draw_blob_with_cape(panel2_rect.centerx, panel2_rect.centery + 30, 45, player_color, surface)
+
+            bubble2_rect = pygame.Rect(panel2_rect.x + 50, panel2_rect.y + 20, 250, 60)
+            pygame.draw.ellipse(surface, WHITE, bubble2_rect)
+            pygame.draw.ellipse(surface, BLACK, bubble2_rect, 3)
+            go_text = render_text(small_font, "Let's go!", True, BLACK)
+            surface.blit(go_text, (bubble2_rect.centerx - go_text.get_width()//2, bubble2_rect.centery - go_text.get_height()//2))
+
+        elif comic_variant == 7:
+            # Village Comic 8: "The countryside is beautiful!" / "And worth protecting!"
+            panel1_rect = pygame.Rect(30, 80, 350, 220)
+            pygame.draw.rect(surface, (160, 220, 160), panel1_rect)
+            pygame.draw.rect(surface, BLACK, panel1_rect, 5)
+
+            # Draw beautiful countryside - cleaner trees and flowers
+            for i in range(3):
+                tx = panel1_rect.x + 70 + i * 100
+                ty = panel1_rect.y + 145
+                # Tree trunk
+                pygame.draw.rect(surface, (101, 67, 33), (tx, ty, 18, 45))
+                pygame.draw.rect(surface, BLACK, (tx, ty, 18, 45), 2)
+                # Tree foliage - layered circles for depth
+                pygame.draw.circle(surface, (34, 139, 34), (tx + 9, ty - 5), 28)
+                pygame.draw.circle(surface, (44, 149, 44), (tx + 9, ty - 5), 22)
+                pygame.draw.circle(surface, BLACK, (tx + 9, ty - 5), 28, 3)
+
+            # Flowers with stems
+            for i in range(5):
+                fx = panel1_rect.x + 55 + i * 60
+                fy = panel1_rect.y + 185
+                # Stem
+                pygame.draw.line(surface, (34, 139, 34), (fx, fy - 10), (fx, fy + 5), 3)
+                # Flower petals
+                pygame.draw.circle(surface, (255, 100, 150), (fx, fy - 10), 8)
+                pygame.draw.circle(surface, BLACK, (fx, fy - 10), 8, 2)
+                # Center
+                pygame.draw.circle(surface, (255, 200, 0), (fx, fy - 10), 3)
+
+            bubble1_rect = pygame.Rect(panel1_rect.x + 30, panel1_rect.y + 20, 290, 60)
+            pygame.draw.ellipse(surface, WHITE, bubble1_rect)
+            pygame.draw.ellipse(surface, BLACK, bubble1_rect, 3)
+            beautiful_text1 = render_text(tiny_font, "The countryside is", True, BLACK)
+            beautiful_text2 = render_text(tiny_font, "beautiful!", True, BLACK)
+            surface.blit(beautiful_text1, (bubble1_rect.centerx - beautiful_text1.get_width()//2, bubble1_rect.centery - 15))
+            surface.blit(beautiful_text2, (bubble1_rect.centerx - beautiful_text2.get_width()//2, bubble1_rect.centery + 10))
+
+            # Panel 2
+            panel2_rect = pygame.Rect(420, 80, 350, 220)
+            pygame.draw.rect(surface, (255, 240, 220), panel2_rect)
+            pygame.draw.rect(surface, BLACK, panel2_rect, 5)
+            draw_blob_with_cape(panel2_rect.centerx, panel2_rect.centery + 30, 45, player_color, surface)
+
+            bubble2_rect = pygame.Rect(panel2_rect.x + 50, panel2_rect.y + 20, 250, 60)
+            pygame.draw.ellipse(surface, WHITE, bubble2_rect)
+            pygame.draw.ellipse(surface, BLACK, bubble2_rect, 3)
+            worth_text1 = render_text(tiny_font, "And worth", True, BLACK)
+            worth_text2 = render_text(tiny_font, "protecting!", True, BLACK)
+            surface.blit(worth_text1, (bubble2_rect.centerx - worth_text1.get_width()//2, bubble2_rect.centery - 15))
+            surface.blit(worth_text2, (bubble2_rect.centerx - worth_text2.get_width()//2, bubble2_rect.centery + 10))
+
+    elif current_world == "forest":
+        # FOREST COMICS - nature and trees themed
+        if comic_variant == 0:
+            # Forest Comic 1: "The forest is in danger!" / "I'll protect these ancient trees!"
+            panel1_rect = pygame.Rect(30, 80, 350, 220)
+            pygame.draw.rect(surface, (180, 220, 180), panel1_rect)  # Forest green background
+            pygame.draw.rect(surface, BLACK, panel1_rect, 5)
+
+            # Draw tall forest trees in background
+            for i in range(2):
+                tx = panel1_rect.x + 80 + i * 120
+                ty = panel1_rect.y + 90
+                # Tree trunk
+                pygame.draw.rect(surface, (101, 67, 33), (tx, ty + 50, 25, 70))
+                pygame.draw.rect(surface, BLACK, (tx, ty + 50, 25, 70), 3)
+                # Layered canopy
+                pygame.draw.circle(surface, (34, 100, 34), (tx + 12, ty + 30), 40)
+                pygame.draw.circle(surface, (40, 110, 40), (tx - 10, ty + 45), 28)
+                pygame.draw.circle(surface, (40, 110, 40), (tx + 34, ty + 45), 28)
+                pygame.draw.circle(surface, BLACK, (tx + 12, ty + 30), 40, 3)
+
+            # Mini blobs in front
+            for i in range(2):
+                mini_x = panel1_rect.x + 120 + i * 90
+                mini_y = panel1_rect.y + 180
+                pygame.draw.circle(surface, PURPLE, (mini_x, mini_y), 20)
+                pygame.draw.circle(surface, BLACK, (mini_x, mini_y), 20, 3)
+                # Eyes
+                eye_size = 5
+                pupil_size = 3
+                pygame.draw.circle(surface, WHITE, (mini_x - 8, mini_y - 5), eye_size)
+                pygame.draw.circle(surface, BLACK, (mini_x - 8, mini_y - 5), pupil_size)
+                pygame.draw.circle(surface, WHITE, (mini_x + 8, mini_y - 5), eye_size)
+                pygame.draw.circle(surface, BLACK, (mini_x + 8, mini_y - 5), pupil_size)
+
+            bubble1_rect = pygame.Rect(panel1_rect.x + 35, panel1_rect.y + 20, 280, 55)
+            pygame.draw.ellipse(surface, WHITE, bubble1_rect)
+            pygame.draw.ellipse(surface, BLACK, bubble1_rect, 4)
+            forest_text = render_text(small_font, "The forest is in danger!", True, BLACK)
+            surface.blit(forest_text, (bubble1_rect.centerx - forest_text.get_width()//2,
+                                      bubble1_rect.centery - forest_text.get_height()//2))
+
+            # Panel 2 - Hero ready
+            panel2_rect = pygame.Rect(420, 80, 350, 220)
+            pygame.draw.rect(surface, (255, 245, 220), panel2_rect)
+            pygame.draw.rect(surface, BLACK, panel2_rect, 5)
+            draw_blob_with_cape(panel2_rect.centerx, panel2_rect.centery + 20, 40, player_color, surface)
+
+            bubble2_rect = pygame.Rect(panel2_rect.x + 30, panel2_rect.y + 20, 290, 70)
+            pygame.draw.ellipse(surface, WHITE, bubble2_rect)
+            pygame.draw.ellipse(surface, BLACK, bubble2_rect, 3)
+            protect_text1 = render_text(tiny_font, "I'll protect these", True, BLACK)
+            protect_text2 = render_text(tiny_font, "ancient trees!", True, BLACK)
+            surface.blit(protect_text1, (bubble2_rect.centerx - protect_text1.get_width()//2, bubble2_rect.centery - 15))
+            surface.blit(protect_text2, (bubble2_rect.centerx - protect_text2.get_width()//2, bubble2_rect.centery + 10))
+
+        elif comic_variant == 1:
+            # Forest Comic 2: "Watch out for the snakes!" / "I'll be careful!"
+            panel1_rect = pygame.Rect(30, 80, 350, 220)
+            pygame.draw.rect(surface, (160, 200, 160), panel1_rect)
+            pygame.draw.rect(surface, BLACK, panel1_rect, 5)
+
+            # Draw tree with snake
+            tx = panel1_rect.centerx - 12
+            ty = panel1_rect.y + 80
+            # Tree trunk
+            pygame.draw.rect(surface, (101, 67, 33), (tx, ty + 60, 25, 80))
+            pygame.draw.rect(surface, BLACK, (tx, ty + 60, 25, 80), 3)
+            # Canopy
+            pygame.draw.circle(surface, (34, 100, 34), (tx + 12, ty + 40), 45)
+            pygame.draw.circle(surface, BLACK, (tx + 12, ty + 40), 45, 3)
+
+            # Snake on top of tree - green with red eyes
+            snake_x = tx + 12
+            snake_y = ty + 5
+            pygame.draw.circle(surface, (50, 180, 50), (snake_x, snake_y), 18)
+            pygame.draw.circle(surface, BLACK, (snake_x, snake_y), 18, 3)
+            # Red eyes
+            pygame.draw.circle(surface, RED, (snake_x - 6, snake_y - 3), 4)
+            pygame.draw.circle(surface, RED, (snake_x + 6, snake_y - 3), 4)
+            # Tongue
+            pygame.draw.line(surface, RED, (snake_x, snake_y + 5), (snake_x + 8, snake_y + 8), 2)
+
+            bubble1_rect = pygame.Rect(panel1_rect.x + 30, panel1_rect.y + 20, 290, 50)
+            pygame.draw.ellipse(surface, WHITE, bubble1_rect)
+            pygame.draw.ellipse(surface, BLACK, bubble1_rect, 3)
+            snake_text = render_text(tiny_font, "Watch out for the snakes!", True, BLACK)
+            surface.blit(snake_text, (bubble1_rect.centerx - snake_text.get_width()//2, bubble1_rect.centery - snake_text.get_height()//2))
+
+            # Panel 2
+            panel2_rect = pygame.Rect(420, 80, 350, 220)
+            pygame.draw.rect(surface, (220, 255, 220), panel2_rect)
+            pygame.draw.rect(surface, BLACK, panel2_rect, 5)
+            draw_blob_with_cape(panel2_rect.centerx, panel2_rect.centery + 30, 45, player_color, surface)
+
+            bubble2_rect = pygame.Rect(panel2_rect.x + 50, panel2_rect.y + 20, 250, 60)
+            pygame.draw.ellipse(surface, WHITE, bubble2_rect)
+            pygame.draw.ellipse(surface, BLACK, bubble2_rect, 3)
+            careful_text = render_text(small_font, "I'll be careful!", True, BLACK)
+            surface.blit(careful_text, (bubble2_rect.centerx - careful_text.get_width()//2,
+                                      bubble2_rect.centery - careful_text.get_height()//2))
+
+        elif comic_variant == 2:
+            # Forest Comic 3: "So many tall trees!" / "I can save them all!"
+            panel1_rect = pygame.Rect(30, 80, 350, 220)
+            pygame.draw.rect(surface, (170, 210, 170), panel1_rect)
+            pygame.draw.rect(surface, BLACK, panel1_rect, 5)
+
+            # Draw multiple tall trees
+            for i in range(4):
+                tx = panel1_rect.x + 50 + i * 68
+                ty = panel1_rect.y + 70
+                # Trunk
+                pygame.draw.rect(surface, (101, 67, 33), (tx, ty + 60, 20, 90))
+                pygame.draw.rect(surface, BLACK, (tx, ty + 60, 20, 90), 2)
+                # Canopy - varied sizes
+                canopy_size = 30 + (i % 2) * 8
+                pygame.draw.circle(surface, (34, 100, 34), (tx + 10, ty + 45), canopy_size)
+                pygame.draw.circle(surface, BLACK, (tx + 10, ty + 45), canopy_size, 2)
+
+            bubble1_rect = pygame.Rect(panel1_rect.x + 40, panel1_rect.y + 20, 270, 50)
+            pygame.draw.ellipse(surface, WHITE, bubble1_rect)
+            pygame.draw.ellipse(surface, BLACK, bubble1_rect, 3)
+            trees_text = render_text(tiny_font, "So many tall trees!", True, BLACK)
+            surface.blit(trees_text, (bubble1_rect.centerx - trees_text.get_width()//2, bubble1_rect.centery - trees_text.get_height()//2))
+
+            # Panel 2
+            panel2_rect = pygame.Rect(420, 80, 350, 220)
+            pygame.draw.rect(surface, (255, 250, 230), panel2_rect)
+            pygame.draw.rect(surface, BLACK, panel2_rect, 5)
+            draw_blob_with_cape(panel2_rect.centerx, panel2_rect.centery + 30, 45, player_color, surface)
+
+            bubble2_rect = pygame.Rect(panel2_rect.x + 50, panel2_rect.y + 20, 250, 60)
+            pygame.draw.ellipse(surface, WHITE, bubble2_rect)
+            pygame.draw.ellipse(surface, BLACK, bubble2_rect, 3)
+            save_text1 = render_text(tiny_font, "I can save", True, BLACK)
+            save_text2 = render_text(tiny_font, "them all!", True, BLACK)
+            surface.blit(save_text1, (bubble2_rect.centerx - save_text1.get_width()//2, bubble2_rect.centery - 15))
+            surface.blit(save_text2, (bubble2_rect.centerx - save_text2.get_width()//2, bubble2_rect.centery + 10))
 
-collision_cooldown = 0  # Prevent multiple collisions in same frame
+        elif comic_variant == 3:
+            # Forest Comic 4: Mini blobs under tree / "Nature needs heroes!"
+            panel1_rect = pygame.Rect(30, 80, 350, 220)
+            pygame.draw.rect(surface, (190, 230, 190), panel1_rect)
+            pygame.draw.rect(surface, BLACK, panel1_rect, 5)
+
+            # Large tree in center
+            tx = panel1_rect.centerx - 15
+            ty = panel1_rect.y + 60
+            pygame.draw.rect(surface, (101, 67, 33), (tx, ty + 50, 30, 100))
+            pygame.draw.rect(surface, BLACK, (tx, ty + 50, 30, 100), 3)
+            # Wide canopy
+            pygame.draw.circle(surface, (34, 100, 34), (tx + 15, ty + 30), 50)
+            pygame.draw.circle(surface, (40, 110, 40), (tx - 15, ty + 50), 35)
+            pygame.draw.circle(surface, (40, 110, 40), (tx + 45, ty + 50), 35)
+            pygame.draw.circle(surface, BLACK, (tx + 15, ty + 30), 50, 3)
+
+            # Mini blobs under tree
+            for i in range(2):
+                mini_x = panel1_rect.centerx - 30 + i * 60
+                mini_y = panel1_rect.y + 175
+                pygame.draw.circle(surface, PURPLE, (mini_x, mini_y), 18)
+                pygame.draw.circle(surface, BLACK, (mini_x, mini_y), 18, 2)
+                # Eyes
+                pygame.draw.circle(surface, WHITE, (mini_x - 7, mini_y - 4), 5)
+                pygame.draw.circle(surface, BLACK, (mini_x - 7, mini_y - 4), 3)
+                pygame.draw.circle(surface, WHITE, (mini_x + 7, mini_y - 4), 5)
+                pygame.draw.circle(surface, BLACK, (mini_x + 7, mini_y - 4), 3)
+
+            bubble1_rect = pygame.Rect(panel1_rect.x + 50, panel1_rect.y + 25, 250, 50)
+            pygame.draw.ellipse(surface, WHITE, bubble1_rect)
+            pygame.draw.ellipse(surface, BLACK, bubble1_rect, 3)
+            nature_text = render_text(small_font, "Nature needs heroes!", True, BLACK)
+            surface.blit(nature_text, (bubble1_rect.centerx - nature_text.get_width()//2, bubble1_rect.centery - nature_text.get_height()//2))
+
+            # Panel 2
+            panel2_rect = pygame.Rect(420, 80, 350, 220)
+            pygame.draw.rect(surface, (255, 248, 220), panel2_rect)
+            pygame.draw.rect(surface, BLACK, panel2_rect, 5)
+            draw_blob_with_cape(panel2_rect.centerx, panel2_rect.centery + 30, 45, player_color, surface)
+
+            bubble2_rect = pygame.Rect(panel2_rect.x + 50, panel2_rect.y + 20, 250, 60)
+            pygame.draw.ellipse(surface, WHITE, bubble2_rect)
+            pygame.draw.ellipse(surface, BLACK, bubble2_rect, 3)
+            hero_text = render_text(small_font, "I'm on my way!", True, BLACK)
+            surface.blit(hero_text, (bubble2_rect.centerx - hero_text.get_width()//2, bubble2_rect.centery - hero_text.get_height()//2))
+
+        elif comic_variant == 4:
+            # Forest Comic 5: "The forest is beautiful!" / "And dangerous!"
+            panel1_rect = pygame.Rect(30, 80, 350, 220)
+            pygame.draw.rect(surface, (150, 210, 150), panel1_rect)
+            pygame.draw.rect(surface, BLACK, panel1_rect, 5)
+
+            # Beautiful forest scene - trees and flowers
+            for i in range(2):
+                tx = panel1_rect.x + 70 + i * 140
+                ty = panel1_rect.y + 80
+                pygame.draw.rect(surface, (101, 67, 33), (tx, ty + 55, 22, 75))
+                pygame.draw.rect(surface, BLACK, (tx, ty + 55, 22, 75), 2)
+                pygame.draw.circle(surface, (34, 100, 34), (tx + 11, ty + 35), 42)
+                pygame.draw.circle(surface, BLACK, (tx + 11, ty + 35), 42, 2)
+
+            # Flowers
+            for i in range(4):
+                fx = panel1_rect.x + 60 + i * 65
+                fy = panel1_rect.y + 170
+                pygame.draw.line(surface, (50, 150, 50), (fx, fy), (fx, fy + 20), 2)
+                colors = [(255, 100, 100), (255, 200, 0), (150, 100, 255), (255, 150, 200)]
+                pygame.draw.circle(surface, colors[i], (fx, fy), 6)
+                pygame.draw.circle(surface, BLACK, (fx, fy), 6, 2)
+
+            bubble1_rect = pygame.Rect(panel1_rect.x + 35, panel1_rect.y + 20, 280, 50)
+            pygame.draw.ellipse(surface, WHITE, bubble1_rect)
+            pygame.draw.ellipse(surface, BLACK, bubble1_rect, 3)
+            beautiful_text = render_text(tiny_font, "The forest is beautiful!", True, BLACK)
+            surface.blit(beautiful_text, (bubble1_rect.centerx - beautiful_text.get_width()//2, bubble1_rect.centery - beautiful_text.get_height()//2))
+
+            # Panel 2
+            panel2_rect = pygame.Rect(420, 80, 350, 220)
+            pygame.draw.rect(surface, (255, 240, 200), panel2_rect)
+            pygame.draw.rect(surface, BLACK, panel2_rect, 5)
+            draw_blob_with_cape(panel2_rect.centerx, panel2_rect.centery + 30, 45, player_color, surface)
+
+            bubble2_rect = pygame.Rect(panel2_rect.x + 50, panel2_rect.y + 20, 250, 60)
+            pygame.draw.ellipse(surface, WHITE, bubble2_rect)
+            pygame.draw.ellipse(surface, BLACK, bubble2_rect, 3)
+            dangerous_text = render_text(small_font, "And dangerous!", True, BLACK)
+            surface.blit(dangerous_text, (bubble2_rect.centerx - dangerous_text.get_width()//2, bubble2_rect.centery - dangerous_text.get_height()//2))
+
+        elif comic_variant == 5:
+            # Forest Comic 6: "Look at that ancient boss tree!" / "Time to save it!"
+            panel1_rect = pygame.Rect(30, 80, 350, 220)
+            pygame.draw.rect(surface, (175, 215, 175), panel1_rect)
+            pygame.draw.rect(surface, BLACK, panel1_rect, 5)
+
+            # Giant ancient boss tree
+            tx = panel1_rect.centerx - 20
+            ty = panel1_rect.y + 45
+            # Thick trunk
+            pygame.draw.rect(surface, (80, 50, 20), (tx, ty + 60, 40, 120))
+            pygame.draw.rect(surface, BLACK, (tx, ty + 60, 40, 120), 4)
+            # Massive canopy
+            pygame.draw.circle(surface, (25, 90, 25), (tx + 20, ty + 35), 60)
+            pygame.draw.circle(surface, (34, 100, 34), (tx - 20, ty + 55), 42)
+            pygame.draw.circle(surface, (34, 100, 34), (tx + 60, ty + 55), 42)
+            pygame.draw.circle(surface, BLACK, (tx + 20, ty + 35), 60, 4)
+
+            bubble1_rect = pygame.Rect(panel1_rect.x + 30, panel1_rect.y + 18, 290, 50)
+            pygame.draw.ellipse(surface, WHITE, bubble1_rect)
+            pygame.draw.ellipse(surface, BLACK, bubble1_rect, 3)
+            boss_text = render_text(tiny_font, "Look at that ancient tree!", True, BLACK)
+            surface.blit(boss_text, (bubble1_rect.centerx - boss_text.get_width()//2, bubble1_rect.centery - boss_text.get_height()//2))
+
+            # Panel 2
+            panel2_rect = pygame.Rect(420, 80, 350, 220)
+            pygame.draw.rect(surface, (255, 245, 210), panel2_rect)
+            pygame.draw.rect(surface, BLACK, panel2_rect, 5)
+            draw_blob_with_cape(panel2_rect.centerx, panel2_rect.centery + 30, 45, player_color, surface)
+
+            bubble2_rect = pygame.Rect(panel2_rect.x + 50, panel2_rect.y + 20, 250, 60)
+            pygame.draw.ellipse(surface, WHITE, bubble2_rect)
+            pygame.draw.ellipse(surface, BLACK, bubble2_rect, 3)
+            time_text = render_text(small_font, "Time to save it!", True, BLACK)
+            surface.blit(time_text, (bubble2_rect.centerx - time_text.get_width()//2, bubble2_rect.centery - time_text.get_height()//2))
+
+        elif comic_variant == 6:
+            # Forest Comic 7: "More mini blobs to rescue!" / "Let's go!"
+            panel1_rect = pygame.Rect(30, 80, 350, 220)
+            pygame.draw.rect(surface, (185, 225, 185), panel1_rect)
+            pygame.draw.rect(surface, BLACK, panel1_rect, 5)
+
+            # Multiple mini blobs scattered in forest
+            blob_positions = [(80, 120), (150, 140), (220, 125), (280, 145)]
+            for bx, by in blob_positions:
+                mini_x = panel1_rect.x + bx
+                mini_y = panel1_rect.y + by
+                pygame.draw.circle(surface, PURPLE, (mini_x, mini_y), 16)
+                pygame.draw.circle(surface, BLACK, (mini_x, mini_y), 16, 2)
+                # Eyes
+                pygame.draw.circle(surface, WHITE, (mini_x - 6, mini_y - 4), 4)
+                pygame.draw.circle(surface, BLACK, (mini_x - 6, mini_y - 4), 2)
+                pygame.draw.circle(surface, WHITE, (mini_x + 6, mini_y - 4), 4)
+                pygame.draw.circle(surface, BLACK, (mini_x + 6, mini_y - 4), 2)
+
+            # Small trees in background
+            for i in range(3):
+                tx = panel1_rect.x + 90 + i * 80
+                ty = panel1_rect.y + 160
+                pygame.draw.rect(surface, (101, 67, 33), (tx, ty, 12, 35))
+                pygame.draw.circle(surface, (34, 100, 34), (tx + 6, ty - 5), 18)
+
+            bubble1_rect = pygame.Rect(panel1_rect.x + 35, panel1_rect.y + 22, 280, 50)
+            pygame.draw.ellipse(surface, WHITE, bubble1_rect)
+            pygame.draw.ellipse(surface, BLACK, bubble1_rect, 3)
+            more_text = render_text(tiny_font, "More mini blobs to rescue!", True, BLACK)
+            surface.blit(more_text, (bubble1_rect.centerx - more_text.get_width()//2, bubble1_rect.centery - more_text.get_height()//2))
+
+            # Panel 2
+            panel2_rect = pygame.Rect(420, 80, 350, 220)
+            pygame.draw.rect(surface, (255, 252, 225), panel2_rect)
+            pygame.draw.rect(surface, BLACK, panel2_rect, 5)
+            draw_blob_with_cape(panel2_rect.centerx, panel2_rect.centery + 30, 45, player_color, surface)
+
+            bubble2_rect = pygame.Rect(panel2_rect.x + 50, panel2_rect.y + 20, 250, 60)
+            pygame.draw.ellipse(surface, WHITE, bubble2_rect)
+            pygame.draw.ellipse(surface, BLACK, bubble2_rect, 3)
+            go_text = render_text(small_font, "Let's go!", True, BLACK)
+            surface.blit(go_text, (bubble2_rect.centerx - go_text.get_width()//2, bubble2_rect.centery - go_text.get_height()//2))
+
+        elif comic_variant == 7:
+            # Forest Comic 8: "The forest gives us life!" / "I'll protect it with everything I have!"
+            panel1_rect = pygame.Rect(30, 80, 350, 220)
+            pygame.draw.rect(surface, (160, 215, 160), panel1_rect)
+            pygame.draw.rect(surface, BLACK, panel1_rect, 5)
+
+            # Beautiful lush forest - multiple trees with depth
+            tree_data = [(70, 110, 25, 65, 38), (150, 95, 28, 75, 42), (240, 105, 26, 70, 40)]
+            for tx, ty, tw, th, canopy_r in tree_data:
+                actual_tx = panel1_rect.x + tx
+                actual_ty = panel1_rect.y + ty
+                pygame.draw.rect(surface, (101, 67, 33), (actual_tx, actual_ty + 50, tw, th))
+                pygame.draw.rect(surface, BLACK, (actual_tx, actual_ty + 50, tw, th), 2)
+                pygame.draw.circle(surface, (34, 100, 34), (actual_tx + tw//2, actual_ty + 30), canopy_r)
+                pygame.draw.circle(surface, BLACK, (actual_tx + tw//2, actual_ty + 30), canopy_r, 2)
+
+            # Bushes at bottom
+            for i in range(4):
+                bx = panel1_rect.x + 55 + i * 70
+                by = panel1_rect.y + 175
+                pygame.draw.circle(surface, (40, 110, 40), (bx, by), 18)
+                pygame.draw.circle(surface, BLACK, (bx, by), 18, 2)
+
+            bubble1_rect = pygame.Rect(panel1_rect.x + 25, panel1_rect.y + 18, 300, 55)
+            pygame.draw.ellipse(surface, WHITE, bubble1_rect)
+            pygame.draw.ellipse(surface, BLACK, bubble1_rect, 3)
+            life_text = render_text(tiny_font, "The forest gives us life!", True, BLACK)
+            surface.blit(life_text, (bubble1_rect.centerx - life_text.get_width()//2, bubble1_rect.centery - life_text.get_height()//2))
+
+            # Panel 2
+            panel2_rect = pygame.Rect(420, 80, 350, 220)
+            pygame.draw.rect(surface, (255, 248, 215), panel2_rect)
+            pygame.draw.rect(surface, BLACK, panel2_rect, 5)
+            draw_blob_with_cape(panel2_rect.centerx, panel2_rect.centery + 30, 45, player_color, surface)
+
+            bubble2_rect = pygame.Rect(panel2_rect.x + 35, panel2_rect.y + 20, 280, 70)
+            pygame.draw.ellipse(surface, WHITE, bubble2_rect)
+            pygame.draw.ellipse(surface, BLACK, bubble2_rect, 3)
+            protect_text1 = render_text(tiny_font, "I'll protect it with", True, BLACK)
+            protect_text2 = render_text(tiny_font, "everything I have!", True, BLACK)
+            surface.blit(protect_text1, (bubble2_rect.centerx - protect_text1.get_width()//2, bubble2_rect.centery - 15))
+            surface.blit(protect_text2, (bubble2_rect.centerx - protect_text2.get_width()//2, bubble2_rect.centery + 10))
+
+    elif comic_variant == 0:
+        # Comic 1: Classic "Help us!" / "I've got to save these blobs!"
+        # Panel 1 (Top Left) - Mini blobs crying for help
+        panel1_rect = pygame.Rect(30, 80, 350, 220)
+        pygame.draw.rect(surface, WHITE, panel1_rect)
+        pygame.draw.rect(surface, BLACK, panel1_rect, 5)
+
+        for i in range(3):
+            mini_x = panel1_rect.x + 80 + i * 80
+            mini_y = panel1_rect.y + 120
+            pygame.draw.circle(surface, PURPLE, (mini_x, mini_y), 20)
+            pygame.draw.circle(surface, BLACK, (mini_x, mini_y), 20, 2)
+            # Eyes like in the game (bigger)
+            eye_size = 5
+            pupil_size = 3
+            eye_y_offset = -5
+            # Left eye
+            pygame.draw.circle(surface, WHITE, (mini_x - 8, mini_y + eye_y_offset), eye_size)
+            pygame.draw.circle(surface, BLACK, (mini_x - 8, mini_y + eye_y_offset), pupil_size)
+            # Right eye
+            pygame.draw.circle(surface, WHITE, (mini_x + 8, mini_y + eye_y_offset), eye_size)
+            pygame.draw.circle(surface, BLACK, (mini_x + 8, mini_y + eye_y_offset), pupil_size)
+
+        bubble1_rect = pygame.Rect(panel1_rect.x + 50, panel1_rect.y + 30, 250, 60)
+        pygame.draw.ellipse(surface, WHITE, bubble1_rect)
+        pygame.draw.ellipse(surface, BLACK, bubble1_rect, 3)
+        tail_points = [(bubble1_rect.centerx - 20, bubble1_rect.bottom),
+                      (bubble1_rect.centerx - 10, bubble1_rect.bottom + 15),
+                      (bubble1_rect.centerx, bubble1_rect.bottom)]
+        pygame.draw.polygon(surface, WHITE, tail_points)
+        pygame.draw.polygon(surface, BLACK, tail_points, 3)
+        help_text = render_text(small_font, "HELP US!", True, BLACK)
+        surface.blit(help_text, (bubble1_rect.centerx - help_text.get_width()//2,
+                                bubble1_rect.centery - help_text.get_height()//2))
+
+        # Panel 2 (Top Right)
+        panel2_rect = pygame.Rect(420, 80, 350, 220)
+        pygame.draw.rect(surface, WHITE, panel2_rect)
+        pygame.draw.rect(surface, BLACK, panel2_rect, 5)
+        draw_blob_with_cape(panel2_rect.centerx, panel2_rect.centery + 20, 40, player_color, surface)
+
+        bubble2_rect = pygame.Rect(panel2_rect.x + 50, panel2_rect.y + 20, 250, 70)
+        pygame.draw.ellipse(surface, WHITE, bubble2_rect)
+        pygame.draw.ellipse(surface, BLACK, bubble2_rect, 3)
+        tail2_points = [(bubble2_rect.centerx, bubble2_rect.bottom),
+                       (bubble2_rect.centerx + 10, bubble2_rect.bottom + 20),
+                       (bubble2_rect.centerx + 20, bubble2_rect.bottom)]
+        pygame.draw.polygon(surface, WHITE, tail2_points)
+        pygame.draw.polygon(surface, BLACK, tail2_points, 3)
+        save_text1 = render_text(tiny_font, "I've got to save", True, BLACK)
+        save_text2 = render_text(tiny_font, "these blobs!", True, BLACK)
+        surface.blit(save_text1, (bubble2_rect.centerx - save_text1.get_width()//2, bubble2_rect.centery - 15))
+        surface.blit(save_text2, (bubble2_rect.centerx - save_text2.get_width()//2, bubble2_rect.centery + 10))
+
+    elif comic_variant == 1:
+        # Comic 2: "There's so many buildings!" / "I can do this!"
+        # Panel 1 - Buildings looming
+        panel1_rect = pygame.Rect(30, 80, 350, 220)
+        pygame.draw.rect(surface, (200, 220, 255), panel1_rect)
+        pygame.draw.rect(surface, BLACK, panel1_rect, 5)
+
+        # Draw threatening buildings with windows
+        for i in range(3):
+            bx = panel1_rect.x + 60 + i * 100
+            by = panel1_rect.y + 60
+            pygame.draw.rect(surface, (80, 80, 80), (bx, by, 50, 140))
+            pygame.draw.rect(surface, BLACK, (bx, by, 50, 140), 2)
+            # Add windows
+            for row in range(5):
+                for col in range(2):
+                    wx = bx + 8 + col * 20
+                    wy = by + 15 + row * 25
+                    pygame.draw.rect(surface, (255, 255, 150), (wx, wy, 12, 10))
+                    pygame.draw.rect(surface, BLACK, (wx, wy, 12, 10), 1)
+
+        bubble1_rect = pygame.Rect(panel1_rect.x + 40, panel1_rect.y + 20, 270, 50)
+        pygame.draw.ellipse(surface, WHITE, bubble1_rect)
+        pygame.draw.ellipse(surface, BLACK, bubble1_rect, 3)
+        worry_text = render_text(tiny_font, "There's so many buildings!", True, BLACK)
+        surface.blit(worry_text, (bubble1_rect.centerx - worry_text.get_width()//2, bubble1_rect.centery - worry_text.get_height()//2))
+
+        # Panel 2 - Super Blob determined
+        panel2_rect = pygame.Rect(420, 80, 350, 220)
+        pygame.draw.rect(surface, (255, 255, 200), panel2_rect)
+        pygame.draw.rect(surface, BLACK, panel2_rect, 5)
+        draw_blob_with_cape(panel2_rect.centerx, panel2_rect.centery + 30, 45, player_color, surface)
+
+        bubble2_rect = pygame.Rect(panel2_rect.x + 50, panel2_rect.y + 20, 250, 60)
+        pygame.draw.ellipse(surface, WHITE, bubble2_rect)
+        pygame.draw.ellipse(surface, BLACK, bubble2_rect, 3)
+        tail2_points = [(bubble2_rect.centerx, bubble2_rect.bottom),
+                       (bubble2_rect.centerx, bubble2_rect.bottom + 25),
+                       (bubble2_rect.centerx + 15, bubble2_rect.bottom)]
+        pygame.draw.polygon(surface, WHITE, tail2_points)
+        pygame.draw.polygon(surface, BLACK, tail2_points, 3)
+        confidence_text = render_text(small_font, "I can do this!", True, BLACK)
+        surface.blit(confidence_text, (bubble2_rect.centerx - confidence_text.get_width()//2, bubble2_rect.centery - confidence_text.get_height()//2))
+
+    elif comic_variant == 2:
+        # Comic 3: "The city needs me!" / "POW!"
+        # Panel 1 - Super Blob flying
+        panel1_rect = pygame.Rect(30, 80, 350, 220)
+        pygame.draw.rect(surface, (135, 206, 250), panel1_rect)
+        pygame.draw.rect(surface, BLACK, panel1_rect, 5)
+
+        # Draw background buildings for city
+        bg_buildings = [
+            (panel1_rect.x + 20, panel1_rect.y + 170, 40, 100),
+            (panel1_rect.x + 75, panel1_rect.y + 140, 35, 130),
+            (panel1_rect.x + 300, panel1_rect.y + 160, 45, 110)
+        ]
+        for bx, by, bw, bh in bg_buildings:
+            pygame.draw.rect(surface, (100, 100, 120), (bx, by, bw, bh))
+            pygame.draw.rect(surface, BLACK, (bx, by, bw, bh), 2)
+            # Windows
+            for row in range(int(bh / 20)):
+                for col in range(2):
+                    wx = bx + 5 + col * (bw - 15)
+                    wy = by + 8 + row * 20
+                    if wy + 8 < by + bh:
+                        pygame.draw.rect(surface, (180, 180, 100), (wx, wy, 8, 8))
+
+        # Draw motion lines
+        for i in range(5):
+            y_pos = panel1_rect.y + 40 + i * 30
+            pygame.draw.line(surface, WHITE, (panel1_rect.x + 120, y_pos), (panel1_rect.x + 200, y_pos), 3)
+
+        draw_blob_with_cape(panel1_rect.x + 250, panel1_rect.y + 130, 40, player_color, surface)
+
+        bubble1_rect = pygame.Rect(panel1_rect.x + 40, panel1_rect.y + 30, 250, 60)
+        pygame.draw.ellipse(surface, WHITE, bubble1_rect)
+        pygame.draw.ellipse(surface, BLACK, bubble1_rect, 3)
+        tail_points = [(bubble1_rect.centerx + 80, bubble1_rect.bottom - 10),
+                      (bubble1_rect.centerx + 110, bubble1_rect.bottom + 30),
+                      (bubble1_rect.centerx + 90, bubble1_rect.bottom)]
+        pygame.draw.polygon(surface, WHITE, tail_points)
+        pygame.draw.polygon(surface, BLACK, tail_points, 3)
+        city_text = render_text(small_font, "The city needs me!", True, BLACK)
+        surface.blit(city_text, (bubble1_rect.centerx - city_text.get_width()//2, bubble1_rect.centery - city_text.get_height()//2))
+
+        # Panel 2 - Action impact
+        panel2_rect = pygame.Rect(420, 80, 350, 220)
+        pygame.draw.rect(surface, ORANGE, panel2_rect)
+        pygame.draw.rect(surface, BLACK, panel2_rect, 5)
+
+        # Draw impact starburst
+        for i in range(8):
+            angle = i * 45
+            import math
+            x_end = panel2_rect.centerx + math.cos(math.radians(angle)) * 100
+            y_end = panel2_rect.centery + math.sin(math.radians(angle)) * 80
+            pygame.draw.line(surface, YELLOW, (panel2_rect.centerx, panel2_rect.centery), (x_end, y_end), 5)
+
+        pow_text = render_text(font, "POW!", True, RED)
+        surface.blit(pow_text, (panel2_rect.centerx - pow_text.get_width()//2, panel2_rect.centery - pow_text.get_height()//2))
+
+    elif comic_variant == 3:
+        # Comic 4: Mini blob "Thank you!" / Super Blob "All in a day's work!"
+        # Panel 1 - Rescued mini blobs happy
+        panel1_rect = pygame.Rect(30, 80, 350, 220)
+        pygame.draw.rect(surface, (255, 240, 245), panel1_rect)
+        pygame.draw.rect(surface, BLACK, panel1_rect, 5)
+
+        for i in range(3):
+            mini_x = panel1_rect.x + 80 + i * 80
+            mini_y = panel1_rect.y + 130
+            pygame.draw.circle(surface, PURPLE, (mini_x, mini_y), 20)
+            pygame.draw.circle(surface, BLACK, (mini_x, mini_y), 20, 2)
+            # Eyes like in the game (bigger)
+            eye_size = 5
+            pupil_size = 3
+            eye_y_offset = -5
+            # Left eye
+            pygame.draw.circle(surface, WHITE, (mini_x - 8, mini_y + eye_y_offset), eye_size)
+            pygame.draw.circle(surface, BLACK, (mini_x - 8, mini_y + eye_y_offset), pupil_size)
+            # Right eye
+            pygame.draw.circle(surface, WHITE, (mini_x + 8, mini_y + eye_y_offset), eye_size)
+            pygame.draw.circle(surface, BLACK, (mini_x + 8, mini_y + eye_y_offset), pupil_size)
+
+        bubble1_rect = pygame.Rect(panel1_rect.x + 50, panel1_rect.y + 25, 250, 65)
+        pygame.draw.ellipse(surface, WHITE, bubble1_rect)
+        pygame.draw.ellipse(surface, BLACK, bubble1_rect, 3)
+        tail_points = [(bubble1_rect.centerx, bubble1_rect.bottom),
+                      (bubble1_rect.centerx - 5, bubble1_rect.bottom + 20),
+                      (bubble1_rect.centerx + 10, bubble1_rect.bottom)]
+        pygame.draw.polygon(surface, WHITE, tail_points)
+        pygame.draw.polygon(surface, BLACK, tail_points, 3)
+        thank_text1 = render_text(tiny_font, "Thank you,", True, BLACK)
+        thank_text2 = render_text(tiny_font, "Super Blob!", True, BLACK)
+        surface.blit(thank_text1, (bubble1_rect.centerx - thank_text1.get_width()//2, bubble1_rect.centery - 15))
+        surface.blit(thank_text2, (bubble1_rect.centerx - thank_text2.get_width()//2, bubble1_rect.centery + 10))
+
+        # Panel 2 - Super Blob heroic pose
+        panel2_rect = pygame.Rect(420, 80, 350, 220)
+        pygame.draw.rect(surface, (255, 235, 200), panel2_rect)
+        pygame.draw.rect(surface, BLACK, panel2_rect, 5)
+        draw_blob_with_cape(panel2_rect.centerx, panel2_rect.centery + 30, 42, player_color, surface)
+
+        bubble2_rect = pygame.Rect(panel2_rect.x + 40, panel2_rect.y + 20, 270, 65)
+        pygame.draw.ellipse(surface, WHITE, bubble2_rect)
+        pygame.draw.ellipse(surface, BLACK, bubble2_rect, 3)
+        tail2_points = [(bubble2_rect.centerx, bubble2_rect.bottom),
+                       (bubble2_rect.centerx + 5, bubble2_rect.bottom + 20),
+                       (bubble2_rect.centerx + 15, bubble2_rect.bottom)]
+        pygame.draw.polygon(surface, WHITE, tail2_points)
+        pygame.draw.polygon(surface, BLACK, tail2_points, 3)
+        hero_text1 = render_text(tiny_font, "All in a", True, BLACK)
+        hero_text2 = render_text(tiny_font, "day's work!", True, BLACK)
+        surface.blit(hero_text1, (bubble2_rect.centerx - hero_text1.get_width()//2, bubble2_rect.centery - 15))
+        surface.blit(hero_text2, (bubble2_rect.centerx - hero_text2.get_width()//2, bubble2_rect.centery + 10))
+
+    elif comic_variant == 4:
+        # Comic 5: Mini blobs cheering / Super Blob smiling
+        # Panel 1 - Mini blobs cheering
+        panel1_rect = pygame.Rect(30, 80, 350, 220)
+        pygame.draw.rect(surface, (255, 250, 230), panel1_rect)
+        pygame.draw.rect(surface, BLACK, panel1_rect, 5)
+
+        # Draw happy mini blobs
+        for i in range(3):
+            mini_x = panel1_rect.x + 80 + i * 80
+            mini_y = panel1_rect.y + 130
+            pygame.draw.circle(surface, PURPLE, (mini_x, mini_y), 18)
+            pygame.draw.circle(surface, BLACK, (mini_x, mini_y), 18, 2)
+            # Eyes like in the game (bigger)
+            eye_size = 5
+            pupil_size = 3
+            eye_y_offset = -4
+            # Left eye
+            pygame.draw.circle(surface, WHITE, (mini_x - 7, mini_y + eye_y_offset), eye_size)
+            pygame.draw.circle(surface, BLACK, (mini_x - 7, mini_y + eye_y_offset), pupil_size)
+            # Right eye
+            pygame.draw.circle(surface, WHITE, (mini_x + 7, mini_y + eye_y_offset), eye_size)
+            pygame.draw.circle(surface, BLACK, (mini_x + 7, mini_y + eye_y_offset), pupil_size)
+
+        bubble1_rect = pygame.Rect(panel1_rect.x + 60, panel1_rect.y + 30, 230, 60)
+        pygame.draw.ellipse(surface, WHITE, bubble1_rect)
+        pygame.draw.ellipse(surface, BLACK, bubble1_rect, 3)
+        tail_points = [(bubble1_rect.centerx, bubble1_rect.bottom),
+                      (bubble1_rect.centerx - 5, bubble1_rect.bottom + 15),
+                      (bubble1_rect.centerx + 10, bubble1_rect.bottom)]
+        pygame.draw.polygon(surface, WHITE, tail_points)
+        pygame.draw.polygon(surface, BLACK, tail_points, 3)
+        cheer_text1 = render_text(tiny_font, "You're doing", True, BLACK)
+        cheer_text2 = render_text(tiny_font, "great!", True, BLACK)
+        surface.blit(cheer_text1, (bubble1_rect.centerx - cheer_text1.get_width()//2, bubble1_rect.centery - 15))
+        surface.blit(cheer_text2, (bubble1_rect.centerx - cheer_text2.get_width()//2, bubble1_rect.centery + 10))
+
+        # Panel 2 - Super Blob happy
+        panel2_rect = pygame.Rect(420, 80, 350, 220)
+        pygame.draw.rect(surface, (230, 255, 230), panel2_rect)
+        pygame.draw.rect(surface, BLACK, panel2_rect, 5)
+        draw_blob_with_cape(panel2_rect.centerx, panel2_rect.centery + 25, 45, player_color, surface)
+
+        bubble2_rect = pygame.Rect(panel2_rect.x + 60, panel2_rect.y + 25, 230, 60)
+        pygame.draw.ellipse(surface, WHITE, bubble2_rect)
+        pygame.draw.ellipse(surface, BLACK, bubble2_rect, 3)
+        tail2_points = [(bubble2_rect.centerx, bubble2_rect.bottom),
+                       (bubble2_rect.centerx + 5, bubble2_rect.bottom + 20),
+                       (bubble2_rect.centerx + 15, bubble2_rect.bottom)]
+        pygame.draw.polygon(surface, WHITE, tail2_points)
+        pygame.draw.polygon(surface, BLACK, tail2_points, 3)
+        happy_text1 = render_text(tiny_font, "Thanks for", True, BLACK)
+        happy_text2 = render_text(tiny_font, "believing in me!", True, BLACK)
+        surface.blit(happy_text1, (bubble2_rect.centerx - happy_text1.get_width()//2, bubble2_rect.centery - 15))
+        surface.blit(happy_text2, (bubble2_rect.centerx - happy_text2.get_width()//2, bubble2_rect.centery + 10))
+
+    elif comic_variant == 5:
+        # Comic 6: "Look at that boss!" / "I can smash it!"
+        # Panel 1 - Looking at golden boss building
+        panel1_rect = pygame.Rect(30, 80, 350, 220)
+        pygame.draw.rect(surface, (220, 240, 255), panel1_rect)
+        pygame.draw.rect(surface, BLACK, panel1_rect, 5)
+
+        # Draw golden boss building with details
+        boss_x = panel1_rect.x + 240
+        boss_y = panel1_rect.y + 80
+        pygame.draw.rect(surface, GOLD, (boss_x, boss_y, 70, 120))
+        # Gold accent sides for depth
+        pygame.draw.rect(surface, (200, 170, 0), (boss_x, boss_y, 7, 120))
+        pygame.draw.rect(surface, (200, 170, 0), (boss_x + 63, boss_y, 7, 120))
+        pygame.draw.rect(surface, BLACK, (boss_x, boss_y, 70, 120), 3)
+        # Windows on boss with borders
+        for row in range(4):
+            for col in range(2):
+                wx = boss_x + 12 + col * 28
+                wy = boss_y + 15 + row * 26
+                pygame.draw.rect(surface, (255, 255, 200), (wx, wy, 16, 14))
+                pygame.draw.rect(surface, BLACK, (wx, wy, 16, 14), 1)
+
+        draw_blob_with_cape(panel1_rect.x + 100, panel1_rect.y + 150, 35, player_color, surface)
+
+        bubble1_rect = pygame.Rect(panel1_rect.x + 40, panel1_rect.y + 30, 240, 60)
+        pygame.draw.ellipse(surface, WHITE, bubble1_rect)
+        pygame.draw.ellipse(surface, BLACK, bubble1_rect, 3)
+        tail_points = [(bubble1_rect.centerx + 20, bubble1_rect.bottom),
+                      (bubble1_rect.centerx + 10, bubble1_rect.bottom + 30),
+                      (bubble1_rect.centerx + 30, bubble1_rect.bottom)]
+        pygame.draw.polygon(surface, WHITE, tail_points)
+        pygame.draw.polygon(surface, BLACK, tail_points, 3)
+        look_text1 = render_text(tiny_font, "Look at that", True, BLACK)
+        look_text2 = render_text(tiny_font, "golden boss!", True, BLACK)
+        surface.blit(look_text1, (bubble1_rect.centerx - look_text1.get_width()//2, bubble1_rect.centery - 15))
+        surface.blit(look_text2, (bubble1_rect.centerx - look_text2.get_width()//2, bubble1_rect.centery + 10))
+
+        # Panel 2 - Super Blob determined
+        panel2_rect = pygame.Rect(420, 80, 350, 220)
+        pygame.draw.rect(surface, (255, 240, 200), panel2_rect)
+        pygame.draw.rect(surface, BLACK, panel2_rect, 5)
+        draw_blob_with_cape(panel2_rect.centerx, panel2_rect.centery + 30, 50, player_color, surface)
+
+        bubble2_rect = pygame.Rect(panel2_rect.x + 70, panel2_rect.y + 25, 210, 60)
+        pygame.draw.ellipse(surface, WHITE, bubble2_rect)
+        pygame.draw.ellipse(surface, BLACK, bubble2_rect, 3)
+        tail2_points = [(bubble2_rect.centerx, bubble2_rect.bottom),
+                       (bubble2_rect.centerx - 10, bubble2_rect.bottom + 20),
+                       (bubble2_rect.centerx + 5, bubble2_rect.bottom)]
+        pygame.draw.polygon(surface, WHITE, tail2_points)
+        pygame.draw.polygon(surface, BLACK, tail2_points, 3)
+        smash_text1 = render_text(tiny_font, "I can", True, BLACK)
+        smash_text2 = render_text(tiny_font, "smash it!", True, BLACK)
+        surface.blit(smash_text1, (bubble2_rect.centerx - smash_text1.get_width()//2, bubble2_rect.centery - 15))
+        surface.blit(smash_text2, (bubble2_rect.centerx - smash_text2.get_width()//2, bubble2_rect.centery + 10))
+
+    elif comic_variant == 6:
+        # Comic 7: "More blobs to save!" / "Let's go!"
+        # Panel 1 - Mini blobs in danger
+        panel1_rect = pygame.Rect(30, 80, 350, 220)
+        pygame.draw.rect(surface, (255, 240, 240), panel1_rect)
+        pygame.draw.rect(surface, BLACK, panel1_rect, 5)
+
+        # Draw mini blobs looking worried
+        for i in range(4):
+            mini_x = panel1_rect.x + 60 + i * 70
+            mini_y = panel1_rect.y + 140
+            pygame.draw.circle(surface, PURPLE, (mini_x, mini_y), 16)
+            pygame.draw.circle(surface, BLACK, (mini_x, mini_y), 16, 2)
+            # Eyes like in the game (bigger)
+            eye_size = 4
+            pupil_size = 3
+            eye_y_offset = -4
+            # Left eye
+            pygame.draw.circle(surface, WHITE, (mini_x - 6, mini_y + eye_y_offset), eye_size)
+            pygame.draw.circle(surface, BLACK, (mini_x - 6, mini_y + eye_y_offset), pupil_size)
+            # Right eye
+            pygame.draw.circle(surface, WHITE, (mini_x + 6, mini_y + eye_y_offset), eye_size)
+            pygame.draw.circle(surface, BLACK, (mini_x + 6, mini_y + eye_y_offset), pupil_size)
+
+        bubble1_rect = pygame.Rect(panel1_rect.x + 50, panel1_rect.y + 30, 250, 65)
+        pygame.draw.ellipse(surface, WHITE, bubble1_rect)
+        pygame.draw.ellipse(surface, BLACK, bubble1_rect, 3)
+        tail_points = [(bubble1_rect.centerx, bubble1_rect.bottom),
+                      (bubble1_rect.centerx - 5, bubble1_rect.bottom + 20),
+                      (bubble1_rect.centerx + 10, bubble1_rect.bottom)]
+        pygame.draw.polygon(surface, WHITE, tail_points)
+        pygame.draw.polygon(surface, BLACK, tail_points, 3)
+        danger_text1 = render_text(tiny_font, "More blobs", True, BLACK)
+        danger_text2 = render_text(tiny_font, "need saving!", True, BLACK)
+        surface.blit(danger_text1, (bubble1_rect.centerx - danger_text1.get_width()//2, bubble1_rect.centery - 15))
+        surface.blit(danger_text2, (bubble1_rect.centerx - danger_text2.get_width()//2, bubble1_rect.centery + 10))
+
+        # Panel 2 - Super Blob ready!
+        panel2_rect = pygame.Rect(420, 80, 350, 220)
+        pygame.draw.rect(surface, (240, 255, 255), panel2_rect)
+        pygame.draw.rect(surface, BLACK, panel2_rect, 5)
+        draw_blob_with_cape(panel2_rect.centerx, panel2_rect.centery + 30, 48, player_color, surface)
+
+        bubble2_rect = pygame.Rect(panel2_rect.x + 80, panel2_rect.y + 25, 190, 60)
+        pygame.draw.ellipse(surface, WHITE, bubble2_rect)
+        pygame.draw.ellipse(surface, BLACK, bubble2_rect, 3)
+        tail2_points = [(bubble2_rect.centerx, bubble2_rect.bottom),
+                       (bubble2_rect.centerx, bubble2_rect.bottom + 20),
+                       (bubble2_rect.centerx + 15, bubble2_rect.bottom)]
+        pygame.draw.polygon(surface, WHITE, tail2_points)
+        pygame.draw.polygon(surface, BLACK, tail2_points, 3)
+        lets_text = render_text(small_font, "Let's go!", True, BLACK)
+        surface.blit(lets_text, (bubble2_rect.centerx - lets_text.get_width()//2, bubble2_rect.centery - lets_text.get_height()//2))
+
+    else:  # comic_variant == 7
+        # Comic 8: "Keep going!" / "We believe in you!"
+        # Panel 1 - Super Blob flying with energy
+        panel1_rect = pygame.Rect(30, 80, 350, 220)
+        pygame.draw.rect(surface, (245, 245, 255), panel1_rect)
+        pygame.draw.rect(surface, BLACK, panel1_rect, 5)
+
+        # Draw motion lines
+        for i in range(5):
+            y_pos = panel1_rect.y + 50 + i * 30
+            line_len = 100 + i * 10
+            pygame.draw.line(surface, (220, 220, 220), (panel1_rect.x + 30, y_pos), (panel1_rect.x + 30 + line_len, y_pos), 3)
+
+        draw_blob_with_cape(panel1_rect.x + 220, panel1_rect.y + 130, 42, player_color, surface)
+
+        bubble1_rect = pygame.Rect(panel1_rect.x + 40, panel1_rect.y + 30, 220, 55)
+        pygame.draw.ellipse(surface, WHITE, bubble1_rect)
+        pygame.draw.ellipse(surface, BLACK, bubble1_rect, 3)
+        tail_points = [(bubble1_rect.centerx + 60, bubble1_rect.bottom - 5),
+                      (bubble1_rect.centerx + 90, bubble1_rect.bottom + 25),
+                      (bubble1_rect.centerx + 70, bubble1_rect.bottom + 5)]
+        pygame.draw.polygon(surface, WHITE, tail_points)
+        pygame.draw.polygon(surface, BLACK, tail_points, 3)
+        keep_text = render_text(small_font, "Keep going!", True, BLACK)
+        surface.blit(keep_text, (bubble1_rect.centerx - keep_text.get_width()//2, bubble1_rect.centery - keep_text.get_height()//2))
+
+        # Panel 2 - Mini blobs cheering
+        panel2_rect = pygame.Rect(420, 80, 350, 220)
+        pygame.draw.rect(surface, (255, 250, 245), panel2_rect)
+        pygame.draw.rect(surface, BLACK, panel2_rect, 5)
+
+        # Draw cheering mini blobs
+        for i in range(3):
+            mini_x = panel2_rect.x + 90 + i * 70
+            mini_y = panel2_rect.y + 140
+            pygame.draw.circle(surface, PURPLE, (mini_x, mini_y), 18)
+            pygame.draw.circle(surface, BLACK, (mini_x, mini_y), 18, 2)
+            # Eyes like in the game (bigger)
+            eye_size = 5
+            pupil_size = 3
+            eye_y_offset = -4
+            # Left eye
+            pygame.draw.circle(surface, WHITE, (mini_x - 7, mini_y + eye_y_offset), eye_size)
+            pygame.draw.circle(surface, BLACK, (mini_x - 7, mini_y + eye_y_offset), pupil_size)
+            # Right eye
+            pygame.draw.circle(surface, WHITE, (mini_x + 7, mini_y + eye_y_offset), eye_size)
+            pygame.draw.circle(surface, BLACK, (mini_x + 7, mini_y + eye_y_offset), pupil_size)
+
+        bubble2_rect = pygame.Rect(panel2_rect.x + 60, panel2_rect.y + 25, 230, 65)
+        pygame.draw.ellipse(surface, WHITE, bubble2_rect)
+        pygame.draw.ellipse(surface, BLACK, bubble2_rect, 3)
+        tail2_points = [(bubble2_rect.centerx, bubble2_rect.bottom),
+                       (bubble2_rect.centerx - 5, bubble2_rect.bottom + 20),
+                       (bubble2_rect.centerx + 10, bubble2_rect.bottom)]
+        pygame.draw.polygon(surface, WHITE, tail2_points)
+        pygame.draw.polygon(surface, BLACK, tail2_points, 3)
+        believe_text1 = render_text(tiny_font, "We believe", True, BLACK)
+        believe_text2 = render_text(tiny_font, "in you!", True, BLACK)
+        surface.blit(believe_text1, (bubble2_rect.centerx - believe_text1.get_width()//2, bubble2_rect.centery - 15))
+        surface.blit(believe_text2, (bubble2_rect.centerx - believe_text2.get_width()//2, bubble2_rect.centery + 10))
+
+    # Panel 3 (Bottom) - Stats panel (same for all variants)
+    panel3_rect = pygame.Rect(30, 330, 740, 220)
+    pygame.draw.rect(surface, YELLOW, panel3_rect)
+    pygame.draw.rect(surface, BLACK, panel3_rect, 5)
+
+    smash_text = render_text(font, "SMASH!", True, RED)
+    surface.blit(smash_text, (panel3_rect.centerx - smash_text.get_width()//2, panel3_rect.y + 30))
+
+    level_complete = render_text(small_font, f"Level {level} Complete!", True, BLACK)
+    rescued_text = render_text(tiny_font, f"Total Blobs Rescued: {blobs_rescued}", True, BLACK)
+
+    surface.blit(level_complete, (panel3_rect.centerx - level_complete.get_width()//2, panel3_rect.y + 100))
+    surface.blit(rescued_text, (panel3_rect.centerx - rescued_text.get_width()//2, panel3_rect.y + 140))
+
+# Comic cache - the comic screen is composed once when the level is completed
+comic_cache = {"key": None, "surface": None}
+
+def get_comic_panel():
+    """Return the composed comic screen, rebuilding it only when its content changes"""
+    key = (current_world, level % 8, level, blobs_rescued, player_color, WIDTH, HEIGHT)
+    if comic_cache["key"] != key:
+        surface = pygame.Surface((WIDTH, HEIGHT)).convert()
+        render_comic_panel(surface)
+        comic_cache["key"] = key
+        comic_cache["surface"] = surface
+    return comic_cache["surface"]
+
+def render_story_backdrop(surface):
+    """Draw the static part of the story intro (gradient, Evil Mob and title)"""
+    # Draw a dramatic background
+    for i in range(HEIGHT):
+        ratio = i / HEIGHT
+        r = int(50 + (20 - 50) * ratio)
+        g = int(50 + (20 - 50) * ratio)
+        b = int(80 + (40 - 80) * ratio)
+        pygame.draw.line(surface, (r, g, b), (0, i), (WIDTH, i))
+
+    # Draw Evil Mob character in center (matching character menu appearance)
+    evil_mob_radius = 60
+
+    # Draw cape (navy blue)
+    cape_points = [
+        (story_evil_mob_x - evil_mob_radius * 0.7, story_evil_mob_y - evil_mob_radius * 0.5),
+        (story_evil_mob_x + evil_mob_radius * 0.7, story_evil_mob_y - evil_mob_radius * 0.5),
+        (story_evil_mob_x + evil_mob_radius * 1.2, story_evil_mob_y + evil_mob_radius * 1.8),
+        (story_evil_mob_x - evil_mob_radius * 1.2, story_evil_mob_y + evil_mob_radius * 1.8),
+    ]
+    pygame.draw.polygon(surface, (0, 0, 128), cape_points)  # Navy blue
+    pygame.draw.polygon(surface, BLACK, cape_points, 3)
+
+    # Main body (gray)
+    pygame.draw.circle(surface, RED, (int(story_evil_mob_x), int(story_evil_mob_y)), evil_mob_radius)
+    pygame.draw.circle(surface, BLACK, (int(story_evil_mob_x), int(story_evil_mob_y)), evil_mob_radius, 3)
+
+    # Dark green rectangular mask
+    mask_y = int(story_evil_mob_y - evil_mob_radius * 0.2)
+    mask_height = int(evil_mob_radius * 0.4)
+    mask_rect = pygame.Rect(int(story_evil_mob_x - evil_mob_radius * 0.6), mask_y - mask_height // 2,
+                            int(evil_mob_radius * 1.2), mask_height)
+    pygame.draw.rect(surface, (0, 100, 0), mask_rect)
+    pygame.draw.rect(surface, BLACK, mask_rect, 3)
+
+    # Eyes
+    eye_y = mask_y
+    eye_size = max(3, int(evil_mob_radius * 0.18))
+    pupil_size = max(2, int(evil_mob_radius * 0.12))
+    pygame.draw.circle(surface, WHITE, (int(story_evil_mob_x - evil_mob_radius * 0.3), eye_y), eye_size)
+    pygame.draw.circle(surface, BLACK, (int(story_evil_mob_x - evil_mob_radius * 0.3), eye_y), pupil_size)
+    pygame.draw.circle(surface, WHITE, (int(story_evil_mob_x + evil_mob_radius * 0.3), eye_y), eye_size)
+    pygame.draw.circle(surface, BLACK, (int(story_evil_mob_x + evil_mob_radius * 0.3), eye_y), pupil_size)
+
+    # Story text
+    title_text = render_text(font, "EVIL MOB", True, (200, 50, 50))
+    surface.blit(title_text, (WIDTH//2 - title_text.get_width()//2, 100))
+
+story_backdrop_cache = {"key": None, "surface": None}
+
+def get_story_backdrop():
+    """Return the composed story intro backdrop, building it when the intro starts"""
+    key = (story_evil_mob_x, story_evil_mob_y, WIDTH, HEIGHT)
+    if story_backdrop_cache["key"] != key:
+        surface = pygame.Surface((WIDTH, HEIGHT)).convert()
+        render_story_backdrop(surface)
+        story_backdrop_cache["key"] = key
+        story_backdrop_cache["surface"] = surface
+    return story_backdrop_cache["surface"]
+
+# Fixed timestep - the simulation always advances in whole FRAME_MS steps however long a frame
+# took to draw, and the playing screen draws positions interpolated between the last two steps
+MAX_STEPS_PER_FRAME = 5  # After a very long frame at most this many steps catch up, the rest are dropped
+pending_sim_events = []  # Mouse presses and releases waiting for the next simulation step
+timestep = {
+    "frame_ms": None,  # Fixed time per drawn frame for headless tools (None = real time)
+    "last_ticks": None,  # pygame ticks of the previous playing frame (None = start over)
+    "accumulator": 0.0,  # Real time not simulated yet (ms)
+    "alpha": 1.0,  # Where the drawn frame is between the previous step (0) and the last one (1)
+    "frames": 0,  # Playing frames drawn
+    "steps": 0,  # Simulation steps taken
+    "extra_steps": 0,  # Steps beyond one per frame (catching up after slow frames)
+    "idle_frames": 0,  # Frames drawn without a new step (drawing faster than the simulation)
+    "dropped_steps": 0  # Steps skipped because a frame took too long to catch up on
+}
+
+def advance_simulation():
+    """Run as many fixed simulation steps as real time calls for; returns the events of all of them"""
+    ticks = pygame.time.get_ticks()
+    if timestep["last_ticks"] is None:
+        # First playing frame after another screen - start with exactly one step
+        timestep["accumulator"] = 0.0
+        elapsed = FRAME_MS
+    elif timestep["frame_ms"] is not None:
+        elapsed = timestep["frame_ms"]
+    else:
+        elapsed = ticks - timestep["last_ticks"]
+    timestep["last_ticks"] = ticks
+    timestep["accumulator"] += elapsed
+
+    # Never fall further behind than MAX_STEPS_PER_FRAME - the rest of a long stall is dropped
+    due = int(timestep["accumulator"] // FRAME_MS)
+    if due > MAX_STEPS_PER_FRAME:
+        timestep["dropped_steps"] += due - MAX_STEPS_PER_FRAME
+        timestep["accumulator"] -= (due - MAX_STEPS_PER_FRAME) * FRAME_MS
+        due = MAX_STEPS_PER_FRAME
+
+    events = []
+    steps = 0
+    for _ in range(due):
+        inputs = {"events": list(pending_sim_events), "pointer": pygame.mouse.get_pos()}
+        pending_sim_events.clear()
+        step_events = sim.step(inputs)
+        events.extend(step_events)
+        steps += 1
+        timestep["accumulator"] -= FRAME_MS
+        # The level is over (out of power or boss smashed) - no more steps this frame
+        if any(kind in ("power_out", "boss_smashed") for kind, target in step_events):
+            timestep["accumulator"] = 0.0
+            break
+
+    timestep["frames"] += 1
+    timestep["steps"] += steps
+    timestep["extra_steps"] += max(0, steps - 1)
+    if steps == 0:
+        timestep["idle_frames"] += 1
+    timestep["alpha"] = min(1.0, max(0.0, timestep["accumulator"] / FRAME_MS))
+    return events
+
+def interpolated(entity):
+    """Drawn position of a mini blob, gas cloud or snake (between the last two steps)"""
+    alpha = timestep["alpha"]
+    return (entity.prev_x + (entity.x - entity.prev_x) * alpha,
+            entity.prev_y + (entity.y - entity.prev_y) * alpha)
+
+def interpolated_blob():
+    """Drawn position of the player blob (between the last two steps)"""
+    alpha = timestep["alpha"]
+    return (sim.prev_blob_x + (sim.blob_x - sim.prev_blob_x) * alpha,
+            sim.prev_blob_y + (sim.blob_y - sim.prev_blob_y) * alpha)
+
+# Dirty-rectangle rendering for the playing state (SUPERBLOB_DIRTY_RECTS=1, F2 toggles)
+# Only the areas under moving entities and HUD values are restored and sent to the display
+dirty_rects_enabled = os.environ.get("SUPERBLOB_DIRTY_RECTS") == "1"
+DIRTY_RECT_FULL_THRESHOLD = 0.4  # Above this fraction of the screen a full flip is used instead
+dirty_state = {
+    "scene": None,  # Static part of the screen when the last playing frame was drawn
+    "prev_rects": [],  # Dynamic areas drawn last frame (restored this frame)
+    "marked": [],  # Extra areas marked while drawing this frame
+    "frame_rects": None,  # Rects to send to the display this frame (None = flip everything)
+    "playing_frame": False,
+    "partial_frames": 0,
+    "full_frames": 0
+}
+
+def mark_dirty(rect):
+    """Remember an area drawn this frame so it gets restored next frame"""
+    dirty_state["marked"].append(rect)
+    return rect
+
+# Static layer for the playing state - background, intact buildings and the boss label
+# only change when a level starts or a building is destroyed, so they are composed into
+# one Surface and only the moving layers are drawn over it each frame
+static_layer = {"key": None, "surface": None, "rebuilds": 0}
+
+def playing_scene_key():
+    """Everything that changes the static layer of the playing screen"""
+    alive_count = sum(1 for building in sim.buildings if building.alive)
+    return (current_world, level, id(sim.buildings), alive_count, WIDTH, HEIGHT)
+
+def get_static_layer():
+    """Return the composed static layer, rebuilding it on level start or building destruction"""
+    key = playing_scene_key()
+    if static_layer["key"] != key:
+        surface = get_world_background(current_world).copy()
+        frame_timer.lap("background")
+        for building in sim.buildings:
+            draw_building(building, current_world, surface)
+            # Draw power requirement for boss
+            if building.alive and building.is_boss:
+                req_text = render_text(tiny_font, f"Need {building.required_power} pwr", True, BLACK)
+                req_bg = pygame.Surface((req_text.get_width() + 10, req_text.get_height() + 4))
+                req_bg.set_alpha(200)
+                req_bg.fill(WHITE)
+                surface.blit(req_bg, (building.x - 5, building.y - 28))
+                surface.blit(req_text, (building.x, building.y - 26))
+        frame_timer.lap("buildings")
+        static_layer["key"] = key
+        static_layer["surface"] = surface
+        static_layer["rebuilds"] += 1
+    return static_layer["surface"]
+
+def begin_playing_frame():
+    """Draw the static layer - only under last frame's dirty rects when possible; returns True for a partial frame"""
+    dirty_state["marked"] = []
+    dirty_state["playing_frame"] = True
+    layer = get_static_layer()
+    scene = (static_layer["rebuilds"], dirty_rects_enabled)
+    if dirty_rects_enabled and dirty_state["scene"] == scene:
+        for rect in dirty_state["prev_rects"]:
+            screen.blit(layer, rect, rect)
+        return True
+    dirty_state["scene"] = scene
+    screen.blit(layer, (0, 0))
+    return False
+
+def playing_dirty_rects():
+    """Bounding rects of everything on the playing screen that moves or changes from frame to frame"""
+    rects = list(dirty_state["marked"])
+
+    # Player sprite, plus the catch and magnet rings while flying
+    reach = int(math.ceil(sim.blob_radius * 1.9)) + 4
+    if sim.flying:
+        reach = max(reach, sim.blob_radius + 52)
+        if sim.magnetic:
+            reach = max(reach, 162)
+    blob_x, blob_y = interpolated_blob()
+    rects.append(pygame.Rect(int(blob_x) - reach, int(blob_y) - reach, reach * 2, reach * 2))
+
+    # Mini blobs (with their pulsing glow)
+    for mini in sim.mini_blobs:
+        if mini.alive:
+            x, y = interpolated(mini)
+            size = mini.r + 5
+            rects.append(pygame.Rect(int(x) - size, int(y) - size, size * 2, size * 2))
+
+    # Falling debris (the pool only keeps pieces that are still on screen)
+    for x, y, w, h, kind in sim.debris.rects(timestep["alpha"]):
+        rects.append(pygame.Rect(x, y, w, h))
+
+    # Gas clouds and snakes (snake head and tongue stick out to the right)
+    if current_world == "village":
+        for cloud in sim.gas_clouds:
+            x, y = interpolated(cloud)
+            size = cloud.r + 2
+            rects.append(pygame.Rect(int(x) - size, int(y) - size, size * 2, size * 2))
+    if current_world == "forest":
+        for snake in sim.snakes:
+            x, y = interpolated(snake)
+            size = snake.r + 2
+            body = pygame.Rect(int(x) - size, int(y) - size, size * 2, size * 2)
+            rects.append(body.union(pygame.Rect(int(x) - 2, int(y) - 15, 36, 22)))
+
+    # Gate (its timer bar changes every frame)
+    if level >= 10 and current_world == "city":
+        rects.append(pygame.Rect(sim.gate.x, sim.gate.y, sim.gate.width, sim.gate.height))
+
+    # HUD values - power bar and Give Up button (texts are marked where they are drawn)
+    rects.append(pygame.Rect(WIDTH - 222, 8, 204, 24))
+    rects.append(give_up_button_rect.copy())
+    return rects
+
+def finish_playing_frame(partial):
+    """Record this frame's dirty rects and decide whether the display can be updated partially"""
+    screen_rect = screen.get_rect()
+    rects = [rect.clip(screen_rect) for rect in playing_dirty_rects()]
+    rects = [rect for rect in rects if rect.width and rect.height]
+    if partial:
+        update_rects = dirty_state["prev_rects"] + rects
+        dirty_area = sum(rect.width * rect.height for rect in update_rects)
+        if dirty_area <= DIRTY_RECT_FULL_THRESHOLD * WIDTH * HEIGHT:
+            dirty_state["frame_rects"] = update_rects
+        # else: fall back to a full flip (the screen surface itself is complete either way)
+    dirty_state["prev_rects"] = rects
+
+def present_frame():
+    """Send the frame to the display - only the dirty rects when possible, otherwise a full flip"""
+    if dirty_state["frame_rects"] is not None:
+        pygame.display.update(dirty_state["frame_rects"])
+        dirty_state["partial_frames"] += 1
+    else:
+        pygame.display.flip()
+        dirty_state["full_frames"] += 1
+    if not dirty_state["playing_frame"]:
+        dirty_state["scene"] = None  # Another screen was drawn, the next playing frame starts from scratch
+    dirty_state["frame_rects"] = None
+    dirty_state["playing_frame"] = False
+
+# Performance overlay (SUPERBLOB_PERF_OVERLAY=1, F3 toggles, F4 dumps the numbers to a file)
+# Each frame is split into phases with frame_timer.lap(); with the overlay off the laps do nothing
+frame_timer = PhaseTimer()
+PERF_OVERLAY_REFRESH = 15  # Frames between re-renders of the panel (the numbers are rolling anyway)
+PERF_OVERLAY_POS = (12, 80)
+perf_overlay = {"visible": os.environ.get("SUPERBLOB_PERF_OVERLAY") == "1", "surface": None, "age": 0}
+frame_timer.set_enabled(perf_overlay["visible"])  # Also switched on by the benchmark without the overlay
+
+def render_perf_overlay():
+    """Render the overlay panel - FPS, game_state and the rolling mean and p99 of every phase"""
+    summary = frame_timer.summary()
+    overlay_font = get_font(20)
+    rows = [(f"{summary['fps']:.0f} fps", game_state, ""), ("phase", "mean", "p99")]
+    for phase in frame_timer.phases:
+        stats = summary["phases"].get(phase)
+        if stats:
+            rows.append((phase, f"{stats['mean_ms']:.2f}", f"{stats['p99_ms']:.2f}"))
+    if summary["work_ms"]:
+        rows.append(("total ms", f"{summary['work_ms']['mean_ms']:.2f}", f"{summary['work_ms']['p99_ms']:.2f}"))
+    if draw_counter.installed:
+        # Calls per frame (SUPERBLOB_DRAW_STATS=1), pixels allocated in thousands
+        counts = draw_counter.summary(top=0)["per_frame"]
+        for key, label, scale in [("draw", "draw calls", 1), ("text", "text renders", 1),
+                                  ("surfaces", "surfaces", 1), ("pixels", "alloc kpx", 1000)]:
+            if key in counts:
+                rows.append((label, f"{counts[key]['mean'] / scale:.1f}", f"{counts[key]['p99'] / scale:.0f}"))
+
+    # Rendered with the font directly - changing numbers would only churn the text cache
+    line_height = overlay_font.get_linesize()
+    surface = pygame.Surface((210, line_height * len(rows) + 10))
+    surface.set_alpha(210)
+    surface.fill(BLACK)
+    for i, row in enumerate(rows):
+        for x, text in zip((6, 100, 155), row):
+            surface.blit(overlay_font.render(text, True, YELLOW if i < 2 else WHITE), (x, 5 + i * line_height))
+    return surface
+
+def draw_perf_overlay():
+    """Draw the overlay over the finished frame (re-rendered every PERF_OVERLAY_REFRESH frames)"""
+    perf_overlay["age"] -= 1
+    if perf_overlay["surface"] is None or perf_overlay["age"] <= 0:
+        perf_overlay["surface"] = render_perf_overlay()
+        perf_overlay["age"] = PERF_OVERLAY_REFRESH
+    rect = screen.blit(perf_overlay["surface"], PERF_OVERLAY_POS)
+    if dirty_state["playing_frame"]:
+        # Restored next frame and sent to the display with this one like any other dirty area
+        dirty_state["prev_rects"].append(rect)
+        if dirty_state["frame_rects"] is not None:
+            dirty_state["frame_rects"].append(rect)
+
+def toggle_perf_overlay():
+    """Turn the overlay and the frame timing behind it on or off"""
+    perf_overlay["visible"] = not perf_overlay["visible"]
+    perf_overlay["surface"] = None
+    frame_timer.set_enabled(perf_overlay["visible"])
+
+def dump_perf_numbers():
+    """Write the overlay's numbers to a timestamped JSON file in the working directory"""
+    path = f"superblob_perf_{time.strftime('%Y%m%d_%H%M%S')}.json"
+    frame_timer.dump(path, game_state=game_state, dirty_rects=dirty_rects_enabled,
+                     timestep=cache_stats()["timestep"],
+                     draw_calls=draw_counter.summary() if draw_counter.installed else None)
+    print(f"Performance numbers written to {path}")
+
+def print_draw_stats():
+    """Print draw calls, text renders and surfaces per frame for each game_state, and the busiest callers"""
+    summary = draw_counter.summary()
+    for state, counts in sorted(summary["by_state"].items()):
+        print(f"{state}: {counts['draw']:.1f} draw calls, {counts['text']:.1f} text renders, "
+              f"{counts['surfaces']:.1f} surfaces ({counts['pixels'] / 1000:.1f} kpx) per frame "
+              f"over {counts['frames']} frames")
+    for caller in summary["top_callers"]:
+        print(f"  {caller['calls']:>8} {caller['kind']:<8} {caller['function']} ({caller['game_state']})")
 
 # Button dimensions
 button_width = 200
@@ -1181,232 +2603,217 @@ forest_world_button = pygame.Rect(WIDTH//2 + 120, HEIGHT//2 - 75, world_button_w
 give_up_button_rect = pygame.Rect(WIDTH - 150, HEIGHT - 60, 140, 50)
 
 running = True
-while running:
-    screen.fill(WHITE)
-    mouse_pos = pygame.mouse.get_pos()
 
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
+# Game states - every screen is an object with enter/exit hooks, event handling, a per-frame
+# update and drawing. run_frame looks the current one up by name in game_states; the enter and
+# exit hooks build and free whatever a screen keeps around while it is showing.
+class GameState:
+    """One screen of the game - the hooks do nothing unless a state overrides them"""
+    name = None
+    clear_screen = True  # Start each frame from a white screen (False for screens that cover it all)
+
+    def enter(self, previous):
+        """Called when the game switches to this state from the previous one (None on start)"""
+
+    def exit(self, following):
+        """Called when the game leaves this state for the following one"""
+
+    def handle_event(self, event):
+        """React to an input event (quitting and debug keys are handled for every state)"""
+
+    def update(self):
+        """Advance this screen's animation and logic by one frame"""
+
+    def draw(self):
+        """Draw this screen's frame"""
+
+game_states = {}  # game_state name -> GameState
+entered_state = None  # Name of the state whose enter hook ran last
+
+def register_state(state_class):
+    """Class decorator - add one instance of a GameState subclass to game_states"""
+    game_states[state_class.name] = state_class()
+    return state_class
+
+def change_state(name):
+    """Leave the current state and enter another one, running their exit and enter hooks"""
+    global game_state, entered_state
+    previous = entered_state
+    if previous is not None:
+        game_states[previous].exit(name)
+    game_state = entered_state = name
+    game_states[name].enter(previous)
+
+def current_state():
+    """The state object for game_state - entered first if game_state was set directly (benchmarks, tools)"""
+    if game_state != entered_state:
+        change_state(game_state)
+    return game_states[game_state]
+
+def start_world(world):
+    """Start a new run in a world - with its intro on level 1"""
+    global current_world
+    current_world = world
+    reset_game()
+    # Show the world's intro only for level 1
+    if level == 1:
+        change_state(WORLD_INTROS[world])
+    else:
+        change_state("playing")
+
+def advance_level():
+    """Go on to the next level after a boss - track max levels, unlock worlds and set the level up"""
+    global level, city_max_level, village_max_level, village_unlocked, forest_unlocked
+    level += 1
+
+    # Track max level and unlock next world
+    if current_world == "city" and level > city_max_level:
+        city_max_level = level
+        if city_max_level >= 13:  # Completed level 12, unlock village
+            village_unlocked = True
+    elif current_world == "village" and level > village_max_level:
+        village_max_level = level
+        if village_max_level >= 11:  # Completed level 10, unlock forest
+            forest_unlocked = True
+
+    # Next level: full health, new buildings, mini blobs and gas clouds
+    sim.next_level(level, 6 + mini_blob_upgrade_level)
+    prerender_level()
+    leak_detector.check(f"advance_level, {current_world} level {level}")
+
+def draw_evil_mob(x, y):
+    """Draw Evil Mob flying through a world intro (gray body with navy blue cape and green mask)"""
+    villain_radius = 35
+    villain_color = RED  # Gray (Evil Mob uses RED which is gray)
+
+    # Draw cape behind the villain (navy blue like Evil Mob in menu)
+    cape_points = [
+        (x - villain_radius * 0.7, y - villain_radius * 0.5),  # Left shoulder
+        (x + villain_radius * 0.7, y - villain_radius * 0.5),  # Right shoulder
+        (x + villain_radius * 1.2, y + villain_radius * 1.8),  # Right bottom
+        (x - villain_radius * 1.2, y + villain_radius * 1.8),  # Left bottom
+    ]
+    cape_color = (0, 0, 128)  # Navy blue (Evil Mob's cape color)
+    pygame.draw.polygon(screen, cape_color, cape_points)
+    pygame.draw.polygon(screen, BLACK, cape_points, 2)
+
+    # Draw "EM" letters on cape for Evil Mob
+    letter_y = int(y + villain_radius * 0.8)
+    letter_font = get_font(max(int(villain_radius * 0.8), 20))
+    em_text = render_text(letter_font, "EM", True, (100, 100, 100))
+    screen.blit(em_text, (int(x - em_text.get_width() // 2), letter_y - em_text.get_height() // 2))
+
+    # Main villain body (gray)
+    pygame.draw.circle(screen, villain_color, (int(x), int(y)), villain_radius)
+    pygame.draw.circle(screen, BLACK, (int(x), int(y)), villain_radius, 2)
+
+    # Face mask - dark green rectangular (Evil Mob's signature look)
+    mask_y = int(y - villain_radius * 0.2)
+    mask_height = int(villain_radius * 0.4)
+    mask_rect = pygame.Rect(int(x - villain_radius * 0.6), mask_y - mask_height // 2,
+                            int(villain_radius * 1.2), mask_height)
+    pygame.draw.rect(screen, (0, 100, 0), mask_rect)  # Dark green
+    pygame.draw.rect(screen, BLACK, mask_rect, 2)
+
+    # Eyes with white circles and black pupils
+    eye_y = mask_y
+    eye_size = max(3, int(villain_radius * 0.18))
+    pupil_size = max(2, int(villain_radius * 0.12))
+    # Left eye
+    pygame.draw.circle(screen, WHITE, (int(x - villain_radius * 0.3), eye_y), eye_size)
+    pygame.draw.circle(screen, BLACK, (int(x - villain_radius * 0.3), eye_y), pupil_size)
+    # Right eye
+    pygame.draw.circle(screen, WHITE, (int(x + villain_radius * 0.3), eye_y), eye_size)
+    pygame.draw.circle(screen, BLACK, (int(x + villain_radius * 0.3), eye_y), pupil_size)
+
+MENU_INSTRUCTIONS = [
+    "HOW TO PLAY:",
+    "• Drag the blob to aim and release to launch",
+    "• Collect gray mini-blobs to gain power",
+    "• Destroy buildings/trees - save power for the GOLD boss!",
+    "• Click mid-flight to catch and re-launch",
+    "",
+    "CHARACTERS:",
+    "• Unlock 4 characters with rescued blobs (20-50 cost)",
+    "• Each has unique abilities: bouncy, efficient, magnetic",
+    "• Upgrade characters for enhanced abilities (2x character cost)",
+    "",
+    "WORLDS:",
+    "• CITY: Beat level 12 to unlock VILLAGE",
+    "• VILLAGE: Houses, gas clouds (avoid!), beat level 10 for FOREST",
+    "• FOREST: Trees, deadly snakes (instant death!), +10 HP per 5 blobs",
+    "",
+    "PROGRESSION:",
+    "• Grow bigger every 5 mini-blobs collected per level",
+    "• Gain +10 max power per 10 blobs collected in run",
+    "• Upgrade mini-blob count (6→10) for more blobs per level",
+    "• Out of power? Restart from level 1!"
+]
+
+@register_state
+class MenuState(GameState):
+    """Main menu - title, PLAY/QUIT and the instructions dropdown over bouncing blobs"""
+    name = "menu"
+
+    def __init__(self):
+        self.title_bg = None  # Semi-transparent panels, built while the menu is showing
+        self.inst_bg = None
+
+    def enter(self, previous):
+        self.title_bg = pygame.Surface((WIDTH - 100, 140))
+        self.title_bg.set_alpha(200)
+        self.title_bg.fill(WHITE)
+        self.inst_bg = pygame.Surface((WIDTH - 100, 360))
+        self.inst_bg.set_alpha(220)
+        self.inst_bg.fill(WHITE)
+
+    def exit(self, following):
+        self.title_bg = None
+        self.inst_bg = None
+
+    def handle_event(self, event):
+        global running, show_instructions
+        if event.type != pygame.MOUSEBUTTONDOWN:
+            return
+        if play_button_rect.collidepoint(event.pos):
+            # Go to story intro
+            change_state("story_intro")
+        elif quit_button_rect.collidepoint(event.pos):
             running = False
-        elif event.type == pygame.MOUSEBUTTONDOWN:
-            if game_state == "menu":
-                if play_button_rect.collidepoint(event.pos):
-                    # Go to story intro
-                    story_intro_frame = 0
-                    game_state = "story_intro"
-                elif quit_button_rect.collidepoint(event.pos):
-                    running = False
-                elif instructions_button_rect.collidepoint(event.pos):
-                    show_instructions = not show_instructions
-                # Check if back button in instructions dropdown is clicked
-                if show_instructions:
-                    inst_back_button = pygame.Rect(WIDTH - 150, HEIGHT - 385, 80, 30)
-                    if inst_back_button.collidepoint(event.pos):
-                        show_instructions = False
-            elif game_state == "story_intro":
-                # Click anywhere to skip to character select
-                game_state = "character_select"
-            elif game_state == "city_intro":
-                # Click anywhere to skip to playing
-                game_state = "playing"
-            elif game_state == "forest_intro":
-                # Click anywhere to skip to playing
-                game_state = "playing"
-            elif game_state == "character_select":
-                # Check character button clicks
-                for i, button in enumerate(char_buttons):
-                    if button.collidepoint(event.pos):
-                        char = characters[i]
-                        if char["unlocked"]:
-                            # Already unlocked, select and go to world select
-                            selected_character = i
-                            game_state = "world_select"
-                        elif blobs_rescued >= char["cost"]:
-                            # Can afford to unlock
-                            blobs_rescued -= char["cost"]
-                            char["unlocked"] = True
-                            selected_character = i
-                            game_state = "world_select"
-                        # else: not enough blobs, do nothing
-                        break
-                # Back button (top right)
-                back_button_char_select = pygame.Rect(WIDTH - 150, 20, 120, 50)
-                if back_button_char_select.collidepoint(event.pos):
-                    game_state = "menu"
-                # Worlds button
-                if worlds_button_rect.collidepoint(event.pos):
-                    game_state = "world_select"
-                # Upgrades button
-                if upgrades_button_rect.collidepoint(event.pos):
-                    game_state = "upgrades"
-            elif game_state == "upgrades":
-                # Character ability upgrades
-                for i, (button, char) in enumerate(zip(char_buttons, characters)):
-                    if button.collidepoint(event.pos):
-                        if char["unlocked"] and not char["upgraded"] and blobs_rescued >= char["upgrade_cost"] and char["upgrade_cost"] > 0:
-                            # Purchase upgrade
-                            blobs_rescued -= char["upgrade_cost"]
-                            char["upgraded"] = True
-                        break
-                # Mini blob count upgrade (4 buttons for 4 upgrades) - moved to bottom
-                mini_blob_button_y = 510
-                for upgrade_num in range(4):
-                    button_rect = pygame.Rect(50 + upgrade_num * 185, mini_blob_button_y, 170, 80)
-                    if button_rect.collidepoint(event.pos):
-                        if upgrade_num == mini_blob_upgrade_level and mini_blob_upgrade_level < 4:
-                            cost = mini_blob_upgrade_costs[upgrade_num]
-                            if blobs_rescued >= cost:
-                                blobs_rescued -= cost
-                                mini_blob_upgrade_level += 1
-                        break
-                # Back button (top right position for upgrades screen)
-                back_button_upgrades = pygame.Rect(WIDTH - 150, 20, 120, 50)
-                if back_button_upgrades.collidepoint(event.pos):
-                    game_state = "character_select"
-            elif game_state == "world_select":
-                # City world button
-                if city_world_button.collidepoint(event.pos):
-                    current_world = "city"
-                    reset_game()
-                    # Show city intro only for city level 1
-                    if level == 1:
-                        villain_active = True
-                        villain_x = WIDTH + 100  # Start off-screen right
-                        villain_frame = 0
-                        game_state = "city_intro"
-                    else:
-                        game_state = "playing"
-                # Forest world button
-                if forest_world_button.collidepoint(event.pos) and forest_unlocked:
-                    current_world = "forest"
-                    reset_game()
-                    # Show forest intro only for forest level 1
-                    if level == 1:
-                        villain_active = True
-                        villain_x = -100  # Start off-screen left
-                        villain_y = HEIGHT // 2
-                        villain_frame = 0
-                        game_state = "forest_intro"
-                    else:
-                        game_state = "playing"
-                # Village world button
-                if village_world_button.collidepoint(event.pos) and village_unlocked:
-                    current_world = "village"
-                    reset_game()
-                    # Show villain intro only for village level 1
-                    if level == 1:
-                        villain_active = True
-                        villain_x = -100
-                        villain_frame = 0
-                        gas_spawn_points = []
-                        game_state = "villain_intro"
-                    else:
-                        game_state = "playing"
-                # Back button
-                if back_button_rect.collidepoint(event.pos):
-                    game_state = "character_select"
-            elif game_state == "playing":
-                # Give Up button
-                if give_up_button_rect.collidepoint(event.pos):
-                    game_state = "character_select"
-            if game_state == "comic_panel":
-                # Next level
-                game_state = "playing"
-                level += 1
-
-                # Track max level and unlock next world
-                if current_world == "city" and level > city_max_level:
-                    city_max_level = level
-                    if city_max_level >= 13:  # Completed level 12, unlock village
-                        village_unlocked = True
-                elif current_world == "village" and level > village_max_level:
-                    village_max_level = level
-                    if village_max_level >= 11:  # Completed level 10, unlock forest
-                        forest_unlocked = True
-
-                # Reset blobs collected this level to 0 so character size goes back to 20
-                blobs_collected_level = 0
-
-                # Start at full health (based on blobs collected in this run)
-                max_power = 100 + (blobs_collected_run // 10) * 10
-                power = max_power
-
-                buildings = create_level_buildings(level, current_world)
-                mini_blobs = spawn_mini_blobs()
-
-                # Spawn gas clouds for village
-                if current_world == "village":
-                    gas_clouds = spawn_gas_clouds(level)
-                else:
-                    gas_clouds = []
-
-                # Reset gate for new level
-                gate["open"] = False
-                gate["timer"] = 0
-
-                blob_x, blob_y = 100, 450
-                blob_vel_x, blob_vel_y = 0, 0
-                flying = False
-                can_catch = False
-                collision_cooldown = 0
-
-            elif game_state == "level_failed":
-                # Out of power - restart from level 1
-                reset_game()
-                game_state = "playing"
-                
-            elif can_catch and flying:
-                # Catch blob mid-flight - INCREASED CATCH RADIUS
-                mouse_x, mouse_y = event.pos
-                dist = math.sqrt((mouse_x - blob_x)**2 + (mouse_y - blob_y)**2)
-                if dist < blob_radius + 50:  # Much bigger catch zone
-                    dragging = True
-                    flying = False
-                    can_catch = False
-                    launch_x, launch_y = blob_x, blob_y
-                    blob_vel_x, blob_vel_y = 0, 0
-                    
-            elif not flying and not dragging:
-                # Initial launch
-                mouse_x, mouse_y = event.pos
-                dist = math.sqrt((mouse_x - blob_x)**2 + (mouse_y - blob_y)**2)
-                if dist < blob_radius + 20:
-                    dragging = True
-                    launch_x, launch_y = blob_x, blob_y
-                    
-        elif event.type == pygame.MOUSEBUTTONUP and dragging:
-            dragging = False
-            flying = True
-            can_catch = True
-            blob_vel_x = (launch_x - blob_x) * 0.2
-            blob_vel_y = (launch_y - blob_y) * 0.2
-
-    if game_state == "menu":
+        elif instructions_button_rect.collidepoint(event.pos):
+            show_instructions = not show_instructions
+        # Check if back button in instructions dropdown is clicked
+        if show_instructions:
+            inst_back_button = pygame.Rect(WIDTH - 150, HEIGHT - 385, 80, 30)
+            if inst_back_button.collidepoint(event.pos):
+                show_instructions = False
+
+    def update(self):
         # Animate background blobs
         for blob in menu_blobs:
-            blob["x"] += blob["vel_x"]
-            blob["y"] += blob["vel_y"]
+            blob.x += blob.vel_x
+            blob.y += blob.vel_y
 
             # Bounce off walls
-            if blob["x"] - blob["radius"] < 0 or blob["x"] + blob["radius"] > WIDTH:
-                blob["vel_x"] *= -1
-            if blob["y"] - blob["radius"] < 0 or blob["y"] + blob["radius"] > HEIGHT:
-                blob["vel_y"] *= -1
+            if blob.x - blob.radius < 0 or blob.x + blob.radius > WIDTH:
+                blob.vel_x *= -1
+            if blob.y - blob.radius < 0 or blob.y + blob.radius > HEIGHT:
+                blob.vel_y *= -1
 
+    def draw(self):
+        mouse_pos = pygame.mouse.get_pos()
+        for blob in menu_blobs:
             # Draw blob with character appearance
-            draw_blob_with_cape(blob["x"], blob["y"], blob["radius"], blob["color"])
+            draw_blob_with_cape(blob.x, blob.y, blob.radius, blob.color)
             pulse = abs(math.sin(pygame.time.get_ticks() / 300)) * 4
-            pygame.draw.circle(screen, WHITE, (int(blob["x"]), int(blob["y"])), blob["radius"] + int(pulse), 2)
+            pygame.draw.circle(screen, WHITE, (int(blob.x), int(blob.y)), blob.radius + int(pulse), 2)
 
-        # Draw semi-transparent background for title area
-        title_bg = pygame.Surface((WIDTH - 100, 140))
-        title_bg.set_alpha(200)
-        title_bg.fill(WHITE)
-        screen.blit(title_bg, (50, 50))
+        # Semi-transparent background for title area
+        screen.blit(self.title_bg, (50, 50))
 
         # Title with character replacing the "O" in BLOB
-        title_part1 = font.render("SUPER BL", True, BLACK)
-        title_part2 = font.render("B", True, BLACK)
+        title_part1 = render_text(font, "SUPER BL", True, BLACK)
+        title_part2 = render_text(font, "B", True, BLACK)
 
         # Calculate positions to center the whole title
         blob_char_size = 35  # Size of the blob character
@@ -1417,12 +2824,12 @@ while running:
         # Draw title parts
         screen.blit(title_part1, (start_x, title_y))
         # Draw Super Blob character in place of "O"
-        blob_x = start_x + title_part1.get_width() + blob_char_size//2
-        blob_y = title_y + font.get_height()//2
-        draw_blob_with_cape(blob_x, blob_y, blob_char_size//2, BLUE)
+        title_blob_x = start_x + title_part1.get_width() + blob_char_size//2
+        title_blob_y = title_y + font.get_height()//2
+        draw_blob_with_cape(title_blob_x, title_blob_y, blob_char_size//2, BLUE)
         screen.blit(title_part2, (start_x + title_part1.get_width() + blob_char_size, title_y))
 
-        credits = tiny_font.render("Created by Emma Wilkinson", True, BLUE)
+        credits = render_text(tiny_font, "Created by Emma Wilkinson", True, BLUE)
         screen.blit(credits, (WIDTH//2 - credits.get_width()//2, 150))
 
         # PLAY button
@@ -1430,14 +2837,14 @@ while running:
         play_color = YELLOW if play_hover else GREEN
         pygame.draw.rect(screen, play_color, play_button_rect, border_radius=10)
         pygame.draw.rect(screen, BLACK, play_button_rect, 4, border_radius=10)
-        play_text = small_font.render("PLAY", True, BLACK)
+        play_text = render_text(small_font, "PLAY", True, BLACK)
         screen.blit(play_text, (play_button_rect.centerx - play_text.get_width()//2,
                                  play_button_rect.centery - play_text.get_height()//2))
 
         # QUIT button
         pygame.draw.rect(screen, BRIGHT_RED, quit_button_rect, border_radius=10)
         pygame.draw.rect(screen, BLACK, quit_button_rect, 4, border_radius=10)
-        quit_text = small_font.render("QUIT", True, BLACK)
+        quit_text = render_text(small_font, "QUIT", True, BLACK)
         screen.blit(quit_text, (quit_button_rect.centerx - quit_text.get_width()//2,
                                  quit_button_rect.centery - quit_text.get_height()//2))
 
@@ -1446,45 +2853,18 @@ while running:
         instructions_color = YELLOW if instructions_hover else BRIGHT_BLUE
         pygame.draw.rect(screen, instructions_color, instructions_button_rect, border_radius=10)
         pygame.draw.rect(screen, BLACK, instructions_button_rect, 4, border_radius=10)
-        instructions_text = small_font.render("HOW TO PLAY", True, BLACK)
+        instructions_text = render_text(small_font, "HOW TO PLAY", True, BLACK)
         screen.blit(instructions_text, (instructions_button_rect.centerx - instructions_text.get_width()//2,
                                  instructions_button_rect.centery - instructions_text.get_height()//2))
 
         # Instructions dropdown (only show if button clicked)
         if show_instructions:
-            instructions = [
-                "HOW TO PLAY:",
-                "• Drag the blob to aim and release to launch",
-                "• Collect gray mini-blobs to gain power",
-                "• Destroy buildings/trees - save power for the GOLD boss!",
-                "• Click mid-flight to catch and re-launch",
-                "",
-                "CHARACTERS:",
-                "• Unlock 4 characters with rescued blobs (20-50 cost)",
-                "• Each has unique abilities: bouncy, efficient, magnetic",
-                "• Upgrade characters for enhanced abilities (2x character cost)",
-                "",
-                "WORLDS:",
-                "• CITY: Beat level 12 to unlock VILLAGE",
-                "• VILLAGE: Houses, gas clouds (avoid!), beat level 10 for FOREST",
-                "• FOREST: Trees, deadly snakes (instant death!), +10 HP per 5 blobs",
-                "",
-                "PROGRESSION:",
-                "• Grow bigger every 5 mini-blobs collected per level",
-                "• Gain +10 max power per 10 blobs collected in run",
-                "• Upgrade mini-blob count (6→10) for more blobs per level",
-                "• Out of power? Restart from level 1!"
-            ]
-
-            # Draw semi-transparent background for instructions
-            inst_bg = pygame.Surface((WIDTH - 100, 360))
-            inst_bg.set_alpha(220)
-            inst_bg.fill(WHITE)
-            screen.blit(inst_bg, (50, HEIGHT - 385))
+            # Semi-transparent background for instructions
+            screen.blit(self.inst_bg, (50, HEIGHT - 385))
 
             y_offset = HEIGHT - 375
-            for i, line in enumerate(instructions):
-                inst_text = tiny_font.render(line, True, BLACK)
+            for i, line in enumerate(MENU_INSTRUCTIONS):
+                inst_text = render_text(tiny_font, line, True, BLACK)
                 screen.blit(inst_text, (WIDTH//2 - inst_text.get_width()//2, y_offset + i * 20))
 
             # BACK button to close instructions (top right of dropdown)
@@ -1493,55 +2873,42 @@ while running:
             inst_back_color = YELLOW if inst_back_hover else BRIGHT_RED
             pygame.draw.rect(screen, inst_back_color, inst_back_button, border_radius=8)
             pygame.draw.rect(screen, BLACK, inst_back_button, 3, border_radius=8)
-            inst_back_text = tiny_font.render("BACK", True, BLACK)
+            inst_back_text = render_text(tiny_font, "BACK", True, BLACK)
             screen.blit(inst_back_text, (inst_back_button.centerx - inst_back_text.get_width()//2,
                                          inst_back_button.centery - inst_back_text.get_height()//2))
 
-    elif game_state == "story_intro":
+@register_state
+class StoryIntroState(GameState):
+    """Story intro - mini blobs run from Evil Mob, then on to character select"""
+    name = "story_intro"
+    clear_screen = False  # The backdrop covers the screen
+
+    def enter(self, previous):
+        global story_intro_frame
+        story_intro_frame = 0
+        get_story_backdrop()  # Static gradient, Evil Mob and title are composed once
+
+    def exit(self, following):
+        story_backdrop_cache["key"] = None
+        story_backdrop_cache["surface"] = None
+
+    def handle_event(self, event):
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            # Click anywhere to skip to character select
+            change_state("character_select")
+
+    def update(self):
+        global story_intro_frame
         # Story intro animation
         story_intro_frame += 1
 
-        # Draw a dramatic background
-        for i in range(HEIGHT):
-            ratio = i / HEIGHT
-            r = int(50 + (20 - 50) * ratio)
-            g = int(50 + (20 - 50) * ratio)
-            b = int(80 + (40 - 80) * ratio)
-            pygame.draw.line(screen, (r, g, b), (0, i), (WIDTH, i))
-
-        # Draw Evil Mob character in center (matching character menu appearance)
-        evil_mob_radius = 60
+        # Auto-advance after 8 seconds
+        if story_intro_frame > 480:
+            change_state("character_select")
 
-        # Draw cape (navy blue)
-        cape_points = [
-            (story_evil_mob_x - evil_mob_radius * 0.7, story_evil_mob_y - evil_mob_radius * 0.5),
-            (story_evil_mob_x + evil_mob_radius * 0.7, story_evil_mob_y - evil_mob_radius * 0.5),
-            (story_evil_mob_x + evil_mob_radius * 1.2, story_evil_mob_y + evil_mob_radius * 1.8),
-            (story_evil_mob_x - evil_mob_radius * 1.2, story_evil_mob_y + evil_mob_radius * 1.8),
-        ]
-        pygame.draw.polygon(screen, (0, 0, 128), cape_points)  # Navy blue
-        pygame.draw.polygon(screen, BLACK, cape_points, 3)
-
-        # Main body (gray)
-        pygame.draw.circle(screen, RED, (int(story_evil_mob_x), int(story_evil_mob_y)), evil_mob_radius)
-        pygame.draw.circle(screen, BLACK, (int(story_evil_mob_x), int(story_evil_mob_y)), evil_mob_radius, 3)
-
-        # Dark green rectangular mask
-        mask_y = int(story_evil_mob_y - evil_mob_radius * 0.2)
-        mask_height = int(evil_mob_radius * 0.4)
-        mask_rect = pygame.Rect(int(story_evil_mob_x - evil_mob_radius * 0.6), mask_y - mask_height // 2,
-                                int(evil_mob_radius * 1.2), mask_height)
-        pygame.draw.rect(screen, (0, 100, 0), mask_rect)
-        pygame.draw.rect(screen, BLACK, mask_rect, 3)
-
-        # Eyes
-        eye_y = mask_y
-        eye_size = max(3, int(evil_mob_radius * 0.18))
-        pupil_size = max(2, int(evil_mob_radius * 0.12))
-        pygame.draw.circle(screen, WHITE, (int(story_evil_mob_x - evil_mob_radius * 0.3), eye_y), eye_size)
-        pygame.draw.circle(screen, BLACK, (int(story_evil_mob_x - evil_mob_radius * 0.3), eye_y), pupil_size)
-        pygame.draw.circle(screen, WHITE, (int(story_evil_mob_x + evil_mob_radius * 0.3), eye_y), eye_size)
-        pygame.draw.circle(screen, BLACK, (int(story_evil_mob_x + evil_mob_radius * 0.3), eye_y), pupil_size)
+    def draw(self):
+        # Static gradient, Evil Mob and title (composed on enter)
+        screen.blit(get_story_backdrop(), (0, 0))
 
         # Draw mini blobs running away from Evil Mob
         mini_blob_y = story_evil_mob_y + 120
@@ -1588,33 +2955,62 @@ while running:
             pygame.draw.circle(screen, WHITE, (int(mx + 6), int(my + eye_offset_y + bob)), eye_size)
             pygame.draw.circle(screen, BLACK, (int(mx + 6 + pupil_offset_x), int(my + eye_offset_y + bob)), pupil_size)
 
-        # Story text
-        title_text = font.render("EVIL MOB", True, (200, 50, 50))
-        screen.blit(title_text, (WIDTH//2 - title_text.get_width()//2, 100))
-
-        # Warning message
-        warning_text = small_font.render("Evil Mob wants to take control of everyone!", True, WHITE)
+        # Warning message (drawn over the blobs, which run underneath it; the title lives in the backdrop)
+        warning_text = render_text(small_font, "Evil Mob wants to take control of everyone!", True, WHITE)
         screen.blit(warning_text, (WIDTH//2 - warning_text.get_width()//2, HEIGHT - 150))
 
-        help_text = small_font.render("Help us stop him!", True, (255, 200, 100))
+        help_text = render_text(small_font, "Help us stop him!", True, (255, 200, 100))
         screen.blit(help_text, (WIDTH//2 - help_text.get_width()//2, HEIGHT - 110))
 
         # Click to continue prompt (blink effect)
         if story_intro_frame % 60 < 40:
-            continue_text = tiny_font.render("Click anywhere to continue...", True, WHITE)
+            continue_text = render_text(tiny_font, "Click anywhere to continue...", True, WHITE)
             screen.blit(continue_text, (WIDTH//2 - continue_text.get_width()//2, HEIGHT - 60))
 
-        # Auto-advance after 8 seconds
-        if story_intro_frame > 480:
-            game_state = "character_select"
+@register_state
+class CharacterSelectState(GameState):
+    """Pick (or unlock) a character - with buttons to the worlds and upgrades"""
+    name = "character_select"
+
+    def handle_event(self, event):
+        global selected_character, blobs_rescued
+        if event.type != pygame.MOUSEBUTTONDOWN:
+            return
+        # Check character button clicks
+        for i, button in enumerate(char_buttons):
+            if button.collidepoint(event.pos):
+                char = characters[i]
+                if char["unlocked"]:
+                    # Already unlocked, select and go to world select
+                    selected_character = i
+                    change_state("world_select")
+                elif blobs_rescued >= char["cost"]:
+                    # Can afford to unlock
+                    blobs_rescued -= char["cost"]
+                    char["unlocked"] = True
+                    selected_character = i
+                    change_state("world_select")
+                # else: not enough blobs, do nothing
+                break
+        # Back button (top right)
+        back_button_char_select = pygame.Rect(WIDTH - 150, 20, 120, 50)
+        if back_button_char_select.collidepoint(event.pos):
+            change_state("menu")
+        # Worlds button
+        if worlds_button_rect.collidepoint(event.pos):
+            change_state("world_select")
+        # Upgrades button
+        if upgrades_button_rect.collidepoint(event.pos):
+            change_state("upgrades")
 
-    elif game_state == "character_select":
+    def draw(self):
+        mouse_pos = pygame.mouse.get_pos()
         # Title
-        title = font.render("SELECT CHARACTER", True, BLACK)
+        title = render_text(font, "SELECT CHARACTER", True, BLACK)
         screen.blit(title, (WIDTH//2 - title.get_width()//2, 80))
 
         # Show total blobs rescued (top left corner)
-        blob_count_text = small_font.render(f"Blobs: {blobs_rescued}", True, PURPLE)
+        blob_count_text = render_text(small_font, f"Blobs: {blobs_rescued}", True, PURPLE)
         screen.blit(blob_count_text, (20, 20))
 
         # Character buttons
@@ -1640,20 +3036,20 @@ while running:
             pygame.draw.rect(screen, BLACK, button, 4, border_radius=10)
 
             # Character name (at top)
-            name_text = tiny_font.render(char["name"], True, BLACK)
+            name_text = render_text(tiny_font, char["name"], True, BLACK)
             screen.blit(name_text, (button.centerx - name_text.get_width()//2, button.y + 10))
 
             # Character description (below name)
-            desc_text = tiny_font.render(char["description"], True, BLACK)
+            desc_text = render_text(tiny_font, char["description"], True, BLACK)
             screen.blit(desc_text, (button.centerx - desc_text.get_width()//2, button.y + 30))
 
             # Lock status or stats (below description, above character)
             if is_locked:
                 cost_color = GREEN if can_afford else RED
-                cost_text = tiny_font.render(f"Cost: {char['cost']} blobs", True, cost_color)
+                cost_text = render_text(tiny_font, f"Cost: {char['cost']} blobs", True, cost_color)
                 screen.blit(cost_text, (button.centerx - cost_text.get_width()//2, button.y + 50))
             else:
-                drain_text = tiny_font.render(f"Drain: {char['power_drain']}", True, BLACK)
+                drain_text = render_text(tiny_font, f"Drain: {char['power_drain']}", True, BLACK)
                 screen.blit(drain_text, (button.centerx - drain_text.get_width()//2, button.y + 50))
 
             # Character preview blob with cape (moved down)
@@ -1663,7 +3059,7 @@ while running:
 
             # Additional info at bottom
             if is_locked and can_afford:
-                unlock_text = tiny_font.render("Click to unlock!", True, GREEN)
+                unlock_text = render_text(tiny_font, "Click to unlock!", True, GREEN)
                 screen.blit(unlock_text, (button.centerx - unlock_text.get_width()//2, button.y + 165))
 
         # Back button (moved to top right)
@@ -1672,7 +3068,7 @@ while running:
         back_color = ORANGE if back_hover else RED
         pygame.draw.rect(screen, back_color, back_button_char_select, border_radius=10)
         pygame.draw.rect(screen, BLACK, back_button_char_select, 4, border_radius=10)
-        back_text = small_font.render("BACK", True, BLACK)
+        back_text = render_text(small_font, "BACK", True, BLACK)
         screen.blit(back_text, (back_button_char_select.centerx - back_text.get_width()//2,
                                 back_button_char_select.centery - back_text.get_height()//2))
 
@@ -1681,7 +3077,7 @@ while running:
         worlds_color = YELLOW if worlds_hover else BRIGHT_BLUE
         pygame.draw.rect(screen, worlds_color, worlds_button_rect, border_radius=10)
         pygame.draw.rect(screen, BLACK, worlds_button_rect, 4, border_radius=10)
-        worlds_text = tiny_font.render("WORLDS", True, BLACK)
+        worlds_text = render_text(tiny_font, "WORLDS", True, BLACK)
         screen.blit(worlds_text, (worlds_button_rect.centerx - worlds_text.get_width()//2,
                                    worlds_button_rect.centery - worlds_text.get_height()//2))
 
@@ -1690,21 +3086,55 @@ while running:
         upgrades_color = YELLOW if upgrades_hover else GREEN
         pygame.draw.rect(screen, upgrades_color, upgrades_button_rect, border_radius=10)
         pygame.draw.rect(screen, BLACK, upgrades_button_rect, 4, border_radius=10)
-        upgrades_text = tiny_font.render("UPGRADES", True, BLACK)
+        upgrades_text = render_text(tiny_font, "UPGRADES", True, BLACK)
         screen.blit(upgrades_text, (upgrades_button_rect.centerx - upgrades_text.get_width()//2,
                                      upgrades_button_rect.centery - upgrades_text.get_height()//2))
 
-    elif game_state == "upgrades":
+@register_state
+class UpgradesState(GameState):
+    """Buy character ability upgrades and more mini blobs per level"""
+    name = "upgrades"
+
+    def handle_event(self, event):
+        global blobs_rescued, mini_blob_upgrade_level
+        if event.type != pygame.MOUSEBUTTONDOWN:
+            return
+        # Character ability upgrades
+        for i, (button, char) in enumerate(zip(char_buttons, characters)):
+            if button.collidepoint(event.pos):
+                if char["unlocked"] and not char["upgraded"] and blobs_rescued >= char["upgrade_cost"] and char["upgrade_cost"] > 0:
+                    # Purchase upgrade
+                    blobs_rescued -= char["upgrade_cost"]
+                    char["upgraded"] = True
+                break
+        # Mini blob count upgrade (4 buttons for 4 upgrades) - moved to bottom
+        mini_blob_button_y = 510
+        for upgrade_num in range(4):
+            button_rect = pygame.Rect(50 + upgrade_num * 185, mini_blob_button_y, 170, 80)
+            if button_rect.collidepoint(event.pos):
+                if upgrade_num == mini_blob_upgrade_level and mini_blob_upgrade_level < 4:
+                    cost = mini_blob_upgrade_costs[upgrade_num]
+                    if blobs_rescued >= cost:
+                        blobs_rescued -= cost
+                        mini_blob_upgrade_level += 1
+                break
+        # Back button (top right position for upgrades screen)
+        back_button_upgrades = pygame.Rect(WIDTH - 150, 20, 120, 50)
+        if back_button_upgrades.collidepoint(event.pos):
+            change_state("character_select")
+
+    def draw(self):
+        mouse_pos = pygame.mouse.get_pos()
         # Upgrades screen
-        title = font.render("UPGRADES", True, BLACK)
+        title = render_text(font, "UPGRADES", True, BLACK)
         screen.blit(title, (WIDTH//2 - title.get_width()//2, 30))
 
         # Show total blobs rescued (top left corner)
-        blob_count_text = small_font.render(f"Blobs: {blobs_rescued}", True, PURPLE)
+        blob_count_text = render_text(small_font, f"Blobs: {blobs_rescued}", True, PURPLE)
         screen.blit(blob_count_text, (20, 20))
 
         # Character ability upgrades
-        subtitle = small_font.render("Character Abilities", True, BLACK)
+        subtitle = render_text(small_font, "Character Abilities", True, BLACK)
         screen.blit(subtitle, (WIDTH//2 - subtitle.get_width()//2, 80))
 
         for i, (button, char) in enumerate(zip(char_buttons, characters)):
@@ -1728,7 +3158,7 @@ while running:
             pygame.draw.rect(screen, BLACK, button, 4, border_radius=10)
 
             # Character name (at top)
-            name_text = tiny_font.render(char["name"], True, BLACK)
+            name_text = render_text(tiny_font, char["name"], True, BLACK)
             screen.blit(name_text, (button.centerx - name_text.get_width()//2, button.y + 15))
 
             # Character preview (below name)
@@ -1738,31 +3168,31 @@ while running:
 
             # Upgraded star indicator (next to name)
             if is_upgraded:
-                star_text = small_font.render("★", True, GOLD)
+                star_text = render_text(small_font, "★", True, GOLD)
                 screen.blit(star_text, (button.centerx + name_text.get_width()//2 + 5, button.y + 12))
 
             # Upgrade status
             if not is_unlocked:
-                locked_text = tiny_font.render("LOCKED", True, RED)
+                locked_text = render_text(tiny_font, "LOCKED", True, RED)
                 screen.blit(locked_text, (button.centerx - locked_text.get_width()//2, button.y + 135))
             elif is_upgraded:
-                upgraded_text = tiny_font.render("UPGRADED!", True, GREEN)
+                upgraded_text = render_text(tiny_font, "UPGRADED!", True, GREEN)
                 screen.blit(upgraded_text, (button.centerx - upgraded_text.get_width()//2, button.y + 135))
             elif has_upgrade:
-                desc_text = tiny_font.render(char["upgrade_desc"], True, BLACK)
+                desc_text = render_text(tiny_font, char["upgrade_desc"], True, BLACK)
                 screen.blit(desc_text, (button.centerx - desc_text.get_width()//2, button.y + 135))
                 cost_color = GREEN if can_afford else RED
-                cost_text = tiny_font.render(f"Cost: {char['upgrade_cost']}", True, cost_color)
+                cost_text = render_text(tiny_font, f"Cost: {char['upgrade_cost']}", True, cost_color)
                 screen.blit(cost_text, (button.centerx - cost_text.get_width()//2, button.y + 155))
                 if can_afford:
-                    click_text = tiny_font.render("Click to buy!", True, GREEN)
+                    click_text = render_text(tiny_font, "Click to buy!", True, GREEN)
                     screen.blit(click_text, (button.centerx - click_text.get_width()//2, button.y + 175))
             else:
-                no_upgrade_text = tiny_font.render("No upgrade", True, BLACK)
+                no_upgrade_text = render_text(tiny_font, "No upgrade", True, BLACK)
                 screen.blit(no_upgrade_text, (button.centerx - no_upgrade_text.get_width()//2, button.y + 135))
 
         # Mini blob count upgrades (moved to bottom)
-        mini_subtitle = small_font.render("Mini Blob Count (6 base)", True, BLACK)
+        mini_subtitle = render_text(small_font, "Mini Blob Count (6 base)", True, BLACK)
         screen.blit(mini_subtitle, (WIDTH//2 - mini_subtitle.get_width()//2, 470))
 
         mini_blob_button_y = 510
@@ -1788,22 +3218,22 @@ while running:
             pygame.draw.rect(screen, BLACK, button_rect, 4, border_radius=10)
 
             # Upgrade info
-            upgrade_title = tiny_font.render(f"Upgrade {upgrade_num + 1}", True, BLACK)
+            upgrade_title = render_text(tiny_font, f"Upgrade {upgrade_num + 1}", True, BLACK)
             screen.blit(upgrade_title, (button_rect.centerx - upgrade_title.get_width()//2, button_rect.y + 10))
 
             new_count = 7 + upgrade_num
-            count_text = tiny_font.render(f"+1 blob ({new_count} total)", True, BLACK)
+            count_text = render_text(tiny_font, f"+1 blob ({new_count} total)", True, BLACK)
             screen.blit(count_text, (button_rect.centerx - count_text.get_width()//2, button_rect.y + 30))
 
             if is_purchased:
-                purchased_text = tiny_font.render("PURCHASED", True, GREEN)
+                purchased_text = render_text(tiny_font, "PURCHASED", True, GREEN)
                 screen.blit(purchased_text, (button_rect.centerx - purchased_text.get_width()//2, button_rect.y + 50))
             elif is_next:
                 cost_color = GREEN if can_afford else RED
-                cost_text = tiny_font.render(f"Cost: {cost}", True, cost_color)
+                cost_text = render_text(tiny_font, f"Cost: {cost}", True, cost_color)
                 screen.blit(cost_text, (button_rect.centerx - cost_text.get_width()//2, button_rect.y + 50))
             else:
-                locked_text = tiny_font.render("LOCKED", True, (100, 100, 100))
+                locked_text = render_text(tiny_font, "LOCKED", True, (100, 100, 100))
                 screen.blit(locked_text, (button_rect.centerx - locked_text.get_width()//2, button_rect.y + 50))
 
         # Back button (moved to top right to avoid blocking mini blob upgrades)
@@ -1812,13 +3242,35 @@ while running:
         back_color = ORANGE if back_hover else RED
         pygame.draw.rect(screen, back_color, back_button_upgrades, border_radius=10)
         pygame.draw.rect(screen, BLACK, back_button_upgrades, 4, border_radius=10)
-        back_text = small_font.render("BACK", True, BLACK)
+        back_text = render_text(small_font, "BACK", True, BLACK)
         screen.blit(back_text, (back_button_upgrades.centerx - back_text.get_width()//2,
                                 back_button_upgrades.centery - back_text.get_height()//2))
 
-    elif game_state == "world_select":
+@register_state
+class WorldSelectState(GameState):
+    """Pick a world - starting one begins a new run from level 1"""
+    name = "world_select"
+
+    def handle_event(self, event):
+        if event.type != pygame.MOUSEBUTTONDOWN:
+            return
+        # City world button
+        if city_world_button.collidepoint(event.pos):
+            start_world("city")
+        # Forest world button
+        if forest_world_button.collidepoint(event.pos) and forest_unlocked:
+            start_world("forest")
+        # Village world button
+        if village_world_button.collidepoint(event.pos) and village_unlocked:
+            start_world("village")
+        # Back button
+        if back_button_rect.collidepoint(event.pos):
+            change_state("character_select")
+
+    def draw(self):
+        mouse_pos = pygame.mouse.get_pos()
         # World selection screen
-        title = font.render("SELECT WORLD", True, BLACK)
+        title = render_text(font, "SELECT WORLD", True, BLACK)
         screen.blit(title, (WIDTH//2 - title.get_width()//2, 80))
 
         # City world button
@@ -1826,11 +3278,11 @@ while running:
         city_color = YELLOW if city_hover else (200, 200, 200)
         pygame.draw.rect(screen, city_color, city_world_button, border_radius=10)
         pygame.draw.rect(screen, BLACK, city_world_button, 5, border_radius=10)
-        city_title = small_font.render("CITY", True, BLACK)
+        city_title = render_text(small_font, "CITY", True, BLACK)
         screen.blit(city_title, (city_world_button.centerx - city_title.get_width()//2, city_world_button.y + 20))
-        city_desc = tiny_font.render("Skyscrapers & Buildings", True, BLACK)
+        city_desc = render_text(tiny_font, "Skyscrapers & Buildings", True, BLACK)
         screen.blit(city_desc, (city_world_button.centerx - city_desc.get_width()//2, city_world_button.y + 60))
-        city_max_text = tiny_font.render(f"Max Level: {city_max_level}", True, BLACK)
+        city_max_text = render_text(tiny_font, f"Max Level: {city_max_level}", True, BLACK)
         screen.blit(city_max_text, (city_world_button.centerx - city_max_text.get_width()//2, city_world_button.y + 90))
 
         # Forest world button
@@ -1839,20 +3291,20 @@ while running:
             forest_color = YELLOW if forest_hover else (100, 180, 100)
             pygame.draw.rect(screen, forest_color, forest_world_button, border_radius=10)
             pygame.draw.rect(screen, BLACK, forest_world_button, 5, border_radius=10)
-            forest_title = small_font.render("FOREST", True, BLACK)
+            forest_title = render_text(small_font, "FOREST", True, BLACK)
             screen.blit(forest_title, (forest_world_button.centerx - forest_title.get_width()//2, forest_world_button.y + 20))
-            forest_desc = tiny_font.render("Trees & Snakes", True, BLACK)
+            forest_desc = render_text(tiny_font, "Trees & Snakes", True, BLACK)
             screen.blit(forest_desc, (forest_world_button.centerx - forest_desc.get_width()//2, forest_world_button.y + 60))
-            forest_bonus = tiny_font.render("+10 HP per 5 blobs", True, (0, 150, 0))
+            forest_bonus = render_text(tiny_font, "+10 HP per 5 blobs", True, (0, 150, 0))
             screen.blit(forest_bonus, (forest_world_button.centerx - forest_bonus.get_width()//2, forest_world_button.y + 90))
         else:
             pygame.draw.rect(screen, (100, 100, 100), forest_world_button, border_radius=10)
             pygame.draw.rect(screen, BLACK, forest_world_button, 5, border_radius=10)
-            locked_icon = font.render("🔒", True, BLACK)
+            locked_icon = render_text(font, "🔒", True, BLACK)
             screen.blit(locked_icon, (forest_world_button.centerx - locked_icon.get_width()//2, forest_world_button.y + 20))
-            unlock_text = tiny_font.render("Beat Village", True, (200, 200, 200))
+            unlock_text = render_text(tiny_font, "Beat Village", True, (200, 200, 200))
             screen.blit(unlock_text, (forest_world_button.centerx - unlock_text.get_width()//2, forest_world_button.y + 70))
-            level_text = tiny_font.render("Level 10", True, (200, 200, 200))
+            level_text = render_text(tiny_font, "Level 10", True, (200, 200, 200))
             screen.blit(level_text, (forest_world_button.centerx - level_text.get_width()//2, forest_world_button.y + 95))
 
         # Village world button
@@ -1861,18 +3313,18 @@ while running:
             village_color = YELLOW if village_hover else (150, 200, 150)
             pygame.draw.rect(screen, village_color, village_world_button, border_radius=10)
             pygame.draw.rect(screen, BLACK, village_world_button, 5, border_radius=10)
-            village_title = small_font.render("VILLAGE", True, BLACK)
+            village_title = render_text(small_font, "VILLAGE", True, BLACK)
             screen.blit(village_title, (village_world_button.centerx - village_title.get_width()//2, village_world_button.y + 20))
-            village_desc = tiny_font.render("Houses & Gas Clouds", True, BLACK)
+            village_desc = render_text(tiny_font, "Houses & Gas Clouds", True, BLACK)
             screen.blit(village_desc, (village_world_button.centerx - village_desc.get_width()//2, village_world_button.y + 60))
-            village_max_text = tiny_font.render(f"Max Level: {village_max_level}", True, BLACK)
+            village_max_text = render_text(tiny_font, f"Max Level: {village_max_level}", True, BLACK)
             screen.blit(village_max_text, (village_world_button.centerx - village_max_text.get_width()//2, village_world_button.y + 90))
         else:
             pygame.draw.rect(screen, (100, 100, 100), village_world_button, border_radius=10)
             pygame.draw.rect(screen, BLACK, village_world_button, 5, border_radius=10)
-            locked_icon = font.render("🔒", True, BLACK)
+            locked_icon = render_text(font, "🔒", True, BLACK)
             screen.blit(locked_icon, (village_world_button.centerx - locked_icon.get_width()//2, village_world_button.y + 30))
-            locked_text = tiny_font.render("Beat City Level 12", True, BLACK)
+            locked_text = render_text(tiny_font, "Beat City Level 12", True, BLACK)
             screen.blit(locked_text, (village_world_button.centerx - locked_text.get_width()//2, village_world_button.y + 100))
 
         # Back button
@@ -1880,126 +3332,84 @@ while running:
         back_color = ORANGE if back_hover else RED
         pygame.draw.rect(screen, back_color, back_button_rect, border_radius=10)
         pygame.draw.rect(screen, BLACK, back_button_rect, 4, border_radius=10)
-        back_text = small_font.render("BACK", True, BLACK)
+        back_text = render_text(small_font, "BACK", True, BLACK)
         screen.blit(back_text, (back_button_rect.centerx - back_text.get_width()//2,
                                 back_button_rect.centery - back_text.get_height()//2))
 
-    elif game_state == "city_intro":
-        # Draw city background
-        draw_city_background()
-
+class WorldIntroState(GameState):
+    """Evil Mob crosses a world's background before its first level - shared by the three intros"""
+    world = None
+    clear_screen = False  # The world background covers the screen
+
+    def enter(self, previous):
+        global villain_active, villain_frame
+        villain_active = True
+        villain_frame = 0
+
+    def exit(self, following):
+        global villain_active
+        villain_active = False
+
+    def draw(self):
+        draw_world_background(self.world)
+        draw_evil_mob(villain_x, villain_y)
+
+@register_state
+class CityIntroState(WorldIntroState):
+    """City intro - Evil Mob runs away to the left"""
+    name = "city_intro"
+    world = "city"
+
+    def enter(self, previous):
+        global villain_x
+        super().enter(previous)
+        villain_x = WIDTH + 100  # Start off-screen right
+
+    def handle_event(self, event):
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            # Click anywhere to skip to playing
+            change_state("playing")
+
+    def update(self):
+        global villain_frame, villain_x
         # Animate Evil Mob running away (left to right, fleeing)
         villain_frame += 1
         villain_x -= 5  # Move left (running away)
 
-        # Draw Evil Mob running away
-        villain_radius = 35
-        villain_color = RED  # Gray (Evil Mob)
+        # When villain reaches left side of screen, transition to playing
+        if villain_x < -100:
+            change_state("playing")
 
-        # Draw cape (navy blue)
-        cape_points = [
-            (villain_x - villain_radius * 0.7, villain_y - villain_radius * 0.5),
-            (villain_x + villain_radius * 0.7, villain_y - villain_radius * 0.5),
-            (villain_x + villain_radius * 1.2, villain_y + villain_radius * 1.8),
-            (villain_x - villain_radius * 1.2, villain_y + villain_radius * 1.8),
-        ]
-        cape_color = (0, 0, 128)  # Navy blue
-        pygame.draw.polygon(screen, cape_color, cape_points)
-        pygame.draw.polygon(screen, BLACK, cape_points, 2)
-
-        # Draw "EM" letters on cape
-        letter_y = int(villain_y + villain_radius * 0.8)
-        letter_font = pygame.font.Font(None, max(int(villain_radius * 0.8), 20))
-        em_text = letter_font.render("EM", True, (100, 100, 100))
-        screen.blit(em_text, (int(villain_x - em_text.get_width() // 2), letter_y - em_text.get_height() // 2))
-
-        # Main body (gray)
-        pygame.draw.circle(screen, villain_color, (int(villain_x), int(villain_y)), villain_radius)
-        pygame.draw.circle(screen, BLACK, (int(villain_x), int(villain_y)), villain_radius, 2)
-
-        # Dark green rectangular mask
-        mask_y = int(villain_y - villain_radius * 0.2)
-        mask_height = int(villain_radius * 0.4)
-        mask_rect = pygame.Rect(int(villain_x - villain_radius * 0.6), mask_y - mask_height // 2,
-                                int(villain_radius * 1.2), mask_height)
-        pygame.draw.rect(screen, (0, 100, 0), mask_rect)
-        pygame.draw.rect(screen, BLACK, mask_rect, 2)
-
-        # Eyes looking forward (fleeing)
-        eye_y = mask_y
-        eye_size = max(3, int(villain_radius * 0.18))
-        pupil_size = max(2, int(villain_radius * 0.12))
-        pygame.draw.circle(screen, WHITE, (int(villain_x - villain_radius * 0.3), eye_y), eye_size)
-        pygame.draw.circle(screen, BLACK, (int(villain_x - villain_radius * 0.3), eye_y), pupil_size)
-        pygame.draw.circle(screen, WHITE, (int(villain_x + villain_radius * 0.3), eye_y), eye_size)
-        pygame.draw.circle(screen, BLACK, (int(villain_x + villain_radius * 0.3), eye_y), pupil_size)
+    def draw(self):
+        super().draw()
 
         # Show villain text
         if villain_frame > 30:
-            villain_name = font.render("EVIL MOB", True, BLACK)
+            villain_name = render_text(font, "EVIL MOB", True, BLACK)
             screen.blit(villain_name, (WIDTH//2 - villain_name.get_width()//2, 40))
 
             # Evil Mob's taunting speech
-            villain_speech = small_font.render("You will never catch me!", True, (80, 20, 100))
+            villain_speech = render_text(small_font, "You will never catch me!", True, (80, 20, 100))
             screen.blit(villain_speech, (WIDTH//2 - villain_speech.get_width()//2, 85))
 
-        # When villain reaches left side of screen, transition to playing
-        if villain_x < -100:
-            villain_active = False
-            game_state = "playing"
+@register_state
+class VillainIntroState(WorldIntroState):
+    """Village intro - Evil Mob flies across dropping the level's gas clouds"""
+    name = "villain_intro"
+    world = "village"
 
-    elif game_state == "villain_intro":
-        # Draw village background
-        draw_village_background()
+    def enter(self, previous):
+        global villain_x, gas_spawn_points
+        super().enter(previous)
+        villain_x = -100
+        gas_spawn_points = []
 
+    def update(self):
+        global villain_frame, villain_x
         # Animate evil mob flying across screen
         villain_frame += 1
         villain_x += 4  # Move right
 
-        # Draw evil mob like the Evil Mob character (gray body with orange cape and green mask)
-        villain_radius = 35
-        villain_color = RED  # Gray (Evil Mob uses RED which is gray)
-
-        # Draw cape behind the villain (navy blue like Evil Mob in menu)
-        cape_points = [
-            (villain_x - villain_radius * 0.7, villain_y - villain_radius * 0.5),  # Left shoulder
-            (villain_x + villain_radius * 0.7, villain_y - villain_radius * 0.5),  # Right shoulder
-            (villain_x + villain_radius * 1.2, villain_y + villain_radius * 1.8),  # Right bottom
-            (villain_x - villain_radius * 1.2, villain_y + villain_radius * 1.8),  # Left bottom
-        ]
-        cape_color = (0, 0, 128)  # Navy blue (Evil Mob's cape color)
-        pygame.draw.polygon(screen, cape_color, cape_points)
-        pygame.draw.polygon(screen, BLACK, cape_points, 2)
-
-        # Draw "EM" letters on cape for Evil Mob
-        letter_y = int(villain_y + villain_radius * 0.8)
-        letter_font = pygame.font.Font(None, max(int(villain_radius * 0.8), 20))
-        em_text = letter_font.render("EM", True, (100, 100, 100))
-        screen.blit(em_text, (int(villain_x - em_text.get_width() // 2), letter_y - em_text.get_height() // 2))
-
-        # Main villain body (gray)
-        pygame.draw.circle(screen, villain_color, (int(villain_x), int(villain_y)), villain_radius)
-        pygame.draw.circle(screen, BLACK, (int(villain_x), int(villain_y)), villain_radius, 2)
-
-        # Face mask - dark green rectangular (Evil Mob's signature look)
-        mask_y = int(villain_y - villain_radius * 0.2)
-        mask_height = int(villain_radius * 0.4)
-        mask_rect = pygame.Rect(int(villain_x - villain_radius * 0.6), mask_y - mask_height // 2,
-                                int(villain_radius * 1.2), mask_height)
-        pygame.draw.rect(screen, (0, 100, 0), mask_rect)  # Dark green
-        pygame.draw.rect(screen, BLACK, mask_rect, 2)
-
-        # Eyes with white circles and black pupils
-        eye_y = mask_y
-        eye_size = max(3, int(villain_radius * 0.18))
-        pupil_size = max(2, int(villain_radius * 0.12))
-        # Left eye
-        pygame.draw.circle(screen, WHITE, (int(villain_x - villain_radius * 0.3), eye_y), eye_size)
-        pygame.draw.circle(screen, BLACK, (int(villain_x - villain_radius * 0.3), eye_y), pupil_size)
-        # Right eye
-        pygame.draw.circle(screen, WHITE, (int(villain_x + villain_radius * 0.3), eye_y), eye_size)
-        pygame.draw.circle(screen, BLACK, (int(villain_x + villain_radius * 0.3), eye_y), pupil_size)
-
         # Spawn gas clouds at intervals
         if villain_frame == 60:  # First cloud
             gas_spawn_points.append((villain_x, villain_y + 40))
@@ -2010,99 +3420,70 @@ while running:
         elif villain_frame == 240 and level >= 8:  # Fourth cloud at level 8+
             gas_spawn_points.append((villain_x, villain_y + 40))
 
+        # When villain reaches right side of screen, transition to playing
+        if villain_x > WIDTH + 100:
+            # Create gas clouds from the spawn points with velocities
+            sim.spawn_gas_clouds_at(gas_spawn_points)
+            change_state("playing")
+
+    def draw(self):
+        super().draw()
+
         # Draw spawning gas clouds with animation
         for i, (gx, gy) in enumerate(gas_spawn_points):
             # Cloud grows in size
             growth_frame = villain_frame - (60 + i * 60)
             if growth_frame > 0:
-                cloud_size = min(25, growth_frame)
-                cloud_surf = pygame.Surface((cloud_size * 2, cloud_size * 2), pygame.SRCALPHA)
-                pygame.draw.circle(cloud_surf, (200, 180, 230, 80), (cloud_size, cloud_size), cloud_size)
-                screen.blit(cloud_surf, (int(gx - cloud_size), int(gy - cloud_size)))
+                cloud_size = min(GAS_CLOUD_RADIUS, growth_frame)
+                screen.blit(get_gas_cloud_texture(cloud_size), (int(gx - cloud_size), int(gy - cloud_size)))
 
         # Show villain text
         if villain_frame > 30:
-            villain_name = font.render("EVIL MOB", True, BLACK)
+            villain_name = render_text(font, "EVIL MOB", True, BLACK)
             screen.blit(villain_name, (WIDTH//2 - villain_name.get_width()//2, 40))
 
             # Evil Mob's speech
-            villain_speech = small_font.render("I will control everyone with this gas!", True, (80, 20, 100))
+            villain_speech = render_text(small_font, "I will control everyone with this gas!", True, (80, 20, 100))
             screen.blit(villain_speech, (WIDTH//2 - villain_speech.get_width()//2, 85))
 
-        # When villain reaches right side of screen, transition to playing
-        if villain_x > WIDTH + 100:
-            villain_active = False
-            # Create gas clouds from the spawn points with velocities
-            gas_clouds = []
-            for i, (gx, gy) in enumerate(gas_spawn_points):
-                gas_clouds.append({
-                    "x": gx,
-                    "y": gy,
-                    "r": 25,
-                    "vel_x": random.choice([-1, 1]) * random.uniform(0.8, 1.2),
-                    "vel_y": random.choice([-1, 1]) * random.uniform(0.8, 1.2)
-                })
-            game_state = "playing"
-
-    elif game_state == "forest_intro":
-        # Draw forest background
-        draw_forest_background()
 
+@register_state
+class ForestIntroState(WorldIntroState):
+    """Forest intro - Evil Mob flies across while the snakes drop onto their trees"""
+    name = "forest_intro"
+    world = "forest"
+
+    def enter(self, previous):
+        global villain_x, villain_y
+        super().enter(previous)
+        villain_x = -100  # Start off-screen left
+        villain_y = HEIGHT // 2
+
+    def handle_event(self, event):
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            # Click anywhere to skip to playing
+            change_state("playing")
+
+    def update(self):
+        global villain_frame, villain_x
         # Animate evil mob flying across screen (left to right)
         villain_frame += 1
         villain_x += 3  # Move right across screen
 
-        # Draw evil mob like the Evil Mob character (gray body with navy blue cape and green mask)
-        villain_radius = 35
-        villain_color = RED  # Gray (Evil Mob uses RED which is gray)
+        # When villain reaches right side of screen AND snakes have finished falling, transition to playing
+        if villain_x > WIDTH + 100 and villain_frame > 120:
+            change_state("playing")
 
-        # Draw cape behind the villain (navy blue like Evil Mob in menu)
-        cape_points = [
-            (villain_x - villain_radius * 0.7, villain_y - villain_radius * 0.5),  # Left shoulder
-            (villain_x + villain_radius * 0.7, villain_y - villain_radius * 0.5),  # Right shoulder
-            (villain_x + villain_radius * 1.2, villain_y + villain_radius * 1.8),  # Right bottom
-            (villain_x - villain_radius * 1.2, villain_y + villain_radius * 1.8),  # Left bottom
-        ]
-        cape_color = (0, 0, 128)  # Navy blue (Evil Mob's cape color)
-        pygame.draw.polygon(screen, cape_color, cape_points)
-        pygame.draw.polygon(screen, BLACK, cape_points, 2)
-
-        # Draw "EM" letters on cape for Evil Mob
-        letter_y = int(villain_y + villain_radius * 0.8)
-        letter_font = pygame.font.Font(None, max(int(villain_radius * 0.8), 20))
-        em_text = letter_font.render("EM", True, (100, 100, 100))
-        screen.blit(em_text, (int(villain_x - em_text.get_width() // 2), letter_y - em_text.get_height() // 2))
-
-        # Main villain body (gray)
-        pygame.draw.circle(screen, villain_color, (int(villain_x), int(villain_y)), villain_radius)
-        pygame.draw.circle(screen, BLACK, (int(villain_x), int(villain_y)), villain_radius, 2)
-
-        # Face mask - dark green rectangular (Evil Mob's signature look)
-        mask_y = int(villain_y - villain_radius * 0.2)
-        mask_height = int(villain_radius * 0.4)
-        mask_rect = pygame.Rect(int(villain_x - villain_radius * 0.6), mask_y - mask_height // 2,
-                                int(villain_radius * 1.2), mask_height)
-        pygame.draw.rect(screen, (0, 100, 0), mask_rect)  # Dark green
-        pygame.draw.rect(screen, BLACK, mask_rect, 2)
-
-        # Eyes with white circles and black pupils
-        eye_y = mask_y
-        eye_size = max(3, int(villain_radius * 0.18))
-        pupil_size = max(2, int(villain_radius * 0.12))
-        # Left eye
-        pygame.draw.circle(screen, WHITE, (int(villain_x - villain_radius * 0.3), eye_y), eye_size)
-        pygame.draw.circle(screen, BLACK, (int(villain_x - villain_radius * 0.3), eye_y), pupil_size)
-        # Right eye
-        pygame.draw.circle(screen, WHITE, (int(villain_x + villain_radius * 0.3), eye_y), eye_size)
-        pygame.draw.circle(screen, BLACK, (int(villain_x + villain_radius * 0.3), eye_y), pupil_size)
+    def draw(self):
+        super().draw()
 
         # Show villain text
         if villain_frame > 30:
-            villain_name = font.render("EVIL MOB", True, BLACK)
+            villain_name = render_text(font, "EVIL MOB", True, BLACK)
             screen.blit(villain_name, (WIDTH//2 - villain_name.get_width()//2, 40))
 
             # Evil Mob's taunting speech about snakes
-            villain_speech = small_font.render("You will never escape from my snakes!", True, (80, 20, 100))
+            villain_speech = render_text(small_font, "You will never escape from my snakes!", True, (80, 20, 100))
             screen.blit(villain_speech, (WIDTH//2 - villain_speech.get_width()//2, 85))
 
         # Draw falling snakes animation (they fall from top of screen to their tree positions)
@@ -2111,11 +3492,11 @@ while running:
             fall_progress = min(1.0, (villain_frame - 60) / 60.0)  # 60 frames to fall
 
             # Get current tree positions to know where snakes should land
-            for i, tree in enumerate(buildings):
-                if not tree.get("is_boss") and "visual_x" in tree:
+            for i, tree in enumerate(sim.buildings):
+                if not tree.is_boss and tree.visual_x is not None:
                     # Target position where snake should end up
-                    target_x = tree["visual_x"] + tree["visual_w"] // 2
-                    target_y = tree["visual_y"] + 150
+                    target_x = tree.visual_x + tree.visual_w // 2
+                    target_y = tree.visual_y + 150
 
                     # Start position (top of screen)
                     start_y = -50 - (i * 30)  # Stagger the starting heights
@@ -2154,286 +3535,103 @@ while running:
                             pygame.draw.line(screen, (200, 0, 0), (int(tongue_x), int(tongue_y)),
                                            (int(tongue_x + 8), int(tongue_y - 3)), 2)
 
-        # When villain reaches right side of screen AND snakes have finished falling, transition to playing
-        if villain_x > WIDTH + 100 and villain_frame > 120:
-            villain_active = False
-            game_state = "playing"
 
-    elif game_state == "playing":
-        # Draw background based on world
-        if current_world == "village":
-            draw_village_background()
-        elif current_world == "forest":
-            draw_forest_background()
-        else:
-            draw_city_background()
+WORLD_INTROS = {"city": "city_intro", "village": "villain_intro", "forest": "forest_intro"}
 
-        # Update blob size based on blobs collected THIS level (resets each level)
-        blob_radius = 20 + (blobs_collected_level // 5) * 4
+@register_state
+class PlayingState(GameState):
+    """A level - the simulation runs on the fixed timestep and the screen is drawn over the static layer"""
+    name = "playing"
+    clear_screen = False  # The static layer covers the screen
 
-        # Max power increases by 10 for every 10 blobs collected in current run
-        max_power = 100 + (blobs_collected_run // 10) * 10
+    def enter(self, previous):
+        # The simulation waited on the other screens - it starts over with one step
+        timestep["last_ticks"] = None
+        pending_sim_events.clear()
 
-        # VILLAGE BONUS: Extra +10 max health for every 7 mini blobs collected in the run
-        # So at 7, 14, 21, 28... blobs you get +10 HP each time
-        if current_world == "village":
-            max_power += (blobs_collected_run // 7) * 10
+    def exit(self, following):
+        # The next level or run brings new buildings, so the composed static layer can go
+        static_layer["key"] = None
+        static_layer["surface"] = None
 
-        # FOREST BONUS: Extra +10 max health for every 5 mini blobs collected in the run
-        # So at 5, 10, 15, 20... blobs you get +10 HP each time
-        if current_world == "forest":
-            max_power += (blobs_collected_run // 5) * 10
-
-        # Gate timer update (level 10+ in city only)
-        if level >= 10 and current_world == "city":
-            gate["timer"] += 1
-            if gate["open"]:
-                if gate["timer"] >= gate["open_duration"]:
-                    gate["open"] = False
-                    gate["timer"] = 0
+    def handle_event(self, event):
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            # Give Up button
+            if give_up_button_rect.collidepoint(event.pos):
+                change_state("character_select")
             else:
-                if gate["timer"] >= gate["close_duration"]:
-                    gate["open"] = True
-                    gate["timer"] = 0
-
-        # Power drain
-        if flying:
-            power -= power_drain_rate
-            power = max(0, power)
-            
-            # Check if power depleted
-            if power <= 0:
-                game_state = "level_failed"
-        
+                # Catch the blob mid-flight or grab it for the initial launch
+                pending_sim_events.append(("press", event.pos))
+        elif event.type == pygame.MOUSEBUTTONUP:
+            # Launch the blob if it is being dragged
+            pending_sim_events.append(("release", event.pos))
+
+    def update(self):
+        global blobs_rescued
+        # Advance the game logic by the fixed steps that are due, then react to what happened
+        outcome = None
+        for event_kind, target in advance_simulation():
+            if event_kind == "collected":
+                blobs_rescued += 1  # Currency for unlocking characters
+            elif event_kind == "power_out":
+                outcome = "level_failed"
+            elif event_kind in ("destroyed", "boss_smashed"):
+                drop_building_sprite(target)
+                if event_kind == "boss_smashed":
+                    outcome = "comic_panel"
+        if outcome:
+            change_state(outcome)
+
+    def draw(self):
+        mouse_pos = pygame.mouse.get_pos()
+        # Draw the static layer (background, buildings, boss label) - in dirty-rect
+        # mode only the areas that changed last frame are restored
+        partial_frame = begin_playing_frame()
+        frame_timer.lap("background")
+
         # Drag visual with trajectory preview
-        if dragging:
-            mouse_x, mouse_y = pygame.mouse.get_pos()
-            blob_x, blob_y = mouse_x, mouse_y
-            pygame.draw.line(screen, RED, (launch_x, launch_y), (blob_x, blob_y), 3)
+        if sim.dragging:
+            launch_x, launch_y = sim.launch_x, sim.launch_y
+            mark_dirty(pygame.draw.line(screen, RED, (launch_x, launch_y), (sim.blob_x, sim.blob_y), 3))
             
-            # Draw arc preview
-            preview_vel_x = (launch_x - blob_x) * 0.2
-            preview_vel_y = (launch_y - blob_y) * 0.2
-            px, py = launch_x, launch_y
-            for i in range(30):
-                preview_vel_y += gravity
-                px += preview_vel_x
-                py += preview_vel_y
+            # Draw arc preview (solved by the simulation, bounces included - cached while the aim holds still)
+            for i, (px, py) in enumerate(sim.preview_path()):
                 if i % 3 == 0 and py < HEIGHT:
-                    pygame.draw.circle(screen, RED, (int(px), int(py)), 2)
-        
-        # Physics
-        if flying:
-            blob_vel_y += gravity
-            blob_x += blob_vel_x
-            blob_y += blob_vel_y
-
-            # Magnetic attraction (Richard's ability - STRONGER PULL!)
-            if has_magnetic_ability:
-                for mini in mini_blobs:
-                    if mini["alive"]:
-                        dist = math.sqrt((blob_x - mini["x"])**2 + (blob_y - mini["y"])**2)
-                        magnetic_range = 150  # Attraction range (same as before)
-                        if dist < magnetic_range and dist > 0:
-                            # Pull mini blobs toward player
-                            pull_strength = 5.0  # Base strength
-                            # Upgrade: Even stronger magnetic pull
-                            if characters[selected_character]["upgraded"]:
-                                pull_strength = 7.5  # Upgraded strength
-                            dx = (blob_x - mini["x"]) / dist
-                            dy = (blob_y - mini["y"]) / dist
-                            mini["x"] += dx * pull_strength
-                            mini["y"] += dy * pull_strength
-
-            # Collect mini blobs - FIXED DISTANCE CHECK
-            for mini in mini_blobs:
-                if mini["alive"]:
-                    dist = math.sqrt((blob_x - mini["x"])**2 + (blob_y - mini["y"])**2)
-                    if dist < blob_radius + mini["r"] + 5:  # Added buffer
-                        mini["alive"] = False
-                        blobs_rescued += 1  # Currency for unlocking characters
-                        blobs_collected_run += 1  # Counter for max power increase
-                        blobs_collected_level += 1  # Counter for size increase this level
-                        power = min(max_power, power + 15)  # Refill power
-            
-            # Collision cooldown
-            if collision_cooldown > 0:
-                collision_cooldown -= 1
-            
-            # Building collisions
-            if collision_cooldown == 0:
-                for building in buildings:
-                    if building["alive"]:
-                        # Rectangle collision detection
-                        if (blob_x + blob_radius > building["x"] and 
-                            blob_x - blob_radius < building["x"] + building["w"] and
-                            blob_y + blob_radius > building["y"] and 
-                            blob_y - blob_radius < building["y"] + building["h"]):
-                            
-                            collision_cooldown = 15  # Prevent rapid re-collision
-                            
-                            # Check if boss building
-                            if building.get("is_boss"):
-                                required = building.get("required_power", 50)
-                                # Evil Mob upgrade: Smash bosses faster (30% less power needed)
-                                if can_pierce_buildings and characters[selected_character]["upgraded"]:
-                                    required = int(required * 0.7)  # 30% reduction
-                                if power >= required:
-                                    # SMASH THE BOSS!
-                                    building["alive"] = False
-                                    building["pieces"] = create_debris(building)
-                                    game_state = "comic_panel"
-                                else:
-                                    # Bounce off - not enough power
-                                    center_x = building["x"] + building["w"] / 2
-                                    
-                                    if blob_x < center_x:
-                                        blob_vel_x = -abs(blob_vel_x) * bounce_damping
-                                        blob_x = building["x"] - blob_radius - 2
-                                    else:
-                                        blob_vel_x = abs(blob_vel_x) * bounce_damping
-                                        blob_x = building["x"] + building["w"] + blob_radius + 2
-                            else:
-                                # Regular building - DESTROY ON HIT
-                                building["alive"] = False
-                                building["pieces"] = create_debris(building)
-
-                                # Pierce or bounce based on character ability
-                                if not can_pierce_buildings:
-                                    # Bounce after destruction
-                                    center_x = building["x"] + building["w"] / 2
-
-                                    if blob_x < center_x:
-                                        blob_vel_x = -abs(blob_vel_x) * bounce_damping
-                                    else:
-                                        blob_vel_x = abs(blob_vel_x) * bounce_damping
-                                # else: Red blob pierces through, no bounce!
-
-                            if not can_pierce_buildings:
-                                break  # Only break if not piercing
-            
-            # Bounce off edges
-            if blob_x - blob_radius < 0:
-                blob_vel_x = abs(blob_vel_x) * bounce_damping
-                blob_x = blob_radius
-            elif blob_x + blob_radius > WIDTH:
-                blob_vel_x = -abs(blob_vel_x) * bounce_damping
-                blob_x = WIDTH - blob_radius
-            
-            if blob_y - blob_radius < 0:
-                blob_vel_y = abs(blob_vel_y) * bounce_damping
-                blob_y = blob_radius
-
-            # Gate collision (level 10+ in city only)
-            if level >= 10 and current_world == "city" and collision_cooldown == 0:
-                if not gate["open"]:
-                    # Check collision with closed gate
-                    if (blob_x + blob_radius > gate["x"] and
-                        blob_x - blob_radius < gate["x"] + gate["width"] and
-                        blob_y + blob_radius > gate["y"] and
-                        blob_y - blob_radius < gate["y"] + gate["height"]):
-                        # Bounce off closed gate
-                        collision_cooldown = 15
-                        if blob_x < gate["x"] + gate["width"] / 2:
-                            blob_vel_x = -abs(blob_vel_x) * bounce_damping
-                            blob_x = gate["x"] - blob_radius - 2
-                        else:
-                            blob_vel_x = abs(blob_vel_x) * bounce_damping
-                            blob_x = gate["x"] + gate["width"] + blob_radius + 2
-
-            # Hit ground - reset
-            if blob_y > HEIGHT - blob_radius:
-                blob_x, blob_y = 100, 450
-                blob_vel_x, blob_vel_y = 0, 0
-                flying = False
-                can_catch = False
-                collision_cooldown = 0
-        
-        # Update debris
-        for building in buildings:
-            for piece in building["pieces"]:
-                piece["vel_y"] += gravity
-                piece["x"] += piece["vel_x"]
-                piece["y"] += piece["vel_y"]
-                piece["rotation"] += piece["rot_speed"]
-
-                if piece["y"] < HEIGHT + 50:
-                    # Choose color based on world and boss status
-                    if building.get("is_boss"):
-                        color = GOLD
-                    elif current_world == "forest":
-                        color = (34, 100, 34)  # Green for forest tree debris
-                    else:
-                        color = (120, 120, 120)  # Gray for regular buildings
-                    pygame.draw.rect(screen, color, (int(piece["x"]), int(piece["y"]), piece["w"], piece["h"]))
-        
-        # Draw buildings with new graphics
-        for building in buildings:
-            draw_building(building, current_world)
-            # Draw power requirement for boss
-            if building["alive"] and building.get("is_boss"):
-                req_text = tiny_font.render(f"Need {building['required_power']} pwr", True, BLACK)
-                req_bg = pygame.Surface((req_text.get_width() + 10, req_text.get_height() + 4))
-                req_bg.set_alpha(200)
-                req_bg.fill(WHITE)
-                screen.blit(req_bg, (building["x"] - 5, building["y"] - 28))
-                screen.blit(req_text, (building["x"], building["y"] - 26))
+                    mark_dirty(pygame.draw.circle(screen, RED, (int(px), int(py)), 2))
+        frame_timer.lap("player")
 
-        # Update and draw gas clouds (village only)
+        # Draw debris (pieces that fell off screen are already back in the pool)
+        for x, y, w, h, kind in sim.debris.rects(timestep["alpha"]):
+            pygame.draw.rect(screen, DEBRIS_COLORS[kind], (x, y, w, h))
+        frame_timer.lap("buildings")
+        
+        # Draw gas clouds (village only)
         if current_world == "village":
-            for cloud in gas_clouds:
-                # Move gas cloud (always moving)
-                cloud["x"] += cloud["vel_x"]
-                cloud["y"] += cloud["vel_y"]
-
-                # Bounce off walls
-                if cloud["x"] - cloud["r"] < 0 or cloud["x"] + cloud["r"] > WIDTH:
-                    cloud["vel_x"] *= -1
-                if cloud["y"] - cloud["r"] < 0 or cloud["y"] + cloud["r"] > HEIGHT:
-                    cloud["vel_y"] *= -1
-
-                # Check collision with player (only when flying)
-                if flying:
-                    dist = math.sqrt((blob_x - cloud["x"])**2 + (blob_y - cloud["y"])**2)
-                    if dist < blob_radius + cloud["r"]:
-                        # Hit gas cloud - lose 20 power!
-                        power = max(0, power - 20)
-
+            for cloud in sim.gas_clouds:
+                x, y = interpolated(cloud)
                 # Draw gas cloud (darker light purple) - ALWAYS VISIBLE
-                gas_surface = pygame.Surface((cloud["r"] * 2, cloud["r"] * 2), pygame.SRCALPHA)
-                # Darker purple with higher alpha - easier to see
-                pygame.draw.circle(gas_surface, (200, 180, 230, 80), (cloud["r"], cloud["r"]), cloud["r"])
-                screen.blit(gas_surface, (int(cloud["x"] - cloud["r"]), int(cloud["y"] - cloud["r"])))
+                # Darker purple with higher alpha - easier to see (cached texture)
+                screen.blit(get_gas_cloud_texture(cloud.r), (int(x - cloud.r), int(y - cloud.r)))
                 # Darker outer edge - more visible
-                pygame.draw.circle(screen, (180, 160, 210, 100), (int(cloud["x"]), int(cloud["y"])), cloud["r"], 2)
+                pygame.draw.circle(screen, (180, 160, 210, 100), (int(x), int(y)), cloud.r, 2)
 
-        # Update and draw snakes (forest only)
+        # Draw snakes (forest only) - animations follow the simulation clock
         if current_world == "forest":
-            frame_count = pygame.time.get_ticks()
-            for snake in snakes:
-                # Swaying animation - snake sways side to side
-                sway = math.sin((frame_count / 500) + snake["sway_offset"]) * 15
-                snake["x"] = snake["tree_x"] + sway
-
-                # Check collision with player (only when flying) - INSTANT DEATH!
-                if flying:
-                    dist = math.sqrt((blob_x - snake["x"])**2 + (blob_y - snake["y"])**2)
-                    if dist < blob_radius + snake["r"]:
-                        # Hit snake - instant death (power to 0)!
-                        power = 0
-
+            frame_count = int(sim.time_ms)
+            for snake in sim.snakes:
+                snake_x, snake_y = interpolated(snake)
                 # Draw snake body (green with darker stripe)
-                pygame.draw.circle(screen, (34, 139, 34), (int(snake["x"]), int(snake["y"])), snake["r"])
-                pygame.draw.circle(screen, BLACK, (int(snake["x"]), int(snake["y"])), snake["r"], 2)
+                pygame.draw.circle(screen, (34, 139, 34), (int(snake_x), int(snake_y)), snake.r)
+                pygame.draw.circle(screen, BLACK, (int(snake_x), int(snake_y)), snake.r, 2)
 
                 # Snake stripe (darker green down the middle)
-                stripe_y = snake["y"] - snake["r"] // 2
+                stripe_y = snake_y - snake.r // 2
                 for i in range(3):
-                    pygame.draw.circle(screen, (20, 100, 20), (int(snake["x"]), int(stripe_y + i * 4)), 4)
+                    pygame.draw.circle(screen, (20, 100, 20), (int(snake_x), int(stripe_y + i * 4)), 4)
 
                 # Snake head (slightly offset, with eyes and tongue)
-                head_x = snake["x"] + 8
-                head_y = snake["y"] - 5
+                head_x = snake_x + 8
+                head_y = snake_y - 5
                 pygame.draw.circle(screen, (34, 139, 34), (int(head_x), int(head_y)), 8)
                 pygame.draw.circle(screen, BLACK, (int(head_x), int(head_y)), 8, 2)
 
@@ -2450,62 +3648,68 @@ while running:
 
         # Draw gate (level 10+ in city only, not in village)
         if level >= 10 and current_world == "city":
-            if gate["open"]:
+            gate = sim.gate
+            if gate.open:
                 # Draw open gate - just the top and bottom bars
                 top_height = 50
-                bottom_y = gate["y"] + gate["height"] - 50
-                pygame.draw.rect(screen, DARK_RED, (gate["x"], gate["y"], gate["width"], top_height))
-                pygame.draw.rect(screen, DARK_RED, (gate["x"], bottom_y, gate["width"], 50))
-                pygame.draw.rect(screen, BLACK, (gate["x"], gate["y"], gate["width"], top_height), 3)
-                pygame.draw.rect(screen, BLACK, (gate["x"], bottom_y, gate["width"], 50), 3)
+                bottom_y = gate.y + gate.height - 50
+                pygame.draw.rect(screen, DARK_RED, (gate.x, gate.y, gate.width, top_height))
+                pygame.draw.rect(screen, DARK_RED, (gate.x, bottom_y, gate.width, 50))
+                pygame.draw.rect(screen, BLACK, (gate.x, gate.y, gate.width, top_height), 3)
+                pygame.draw.rect(screen, BLACK, (gate.x, bottom_y, gate.width, 50), 3)
             else:
                 # Draw closed gate - full bar
-                pygame.draw.rect(screen, DARK_RED, (gate["x"], gate["y"], gate["width"], gate["height"]))
-                pygame.draw.rect(screen, BLACK, (gate["x"], gate["y"], gate["width"], gate["height"]), 3)
+                pygame.draw.rect(screen, DARK_RED, (gate.x, gate.y, gate.width, gate.height))
+                pygame.draw.rect(screen, BLACK, (gate.x, gate.y, gate.width, gate.height), 3)
                 # Timer indicator
-                progress = gate["timer"] / gate["close_duration"]
-                indicator_height = int(gate["height"] * progress)
-                pygame.draw.rect(screen, YELLOW, (gate["x"] + 5, gate["y"] + gate["height"] - indicator_height, gate["width"] - 10, indicator_height))
+                progress = gate.timer / gate.close_duration
+                indicator_height = int(gate.height * progress)
+                pygame.draw.rect(screen, YELLOW, (gate.x + 5, gate.y + gate.height - indicator_height, gate.width - 10, indicator_height))
+        frame_timer.lap("hazards")
 
         # Draw mini blobs
-        for mini in mini_blobs:
-            if mini["alive"]:
+        for mini in sim.mini_blobs:
+            if mini.alive:
+                mini_x, mini_y = interpolated(mini)
                 # Main body
-                pygame.draw.circle(screen, PURPLE, (mini["x"], mini["y"]), mini["r"])
-                pygame.draw.circle(screen, BLACK, (mini["x"], mini["y"]), mini["r"], 1)
+                pygame.draw.circle(screen, PURPLE, (mini_x, mini_y), mini.r)
+                pygame.draw.circle(screen, BLACK, (mini_x, mini_y), mini.r, 1)
 
                 # Pulsing glow effect
-                pulse = abs(math.sin(pygame.time.get_ticks() / 200)) * 3
-                pygame.draw.circle(screen, WHITE, (mini["x"], mini["y"]), mini["r"] + int(pulse), 1)
+                pulse = abs(math.sin(sim.time_ms / 200)) * 3
+                pygame.draw.circle(screen, WHITE, (mini_x, mini_y), mini.r + int(pulse), 1)
 
                 # Draw eyes with white circles and black pupils
-                eye_size = max(2, int(mini["r"] * 0.4))
-                pupil_size = max(1, int(mini["r"] * 0.25))
-                eye_y = mini["y"] - mini["r"] * 0.25
+                eye_size = max(2, int(mini.r * 0.4))
+                pupil_size = max(1, int(mini.r * 0.25))
+                eye_y = mini_y - mini.r * 0.25
                 # Left eye
-                pygame.draw.circle(screen, WHITE, (int(mini["x"] - mini["r"] * 0.4), int(eye_y)), eye_size)
-                pygame.draw.circle(screen, BLACK, (int(mini["x"] - mini["r"] * 0.4), int(eye_y)), pupil_size)
+                pygame.draw.circle(screen, WHITE, (int(mini_x - mini.r * 0.4), int(eye_y)), eye_size)
+                pygame.draw.circle(screen, BLACK, (int(mini_x - mini.r * 0.4), int(eye_y)), pupil_size)
                 # Right eye
-                pygame.draw.circle(screen, WHITE, (int(mini["x"] + mini["r"] * 0.4), int(eye_y)), eye_size)
-                pygame.draw.circle(screen, BLACK, (int(mini["x"] + mini["r"] * 0.4), int(eye_y)), pupil_size)
+                pygame.draw.circle(screen, WHITE, (int(mini_x + mini.r * 0.4), int(eye_y)), eye_size)
+                pygame.draw.circle(screen, BLACK, (int(mini_x + mini.r * 0.4), int(eye_y)), pupil_size)
 
                 # Small happy smile
-                smile_y = int(mini["y"] + mini["r"] * 0.2)
-                pygame.draw.arc(screen, BLACK, (int(mini["x"] - mini["r"] * 0.3), smile_y - 3, int(mini["r"] * 0.6), 8), 3.14, 6.28, 2)
-        
+                smile_y = int(mini_y + mini.r * 0.2)
+                pygame.draw.arc(screen, BLACK, (int(mini_x - mini.r * 0.3), smile_y - 3, int(mini.r * 0.6), 8), 3.14, 6.28, 2)
+        frame_timer.lap("mini_blobs")
+
         # Draw main blob with cape
-        draw_blob_with_cape(blob_x, blob_y, blob_radius, player_color)
+        blob_x, blob_y = interpolated_blob()
+        draw_blob_with_cape(blob_x, blob_y, sim.blob_radius, player_color)
 
         # Magnetic field indicator (Richard)
-        if has_magnetic_ability and flying:
+        if sim.magnetic and sim.flying:
             magnetic_range = 150  # Same range, stronger pull
-            pulse = abs(math.sin(pygame.time.get_ticks() / 300)) * 10
+            pulse = abs(math.sin(sim.time_ms / 300)) * 10
             pygame.draw.circle(screen, ORANGE, (int(blob_x), int(blob_y)), int(magnetic_range + pulse), 2)
 
         # Catch indicator - BIGGER VISUAL
-        if can_catch and flying:
-            pygame.draw.circle(screen, ORANGE, (int(blob_x), int(blob_y)), blob_radius + 50, 3)
-        
+        if sim.can_catch and sim.flying:
+            pygame.draw.circle(screen, ORANGE, (int(blob_x), int(blob_y)), sim.blob_radius + 50, 3)
+        frame_timer.lap("player")
+
         # Comic panel border
         pygame.draw.rect(screen, BLACK, (0, 0, WIDTH, HEIGHT), 10)
         
@@ -2518,1231 +3722,151 @@ while running:
         pygame.draw.rect(screen, BLACK, (bar_x - 2, bar_y - 2, bar_width + 4, bar_height + 4))
         pygame.draw.rect(screen, DARK_RED, (bar_x, bar_y, bar_width, bar_height))
         
-        current_bar = int((power / max_power) * bar_width)
-        bar_color = GREEN if power > 50 else ORANGE if power > 25 else RED
+        current_bar = int((sim.power / sim.max_power) * bar_width)
+        bar_color = GREEN if sim.power > 50 else ORANGE if sim.power > 25 else RED
         pygame.draw.rect(screen, bar_color, (bar_x, bar_y, current_bar, bar_height))
         
-        power_text = tiny_font.render(f"POWER: {int(power)}", True, WHITE)
+        power_text = render_text(tiny_font, f"POWER: {int(sim.power)}", True, WHITE)
         screen.blit(power_text, (bar_x + 5, bar_y + 2))
         
         # Level and stats
-        level_text = small_font.render(f"Level {level}", True, BLACK)
-        screen.blit(level_text, (10, 10))
+        level_text = render_text(small_font, f"Level {level}", True, BLACK)
+        mark_dirty(screen.blit(level_text, (10, 10)))
         
-        rescue_text = tiny_font.render(f"Rescued: {blobs_rescued} | Size: {blob_radius}", True, BLACK)
-        screen.blit(rescue_text, (10, 50))
+        rescue_text = render_text(tiny_font, f"Rescued: {blobs_rescued} | Size: {sim.blob_radius}", True, BLACK)
+        mark_dirty(screen.blit(rescue_text, (10, 50)))
 
         # Give Up button
         give_up_hover = give_up_button_rect.collidepoint(mouse_pos)
         give_up_color = YELLOW if give_up_hover else BRIGHT_RED
         pygame.draw.rect(screen, give_up_color, give_up_button_rect, border_radius=10)
         pygame.draw.rect(screen, BLACK, give_up_button_rect, 4, border_radius=10)
-        give_up_text = tiny_font.render("GIVE UP", True, BLACK)
+        give_up_text = render_text(tiny_font, "GIVE UP", True, BLACK)
         screen.blit(give_up_text, (give_up_button_rect.centerx - give_up_text.get_width()//2,
                                    give_up_button_rect.centery - give_up_text.get_height()//2))
 
-    elif game_state == "comic_panel":
-        # Traditional comic book style with multiple panels - rotate designs
-        screen.fill((240, 240, 240))  # Light gray background
+        # Remember what moved so the next frame only restores those areas
+        finish_playing_frame(partial_frame)
 
-        # Comic title at top
-        title = font.render("SUPER BLOB", True, BLACK)
-        screen.blit(title, (WIDTH//2 - title.get_width()//2, 20))
+@register_state
+class ComicPanelState(GameState):
+    """Comic after a smashed boss - click on to the next level"""
+    name = "comic_panel"
 
-        comic_variant = level % 8  # Rotate through 8 different comic styles
+    def enter(self, previous):
+        get_comic_panel()  # Composed once per level transition
 
-        # Different comics for village vs city
-        if current_world == "village":
-            # VILLAGE COMICS - countryside themed
-            if comic_variant == 0:
-                # Village Comic 1: "The village needs help!" / "I'll protect the houses!"
-                # Panel 1 - Mini blobs in front of village houses
-                panel1_rect = pygame.Rect(30, 80, 350, 220)
-                pygame.draw.rect(screen, (150, 220, 150), panel1_rect)  # Green background
-                pygame.draw.rect(screen, BLACK, panel1_rect, 5)
-
-                # Draw small village houses in background - cleaner design
-                for i in range(2):
-                    hx = panel1_rect.x + 60 + i * 130
-                    hy = panel1_rect.y + 110
-                    # House body with shading
-                    pygame.draw.rect(screen, (160, 82, 45), (hx, hy, 60, 55))
-                    pygame.draw.rect(screen, BLACK, (hx, hy, 60, 55), 3)
-                    # Clean triangular roof
-                    roof = [(hx - 6, hy), (hx + 30, hy - 25), (hx + 66, hy)]
-                    pygame.draw.polygon(screen, (200, 50, 50), roof)
-                    pygame.draw.polygon(screen, BLACK, roof, 3)
-                    # Door
-                    pygame.draw.rect(screen, (101, 67, 33), (hx + 20, hy + 25, 20, 30))
-                    pygame.draw.rect(screen, BLACK, (hx + 20, hy + 25, 20, 30), 2)
-                    # Window
-                    pygame.draw.rect(screen, (255, 255, 200), (hx + 8, hy + 15, 15, 15))
-                    pygame.draw.rect(screen, BLACK, (hx + 8, hy + 15, 15, 15), 2)
-
-                # Mini blobs - cleaner with consistent style
-                for i in range(2):
-                    mini_x = panel1_rect.x + 110 + i * 90
-                    mini_y = panel1_rect.y + 170
-                    # Body with outline
-                    pygame.draw.circle(screen, PURPLE, (mini_x, mini_y), 22)
-                    pygame.draw.circle(screen, BLACK, (mini_x, mini_y), 22, 3)
-                    # Eyes - larger and cleaner
-                    eye_size = 6
-                    pupil_size = 4
-                    # Left eye
-                    pygame.draw.circle(screen, WHITE, (mini_x - 9, mini_y - 5), eye_size)
-                    pygame.draw.circle(screen, BLACK, (mini_x - 9, mini_y - 5), eye_size, 1)
-                    pygame.draw.circle(screen, BLACK, (mini_x - 9, mini_y - 5), pupil_size)
-                    # Right eye
-                    pygame.draw.circle(screen, WHITE, (mini_x + 9, mini_y - 5), eye_size)
-                    pygame.draw.circle(screen, BLACK, (mini_x + 9, mini_y - 5), eye_size, 1)
-                    pygame.draw.circle(screen, BLACK, (mini_x + 9, mini_y - 5), pupil_size)
-
-                # Cleaner speech bubble with rounded rect
-                bubble1_rect = pygame.Rect(panel1_rect.x + 35, panel1_rect.y + 22, 280, 55)
-                pygame.draw.ellipse(screen, WHITE, bubble1_rect)
-                pygame.draw.ellipse(screen, BLACK, bubble1_rect, 4)
-                help_text = small_font.render("The village needs help!", True, BLACK)
-                screen.blit(help_text, (bubble1_rect.centerx - help_text.get_width()//2,
-                                        bubble1_rect.centery - help_text.get_height()//2))
-
-                # Panel 2 - Hero ready
-                panel2_rect = pygame.Rect(420, 80, 350, 220)
-                pygame.draw.rect(screen, (255, 235, 200), panel2_rect)
-                pygame.draw.rect(screen, BLACK, panel2_rect, 5)
-                draw_blob_with_cape(panel2_rect.centerx, panel2_rect.centery + 20, 40, player_color)
-
-                bubble2_rect = pygame.Rect(panel2_rect.x + 50, panel2_rect.y + 20, 250, 70)
-                pygame.draw.ellipse(screen, WHITE, bubble2_rect)
-                pygame.draw.ellipse(screen, BLACK, bubble2_rect, 3)
-                save_text1 = tiny_font.render("I'll protect", True, BLACK)
-                save_text2 = tiny_font.render("the houses!", True, BLACK)
-                screen.blit(save_text1, (bubble2_rect.centerx - save_text1.get_width()//2, bubble2_rect.centery - 15))
-                screen.blit(save_text2, (bubble2_rect.centerx - save_text2.get_width()//2, bubble2_rect.centery + 10))
-
-            elif comic_variant == 1:
-                # Village Comic 2: "The gas cloud is dangerous!" / "I'll fly carefully!"
-                # Panel 1 - Gas cloud warning
-                panel1_rect = pygame.Rect(30, 80, 350, 220)
-                pygame.draw.rect(screen, (180, 200, 180), panel1_rect)
-                pygame.draw.rect(screen, BLACK, panel1_rect, 5)
-
-                # Draw gas cloud
-                gas_surface = pygame.Surface((80, 80), pygame.SRCALPHA)
-                pygame.draw.circle(gas_surface, (200, 180, 230, 150), (40, 40), 40)
-                screen.blit(gas_surface, (panel1_rect.centerx - 40, panel1_rect.centery - 20))
-                pygame.draw.circle(screen, (180, 160, 210, 200), (panel1_rect.centerx, panel1_rect.centery), 40, 3)
-
-                bubble1_rect = pygame.Rect(panel1_rect.x + 30, panel1_rect.y + 20, 290, 60)
-                pygame.draw.ellipse(screen, WHITE, bubble1_rect)
-                pygame.draw.ellipse(screen, BLACK, bubble1_rect, 3)
-                warn_text1 = tiny_font.render("The gas cloud is", True, BLACK)
-                warn_text2 = tiny_font.render("dangerous!", True, BLACK)
-                screen.blit(warn_text1, (bubble1_rect.centerx - warn_text1.get_width()//2, bubble1_rect.centery - 15))
-                screen.blit(warn_text2, (bubble1_rect.centerx - warn_text2.get_width()//2, bubble1_rect.centery + 10))
-
-                # Panel 2 - Determined hero
-                panel2_rect = pygame.Rect(420, 80, 350, 220)
-                pygame.draw.rect(screen, (200, 255, 200), panel2_rect)
-                pygame.draw.rect(screen, BLACK, panel2_rect, 5)
-                draw_blob_with_cape(panel2_rect.centerx, panel2_rect.centery + 30, 45, player_color)
-
-                bubble2_rect = pygame.Rect(panel2_rect.x + 50, panel2_rect.y + 20, 250, 60)
-                pygame.draw.ellipse(screen, WHITE, bubble2_rect)
-                pygame.draw.ellipse(screen, BLACK, bubble2_rect, 3)
-                careful_text = small_font.render("I'll fly carefully!", True, BLACK)
-                screen.blit(careful_text, (bubble2_rect.centerx - careful_text.get_width()//2,
-                                          bubble2_rect.centery - careful_text.get_height()//2))
-
-            elif comic_variant == 2:
-                # Village Comic 3: "So many houses!" / "I can protect them all!"
-                panel1_rect = pygame.Rect(30, 80, 350, 220)
-                pygame.draw.rect(screen, (180, 220, 180), panel1_rect)
-                pygame.draw.rect(screen, BLACK, panel1_rect, 5)
-
-                # Draw multiple small houses - cleaner design
-                for i in range(4):
-                    hx = panel1_rect.x + 35 + i * 72
-                    hy = panel1_rect.y + 125
-                    # House body
-                    pygame.draw.rect(screen, (160, 82, 45), (hx, hy, 48, 45))
-                    pygame.draw.rect(screen, BLACK, (hx, hy, 48, 45), 3)
-                    # Clean triangular roof
-                    roof = [(hx - 4, hy), (hx + 24, hy - 18), (hx + 52, hy)]
-                    pygame.draw.polygon(screen, (200, 50, 50), roof)
-                    pygame.draw.polygon(screen, BLACK, roof, 3)
-                    # Door
-                    pygame.draw.rect(screen, (101, 67, 33), (hx + 16, hy + 20, 16, 25))
-                    pygame.draw.rect(screen, BLACK, (hx + 16, hy + 20, 16, 25), 2)
-                    # Window
-                    pygame.draw.rect(screen, (255, 255, 200), (hx + 6, hy + 12, 12, 12))
-                    pygame.draw.rect(screen, BLACK, (hx + 6, hy + 12, 12, 12), 2)
-
-                bubble1_rect = pygame.Rect(panel1_rect.x + 40, panel1_rect.y + 20, 270, 50)
-                pygame.draw.ellipse(screen, WHITE, bubble1_rect)
-                pygame.draw.ellipse(screen, BLACK, bubble1_rect, 3)
-                houses_text = tiny_font.render("So many houses!", True, BLACK)
-                screen.blit(houses_text, (bubble1_rect.centerx - houses_text.get_width()//2, bubble1_rect.centery - houses_text.get_height()//2))
-
-                # Panel 2
-                panel2_rect = pygame.Rect(420, 80, 350, 220)
-                pygame.draw.rect(screen, (255, 240, 200), panel2_rect)
-                pygame.draw.rect(screen, BLACK, panel2_rect, 5)
-                draw_blob_with_cape(panel2_rect.centerx, panel2_rect.centery + 30, 45, player_color)
-
-                bubble2_rect = pygame.Rect(panel2_rect.x + 50, panel2_rect.y + 20, 250, 60)
-                pygame.draw.ellipse(screen, WHITE, bubble2_rect)
-                pygame.draw.ellipse(screen, BLACK, bubble2_rect, 3)
-                protect_text1 = tiny_font.render("I can protect", True, BLACK)
-                protect_text2 = tiny_font.render("them all!", True, BLACK)
-                screen.blit(protect_text1, (bubble2_rect.centerx - protect_text1.get_width()//2, bubble2_rect.centery - 15))
-                screen.blit(protect_text2, (bubble2_rect.centerx - protect_text2.get_width()//2, bubble2_rect.centery + 10))
-
-            elif comic_variant == 3:
-                # Village Comic 4: Mini blobs with countryside / "We believe in you!"
-                panel1_rect = pygame.Rect(30, 80, 350, 220)
-                pygame.draw.rect(screen, (200, 240, 200), panel1_rect)
-                pygame.draw.rect(screen, BLACK, panel1_rect, 5)
-
-                # Draw cleaner fence with horizontal bars
-                for i in range(7):
-                    fx = panel1_rect.x + 40 + i * 45
-                    fy = panel1_rect.y + 155
-                    # Vertical post
-                    pygame.draw.rect(screen, (139, 69, 19), (fx, fy, 10, 50))
-                    pygame.draw.rect(screen, BLACK, (fx, fy, 10, 50), 2)
-                # Horizontal bars
-                pygame.draw.rect(screen, (139, 69, 19), (panel1_rect.x + 40, panel1_rect.y + 170, 280, 8))
-                pygame.draw.rect(screen, BLACK, (panel1_rect.x + 40, panel1_rect.y + 170, 280, 8), 2)
-                pygame.draw.rect(screen, (139, 69, 19), (panel1_rect.x + 40, panel1_rect.y + 190, 280, 8))
-                pygame.draw.rect(screen, BLACK, (panel1_rect.x + 40, panel1_rect.y + 190, 280, 8), 2)
-
-                # Mini blobs in front of fence
-                for i in range(2):
-                    mini_x = panel1_rect.x + 120 + i * 80
-                    mini_y = panel1_rect.y + 160
-                    pygame.draw.circle(screen, PURPLE, (mini_x, mini_y), 20)
-                    pygame.draw.circle(screen, BLACK, (mini_x, mini_y), 20, 2)
-                    # Eyes
-                    eye_size = 5
-                    pupil_size = 3
-                    pygame.draw.circle(screen, WHITE, (mini_x - 8, mini_y - 5), eye_size)
-                    pygame.draw.circle(screen, BLACK, (mini_x - 8, mini_y - 5), pupil_size)
-                    pygame.draw.circle(screen, WHITE, (mini_x + 8, mini_y - 5), eye_size)
-                    pygame.draw.circle(screen, BLACK, (mini_x + 8, mini_y - 5), pupil_size)
-
-                bubble1_rect = pygame.Rect(panel1_rect.x + 60, panel1_rect.y + 30, 230, 60)
-                pygame.draw.ellipse(screen, WHITE, bubble1_rect)
-                pygame.draw.ellipse(screen, BLACK, bubble1_rect, 3)
-                believe_text = small_font.render("We believe in you!", True, BLACK)
-                screen.blit(believe_text, (bubble1_rect.centerx - believe_text.get_width()//2, bubble1_rect.centery - believe_text.get_height()//2))
-
-                # Panel 2
-                panel2_rect = pygame.Rect(420, 80, 350, 220)
-                pygame.draw.rect(screen, (255, 245, 220), panel2_rect)
-                pygame.draw.rect(screen, BLACK, panel2_rect, 5)
-                draw_blob_with_cape(panel2_rect.centerx, panel2_rect.centery + 30, 45, player_color)
-
-                bubble2_rect = pygame.Rect(panel2_rect.x + 50, panel2_rect.y + 20, 250, 60)
-                pygame.draw.ellipse(screen, WHITE, bubble2_rect)
-                pygame.draw.ellipse(screen, BLACK, bubble2_rect, 3)
-                thanks_text = small_font.render("Thanks!", True, BLACK)
-                screen.blit(thanks_text, (bubble2_rect.centerx - thanks_text.get_width()//2, bubble2_rect.centery - thanks_text.get_height()//2))
-
-            elif comic_variant == 4:
-                # Village Comic 5: "You're doing great!" / "I won't give up!"
-                panel1_rect = pygame.Rect(30, 80, 350, 220)
-                pygame.draw.rect(screen, (220, 255, 220), panel1_rect)
-                pygame.draw.rect(screen, BLACK, panel1_rect, 5)
-
-                # Mini blob cheering
-                mini_x = panel1_rect.centerx
-                mini_y = panel1_rect.centery + 20
-                pygame.draw.circle(screen, PURPLE, (mini_x, mini_y), 25)
-                pygame.draw.circle(screen, BLACK, (mini_x, mini_y), 25, 2)
-                # Eyes
-                eye_size = 6
-                pupil_size = 4
-                pygame.draw.circle(screen, WHITE, (mini_x - 10, mini_y - 6), eye_size)
-                pygame.draw.circle(screen, BLACK, (mini_x - 10, mini_y - 6), pupil_size)
-                pygame.draw.circle(screen, WHITE, (mini_x + 10, mini_y - 6), eye_size)
-                pygame.draw.circle(screen, BLACK, (mini_x + 10, mini_y - 6), pupil_size)
-
-                bubble1_rect = pygame.Rect(panel1_rect.x + 60, panel1_rect.y + 30, 230, 60)
-                pygame.draw.ellipse(screen, WHITE, bubble1_rect)
-                pygame.draw.ellipse(screen, BLACK, bubble1_rect, 3)
-                great_text = small_font.render("You're doing great!", True, BLACK)
-                screen.blit(great_text, (bubble1_rect.centerx - great_text.get_width()//2, bubble1_rect.centery - great_text.get_height()//2))
-
-                # Panel 2
-                panel2_rect = pygame.Rect(420, 80, 350, 220)
-                pygame.draw.rect(screen, (255, 240, 200), panel2_rect)
-                pygame.draw.rect(screen, BLACK, panel2_rect, 5)
-                draw_blob_with_cape(panel2_rect.centerx, panel2_rect.centery + 30, 45, player_color)
-
-                bubble2_rect = pygame.Rect(panel2_rect.x + 50, panel2_rect.y + 20, 250, 60)
-                pygame.draw.ellipse(screen, WHITE, bubble2_rect)
-                pygame.draw.ellipse(screen, BLACK, bubble2_rect, 3)
-                wont_text = small_font.render("I won't give up!", True, BLACK)
-                screen.blit(wont_text, (bubble2_rect.centerx - wont_text.get_width()//2, bubble2_rect.centery - wont_text.get_height()//2))
-
-            elif comic_variant == 5:
-                # Village Comic 6: "Look at that boss house!" / "I can do this!"
-                panel1_rect = pygame.Rect(30, 80, 350, 220)
-                pygame.draw.rect(screen, (180, 200, 220), panel1_rect)
-                pygame.draw.rect(screen, BLACK, panel1_rect, 5)
-
-                # Big boss house - cleaner design
-                hx = panel1_rect.centerx - 45
-                hy = panel1_rect.y + 90
-                # House body
-                pygame.draw.rect(screen, (139, 69, 19), (hx, hy, 90, 110))
-                pygame.draw.rect(screen, BLACK, (hx, hy, 90, 110), 4)
-                # Big red roof with clean lines
-                roof = [(hx - 12, hy), (hx + 45, hy - 45), (hx + 102, hy)]
-                pygame.draw.polygon(screen, (180, 0, 0), roof)
-                pygame.draw.polygon(screen, BLACK, roof, 4)
-                # Door
-                pygame.draw.rect(screen, (101, 67, 33), (hx + 30, hy + 60, 30, 50))
-                pygame.draw.rect(screen, BLACK, (hx + 30, hy + 60, 30, 50), 3)
-                # Windows
-                for row in range(2):
-                    for col in range(2):
-                        wx = hx + 12 + col * 45
-                        wy = hy + 20 + row * 35
-                        pygame.draw.rect(screen, (255, 255, 200), (wx, wy, 20, 20))
-                        pygame.draw.rect(screen, BLACK, (wx, wy, 20, 20), 2)
-
-                bubble1_rect = pygame.Rect(panel1_rect.x + 40, panel1_rect.y + 20, 270, 50)
-                pygame.draw.ellipse(screen, WHITE, bubble1_rect)
-                pygame.draw.ellipse(screen, BLACK, bubble1_rect, 3)
-                boss_text = tiny_font.render("Look at that boss house!", True, BLACK)
-                screen.blit(boss_text, (bubble1_rect.centerx - boss_text.get_width()//2, bubble1_rect.centery - boss_text.get_height()//2))
-
-                # Panel 2
-                panel2_rect = pygame.Rect(420, 80, 350, 220)
-                pygame.draw.rect(screen, (255, 250, 200), panel2_rect)
-                pygame.draw.rect(screen, BLACK, panel2_rect, 5)
-                draw_blob_with_cape(panel2_rect.centerx, panel2_rect.centery + 30, 45, player_color)
-
-                bubble2_rect = pygame.Rect(panel2_rect.x + 50, panel2_rect.y + 20, 250, 60)
-                pygame.draw.ellipse(screen, WHITE, bubble2_rect)
-                pygame.draw.ellipse(screen, BLACK, bubble2_rect, 3)
-                can_text = small_font.render("I can do this!", True, BLACK)
-                screen.blit(can_text, (bubble2_rect.centerx - can_text.get_width()//2, bubble2_rect.centery - can_text.get_height()//2))
-
-            elif comic_variant == 6:
-                # Village Comic 7: "More blobs to save!" / "Let's go!"
-                panel1_rect = pygame.Rect(30, 80, 350, 220)
-                pygame.draw.rect(screen, (200, 255, 200), panel1_rect)
-                pygame.draw.rect(screen, BLACK, panel1_rect, 5)
-
-                # Multiple mini blobs scattered
-                blob_positions = [(100, 130), (160, 150), (220, 140), (280, 135)]
-                for bx, by in blob_positions:
-                    mini_x = panel1_rect.x + bx
-                    mini_y = panel1_rect.y + by
-                    pygame.draw.circle(screen, PURPLE, (mini_x, mini_y), 15)
-                    pygame.draw.circle(screen, BLACK, (mini_x, mini_y), 15, 2)
-                    # Eyes
-                    eye_size = 4
-                    pupil_size = 2
-                    pygame.draw.circle(screen, WHITE, (mini_x - 6, mini_y - 4), eye_size)
-                    pygame.draw.circle(screen, BLACK, (mini_x - 6, mini_y - 4), pupil_size)
-                    pygame.draw.circle(screen, WHITE, (mini_x + 6, mini_y - 4), eye_size)
-                    pygame.draw.circle(screen, BLACK, (mini_x + 6, mini_y - 4), pupil_size)
-
-                bubble1_rect = pygame.Rect(panel1_rect.x + 40, panel1_rect.y + 20, 270, 50)
-                pygame.draw.ellipse(screen, WHITE, bubble1_rect)
-                pygame.draw.ellipse(screen, BLACK, bubble1_rect, 3)
-                more_text = tiny_font.render("More blobs to save!", True, BLACK)
-                screen.blit(more_text, (bubble1_rect.centerx - more_text.get_width()//2, bubble1_rect.centery - more_text.get_height()//2))
-
-                # Panel 2
-                panel2_rect = pygame.Rect(420, 80, 350, 220)
-                pygame.draw.rect(screen, (255, 255, 220), panel2_rect)
-                pygame.draw.rect(screen, BLACK, panel2_rect, 5)
-                draw_blob_with_cape(panel2_rect.centerx, panel2_rect.centery + 30, 45, player_color)
-
-                bubble2_rect = pygame.Rect(panel2_rect.x + 50, panel2_rect.y + 20, 250, 60)
-                pygame.draw.ellipse(screen, WHITE, bubble2_rect)
-                pygame.draw.ellipse(screen, BLACK, bubble2_rect, 3)
-                go_text = small_font.render("Let's go!", True, BLACK)
-                screen.blit(go_text, (bubble2_rect.centerx - go_text.get_width()//2, bubble2_rect.centery - go_text.get_height()//2))
-
-            elif comic_variant == 7:
-                # Village Comic 8: "The countryside is beautiful!" / "And worth protecting!"
-                panel1_rect = pygame.Rect(30, 80, 350, 220)
-                pygame.draw.rect(screen, (160, 220, 160), panel1_rect)
-                pygame.draw.rect(screen, BLACK, panel1_rect, 5)
-
-                # Draw beautiful countryside - cleaner trees and flowers
-                for i in range(3):
-                    tx = panel1_rect.x + 70 + i * 100
-                    ty = panel1_rect.y + 145
-                    # Tree trunk
-                    pygame.draw.rect(screen, (101, 67, 33), (tx, ty, 18, 45))
-                    pygame.draw.rect(screen, BLACK, (tx, ty, 18, 45), 2)
-                    # Tree foliage - layered circles for depth
-                    pygame.draw.circle(screen, (34, 139, 34), (tx + 9, ty - 5), 28)
-                    pygame.draw.circle(screen, (44, 149, 44), (tx + 9, ty - 5), 22)
-                    pygame.draw.circle(screen, BLACK, (tx + 9, ty - 5), 28, 3)
-
-                # Flowers with stems
-                for i in range(5):
-                    fx = panel1_rect.x + 55 + i * 60
-                    fy = panel1_rect.y + 185
-                    # Stem
-                    pygame.draw.line(screen, (34, 139, 34), (fx, fy - 10), (fx, fy + 5), 3)
-                    # Flower petals
-                    pygame.draw.circle(screen, (255, 100, 150), (fx, fy - 10), 8)
-                    pygame.draw.circle(screen, BLACK, (fx, fy - 10), 8, 2)
-                    # Center
-                    pygame.draw.circle(screen, (255, 200, 0), (fx, fy - 10), 3)
-
-                bubble1_rect = pygame.Rect(panel1_rect.x + 30, panel1_rect.y + 20, 290, 60)
-                pygame.draw.ellipse(screen, WHITE, bubble1_rect)
-                pygame.draw.ellipse(screen, BLACK, bubble1_rect, 3)
-                beautiful_text1 = tiny_font.render("The countryside is", True, BLACK)
-                beautiful_text2 = tiny_font.render("beautiful!", True, BLACK)
-                screen.blit(beautiful_text1, (bubble1_rect.centerx - beautiful_text1.get_width()//2, bubble1_rect.centery - 15))
-                screen.blit(beautiful_text2, (bubble1_rect.centerx - beautiful_text2.get_width()//2, bubble1_rect.centery + 10))
-
-                # Panel 2
-                panel2_rect = pygame.Rect(420, 80, 350, 220)
-                pygame.draw.rect(screen, (255, 240, 220), panel2_rect)
-                pygame.draw.rect(screen, BLACK, panel2_rect, 5)
-                draw_blob_with_cape(panel2_rect.centerx, panel2_rect.centery + 30, 45, player_color)
-
-                bubble2_rect = pygame.Rect(panel2_rect.x + 50, panel2_rect.y + 20, 250, 60)
-                pygame.draw.ellipse(screen, WHITE, bubble2_rect)
-                pygame.draw.ellipse(screen, BLACK, bubble2_rect, 3)
-                worth_text1 = tiny_font.render("And worth", True, BLACK)
-                worth_text2 = tiny_font.render("protecting!", True, BLACK)
-                screen.blit(worth_text1, (bubble2_rect.centerx - worth_text1.get_width()//2, bubble2_rect.centery - 15))
-                screen.blit(worth_text2, (bubble2_rect.centerx - worth_text2.get_width()//2, bubble2_rect.centery + 10))
-
-        elif current_world == "forest":
-            # FOREST COMICS - nature and trees themed
-            if comic_variant == 0:
-                # Forest Comic 1: "The forest is in danger!" / "I'll protect these ancient trees!"
-                panel1_rect = pygame.Rect(30, 80, 350, 220)
-                pygame.draw.rect(screen, (180, 220, 180), panel1_rect)  # Forest green background
-                pygame.draw.rect(screen, BLACK, panel1_rect, 5)
-
-                # Draw tall forest trees in background
-                for i in range(2):
-                    tx = panel1_rect.x + 80 + i * 120
-                    ty = panel1_rect.y + 90
-                    # Tree trunk
-                    pygame.draw.rect(screen, (101, 67, 33), (tx, ty + 50, 25, 70))
-                    pygame.draw.rect(screen, BLACK, (tx, ty + 50, 25, 70), 3)
-                    # Layered canopy
-                    pygame.draw.circle(screen, (34, 100, 34), (tx + 12, ty + 30), 40)
-                    pygame.draw.circle(screen, (40, 110, 40), (tx - 10, ty + 45), 28)
-                    pygame.draw.circle(screen, (40, 110, 40), (tx + 34, ty + 45), 28)
-                    pygame.draw.circle(screen, BLACK, (tx + 12, ty + 30), 40, 3)
-
-                # Mini blobs in front
-                for i in range(2):
-                    mini_x = panel1_rect.x + 120 + i * 90
-                    mini_y = panel1_rect.y + 180
-                    pygame.draw.circle(screen, PURPLE, (mini_x, mini_y), 20)
-                    pygame.draw.circle(screen, BLACK, (mini_x, mini_y), 20, 3)
-                    # Eyes
-                    eye_size = 5
-                    pupil_size = 3
-                    pygame.draw.circle(screen, WHITE, (mini_x - 8, mini_y - 5), eye_size)
-                    pygame.draw.circle(screen, BLACK, (mini_x - 8, mini_y - 5), pupil_size)
-                    pygame.draw.circle(screen, WHITE, (mini_x + 8, mini_y - 5), eye_size)
-                    pygame.draw.circle(screen, BLACK, (mini_x + 8, mini_y - 5), pupil_size)
-
-                bubble1_rect = pygame.Rect(panel1_rect.x + 35, panel1_rect.y + 20, 280, 55)
-                pygame.draw.ellipse(screen, WHITE, bubble1_rect)
-                pygame.draw.ellipse(screen, BLACK, bubble1_rect, 4)
-                forest_text = small_font.render("The forest is in danger!", True, BLACK)
-                screen.blit(forest_text, (bubble1_rect.centerx - forest_text.get_width()//2,
-                                          bubble1_rect.centery - forest_text.get_height()//2))
-
-                # Panel 2 - Hero ready
-                panel2_rect = pygame.Rect(420, 80, 350, 220)
-                pygame.draw.rect(screen, (255, 245, 220), panel2_rect)
-                pygame.draw.rect(screen, BLACK, panel2_rect, 5)
-                draw_blob_with_cape(panel2_rect.centerx, panel2_rect.centery + 20, 40, player_color)
-
-                bubble2_rect = pygame.Rect(panel2_rect.x + 30, panel2_rect.y + 20, 290, 70)
-                pygame.draw.ellipse(screen, WHITE, bubble2_rect)
-                pygame.draw.ellipse(screen, BLACK, bubble2_rect, 3)
-                protect_text1 = tiny_font.render("I'll protect these", True, BLACK)
-                protect_text2 = tiny_font.render("ancient trees!", True, BLACK)
-                screen.blit(protect_text1, (bubble2_rect.centerx - protect_text1.get_width()//2, bubble2_rect.centery - 15))
-                screen.blit(protect_text2, (bubble2_rect.centerx - protect_text2.get_width()//2, bubble2_rect.centery + 10))
-
-            elif comic_variant == 1:
-                # Forest Comic 2: "Watch out for the snakes!" / "I'll be careful!"
-                panel1_rect = pygame.Rect(30, 80, 350, 220)
-                pygame.draw.rect(screen, (160, 200, 160), panel1_rect)
-                pygame.draw.rect(screen, BLACK, panel1_rect, 5)
-
-                # Draw tree with snake
-                tx = panel1_rect.centerx - 12
-                ty = panel1_rect.y + 80
-                # Tree trunk
-                pygame.draw.rect(screen, (101, 67, 33), (tx, ty + 60, 25, 80))
-                pygame.draw.rect(screen, BLACK, (tx, ty + 60, 25, 80), 3)
-                # Canopy
-                pygame.draw.circle(screen, (34, 100, 34), (tx + 12, ty + 40), 45)
-                pygame.draw.circle(screen, BLACK, (tx + 12, ty + 40), 45, 3)
-
-                # Snake on top of tree - green with red eyes
-                snake_x = tx + 12
-                snake_y = ty + 5
-                pygame.draw.circle(screen, (50, 180, 50), (snake_x, snake_y), 18)
-                pygame.draw.circle(screen, BLACK, (snake_x, snake_y), 18, 3)
-                # Red eyes
-                pygame.draw.circle(screen, RED, (snake_x - 6, snake_y - 3), 4)
-                pygame.draw.circle(screen, RED, (snake_x + 6, snake_y - 3), 4)
-                # Tongue
-                pygame.draw.line(screen, RED, (snake_x, snake_y + 5), (snake_x + 8, snake_y + 8), 2)
-
-                bubble1_rect = pygame.Rect(panel1_rect.x + 30, panel1_rect.y + 20, 290, 50)
-                pygame.draw.ellipse(screen, WHITE, bubble1_rect)
-                pygame.draw.ellipse(screen, BLACK, bubble1_rect, 3)
-                snake_text = tiny_font.render("Watch out for the snakes!", True, BLACK)
-                screen.blit(snake_text, (bubble1_rect.centerx - snake_text.get_width()//2, bubble1_rect.centery - snake_text.get_height()//2))
-
-                # Panel 2
-                panel2_rect = pygame.Rect(420, 80, 350, 220)
-                pygame.draw.rect(screen, (220, 255, 220), panel2_rect)
-                pygame.draw.rect(screen, BLACK, panel2_rect, 5)
-                draw_blob_with_cape(panel2_rect.centerx, panel2_rect.centery + 30, 45, player_color)
-
-                bubble2_rect = pygame.Rect(panel2_rect.x + 50, panel2_rect.y + 20, 250, 60)
-                pygame.draw.ellipse(screen, WHITE, bubble2_rect)
-                pygame.draw.ellipse(screen, BLACK, bubble2_rect, 3)
-                careful_text = small_font.render("I'll be careful!", True, BLACK)
-                screen.blit(careful_text, (bubble2_rect.centerx - careful_text.get_width()//2,
-                                          bubble2_rect.centery - careful_text.get_height()//2))
-
-            elif comic_variant == 2:
-                # Forest Comic 3: "So many tall trees!" / "I can save them all!"
-                panel1_rect = pygame.Rect(30, 80, 350, 220)
-                pygame.draw.rect(screen, (170, 210, 170), panel1_rect)
-                pygame.draw.rect(screen, BLACK, panel1_rect, 5)
-
-                # Draw multiple tall trees
-                for i in range(4):
-                    tx = panel1_rect.x + 50 + i * 68
-                    ty = panel1_rect.y + 70
-                    # Trunk
-                    pygame.draw.rect(screen, (101, 67, 33), (tx, ty + 60, 20, 90))
-                    pygame.draw.rect(screen, BLACK, (tx, ty + 60, 20, 90), 2)
-                    # Canopy - varied sizes
-                    canopy_size = 30 + (i % 2) * 8
-                    pygame.draw.circle(screen, (34, 100, 34), (tx + 10, ty + 45), canopy_size)
-                    pygame.draw.circle(screen, BLACK, (tx + 10, ty + 45), canopy_size, 2)
-
-                bubble1_rect = pygame.Rect(panel1_rect.x + 40, panel1_rect.y + 20, 270, 50)
-                pygame.draw.ellipse(screen, WHITE, bubble1_rect)
-                pygame.draw.ellipse(screen, BLACK, bubble1_rect, 3)
-                trees_text = tiny_font.render("So many tall trees!", True, BLACK)
-                screen.blit(trees_text, (bubble1_rect.centerx - trees_text.get_width()//2, bubble1_rect.centery - trees_text.get_height()//2))
-
-                # Panel 2
-                panel2_rect = pygame.Rect(420, 80, 350, 220)
-                pygame.draw.rect(screen, (255, 250, 230), panel2_rect)
-                pygame.draw.rect(screen, BLACK, panel2_rect, 5)
-                draw_blob_with_cape(panel2_rect.centerx, panel2_rect.centery + 30, 45, player_color)
-
-                bubble2_rect = pygame.Rect(panel2_rect.x + 50, panel2_rect.y + 20, 250, 60)
-                pygame.draw.ellipse(screen, WHITE, bubble2_rect)
-                pygame.draw.ellipse(screen, BLACK, bubble2_rect, 3)
-                save_text1 = tiny_font.render("I can save", True, BLACK)
-                save_text2 = tiny_font.render("them all!", True, BLACK)
-                screen.blit(save_text1, (bubble2_rect.centerx - save_text1.get_width()//2, bubble2_rect.centery - 15))
-                screen.blit(save_text2, (bubble2_rect.centerx - save_text2.get_width()//2, bubble2_rect.centery + 10))
-
-            elif comic_variant == 3:
-                # Forest Comic 4: Mini blobs under tree / "Nature needs heroes!"
-                panel1_rect = pygame.Rect(30, 80, 350, 220)
-                pygame.draw.rect(screen, (190, 230, 190), panel1_rect)
-                pygame.draw.rect(screen, BLACK, panel1_rect, 5)
-
-                # Large tree in center
-                tx = panel1_rect.centerx - 15
-                ty = panel1_rect.y + 60
-                pygame.draw.rect(screen, (101, 67, 33), (tx, ty + 50, 30, 100))
-                pygame.draw.rect(screen, BLACK, (tx, ty + 50, 30, 100), 3)
-                # Wide canopy
-                pygame.draw.circle(screen, (34, 100, 34), (tx + 15, ty + 30), 50)
-                pygame.draw.circle(screen, (40, 110, 40), (tx - 15, ty + 50), 35)
-                pygame.draw.circle(screen, (40, 110, 40), (tx + 45, ty + 50), 35)
-                pygame.draw.circle(screen, BLACK, (tx + 15, ty + 30), 50, 3)
-
-                # Mini blobs under tree
-                for i in range(2):
-                    mini_x = panel1_rect.centerx - 30 + i * 60
-                    mini_y = panel1_rect.y + 175
-                    pygame.draw.circle(screen, PURPLE, (mini_x, mini_y), 18)
-                    pygame.draw.circle(screen, BLACK, (mini_x, mini_y), 18, 2)
-                    # Eyes
-                    pygame.draw.circle(screen, WHITE, (mini_x - 7, mini_y - 4), 5)
-                    pygame.draw.circle(screen, BLACK, (mini_x - 7, mini_y - 4), 3)
-                    pygame.draw.circle(screen, WHITE, (mini_x + 7, mini_y - 4), 5)
-                    pygame.draw.circle(screen, BLACK, (mini_x + 7, mini_y - 4), 3)
-
-                bubble1_rect = pygame.Rect(panel1_rect.x + 50, panel1_rect.y + 25, 250, 50)
-                pygame.draw.ellipse(screen, WHITE, bubble1_rect)
-                pygame.draw.ellipse(screen, BLACK, bubble1_rect, 3)
-                nature_text = small_font.render("Nature needs heroes!", True, BLACK)
-                screen.blit(nature_text, (bubble1_rect.centerx - nature_text.get_width()//2, bubble1_rect.centery - nature_text.get_height()//2))
-
-                # Panel 2
-                panel2_rect = pygame.Rect(420, 80, 350, 220)
-                pygame.draw.rect(screen, (255, 248, 220), panel2_rect)
-                pygame.draw.rect(screen, BLACK, panel2_rect, 5)
-                draw_blob_with_cape(panel2_rect.centerx, panel2_rect.centery + 30, 45, player_color)
-
-                bubble2_rect = pygame.Rect(panel2_rect.x + 50, panel2_rect.y + 20, 250, 60)
-                pygame.draw.ellipse(screen, WHITE, bubble2_rect)
-                pygame.draw.ellipse(screen, BLACK, bubble2_rect, 3)
-                hero_text = small_font.render("I'm on my way!", True, BLACK)
-                screen.blit(hero_text, (bubble2_rect.centerx - hero_text.get_width()//2, bubble2_rect.centery - hero_text.get_height()//2))
-
-            elif comic_variant == 4:
-                # Forest Comic 5: "The forest is beautiful!" / "And dangerous!"
-                panel1_rect = pygame.Rect(30, 80, 350, 220)
-                pygame.draw.rect(screen, (150, 210, 150), panel1_rect)
-                pygame.draw.rect(screen, BLACK, panel1_rect, 5)
-
-                # Beautiful forest scene - trees and flowers
-                for i in range(2):
-                    tx = panel1_rect.x + 70 + i * 140
-                    ty = panel1_rect.y + 80
-                    pygame.draw.rect(screen, (101, 67, 33), (tx, ty + 55, 22, 75))
-                    pygame.draw.rect(screen, BLACK, (tx, ty + 55, 22, 75), 2)
-                    pygame.draw.circle(screen, (34, 100, 34), (tx + 11, ty + 35), 42)
-                    pygame.draw.circle(screen, BLACK, (tx + 11, ty + 35), 42, 2)
-
-                # Flowers
-                for i in range(4):
-                    fx = panel1_rect.x + 60 + i * 65
-                    fy = panel1_rect.y + 170
-                    pygame.draw.line(screen, (50, 150, 50), (fx, fy), (fx, fy + 20), 2)
-                    colors = [(255, 100, 100), (255, 200, 0), (150, 100, 255), (255, 150, 200)]
-                    pygame.draw.circle(screen, colors[i], (fx, fy), 6)
-                    pygame.draw.circle(screen, BLACK, (fx, fy), 6, 2)
-
-                bubble1_rect = pygame.Rect(panel1_rect.x + 35, panel1_rect.y + 20, 280, 50)
-                pygame.draw.ellipse(screen, WHITE, bubble1_rect)
-                pygame.draw.ellipse(screen, BLACK, bubble1_rect, 3)
-                beautiful_text = tiny_font.render("The forest is beautiful!", True, BLACK)
-                screen.blit(beautiful_text, (bubble1_rect.centerx - beautiful_text.get_width()//2, bubble1_rect.centery - beautiful_text.get_height()//2))
-
-                # Panel 2
-                panel2_rect = pygame.Rect(420, 80, 350, 220)
-                pygame.draw.rect(screen, (255, 240, 200), panel2_rect)
-                pygame.draw.rect(screen, BLACK, panel2_rect, 5)
-                draw_blob_with_cape(panel2_rect.centerx, panel2_rect.centery + 30, 45, player_color)
-
-                bubble2_rect = pygame.Rect(panel2_rect.x + 50, panel2_rect.y + 20, 250, 60)
-                pygame.draw.ellipse(screen, WHITE, bubble2_rect)
-                pygame.draw.ellipse(screen, BLACK, bubble2_rect, 3)
-                dangerous_text = small_font.render("And dangerous!", True, BLACK)
-                screen.blit(dangerous_text, (bubble2_rect.centerx - dangerous_text.get_width()//2, bubble2_rect.centery - dangerous_text.get_height()//2))
-
-            elif comic_variant == 5:
-                # Forest Comic 6: "Look at that ancient boss tree!" / "Time to save it!"
-                panel1_rect = pygame.Rect(30, 80, 350, 220)
-                pygame.draw.rect(screen, (175, 215, 175), panel1_rect)
-                pygame.draw.rect(screen, BLACK, panel1_rect, 5)
-
-                # Giant ancient boss tree
-                tx = panel1_rect.centerx - 20
-                ty = panel1_rect.y + 45
-                # Thick trunk
-                pygame.draw.rect(screen, (80, 50, 20), (tx, ty + 60, 40, 120))
-                pygame.draw.rect(screen, BLACK, (tx, ty + 60, 40, 120), 4)
-                # Massive canopy
-                pygame.draw.circle(screen, (25, 90, 25), (tx + 20, ty + 35), 60)
-                pygame.draw.circle(screen, (34, 100, 34), (tx - 20, ty + 55), 42)
-                pygame.draw.circle(screen, (34, 100, 34), (tx + 60, ty + 55), 42)
-                pygame.draw.circle(screen, BLACK, (tx + 20, ty + 35), 60, 4)
-
-                bubble1_rect = pygame.Rect(panel1_rect.x + 30, panel1_rect.y + 18, 290, 50)
-                pygame.draw.ellipse(screen, WHITE, bubble1_rect)
-                pygame.draw.ellipse(screen, BLACK, bubble1_rect, 3)
-                boss_text = tiny_font.render("Look at that ancient tree!", True, BLACK)
-                screen.blit(boss_text, (bubble1_rect.centerx - boss_text.get_width()//2, bubble1_rect.centery - boss_text.get_height()//2))
-
-                # Panel 2
-                panel2_rect = pygame.Rect(420, 80, 350, 220)
-                pygame.draw.rect(screen, (255, 245, 210), panel2_rect)
-                pygame.draw.rect(screen, BLACK, panel2_rect, 5)
-                draw_blob_with_cape(panel2_rect.centerx, panel2_rect.centery + 30, 45, player_color)
-
-                bubble2_rect = pygame.Rect(panel2_rect.x + 50, panel2_rect.y + 20, 250, 60)
-                pygame.draw.ellipse(screen, WHITE, bubble2_rect)
-                pygame.draw.ellipse(screen, BLACK, bubble2_rect, 3)
-                time_text = small_font.render("Time to save it!", True, BLACK)
-                screen.blit(time_text, (bubble2_rect.centerx - time_text.get_width()//2, bubble2_rect.centery - time_text.get_height()//2))
-
-            elif comic_variant == 6:
-                # Forest Comic 7: "More mini blobs to rescue!" / "Let's go!"
-                panel1_rect = pygame.Rect(30, 80, 350, 220)
-                pygame.draw.rect(screen, (185, 225, 185), panel1_rect)
-                pygame.draw.rect(screen, BLACK, panel1_rect, 5)
-
-                # Multiple mini blobs scattered in forest
-                blob_positions = [(80, 120), (150, 140), (220, 125), (280, 145)]
-                for bx, by in blob_positions:
-                    mini_x = panel1_rect.x + bx
-                    mini_y = panel1_rect.y + by
-                    pygame.draw.circle(screen, PURPLE, (mini_x, mini_y), 16)
-                    pygame.draw.circle(screen, BLACK, (mini_x, mini_y), 16, 2)
-                    # Eyes
-                    pygame.draw.circle(screen, WHITE, (mini_x - 6, mini_y - 4), 4)
-                    pygame.draw.circle(screen, BLACK, (mini_x - 6, mini_y - 4), 2)
-                    pygame.draw.circle(screen, WHITE, (mini_x + 6, mini_y - 4), 4)
-                    pygame.draw.circle(screen, BLACK, (mini_x + 6, mini_y - 4), 2)
-
-                # Small trees in background
-                for i in range(3):
-                    tx = panel1_rect.x + 90 + i * 80
-                    ty = panel1_rect.y + 160
-                    pygame.draw.rect(screen, (101, 67, 33), (tx, ty, 12, 35))
-                    pygame.draw.circle(screen, (34, 100, 34), (tx + 6, ty - 5), 18)
-
-                bubble1_rect = pygame.Rect(panel1_rect.x + 35, panel1_rect.y + 22, 280, 50)
-                pygame.draw.ellipse(screen, WHITE, bubble1_rect)
-                pygame.draw.ellipse(screen, BLACK, bubble1_rect, 3)
-                more_text = tiny_font.render("More mini blobs to rescue!", True, BLACK)
-                screen.blit(more_text, (bubble1_rect.centerx - more_text.get_width()//2, bubble1_rect.centery - more_text.get_height()//2))
-
-                # Panel 2
-                panel2_rect = pygame.Rect(420, 80, 350, 220)
-                pygame.draw.rect(screen, (255, 252, 225), panel2_rect)
-                pygame.draw.rect(screen, BLACK, panel2_rect, 5)
-                draw_blob_with_cape(panel2_rect.centerx, panel2_rect.centery + 30, 45, player_color)
-
-                bubble2_rect = pygame.Rect(panel2_rect.x + 50, panel2_rect.y + 20, 250, 60)
-                pygame.draw.ellipse(screen, WHITE, bubble2_rect)
-                pygame.draw.ellipse(screen, BLACK, bubble2_rect, 3)
-                go_text = small_font.render("Let's go!", True, BLACK)
-                screen.blit(go_text, (bubble2_rect.centerx - go_text.get_width()//2, bubble2_rect.centery - go_text.get_height()//2))
-
-            elif comic_variant == 7:
-                # Forest Comic 8: "The forest gives us life!" / "I'll protect it with everything I have!"
-                panel1_rect = pygame.Rect(30, 80, 350, 220)
-                pygame.draw.rect(screen, (160, 215, 160), panel1_rect)
-                pygame.draw.rect(screen, BLACK, panel1_rect, 5)
-
-                # Beautiful lush forest - multiple trees with depth
-                tree_data = [(70, 110, 25, 65, 38), (150, 95, 28, 75, 42), (240, 105, 26, 70, 40)]
-                for tx, ty, tw, th, canopy_r in tree_data:
-                    actual_tx = panel1_rect.x + tx
-                    actual_ty = panel1_rect.y + ty
-                    pygame.draw.rect(screen, (101, 67, 33), (actual_tx, actual_ty + 50, tw, th))
-                    pygame.draw.rect(screen, BLACK, (actual_tx, actual_ty + 50, tw, th), 2)
-                    pygame.draw.circle(screen, (34, 100, 34), (actual_tx + tw//2, actual_ty + 30), canopy_r)
-                    pygame.draw.circle(screen, BLACK, (actual_tx + tw//2, actual_ty + 30), canopy_r, 2)
-
-                # Bushes at bottom
-                for i in range(4):
-                    bx = panel1_rect.x + 55 + i * 70
-                    by = panel1_rect.y + 175
-                    pygame.draw.circle(screen, (40, 110, 40), (bx, by), 18)
-                    pygame.draw.circle(screen, BLACK, (bx, by), 18, 2)
-
-                bubble1_rect = pygame.Rect(panel1_rect.x + 25, panel1_rect.y + 18, 300, 55)
-                pygame.draw.ellipse(screen, WHITE, bubble1_rect)
-                pygame.draw.ellipse(screen, BLACK, bubble1_rect, 3)
-                life_text = tiny_font.render("The forest gives us life!", True, BLACK)
-                screen.blit(life_text, (bubble1_rect.centerx - life_text.get_width()//2, bubble1_rect.centery - life_text.get_height()//2))
-
-                # Panel 2
-                panel2_rect = pygame.Rect(420, 80, 350, 220)
-                pygame.draw.rect(screen, (255, 248, 215), panel2_rect)
-                pygame.draw.rect(screen, BLACK, panel2_rect, 5)
-                draw_blob_with_cape(panel2_rect.centerx, panel2_rect.centery + 30, 45, player_color)
-
-                bubble2_rect = pygame.Rect(panel2_rect.x + 35, panel2_rect.y + 20, 280, 70)
-                pygame.draw.ellipse(screen, WHITE, bubble2_rect)
-                pygame.draw.ellipse(screen, BLACK, bubble2_rect, 3)
-                protect_text1 = tiny_font.render("I'll protect it with", True, BLACK)
-                protect_text2 = tiny_font.render("everything I have!", True, BLACK)
-                screen.blit(protect_text1, (bubble2_rect.centerx - protect_text1.get_width()//2, bubble2_rect.centery - 15))
-                screen.blit(protect_text2, (bubble2_rect.centerx - protect_text2.get_width()//2, bubble2_rect.centery + 10))
-
-        elif comic_variant == 0:
-            # Comic 1: Classic "Help us!" / "I've got to save these blobs!"
-            # Panel 1 (Top Left) - Mini blobs crying for help
-            panel1_rect = pygame.Rect(30, 80, 350, 220)
-            pygame.draw.rect(screen, WHITE, panel1_rect)
-            pygame.draw.rect(screen, BLACK, panel1_rect, 5)
-
-            for i in range(3):
-                mini_x = panel1_rect.x + 80 + i * 80
-                mini_y = panel1_rect.y + 120
-                pygame.draw.circle(screen, PURPLE, (mini_x, mini_y), 20)
-                pygame.draw.circle(screen, BLACK, (mini_x, mini_y), 20, 2)
-                # Eyes like in the game (bigger)
-                eye_size = 5
-                pupil_size = 3
-                eye_y_offset = -5
-                # Left eye
-                pygame.draw.circle(screen, WHITE, (mini_x - 8, mini_y + eye_y_offset), eye_size)
-                pygame.draw.circle(screen, BLACK, (mini_x - 8, mini_y + eye_y_offset), pupil_size)
-                # Right eye
-                pygame.draw.circle(screen, WHITE, (mini_x + 8, mini_y + eye_y_offset), eye_size)
-                pygame.draw.circle(screen, BLACK, (mini_x + 8, mini_y + eye_y_offset), pupil_size)
-
-            bubble1_rect = pygame.Rect(panel1_rect.x + 50, panel1_rect.y + 30, 250, 60)
-            pygame.draw.ellipse(screen, WHITE, bubble1_rect)
-            pygame.draw.ellipse(screen, BLACK, bubble1_rect, 3)
-            tail_points = [(bubble1_rect.centerx - 20, bubble1_rect.bottom),
-                          (bubble1_rect.centerx - 10, bubble1_rect.bottom + 15),
-                          (bubble1_rect.centerx, bubble1_rect.bottom)]
-            pygame.draw.polygon(screen, WHITE, tail_points)
-            pygame.draw.polygon(screen, BLACK, tail_points, 3)
-            help_text = small_font.render("HELP US!", True, BLACK)
-            screen.blit(help_text, (bubble1_rect.centerx - help_text.get_width()//2,
-                                    bubble1_rect.centery - help_text.get_height()//2))
-
-            # Panel 2 (Top Right)
-            panel2_rect = pygame.Rect(420, 80, 350, 220)
-            pygame.draw.rect(screen, WHITE, panel2_rect)
-            pygame.draw.rect(screen, BLACK, panel2_rect, 5)
-            draw_blob_with_cape(panel2_rect.centerx, panel2_rect.centery + 20, 40, player_color)
+    def exit(self, following):
+        comic_cache["key"] = None
+        comic_cache["surface"] = None
 
-            bubble2_rect = pygame.Rect(panel2_rect.x + 50, panel2_rect.y + 20, 250, 70)
-            pygame.draw.ellipse(screen, WHITE, bubble2_rect)
-            pygame.draw.ellipse(screen, BLACK, bubble2_rect, 3)
-            tail2_points = [(bubble2_rect.centerx, bubble2_rect.bottom),
-                           (bubble2_rect.centerx + 10, bubble2_rect.bottom + 20),
-                           (bubble2_rect.centerx + 20, bubble2_rect.bottom)]
-            pygame.draw.polygon(screen, WHITE, tail2_points)
-            pygame.draw.polygon(screen, BLACK, tail2_points, 3)
-            save_text1 = tiny_font.render("I've got to save", True, BLACK)
-            save_text2 = tiny_font.render("these blobs!", True, BLACK)
-            screen.blit(save_text1, (bubble2_rect.centerx - save_text1.get_width()//2, bubble2_rect.centery - 15))
-            screen.blit(save_text2, (bubble2_rect.centerx - save_text2.get_width()//2, bubble2_rect.centery + 10))
-
-        elif comic_variant == 1:
-            # Comic 2: "There's so many buildings!" / "I can do this!"
-            # Panel 1 - Buildings looming
-            panel1_rect = pygame.Rect(30, 80, 350, 220)
-            pygame.draw.rect(screen, (200, 220, 255), panel1_rect)
-            pygame.draw.rect(screen, BLACK, panel1_rect, 5)
-
-            # Draw threatening buildings with windows
-            for i in range(3):
-                bx = panel1_rect.x + 60 + i * 100
-                by = panel1_rect.y + 60
-                pygame.draw.rect(screen, (80, 80, 80), (bx, by, 50, 140))
-                pygame.draw.rect(screen, BLACK, (bx, by, 50, 140), 2)
-                # Add windows
-                for row in range(5):
-                    for col in range(2):
-                        wx = bx + 8 + col * 20
-                        wy = by + 15 + row * 25
-                        pygame.draw.rect(screen, (255, 255, 150), (wx, wy, 12, 10))
-                        pygame.draw.rect(screen, BLACK, (wx, wy, 12, 10), 1)
-
-            bubble1_rect = pygame.Rect(panel1_rect.x + 40, panel1_rect.y + 20, 270, 50)
-            pygame.draw.ellipse(screen, WHITE, bubble1_rect)
-            pygame.draw.ellipse(screen, BLACK, bubble1_rect, 3)
-            worry_text = tiny_font.render("There's so many buildings!", True, BLACK)
-            screen.blit(worry_text, (bubble1_rect.centerx - worry_text.get_width()//2, bubble1_rect.centery - worry_text.get_height()//2))
-
-            # Panel 2 - Super Blob determined
-            panel2_rect = pygame.Rect(420, 80, 350, 220)
-            pygame.draw.rect(screen, (255, 255, 200), panel2_rect)
-            pygame.draw.rect(screen, BLACK, panel2_rect, 5)
-            draw_blob_with_cape(panel2_rect.centerx, panel2_rect.centery + 30, 45, player_color)
-
-            bubble2_rect = pygame.Rect(panel2_rect.x + 50, panel2_rect.y + 20, 250, 60)
-            pygame.draw.ellipse(screen, WHITE, bubble2_rect)
-            pygame.draw.ellipse(screen, BLACK, bubble2_rect, 3)
-            tail2_points = [(bubble2_rect.centerx, bubble2_rect.bottom),
-                           (bubble2_rect.centerx, bubble2_rect.bottom + 25),
-                           (bubble2_rect.centerx + 15, bubble2_rect.bottom)]
-            pygame.draw.polygon(screen, WHITE, tail2_points)
-            pygame.draw.polygon(screen, BLACK, tail2_points, 3)
-            confidence_text = small_font.render("I can do this!", True, BLACK)
-            screen.blit(confidence_text, (bubble2_rect.centerx - confidence_text.get_width()//2, bubble2_rect.centery - confidence_text.get_height()//2))
-
-        elif comic_variant == 2:
-            # Comic 3: "The city needs me!" / "POW!"
-            # Panel 1 - Super Blob flying
-            panel1_rect = pygame.Rect(30, 80, 350, 220)
-            pygame.draw.rect(screen, (135, 206, 250), panel1_rect)
-            pygame.draw.rect(screen, BLACK, panel1_rect, 5)
-
-            # Draw background buildings for city
-            bg_buildings = [
-                (panel1_rect.x + 20, panel1_rect.y + 170, 40, 100),
-                (panel1_rect.x + 75, panel1_rect.y + 140, 35, 130),
-                (panel1_rect.x + 300, panel1_rect.y + 160, 45, 110)
-            ]
-            for bx, by, bw, bh in bg_buildings:
-                pygame.draw.rect(screen, (100, 100, 120), (bx, by, bw, bh))
-                pygame.draw.rect(screen, BLACK, (bx, by, bw, bh), 2)
-                # Windows
-                for row in range(int(bh / 20)):
-                    for col in range(2):
-                        wx = bx + 5 + col * (bw - 15)
-                        wy = by + 8 + row * 20
-                        if wy + 8 < by + bh:
-                            pygame.draw.rect(screen, (180, 180, 100), (wx, wy, 8, 8))
-
-            # Draw motion lines
-            for i in range(5):
-                y_pos = panel1_rect.y + 40 + i * 30
-                pygame.draw.line(screen, WHITE, (panel1_rect.x + 120, y_pos), (panel1_rect.x + 200, y_pos), 3)
-
-            draw_blob_with_cape(panel1_rect.x + 250, panel1_rect.y + 130, 40, player_color)
-
-            bubble1_rect = pygame.Rect(panel1_rect.x + 40, panel1_rect.y + 30, 250, 60)
-            pygame.draw.ellipse(screen, WHITE, bubble1_rect)
-            pygame.draw.ellipse(screen, BLACK, bubble1_rect, 3)
-            tail_points = [(bubble1_rect.centerx + 80, bubble1_rect.bottom - 10),
-                          (bubble1_rect.centerx + 110, bubble1_rect.bottom + 30),
-                          (bubble1_rect.centerx + 90, bubble1_rect.bottom)]
-            pygame.draw.polygon(screen, WHITE, tail_points)
-            pygame.draw.polygon(screen, BLACK, tail_points, 3)
-            city_text = small_font.render("The city needs me!", True, BLACK)
-            screen.blit(city_text, (bubble1_rect.centerx - city_text.get_width()//2, bubble1_rect.centery - city_text.get_height()//2))
-
-            # Panel 2 - Action impact
-            panel2_rect = pygame.Rect(420, 80, 350, 220)
-            pygame.draw.rect(screen, ORANGE, panel2_rect)
-            pygame.draw.rect(screen, BLACK, panel2_rect, 5)
+    def handle_event(self, event):
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            # Next level
+            advance_level()
+            change_state("playing")
 
-            # Draw impact starburst
-            for i in range(8):
-                angle = i * 45
-                import math
-                x_end = panel2_rect.centerx + math.cos(math.radians(angle)) * 100
-                y_end = panel2_rect.centery + math.sin(math.radians(angle)) * 80
-                pygame.draw.line(screen, YELLOW, (panel2_rect.centerx, panel2_rect.centery), (x_end, y_end), 5)
+    def draw(self):
+        # The comic only depends on world, variant, level and rescued count, so it is
+        # composed once per level transition and blitted every frame
+        screen.blit(get_comic_panel(), (0, 0))
 
-            pow_text = font.render("POW!", True, RED)
-            screen.blit(pow_text, (panel2_rect.centerx - pow_text.get_width()//2, panel2_rect.centery - pow_text.get_height()//2))
-
-        elif comic_variant == 3:
-            # Comic 4: Mini blob "Thank you!" / Super Blob "All in a day's work!"
-            # Panel 1 - Rescued mini blobs happy
-            panel1_rect = pygame.Rect(30, 80, 350, 220)
-            pygame.draw.rect(screen, (255, 240, 245), panel1_rect)
-            pygame.draw.rect(screen, BLACK, panel1_rect, 5)
-
-            for i in range(3):
-                mini_x = panel1_rect.x + 80 + i * 80
-                mini_y = panel1_rect.y + 130
-                pygame.draw.circle(screen, PURPLE, (mini_x, mini_y), 20)
-                pygame.draw.circle(screen, BLACK, (mini_x, mini_y), 20, 2)
-                # Eyes like in the game (bigger)
-                eye_size = 5
-                pupil_size = 3
-                eye_y_offset = -5
-                # Left eye
-                pygame.draw.circle(screen, WHITE, (mini_x - 8, mini_y + eye_y_offset), eye_size)
-                pygame.draw.circle(screen, BLACK, (mini_x - 8, mini_y + eye_y_offset), pupil_size)
-                # Right eye
-                pygame.draw.circle(screen, WHITE, (mini_x + 8, mini_y + eye_y_offset), eye_size)
-                pygame.draw.circle(screen, BLACK, (mini_x + 8, mini_y + eye_y_offset), pupil_size)
-
-            bubble1_rect = pygame.Rect(panel1_rect.x + 50, panel1_rect.y + 25, 250, 65)
-            pygame.draw.ellipse(screen, WHITE, bubble1_rect)
-            pygame.draw.ellipse(screen, BLACK, bubble1_rect, 3)
-            tail_points = [(bubble1_rect.centerx, bubble1_rect.bottom),
-                          (bubble1_rect.centerx - 5, bubble1_rect.bottom + 20),
-                          (bubble1_rect.centerx + 10, bubble1_rect.bottom)]
-            pygame.draw.polygon(screen, WHITE, tail_points)
-            pygame.draw.polygon(screen, BLACK, tail_points, 3)
-            thank_text1 = tiny_font.render("Thank you,", True, BLACK)
-            thank_text2 = tiny_font.render("Super Blob!", True, BLACK)
-            screen.blit(thank_text1, (bubble1_rect.centerx - thank_text1.get_width()//2, bubble1_rect.centery - 15))
-            screen.blit(thank_text2, (bubble1_rect.centerx - thank_text2.get_width()//2, bubble1_rect.centery + 10))
-
-            # Panel 2 - Super Blob heroic pose
-            panel2_rect = pygame.Rect(420, 80, 350, 220)
-            pygame.draw.rect(screen, (255, 235, 200), panel2_rect)
-            pygame.draw.rect(screen, BLACK, panel2_rect, 5)
-            draw_blob_with_cape(panel2_rect.centerx, panel2_rect.centery + 30, 42, player_color)
-
-            bubble2_rect = pygame.Rect(panel2_rect.x + 40, panel2_rect.y + 20, 270, 65)
-            pygame.draw.ellipse(screen, WHITE, bubble2_rect)
-            pygame.draw.ellipse(screen, BLACK, bubble2_rect, 3)
-            tail2_points = [(bubble2_rect.centerx, bubble2_rect.bottom),
-                           (bubble2_rect.centerx + 5, bubble2_rect.bottom + 20),
-                           (bubble2_rect.centerx + 15, bubble2_rect.bottom)]
-            pygame.draw.polygon(screen, WHITE, tail2_points)
-            pygame.draw.polygon(screen, BLACK, tail2_points, 3)
-            hero_text1 = tiny_font.render("All in a", True, BLACK)
-            hero_text2 = tiny_font.render("day's work!", True, BLACK)
-            screen.blit(hero_text1, (bubble2_rect.centerx - hero_text1.get_width()//2, bubble2_rect.centery - 15))
-            screen.blit(hero_text2, (bubble2_rect.centerx - hero_text2.get_width()//2, bubble2_rect.centery + 10))
-
-        elif comic_variant == 4:
-            # Comic 5: Mini blobs cheering / Super Blob smiling
-            # Panel 1 - Mini blobs cheering
-            panel1_rect = pygame.Rect(30, 80, 350, 220)
-            pygame.draw.rect(screen, (255, 250, 230), panel1_rect)
-            pygame.draw.rect(screen, BLACK, panel1_rect, 5)
-
-            # Draw happy mini blobs
-            for i in range(3):
-                mini_x = panel1_rect.x + 80 + i * 80
-                mini_y = panel1_rect.y + 130
-                pygame.draw.circle(screen, PURPLE, (mini_x, mini_y), 18)
-                pygame.draw.circle(screen, BLACK, (mini_x, mini_y), 18, 2)
-                # Eyes like in the game (bigger)
-                eye_size = 5
-                pupil_size = 3
-                eye_y_offset = -4
-                # Left eye
-                pygame.draw.circle(screen, WHITE, (mini_x - 7, mini_y + eye_y_offset), eye_size)
-                pygame.draw.circle(screen, BLACK, (mini_x - 7, mini_y + eye_y_offset), pupil_size)
-                # Right eye
-                pygame.draw.circle(screen, WHITE, (mini_x + 7, mini_y + eye_y_offset), eye_size)
-                pygame.draw.circle(screen, BLACK, (mini_x + 7, mini_y + eye_y_offset), pupil_size)
-
-            bubble1_rect = pygame.Rect(panel1_rect.x + 60, panel1_rect.y + 30, 230, 60)
-            pygame.draw.ellipse(screen, WHITE, bubble1_rect)
-            pygame.draw.ellipse(screen, BLACK, bubble1_rect, 3)
-            tail_points = [(bubble1_rect.centerx, bubble1_rect.bottom),
-                          (bubble1_rect.centerx - 5, bubble1_rect.bottom + 15),
-                          (bubble1_rect.centerx + 10, bubble1_rect.bottom)]
-            pygame.draw.polygon(screen, WHITE, tail_points)
-            pygame.draw.polygon(screen, BLACK, tail_points, 3)
-            cheer_text1 = tiny_font.render("You're doing", True, BLACK)
-            cheer_text2 = tiny_font.render("great!", True, BLACK)
-            screen.blit(cheer_text1, (bubble1_rect.centerx - cheer_text1.get_width()//2, bubble1_rect.centery - 15))
-            screen.blit(cheer_text2, (bubble1_rect.centerx - cheer_text2.get_width()//2, bubble1_rect.centery + 10))
-
-            # Panel 2 - Super Blob happy
-            panel2_rect = pygame.Rect(420, 80, 350, 220)
-            pygame.draw.rect(screen, (230, 255, 230), panel2_rect)
-            pygame.draw.rect(screen, BLACK, panel2_rect, 5)
-            draw_blob_with_cape(panel2_rect.centerx, panel2_rect.centery + 25, 45, player_color)
-
-            bubble2_rect = pygame.Rect(panel2_rect.x + 60, panel2_rect.y + 25, 230, 60)
-            pygame.draw.ellipse(screen, WHITE, bubble2_rect)
-            pygame.draw.ellipse(screen, BLACK, bubble2_rect, 3)
-            tail2_points = [(bubble2_rect.centerx, bubble2_rect.bottom),
-                           (bubble2_rect.centerx + 5, bubble2_rect.bottom + 20),
-                           (bubble2_rect.centerx + 15, bubble2_rect.bottom)]
-            pygame.draw.polygon(screen, WHITE, tail2_points)
-            pygame.draw.polygon(screen, BLACK, tail2_points, 3)
-            happy_text1 = tiny_font.render("Thanks for", True, BLACK)
-            happy_text2 = tiny_font.render("believing in me!", True, BLACK)
-            screen.blit(happy_text1, (bubble2_rect.centerx - happy_text1.get_width()//2, bubble2_rect.centery - 15))
-            screen.blit(happy_text2, (bubble2_rect.centerx - happy_text2.get_width()//2, bubble2_rect.centery + 10))
-
-        elif comic_variant == 5:
-            # Comic 6: "Look at that boss!" / "I can smash it!"
-            # Panel 1 - Looking at golden boss building
-            panel1_rect = pygame.Rect(30, 80, 350, 220)
-            pygame.draw.rect(screen, (220, 240, 255), panel1_rect)
-            pygame.draw.rect(screen, BLACK, panel1_rect, 5)
-
-            # Draw golden boss building with details
-            boss_x = panel1_rect.x + 240
-            boss_y = panel1_rect.y + 80
-            pygame.draw.rect(screen, GOLD, (boss_x, boss_y, 70, 120))
-            # Gold accent sides for depth
-            pygame.draw.rect(screen, (200, 170, 0), (boss_x, boss_y, 7, 120))
-            pygame.draw.rect(screen, (200, 170, 0), (boss_x + 63, boss_y, 7, 120))
-            pygame.draw.rect(screen, BLACK, (boss_x, boss_y, 70, 120), 3)
-            # Windows on boss with borders
-            for row in range(4):
-                for col in range(2):
-                    wx = boss_x + 12 + col * 28
-                    wy = boss_y + 15 + row * 26
-                    pygame.draw.rect(screen, (255, 255, 200), (wx, wy, 16, 14))
-                    pygame.draw.rect(screen, BLACK, (wx, wy, 16, 14), 1)
-
-            draw_blob_with_cape(panel1_rect.x + 100, panel1_rect.y + 150, 35, player_color)
-
-            bubble1_rect = pygame.Rect(panel1_rect.x + 40, panel1_rect.y + 30, 240, 60)
-            pygame.draw.ellipse(screen, WHITE, bubble1_rect)
-            pygame.draw.ellipse(screen, BLACK, bubble1_rect, 3)
-            tail_points = [(bubble1_rect.centerx + 20, bubble1_rect.bottom),
-                          (bubble1_rect.centerx + 10, bubble1_rect.bottom + 30),
-                          (bubble1_rect.centerx + 30, bubble1_rect.bottom)]
-            pygame.draw.polygon(screen, WHITE, tail_points)
-            pygame.draw.polygon(screen, BLACK, tail_points, 3)
-            look_text1 = tiny_font.render("Look at that", True, BLACK)
-            look_text2 = tiny_font.render("golden boss!", True, BLACK)
-            screen.blit(look_text1, (bubble1_rect.centerx - look_text1.get_width()//2, bubble1_rect.centery - 15))
-            screen.blit(look_text2, (bubble1_rect.centerx - look_text2.get_width()//2, bubble1_rect.centery + 10))
-
-            # Panel 2 - Super Blob determined
-            panel2_rect = pygame.Rect(420, 80, 350, 220)
-            pygame.draw.rect(screen, (255, 240, 200), panel2_rect)
-            pygame.draw.rect(screen, BLACK, panel2_rect, 5)
-            draw_blob_with_cape(panel2_rect.centerx, panel2_rect.centery + 30, 50, player_color)
-
-            bubble2_rect = pygame.Rect(panel2_rect.x + 70, panel2_rect.y + 25, 210, 60)
-            pygame.draw.ellipse(screen, WHITE, bubble2_rect)
-            pygame.draw.ellipse(screen, BLACK, bubble2_rect, 3)
-            tail2_points = [(bubble2_rect.centerx, bubble2_rect.bottom),
-                           (bubble2_rect.centerx - 10, bubble2_rect.bottom + 20),
-                           (bubble2_rect.centerx + 5, bubble2_rect.bottom)]
-            pygame.draw.polygon(screen, WHITE, tail2_points)
-            pygame.draw.polygon(screen, BLACK, tail2_points, 3)
-            smash_text1 = tiny_font.render("I can", True, BLACK)
-            smash_text2 = tiny_font.render("smash it!", True, BLACK)
-            screen.blit(smash_text1, (bubble2_rect.centerx - smash_text1.get_width()//2, bubble2_rect.centery - 15))
-            screen.blit(smash_text2, (bubble2_rect.centerx - smash_text2.get_width()//2, bubble2_rect.centery + 10))
-
-        elif comic_variant == 6:
-            # Comic 7: "More blobs to save!" / "Let's go!"
-            # Panel 1 - Mini blobs in danger
-            panel1_rect = pygame.Rect(30, 80, 350, 220)
-            pygame.draw.rect(screen, (255, 240, 240), panel1_rect)
-            pygame.draw.rect(screen, BLACK, panel1_rect, 5)
-
-            # Draw mini blobs looking worried
-            for i in range(4):
-                mini_x = panel1_rect.x + 60 + i * 70
-                mini_y = panel1_rect.y + 140
-                pygame.draw.circle(screen, PURPLE, (mini_x, mini_y), 16)
-                pygame.draw.circle(screen, BLACK, (mini_x, mini_y), 16, 2)
-                # Eyes like in the game (bigger)
-                eye_size = 4
-                pupil_size = 3
-                eye_y_offset = -4
-                # Left eye
-                pygame.draw.circle(screen, WHITE, (mini_x - 6, mini_y + eye_y_offset), eye_size)
-                pygame.draw.circle(screen, BLACK, (mini_x - 6, mini_y + eye_y_offset), pupil_size)
-                # Right eye
-                pygame.draw.circle(screen, WHITE, (mini_x + 6, mini_y + eye_y_offset), eye_size)
-                pygame.draw.circle(screen, BLACK, (mini_x + 6, mini_y + eye_y_offset), pupil_size)
-
-            bubble1_rect = pygame.Rect(panel1_rect.x + 50, panel1_rect.y + 30, 250, 65)
-            pygame.draw.ellipse(screen, WHITE, bubble1_rect)
-            pygame.draw.ellipse(screen, BLACK, bubble1_rect, 3)
-            tail_points = [(bubble1_rect.centerx, bubble1_rect.bottom),
-                          (bubble1_rect.centerx - 5, bubble1_rect.bottom + 20),
-                          (bubble1_rect.centerx + 10, bubble1_rect.bottom)]
-            pygame.draw.polygon(screen, WHITE, tail_points)
-            pygame.draw.polygon(screen, BLACK, tail_points, 3)
-            danger_text1 = tiny_font.render("More blobs", True, BLACK)
-            danger_text2 = tiny_font.render("need saving!", True, BLACK)
-            screen.blit(danger_text1, (bubble1_rect.centerx - danger_text1.get_width()//2, bubble1_rect.centery - 15))
-            screen.blit(danger_text2, (bubble1_rect.centerx - danger_text2.get_width()//2, bubble1_rect.centery + 10))
-
-            # Panel 2 - Super Blob ready!
-            panel2_rect = pygame.Rect(420, 80, 350, 220)
-            pygame.draw.rect(screen, (240, 255, 255), panel2_rect)
-            pygame.draw.rect(screen, BLACK, panel2_rect, 5)
-            draw_blob_with_cape(panel2_rect.centerx, panel2_rect.centery + 30, 48, player_color)
-
-            bubble2_rect = pygame.Rect(panel2_rect.x + 80, panel2_rect.y + 25, 190, 60)
-            pygame.draw.ellipse(screen, WHITE, bubble2_rect)
-            pygame.draw.ellipse(screen, BLACK, bubble2_rect, 3)
-            tail2_points = [(bubble2_rect.centerx, bubble2_rect.bottom),
-                           (bubble2_rect.centerx, bubble2_rect.bottom + 20),
-                           (bubble2_rect.centerx + 15, bubble2_rect.bottom)]
-            pygame.draw.polygon(screen, WHITE, tail2_points)
-            pygame.draw.polygon(screen, BLACK, tail2_points, 3)
-            lets_text = small_font.render("Let's go!", True, BLACK)
-            screen.blit(lets_text, (bubble2_rect.centerx - lets_text.get_width()//2, bubble2_rect.centery - lets_text.get_height()//2))
-
-        else:  # comic_variant == 7
-            # Comic 8: "Keep going!" / "We believe in you!"
-            # Panel 1 - Super Blob flying with energy
-            panel1_rect = pygame.Rect(30, 80, 350, 220)
-            pygame.draw.rect(screen, (245, 245, 255), panel1_rect)
-            pygame.draw.rect(screen, BLACK, panel1_rect, 5)
-
-            # Draw motion lines
-            for i in range(5):
-                y_pos = panel1_rect.y + 50 + i * 30
-                line_len = 100 + i * 10
-                pygame.draw.line(screen, (220, 220, 220), (panel1_rect.x + 30, y_pos), (panel1_rect.x + 30 + line_len, y_pos), 3)
-
-            draw_blob_with_cape(panel1_rect.x + 220, panel1_rect.y + 130, 42, player_color)
-
-            bubble1_rect = pygame.Rect(panel1_rect.x + 40, panel1_rect.y + 30, 220, 55)
-            pygame.draw.ellipse(screen, WHITE, bubble1_rect)
-            pygame.draw.ellipse(screen, BLACK, bubble1_rect, 3)
-            tail_points = [(bubble1_rect.centerx + 60, bubble1_rect.bottom - 5),
-                          (bubble1_rect.centerx + 90, bubble1_rect.bottom + 25),
-                          (bubble1_rect.centerx + 70, bubble1_rect.bottom + 5)]
-            pygame.draw.polygon(screen, WHITE, tail_points)
-            pygame.draw.polygon(screen, BLACK, tail_points, 3)
-            keep_text = small_font.render("Keep going!", True, BLACK)
-            screen.blit(keep_text, (bubble1_rect.centerx - keep_text.get_width()//2, bubble1_rect.centery - keep_text.get_height()//2))
-
-            # Panel 2 - Mini blobs cheering
-            panel2_rect = pygame.Rect(420, 80, 350, 220)
-            pygame.draw.rect(screen, (255, 250, 245), panel2_rect)
-            pygame.draw.rect(screen, BLACK, panel2_rect, 5)
-
-            # Draw cheering mini blobs
-            for i in range(3):
-                mini_x = panel2_rect.x + 90 + i * 70
-                mini_y = panel2_rect.y + 140
-                pygame.draw.circle(screen, PURPLE, (mini_x, mini_y), 18)
-                pygame.draw.circle(screen, BLACK, (mini_x, mini_y), 18, 2)
-                # Eyes like in the game (bigger)
-                eye_size = 5
-                pupil_size = 3
-                eye_y_offset = -4
-                # Left eye
-                pygame.draw.circle(screen, WHITE, (mini_x - 7, mini_y + eye_y_offset), eye_size)
-                pygame.draw.circle(screen, BLACK, (mini_x - 7, mini_y + eye_y_offset), pupil_size)
-                # Right eye
-                pygame.draw.circle(screen, WHITE, (mini_x + 7, mini_y + eye_y_offset), eye_size)
-                pygame.draw.circle(screen, BLACK, (mini_x + 7, mini_y + eye_y_offset), pupil_size)
-
-            bubble2_rect = pygame.Rect(panel2_rect.x + 60, panel2_rect.y + 25, 230, 65)
-            pygame.draw.ellipse(screen, WHITE, bubble2_rect)
-            pygame.draw.ellipse(screen, BLACK, bubble2_rect, 3)
-            tail2_points = [(bubble2_rect.centerx, bubble2_rect.bottom),
-                           (bubble2_rect.centerx - 5, bubble2_rect.bottom + 20),
-                           (bubble2_rect.centerx + 10, bubble2_rect.bottom)]
-            pygame.draw.polygon(screen, WHITE, tail2_points)
-            pygame.draw.polygon(screen, BLACK, tail2_points, 3)
-            believe_text1 = tiny_font.render("We believe", True, BLACK)
-            believe_text2 = tiny_font.render("in you!", True, BLACK)
-            screen.blit(believe_text1, (bubble2_rect.centerx - believe_text1.get_width()//2, bubble2_rect.centery - 15))
-            screen.blit(believe_text2, (bubble2_rect.centerx - believe_text2.get_width()//2, bubble2_rect.centery + 10))
-
-        # Panel 3 (Bottom) - Stats panel (same for all variants)
+        # Drawn on top of the cached comic each frame
         panel3_rect = pygame.Rect(30, 330, 740, 220)
-        pygame.draw.rect(screen, YELLOW, panel3_rect)
-        pygame.draw.rect(screen, BLACK, panel3_rect, 5)
+        continue_text = render_text(small_font, "Click to continue...", True, BLACK)
+        screen.blit(continue_text, (panel3_rect.centerx - continue_text.get_width()//2, panel3_rect.y + 180))
 
-        smash_text = font.render("SMASH!", True, RED)
-        screen.blit(smash_text, (panel3_rect.centerx - smash_text.get_width()//2, panel3_rect.y + 30))
+@register_state
+class LevelFailedState(GameState):
+    """Out of power - click to start the run over from level 1"""
+    name = "level_failed"
 
-        level_complete = small_font.render(f"Level {level} Complete!", True, BLACK)
-        rescued_text = tiny_font.render(f"Total Blobs Rescued: {blobs_rescued}", True, BLACK)
-        continue_text = small_font.render("Click to continue...", True, BLACK)
+    def handle_event(self, event):
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            # Out of power - restart from level 1
+            reset_game()
+            change_state("playing")
 
-        screen.blit(level_complete, (panel3_rect.centerx - level_complete.get_width()//2, panel3_rect.y + 100))
-        screen.blit(rescued_text, (panel3_rect.centerx - rescued_text.get_width()//2, panel3_rect.y + 140))
-        screen.blit(continue_text, (panel3_rect.centerx - continue_text.get_width()//2, panel3_rect.y + 180))
-    
-    elif game_state == "level_failed":
+    def draw(self):
         # Failure screen - restart from level 1
         pygame.draw.rect(screen, RED, (50, 50, WIDTH-100, HEIGHT-100))
         pygame.draw.rect(screen, BLACK, (50, 50, WIDTH-100, HEIGHT-100), 15)
 
-        title = font.render("OUT OF POWER!", True, BLACK)
-        subtitle = small_font.render("Restarting from Level 1...", True, BLACK)
-        retry = small_font.render("Click to continue...", True, BLACK)
+        title = render_text(font, "OUT OF POWER!", True, BLACK)
+        subtitle = render_text(small_font, "Restarting from Level 1...", True, BLACK)
+        retry = render_text(small_font, "Click to continue...", True, BLACK)
 
         screen.blit(title, (WIDTH//2 - title.get_width()//2, HEIGHT//2 - 60))
         screen.blit(subtitle, (WIDTH//2 - subtitle.get_width()//2, HEIGHT//2))
         screen.blit(retry, (WIDTH//2 - retry.get_width()//2, HEIGHT//2 + 60))
-    
-    pygame.display.flip()
-    clock.tick(60)
 
-pygame.quit()
\ No newline at end of file
+def run_frame():
+    """Handle input, update and draw one frame of the current game state"""
+    global running, dirty_rects_enabled
+
+    frame_timer.begin_frame()
+    draw_counter.begin_frame(game_state)
+    for event in pygame.event.get():
+        if event.type == pygame.QUIT:
+            running = False
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_F2:
+            # Toggle dirty-rectangle rendering
+            dirty_rects_enabled = not dirty_rects_enabled
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+            toggle_perf_overlay()
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+            dump_perf_numbers()
+        else:
+            current_state().handle_event(event)
+    frame_timer.lap("events")
+
+    current_state().update()
+    frame_timer.lap("simulation")
+
+    # Draw the state the update left us in, counting render cache lookups under it
+    state = current_state()
+    set_cache_context(game_state)
+    draw_counter.context = game_state
+    if state.clear_screen:
+        screen.fill(WHITE)
+        frame_timer.lap("background")
+    state.draw()
+    frame_timer.lap("hud")  # Menus and other screens are all HUD; playing laps its own layers
+
+    if perf_overlay["visible"]:
+        draw_perf_overlay()
+        frame_timer.lap("overlay")
+    present_frame()
+    frame_timer.lap("flip")
+    frame_timer.end_frame()
+    draw_counter.end_frame()
+
+def main():
+    """Run the game until the window is closed"""
+    if os.environ.get("SUPERBLOB_PROFILE") == "1":
+        profiler.start()
+    while running:
+        run_frame()
+        clock.tick(60)
+
+    # Collapsed stacks of the session (SUPERBLOB_PROFILE=1)
+    if profiler.thread is not None:
+        profiler.stop()
+        path = profiler.write(f"superblob_profile_{time.strftime('%Y%m%d_%H%M%S')}.collapsed")
+        print(f"Profile ({profiler.samples} samples) written to {path}")
+
+    # Render cache hit rates per game_state (SUPERBLOB_CACHE_STATS=1 to print on exit)
+    if os.environ.get("SUPERBLOB_CACHE_STATS"):
+        print_cache_stats()
+    # Draw calls and allocations per game_state (SUPERBLOB_DRAW_STATS=1)
+    if draw_counter.installed:
+        print_draw_stats()
+    # Lines that kept growing across level transitions (SUPERBLOB_LEAK_CHECK=1)
+    if leak_detector.enabled:
+        summary = leak_detector.summary()
+        print(f"[leaks] {summary['transitions']} transitions, {len(summary['flagged'])} lines kept growing")
+
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
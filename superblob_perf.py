@@ -0,0 +1,403 @@
+"""Performance diagnostics for Super Blob
+
+PhaseTimer splits every frame of the main loop into named phases (event pump, simulation,
+the drawing layers, flip) and keeps the last frames of each, so the in-game overlay can
+show rolling means and p99s and dump them to a file. DrawCounter counts the pygame
+drawing calls and surface allocations behind each frame, LeakDetector watches
+memory across level transitions with tracemalloc and StackSampler is a sampling
+profiler for whole sessions. Nothing here imports pygame - DrawCounter.install()
+is handed the module to instrument.
+"""
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import deque
+
+# Phases of a frame, in the order the main loop runs them (the overlay lists them in this order)
+FRAME_PHASES = ("events", "simulation", "background", "buildings", "hazards",
+                "mini_blobs", "player", "hud", "overlay", "flip")
+
+def percentile(values, p):
+    """The p-th percentile of a list of numbers (nearest rank)"""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))]
+
+class PhaseTimer:
+    """Per-phase frame timings - lap(phase) charges the time since the previous lap to phase
+
+    While disabled every method returns straight away, so the laps left in the main
+    loop cost one attribute check each.
+    """
+
+    def __init__(self, phases=FRAME_PHASES, window=120):
+        self.enabled = False
+        self.phases = phases
+        self.window = window  # Frames the rolling numbers cover
+        self.history = {phase: deque(maxlen=window) for phase in phases}  # ms per frame, per phase
+        self.frame_times = deque(maxlen=window)  # Wall-clock ms from one frame start to the next
+        self.current = dict.fromkeys(phases, 0.0)  # ms charged to each phase so far this frame
+        self.frame_start = None
+        self.last = None  # perf_counter() of the previous lap (None = no frame started)
+
+    def set_enabled(self, enabled):
+        """Start or stop timing - the numbers start over either way"""
+        self.enabled = enabled
+        for samples in self.history.values():
+            samples.clear()
+        self.frame_times.clear()
+        self.current = dict.fromkeys(self.phases, 0.0)
+        self.frame_start = None
+        self.last = None
+
+    def begin_frame(self):
+        """Start timing a frame"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if self.frame_start is not None:
+            self.frame_times.append((now - self.frame_start) * 1000)
+        self.frame_start = self.last = now
+
+    def lap(self, phase):
+        """Charge the time since the previous lap (or the frame start) to phase"""
+        if not self.enabled or self.last is None:
+            return
+        now = time.perf_counter()
+        self.current[phase] += (now - self.last) * 1000
+        self.last = now
+
+    def end_frame(self):
+        """Close the frame - its phase times join the rolling window"""
+        if not self.enabled or self.last is None:
+            return
+        for phase in self.phases:
+            self.history[phase].append(self.current[phase])
+            self.current[phase] = 0.0
+        self.last = None
+
+    def summary(self):
+        """Rolling mean, p99 and max per phase, the total per frame and the FPS"""
+        phases = {}
+        for phase in self.phases:
+            samples = self.history[phase]
+            if samples:
+                phases[phase] = {"mean_ms": sum(samples) / len(samples), "p99_ms": percentile(samples, 99),
+                                 "max_ms": max(samples)}
+        totals = [sum(frame) for frame in zip(*(self.history[phase] for phase in self.phases))]
+        mean_frame = sum(self.frame_times) / len(self.frame_times) if self.frame_times else 0.0
+        return {
+            "frames": len(totals),
+            "fps": 1000 / mean_frame if mean_frame else 0.0,
+            "work_ms": {"mean_ms": sum(totals) / len(totals), "p99_ms": percentile(totals, 99)} if totals else {},
+            "phases": phases
+        }
+
+    def dump(self, path, **extra):
+        """Write summary() and any extra fields to path as JSON; returns the path"""
+        data = dict(self.summary(), window=self.window, time=time.strftime("%Y-%m-%d %H:%M:%S"), **extra)
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2)
+        return path
+
+# pygame.draw functions DrawCounter wraps
+DRAW_FUNCTIONS = ("rect", "circle", "ellipse", "arc", "line", "lines", "aaline", "aalines", "polygon")
+# What it counts - drawing calls, text rasterized with Font.render and surfaces made with pygame.Surface()
+DRAW_KINDS = ("draw", "text", "surfaces")
+
+class DrawCounter:
+    """Calls to pygame.draw.*, Font.render and pygame.Surface() per frame, by game_state and calling function
+
+    install() swaps the pygame entry points for counting wrappers and uninstall() puts
+    them back, so an uninstalled counter costs nothing. Fonts are counted through a Font
+    subclass, which only covers fonts created after the first install().
+    Text and surfaces also count the pixels they allocate.
+    """
+
+    def __init__(self, window=120):
+        self.installed = False
+        self.window = window
+        self.context = None  # game_state the calls are counted under
+        self.passthrough = set()  # Qualified names of helpers whose calls are charged to their caller
+        self.frame = dict.fromkeys(DRAW_KINDS + ("pixels",), 0)  # Counts so far this frame
+        self.history = deque(maxlen=window)  # Counts of the last frames
+        self.by_state = {}  # game_state -> {"frames": n, kind: total, ..., "pixels": total}
+        self.by_caller = {}  # (game_state, kind, function) -> [calls, pixels]
+        self.originals = {}  # What install() replaced: (namespace, name) -> original
+        self.font_class = None
+
+    def reset(self):
+        """Forget everything counted so far"""
+        self.frame = dict.fromkeys(DRAW_KINDS + ("pixels",), 0)
+        self.history.clear()
+        self.by_state.clear()
+        self.by_caller.clear()
+
+    def caller(self, frame):
+        """Qualified name of the function a call came from, skipping the passthrough helpers"""
+        name = frame.f_code.co_qualname
+        while name in self.passthrough and frame.f_back is not None:
+            frame = frame.f_back
+            name = frame.f_code.co_qualname
+        return name
+
+    def count(self, kind, frame, pixels=0):
+        """Count one call of kind made from frame"""
+        self.frame[kind] += 1
+        self.frame["pixels"] += pixels
+        key = (self.context, kind, self.caller(frame))
+        entry = self.by_caller.get(key)
+        if entry is None:
+            self.by_caller[key] = [1, pixels]
+        else:
+            entry[0] += 1
+            entry[1] += pixels
+
+    def counting(self, kind, function, allocates=False):
+        """Wrap function so every call is counted as kind (with the pixels of the surface it returns)"""
+        counter = self
+        def counted(*args, **kwargs):
+            result = function(*args, **kwargs)
+            counter.count(kind, sys._getframe(1), result.get_width() * result.get_height() if allocates else 0)
+            return result
+        counted.__name__ = function.__name__
+        counted.__doc__ = function.__doc__
+        return counted
+
+    def replace(self, namespace, name, replacement):
+        """Swap namespace.name for replacement, remembering the original for uninstall()"""
+        self.originals[(namespace, name)] = getattr(namespace, name)
+        setattr(namespace, name, replacement)
+
+    def install(self, pygame):
+        """Start counting - wraps pygame.draw.*, pygame.Surface and pygame.font.Font"""
+        if self.installed:
+            return
+        for name in DRAW_FUNCTIONS:
+            self.replace(pygame.draw, name, self.counting("draw", getattr(pygame.draw, name)))
+        self.replace(pygame, "Surface", self.counting("surfaces", pygame.Surface, allocates=True))
+        if self.font_class is None:
+            counter = self
+            class CountedFont(pygame.font.Font):
+                """Font whose render() is counted while the counter is installed"""
+                def render(self, *args, **kwargs):
+                    result = super().render(*args, **kwargs)
+                    if counter.installed:
+                        counter.count("text", sys._getframe(1), result.get_width() * result.get_height())
+                    return result
+            self.font_class = CountedFont
+        self.replace(pygame.font, "Font", self.font_class)
+        self.installed = True
+
+    def uninstall(self):
+        """Stop counting and put the pygame functions back"""
+        for (namespace, name), original in self.originals.items():
+            setattr(namespace, name, original)
+        self.originals.clear()
+        self.installed = False
+
+    def begin_frame(self, context):
+        """Start counting a frame of the given game_state (calls made between frames are dropped)"""
+        if not self.installed:
+            return
+        self.context = context
+        for key in self.frame:
+            self.frame[key] = 0
+
+    def end_frame(self):
+        """Close the frame - its counts join the rolling window and the totals of its game_state"""
+        if not self.installed:
+            return
+        counts = dict(self.frame)
+        self.history.append(counts)
+        totals = self.by_state.setdefault(self.context, dict.fromkeys(("frames",) + tuple(counts), 0))
+        totals["frames"] += 1
+        for key, value in counts.items():
+            totals[key] += value
+
+    def summary(self, top=10):
+        """Rolling mean and p99 per frame, means per frame for each game_state and the busiest callers"""
+        per_frame = {}
+        for key in DRAW_KINDS + ("pixels",):
+            samples = [counts[key] for counts in self.history]
+            if samples:
+                per_frame[key] = {"mean": sum(samples) / len(samples), "p99": percentile(samples, 99)}
+        by_state = {}
+        for state, totals in self.by_state.items():
+            frames = totals["frames"]
+            by_state[str(state)] = dict({key: value / frames for key, value in totals.items() if key != "frames"},
+                                        frames=frames)
+        callers = sorted(self.by_caller.items(), key=lambda item: item[1][0], reverse=True)[:top]
+        return {
+            "frames": len(self.history),
+            "per_frame": per_frame,
+            "by_state": by_state,
+            "top_callers": [{"game_state": state, "kind": kind, "function": function, "calls": calls,
+                             "pixels": pixels} for (state, kind, function), (calls, pixels) in callers]
+        }
+
+# Allocations LeakDetector leaves out - tracemalloc's own and the detector's history
+LEAK_FILTERS = (tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"), tracemalloc.Filter(False, "<unknown>"))
+
+class LeakDetector:
+    """tracemalloc snapshots at level transitions - logs what grew since the last one and flags lines that keep growing
+
+    check(label) is called after every transition. A file:line whose memory went up
+    at each of the last window transitions is flagged (once). Only every interval-th
+    transition is snapshotted, so long headless runs stay fast.
+    """
+
+    def __init__(self, window=10, interval=1, top=5, log=print):
+        self.enabled = False
+        self.window = window  # Transitions in a row a line must grow across to be flagged
+        self.interval = interval
+        self.top = top  # Lines of growth logged per snapshot
+        self.log = log  # Called with each log line (None = quiet)
+        self.transitions = 0
+        self.snapshots = 0
+        self.first = None  # Snapshot of the first transition, for the growth over the whole run
+        self.previous = None
+        self.history = {}  # "file:line" -> deque of its size at the last window + 1 snapshots
+        self.flagged = {}  # "file:line" -> sizes when it was flagged
+
+    def start(self):
+        """Start tracing allocations (the earlier this is called, the more of the game is covered)"""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self.enabled = True
+
+    def stop(self):
+        """Stop tracing and forget the snapshots"""
+        tracemalloc.stop()
+        self.enabled = False
+        self.first = self.previous = None
+
+    def check(self, label):
+        """Snapshot after a level transition; logs the top growth since the last snapshot"""
+        if not self.enabled:
+            return
+        self.transitions += 1
+        if (self.transitions - 1) % self.interval:
+            return
+        self.snapshots += 1
+        snapshot = tracemalloc.take_snapshot().filter_traces(LEAK_FILTERS)
+        sizes = {self.location(stat.traceback): stat.size for stat in snapshot.statistics("lineno")}
+        if self.previous is not None and self.log:
+            growth = [stat for stat in snapshot.compare_to(self.previous, "lineno") if stat.size_diff > 0]
+            total = sum(sizes.values()) - sum(samples[-1] for samples in self.history.values())
+            self.log(f"[leaks] transition {self.transitions} ({label}): {total / 1024:+.1f} KiB, "
+                     f"{tracemalloc.get_traced_memory()[0] / 1048576:.1f} MiB traced")
+            for stat in growth[:self.top]:
+                self.log(f"[leaks]   {self.location(stat.traceback)} {stat.size_diff / 1024:+.1f} KiB "
+                         f"({stat.count_diff:+d} blocks)")
+        self.track(sizes, label)
+        if self.first is None:
+            self.first = snapshot
+        self.previous = snapshot
+
+    def location(self, traceback):
+        """file:line of an allocation site"""
+        frame = traceback[0]
+        return f"{frame.filename}:{frame.lineno}"
+
+    def track(self, sizes, label):
+        """Add a snapshot's size per line to the history and flag lines that grew every time"""
+        for location in sizes.keys() - self.history.keys():
+            self.history[location] = deque(maxlen=self.window + 1)
+        for location, samples in self.history.items():
+            samples.append(sizes.get(location, 0))
+            if (len(samples) == samples.maxlen and location not in self.flagged
+                    and all(a < b for a, b in zip(samples, list(samples)[1:]))):
+                self.flagged[location] = list(samples)
+                if self.log:
+                    self.log(f"[leaks] {location} grew at each of the last {self.window} snapshots "
+                             f"({samples[0] / 1024:.1f} -> {samples[-1] / 1024:.1f} KiB, at {label})")
+
+    def summary(self, top=10):
+        """Transitions seen, traced memory, the flagged lines and the top growth since the first snapshot"""
+        growth = []
+        if self.first is not None and self.previous is not None:
+            growth = [{"location": self.location(stat.traceback), "size_diff": stat.size_diff,
+                       "count_diff": stat.count_diff}
+                      for stat in self.previous.compare_to(self.first, "lineno")[:top] if stat.size_diff > 0]
+        current, peak = tracemalloc.get_traced_memory() if self.enabled else (0, 0)
+        return {
+            "transitions": self.transitions,
+            "snapshots": self.snapshots,
+            "traced_bytes": current,
+            "peak_bytes": peak,
+            # Sizes when each line was flagged and at the last snapshot (a cache filling up levels off)
+            "flagged": {location: {"sizes": sizes, "now": self.history[location][-1]}
+                        for location, sizes in self.flagged.items()},
+            "growth_since_first": growth
+        }
+
+class StackSampler:
+    """Sampling profiler - a background thread records the main thread's stack rate times a second
+
+    Samples are kept as collapsed stacks ("state;outer;...;inner count", what flamegraph.pl
+    and speedscope read), rooted at whatever get_context() returned when they were taken
+    (the game_state). The main thread never does any of the work, so a session runs at
+    close to full speed while it is profiled.
+    """
+
+    def __init__(self, rate=100, get_context=None):
+        self.rate = rate  # Samples per second
+        self.get_context = get_context
+        self.counts = {}  # Collapsed stack -> samples
+        self.samples = 0
+        self.labels = {}  # Code object -> its frame label
+        self.thread = None
+        self.stopping = threading.Event()
+        self.target = None  # Thread id being sampled
+
+    def start(self):
+        """Start sampling the calling thread"""
+        if self.thread is not None:
+            return
+        self.target = threading.get_ident()
+        self.stopping.clear()
+        self.thread = threading.Thread(target=self.run, name="StackSampler", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """Stop sampling (the samples are kept)"""
+        if self.thread is None:
+            return
+        self.stopping.set()
+        self.thread.join()
+        self.thread = None
+
+    def label(self, code):
+        """Frame label for a code object - function (file:line), worked out once per function"""
+        label = self.labels.get(code)
+        if label is None:
+            label = self.labels[code] = (f"{code.co_qualname} ({os.path.basename(code.co_filename)}:"
+                                         f"{code.co_firstlineno})").replace(";", ":")
+        return label
+
+    def run(self):
+        """Sampler thread - take a sample every 1/rate seconds until stopped"""
+        interval = 1 / self.rate
+        while not self.stopping.wait(interval):
+            frame = sys._current_frames().get(self.target)
+            if frame is None:
+                break  # The sampled thread is gone
+            stack = []
+            while frame is not None:
+                stack.append(self.label(frame.f_code))
+                frame = frame.f_back
+            stack.append(str(self.get_context()) if self.get_context else "all")
+            key = ";".join(reversed(stack))
+            self.counts[key] = self.counts.get(key, 0) + 1
+            self.samples += 1
+
+    def write(self, path):
+        """Write the samples as collapsed stacks, one "stack count" line each; returns the path"""
+        with open(path, "w") as f:
+            for stack, count in sorted(self.counts.items()):
+                f.write(f"{stack} {count}\n")
+        return path
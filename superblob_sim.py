@@ -0,0 +1,1299 @@
+"""Headless game logic for Super Blob
+
+Everything that happens while a level is being played - blob physics, mini blob
+collection, building and gate collisions, gas clouds, snakes, power and debris -
+lives in Simulation. Nothing here touches pygame, so levels can be stepped far
+faster than real time for testing and analysis; superblob_game.py draws it.
+"""
+import math
+import random
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional - crowds of mini blobs are then handled one by one
+    np = None
+
+from superblob_debris import make_debris
+
+GRAVITY = 0.5
+MAX_LIVE_DEBRIS = 96  # Oldest pieces are recycled first when this many are falling
+FRAME_MS = 1000 / 60  # Simulation clock - every step is one frame at 60 fps
+GRID_MIN_ENTITIES = 32  # Smaller entity lists are just scanned, the grid only pays off for crowds
+MAGNET_RANGE = 150  # Richard's magnet pulls mini blobs closer than this
+PREVIEW_STEPS = 60  # How far ahead the drag preview predicts the flight
+
+def make_rng(seed, *names):
+    """Independent random stream for one subsystem, derived from a run seed and the given names"""
+    return random.Random("/".join(str(part) for part in (seed,) + names))
+
+def new_seed():
+    """Pick a seed for a run that was not given one"""
+    return random.randrange(2 ** 32)
+
+# Entities - small classes with __slots__ rather than dicts, so the hot loops read plain
+# attributes and a level full of them stays small in memory
+
+class CircleEntity:
+    """Anything round that moves (mini blobs, gas clouds, snakes)"""
+    __slots__ = ("x", "y", "r", "prev_x", "prev_y")
+
+    def __init__(self, x, y, r):
+        self.x = x
+        self.y = y
+        self.r = r
+        self.prev_x, self.prev_y = x, y  # Position before the last step (drawing interpolates from it)
+
+    def bounds(self):
+        """Box around the circle: (left, top, right, bottom)"""
+        return (self.x - self.r, self.y - self.r, self.x + self.r, self.y + self.r)
+
+class MiniBlob(CircleEntity):
+    """A mini blob waiting to be rescued"""
+    __slots__ = ("alive",)
+
+    def __init__(self, x, y, r=8, alive=True):
+        CircleEntity.__init__(self, x, y, r)
+        self.alive = alive
+
+class GasCloud(CircleEntity):
+    """Village gas cloud drifting around the level"""
+    __slots__ = ("vel_x", "vel_y")
+
+    def __init__(self, x, y, r, vel_x, vel_y):
+        CircleEntity.__init__(self, x, y, r)
+        self.vel_x = vel_x
+        self.vel_y = vel_y
+
+class Snake(CircleEntity):
+    """Forest snake swaying on top of a tree"""
+    __slots__ = ("tree_x", "sway_offset")
+
+    def __init__(self, x, y, r, tree_x, sway_offset):
+        CircleEntity.__init__(self, x, y, r)
+        self.tree_x = tree_x  # Reference position for swaying
+        self.sway_offset = sway_offset
+
+class Building:
+    """Building, house or tree - (x, y, w, h) is the hit box, trees are drawn at their visual box"""
+    __slots__ = ("x", "y", "w", "h", "alive", "is_boss", "hit_count", "required_power",
+                 "visual_x", "visual_y", "visual_w", "visual_h")
+
+    def __init__(self, x, y, w, h, alive=True, is_boss=False, hit_count=0, required_power=50,
+                 visual_x=None, visual_y=None, visual_w=None, visual_h=None):
+        self.x = x
+        self.y = y
+        self.w = w
+        self.h = h
+        self.alive = alive
+        self.is_boss = is_boss
+        self.hit_count = hit_count
+        self.required_power = required_power  # Power needed to smash a boss
+        self.visual_x = visual_x  # None unless the drawing is bigger than the hit box (trees)
+        self.visual_y = visual_y
+        self.visual_w = visual_w
+        self.visual_h = visual_h
+
+    def bounds(self):
+        """Hit box: (left, top, right, bottom)"""
+        return (self.x, self.y, self.x + self.w, self.y + self.h)
+
+class Gate:
+    """City gate (level 10+) that opens and closes on a timer"""
+    __slots__ = ("x", "y", "width", "height", "open", "timer", "open_duration", "close_duration")
+
+    def __init__(self, x, y, width, height, open=False, timer=0, open_duration=120, close_duration=90):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.open = open
+        self.timer = timer
+        self.open_duration = open_duration  # Frames gate stays open
+        self.close_duration = close_duration  # Frames gate stays closed
+
+def sweep_circles(x0, y0, x1, y1, other_x0, other_y0, other_x1, other_y1, reach):
+    """Time of impact (0-1) of two circles moving during a step, or None if they never get closer than reach
+
+    reach is the sum of their radii. Both move in straight lines from their (x0, y0)
+    to their (x1, y1) positions, so a fast blob cannot pass through a circle between steps.
+    """
+    # Work in the other circle's frame - it stands still and the blob moves by the difference
+    start_x, start_y = x0 - other_x0, y0 - other_y0
+    move_x = (x1 - other_x1) - start_x
+    move_y = (y1 - other_y1) - start_y
+    c = start_x * start_x + start_y * start_y - reach * reach
+    if c < 0:
+        return 0.0  # Already touching at the start of the step
+    b = start_x * move_x + start_y * move_y
+    if b >= 0:
+        return None  # Not getting any closer (or not moving at all)
+    a = move_x * move_x + move_y * move_y
+    discriminant = b * b - a * c
+    if discriminant <= 0:
+        return None
+    t = (-b - math.sqrt(discriminant)) / a
+    return t if 0 <= t < 1 else None
+
+def sweep_box(x0, y0, x1, y1, radius, left, top, right, bottom):
+    """Time of impact (0-1) of a circle moving (x0, y0) -> (x1, y1) with a rectangle, or None if it misses
+
+    Uses the square around the circle, like the rectangle collision checks, so a hit at the
+    end of the step is exactly the old overlap test - only passing through in between is new.
+    """
+    left -= radius
+    right += radius
+    top -= radius
+    bottom += radius
+    # Quick miss - the whole path is to one side of the box (most buildings, most steps)
+    if (x0 <= left and x1 <= left) or (x0 >= right and x1 >= right) or \
+       (y0 <= top and y1 <= top) or (y0 >= bottom and y1 >= bottom):
+        return None
+
+    t_enter, t_exit = 0.0, 1.0
+    move_x = x1 - x0
+    if move_x:
+        t_low = (left - x0) / move_x
+        t_high = (right - x0) / move_x
+        if t_low > t_high:
+            t_low, t_high = t_high, t_low
+        t_enter = max(t_enter, t_low)
+        t_exit = min(t_exit, t_high)
+    move_y = y1 - y0
+    if move_y:
+        t_low = (top - y0) / move_y
+        t_high = (bottom - y0) / move_y
+        if t_low > t_high:
+            t_low, t_high = t_high, t_low
+        t_enter = max(t_enter, t_low)
+        t_exit = min(t_exit, t_high)
+    return t_enter if t_enter < t_exit else None
+
+def quadratic_roots(a, b, c):
+    """Real roots of a*k^2 + b*k + c = 0, smallest first"""
+    if a == 0:
+        return [-c / b] if b else []
+    discriminant = b * b - 4 * a * c
+    if discriminant < 0:
+        return []
+    root = math.sqrt(discriminant)
+    return sorted(((-b - root) / (2 * a), (-b + root) / (2 * a)))
+
+def spawn_snakes(trees, level_num=1, rng=random):
+    """Create snakes on top of trees in forest - snakes grow bigger each level"""
+    snake_list = []
+    # Snakes grow 10 pixels bigger each level (12 base + 10 per level)
+    snake_radius = 12 + (level_num * 10)
+
+    for tree in trees:
+        if not tree.is_boss:  # Don't put snakes on boss tree
+            # Snake sits much lower on tree - use visual coordinates if available
+            if tree.visual_x is not None:
+                snake_x = tree.visual_x + tree.visual_w // 2
+                snake_y = tree.visual_y + 150  # Much lower down - near middle of tree
+            else:
+                snake_x = tree.x + tree.w // 2
+                snake_y = tree.y - 15
+
+            snake_list.append(Snake(
+                x=snake_x,
+                y=snake_y,
+                r=snake_radius,
+                tree_x=snake_x,  # Reference position for swaying
+                sway_offset=rng.randint(0, 360)  # For animation
+            ))
+    return snake_list
+
+def spawn_mini_blobs(num_blobs=6, rng=random):
+    """Create mini blobs scattered across the level (6 base + upgrades)"""
+    blobs = []
+    for i in range(num_blobs):
+        blobs.append(MiniBlob(
+            x=rng.randint(250, 750),
+            y=rng.randint(150, 400),
+            r=8,
+            alive=True
+        ))
+    return blobs
+
+def spawn_gas_clouds(level_num, rng=random):
+    """Create moving gas clouds for village levels - increases with level"""
+    clouds = []
+    # Start with 2 clouds, add 1 at level 5, add another at level 8
+    num_clouds = 2
+    if level_num >= 8:
+        num_clouds = 4
+    elif level_num >= 5:
+        num_clouds = 3
+
+    for i in range(num_clouds):
+        clouds.append(GasCloud(
+            x=rng.randint(200 + i * 150, 350 + i * 100),
+            y=rng.randint(150, 400),
+            r=25,
+            vel_x=rng.choice([-1, 1]) * rng.uniform(0.8, 1.2),
+            vel_y=rng.choice([-1, 1]) * rng.uniform(0.8, 1.2)
+        ))
+    return clouds
+
+def create_level_buildings(level_num, world="city", rng=random):
+    """Create buildings for the level - last one is the boss"""
+    bldgs = []
+
+    if world == "village":
+        # Village has houses instead of skyscrapers (taller houses!)
+        if level_num <= 4:
+            # 2 taller houses
+            for i in range(2):
+                bldgs.append(Building(
+                    x=350 + i * 150,
+                    y=380,  # Higher up (taller)
+                    w=80,
+                    h=220,  # Taller (was 180)
+                    alive=True,
+                    is_boss=False,
+                    hit_count=0
+                ))
+        elif level_num <= 9:
+            # 4 taller houses (was 3)
+            for i in range(4):
+                bldgs.append(Building(
+                    x=280 + i * 100,
+                    y=380,  # Higher up (taller)
+                    w=80,
+                    h=220,  # Taller (was 180)
+                    alive=True,
+                    is_boss=False,
+                    hit_count=0
+                ))
+        else:
+            # Level 10+: 4 houses with varied heights
+            for i in range(4):
+                height = rng.randint(220, 270)
+                y_pos = 600 - height
+                bldgs.append(Building(
+                    x=280 + i * 100,
+                    y=y_pos,
+                    w=80,
+                    h=height,
+                    alive=True,
+                    is_boss=False,
+                    hit_count=0
+                ))
+
+        # Boss house (larger, taller)
+        bldgs.append(Building(
+            x=650,
+            y=320,  # Higher up (taller)
+            w=120,
+            h=280,  # Taller (was 250)
+            alive=True,
+            is_boss=True,
+            required_power=level_num * 15  # 15, 30, 45, 60, etc. (harder than city)
+        ))
+        return bldgs
+
+    if world == "forest":
+        # Forest has trees - trunk-only collision boxes (narrower than visual)
+        if level_num <= 4:
+            # 2 trees (much taller and thicker)
+            for i in range(2):
+                bldgs.append(Building(
+                    x=355 + i * 150,  # Centered on trunk
+                    y=350,  # Trunk starts lower (much taller tree)
+                    w=50,  # Trunk width - THICKER!
+                    h=250,  # Trunk height - MUCH TALLER!
+                    alive=True,
+                    is_boss=False,
+                    hit_count=0,
+                    visual_x=340 + i * 150,  # Full tree visual position
+                    visual_y=150,  # Much higher up (taller tree)
+                    visual_w=80,  # Thicker visual tree
+                    visual_h=450  # Much taller tree
+                ))
+        elif level_num <= 9:
+            # 5 trees (level 5+, much taller and thicker)
+            for i in range(5):
+                bldgs.append(Building(
+                    x=255 + i * 90,  # Centered on trunk
+                    y=350,  # Trunk starts lower (much taller tree)
+                    w=50,  # Trunk width - THICKER!
+                    h=250,  # Trunk height - MUCH TALLER!
+                    alive=True,
+                    is_boss=False,
+                    hit_count=0,
+                    visual_x=240 + i * 90,  # Full tree visual position
+                    visual_y=150,  # Much higher up (taller tree)
+                    visual_w=80,  # Thicker visual tree
+                    visual_h=450  # Much taller tree
+                ))
+        else:
+            # Level 10+: 4 trees with varied heights (much taller and thicker)
+            for i in range(4):
+                visual_height = rng.randint(450, 520)  # Much taller varied heights
+                visual_y_pos = 600 - visual_height
+                # Trunk is collision box - thicker and taller
+                trunk_h = 250  # Consistent tall trunk
+                trunk_y = 350  # Same as other levels
+                bldgs.append(Building(
+                    x=295 + i * 100,  # Centered on trunk
+                    y=trunk_y,
+                    w=50,  # Trunk width - THICKER!
+                    h=trunk_h,  # Trunk height - TALLER!
+                    alive=True,
+                    is_boss=False,
+                    hit_count=0,
+                    visual_x=280 + i * 100,
+                    visual_y=visual_y_pos,
+                    visual_w=80,  # Thicker visual tree
+                    visual_h=visual_height  # Much taller visual tree
+                ))
+
+        # Boss tree (ancient tree - much larger trunk and SIGNIFICANTLY taller)
+        bldgs.append(Building(
+            x=680,  # Centered on trunk
+            y=250,  # Trunk position (MUCH taller tree - starts higher)
+            w=60,  # Boss trunk width - THICKER!
+            h=350,  # Boss trunk height - SUPER TALL!
+            alive=True,
+            is_boss=True,
+            required_power=level_num * 20,  # 20, 40, 60, 80, 100, etc.
+            visual_x=650,
+            visual_y=0,  # Much higher up - starts at top of screen!
+            visual_w=130,  # Thicker visual boss tree
+            visual_h=600  # SUPER tall boss tree visual - towers above others
+        ))
+        return bldgs
+
+    # City buildings (original code)
+    # Regular buildings (can be destroyed by any hit)
+
+    if level_num <= 4:
+        # Levels 1-4: 2 buildings in a line
+        for i in range(2):
+            bldgs.append(Building(
+                x=350 + i * 150,
+                y=350,
+                w=70,
+                h=250,
+                alive=True,
+                is_boss=False,
+                hit_count=0  # Track hits
+            ))
+    elif level_num <= 9:
+        # Levels 5-9: 3 buildings in a line
+        for i in range(3):
+            bldgs.append(Building(
+                x=300 + i * 120,
+                y=350,
+                w=70,
+                h=250,
+                alive=True,
+                is_boss=False,
+                hit_count=0
+            ))
+    else:
+        # Level 10+: 3 buildings with varied heights and positions
+        num_obstacles = 3
+        for i in range(num_obstacles):
+            height = rng.randint(200, 300)
+            y_pos = 600 - height
+            x_spacing = (600 - 350) // (num_obstacles + 1)
+            bldgs.append(Building(
+                x=350 + (i + 1) * x_spacing - 35,
+                y=y_pos,
+                w=70,
+                h=height,
+                alive=True,
+                is_boss=False,
+                hit_count=0
+            ))
+
+    # Boss building (taller, wider, different color)
+    bldgs.append(Building(
+        x=650,
+        y=250,
+        w=100,
+        h=350,
+        alive=True,
+        is_boss=True,
+        required_power=level_num * 10  # 10, 20, 30, 40, etc.
+    ))
+    return bldgs
+
+class SpatialGrid:
+    """Uniform grid over the playfield - finds the entities near a circle without scanning them all"""
+
+    def __init__(self, width, height, cell_size=64):
+        self.cell_size = cell_size
+        self.cols = int(width // cell_size) + 1
+        self.rows = int(height // cell_size) + 1
+        self.cells = [{} for _ in range(self.cols * self.rows)]  # id(entity) -> entity, per cell
+        self.entries = {}  # id(entity) -> [entity, insertion order, covered cell range]
+        self.source = None  # The entity list the grid was last built from
+        self.source_len = 0
+        self.next_order = 0
+        self.linear = True  # Too few entities to be worth indexing - queries return the whole list
+
+    def cell_range(self, left, top, right, bottom):
+        """Columns and rows covered by a box (clamped, things off the playfield go in the edge cells)"""
+        size = self.cell_size
+        last_col = self.cols - 1
+        last_row = self.rows - 1
+        # Plain comparisons rather than min()/max() - this runs for every moving entity every step
+        col0 = int(left) // size
+        col0 = 0 if col0 < 0 else last_col if col0 > last_col else col0
+        col1 = int(right) // size
+        col1 = 0 if col1 < 0 else last_col if col1 > last_col else col1
+        row0 = int(top) // size
+        row0 = 0 if row0 < 0 else last_row if row0 > last_row else row0
+        row1 = int(bottom) // size
+        row1 = 0 if row1 < 0 else last_row if row1 > last_row else row1
+        return (col0, row0, col1, row1)
+
+    def entity_range(self, entity):
+        """Cell range of an entity's bounds"""
+        return self.cell_range(*entity.bounds())
+
+    def add_to_cells(self, entity, cell_range):
+        col0, row0, col1, row1 = cell_range
+        for row in range(row0, row1 + 1):
+            for col in range(col0, col1 + 1):
+                self.cells[row * self.cols + col][id(entity)] = entity
+
+    def remove_from_cells(self, entity, cell_range):
+        col0, row0, col1, row1 = cell_range
+        for row in range(row0, row1 + 1):
+            for col in range(col0, col1 + 1):
+                self.cells[row * self.cols + col].pop(id(entity), None)
+
+    def insert(self, entity):
+        """Add an entity to the grid"""
+        cell_range = self.entity_range(entity)
+        self.entries[id(entity)] = [entity, self.next_order, cell_range]
+        self.next_order += 1
+        self.add_to_cells(entity, cell_range)
+
+    def remove(self, entity):
+        """Take an entity out of the grid (collected or destroyed)"""
+        if self.linear:
+            return
+        entry = self.entries.pop(id(entity), None)
+        if entry:
+            self.remove_from_cells(entity, entry[2])
+
+    def move(self, entity):
+        """Update an entity after it moved - only touches the cells when it crossed into new ones"""
+        if self.linear:
+            return
+        entry = self.entries.get(id(entity))
+        if entry is None:
+            return
+        cell_range = self.entity_range(entity)
+        if cell_range != entry[2]:
+            self.remove_from_cells(entity, entry[2])
+            self.add_to_cells(entity, cell_range)
+            entry[2] = cell_range
+
+    def rebuild(self, entities):
+        """Index a new list of entities (the ones still alive)"""
+        for cell in self.cells:
+            cell.clear()
+        self.entries = {}
+        self.next_order = 0
+        self.source = entities
+        self.source_len = len(entities)
+        self.linear = len(entities) < GRID_MIN_ENTITIES
+        if not self.linear:
+            for entity in entities:
+                if getattr(entity, "alive", True):
+                    self.insert(entity)
+
+    def sync(self, entities):
+        """Rebuild if the entity list was replaced or grown since the grid was built from it"""
+        if entities is not self.source or len(entities) != self.source_len:
+            self.rebuild(entities)
+
+    def query(self, x, y, r):
+        """Entities in the cells around a circle, in the order they were added (callers do the exact test)"""
+        if self.linear:
+            return self.source
+        col0, row0, col1, row1 = self.cell_range(x - r, y - r, x + r, y + r)
+        if col0 == col1 and row0 == row1:
+            found = self.cells[row0 * self.cols + col0]
+        else:
+            found = {}
+            for row in range(row0, row1 + 1):
+                for col in range(col0, col1 + 1):
+                    found.update(self.cells[row * self.cols + col])
+        if len(found) < 2:
+            return list(found.values())
+        entries = self.entries
+        return [entries[key][0] for key in sorted(found, key=lambda key: entries[key][1])]
+
+class MiniBlobField:
+    """Mini blob positions packed into NumPy arrays - the magnet and collection run on all of them at once"""
+
+    def __init__(self):
+        self.source = None  # The mini blob list the arrays were packed from
+        self.source_len = 0
+        self.moved = []  # Indices the magnet moved in the last step
+
+    def sync(self, minis):
+        """Repack if the mini blob list was replaced or grown since it was packed"""
+        if minis is not self.source or len(minis) != self.source_len:
+            self.source = minis
+            self.source_len = len(minis)
+            self.x = np.array([mini.x for mini in minis], dtype=float)
+            self.y = np.array([mini.y for mini in minis], dtype=float)
+            self.prev_x = np.array([mini.prev_x for mini in minis], dtype=float)
+            self.prev_y = np.array([mini.prev_y for mini in minis], dtype=float)
+            self.r = np.array([mini.r for mini in minis], dtype=float)
+            self.alive = np.array([mini.alive for mini in minis], dtype=bool)
+            self.moved = []
+
+    def remember_positions(self):
+        """Keep the current positions - only the mini blobs the magnet moved have stale ones"""
+        np.copyto(self.prev_x, self.x)
+        np.copyto(self.prev_y, self.y)
+        for index in self.moved:
+            mini = self.source[index]
+            mini.prev_x, mini.prev_y = mini.x, mini.y
+        self.moved = []
+
+    def pull_and_collect(self, sim):
+        """Magnet pull and collection for every live mini blob; returns the indices collected this step"""
+        live = np.flatnonzero(self.alive)
+        if not len(live):
+            return []
+
+        # Magnet - one distance computation, a range mask and a pull for everything in range
+        if sim.magnetic:
+            dx = sim.blob_x - self.x[live]
+            dy = sim.blob_y - self.y[live]
+            dist = np.sqrt(dx * dx + dy * dy)
+            in_range = (dist < MAGNET_RANGE) & (dist > 0)
+            pulled = live[in_range]
+            if len(pulled):
+                self.x[pulled] += dx[in_range] / dist[in_range] * sim.pull_strength
+                self.y[pulled] += dy[in_range] / dist[in_range] * sim.pull_strength
+                # Copy the new positions back onto the MiniBlob objects the renderer draws
+                minis = self.source
+                for index, x, y in zip(pulled.tolist(), self.x[pulled].tolist(), self.y[pulled].tolist()):
+                    mini = minis[index]
+                    mini.x, mini.y = x, y
+                self.moved = pulled.tolist()
+
+        # Collection - sweep_circles for every live mini blob at once
+        start_x = sim.prev_blob_x - self.prev_x[live]
+        start_y = sim.prev_blob_y - self.prev_y[live]
+        move_x = (sim.blob_x - self.x[live]) - start_x
+        move_y = (sim.blob_y - self.y[live]) - start_y
+        reach = sim.blob_radius + self.r[live] + 5  # Added buffer
+        c = start_x * start_x + start_y * start_y - reach * reach
+        b = start_x * move_x + start_y * move_y
+        a = move_x * move_x + move_y * move_y
+        discriminant = b * b - a * c
+        approaching = (b < 0) & (discriminant > 0)
+        t = np.full(len(live), 2.0)
+        t[approaching] = (-b[approaching] - np.sqrt(discriminant[approaching])) / a[approaching]
+        collected = live[(c < 0) | (approaching & (t >= 0) & (t < 1))]
+
+        self.alive[collected] = False
+        for index in collected.tolist():
+            self.source[index].alive = False
+        return collected.tolist()
+
+class Simulation:
+    """Playing-state game logic: blob, buildings, mini blobs, hazards, gate, power and debris"""
+
+    def __init__(self, width=800, height=600, seed=None):
+        self.width = width
+        self.height = height
+        self.gravity = GRAVITY
+        self.world = "city"  # "city", "village", or "forest"
+        self.level = 1
+
+        # Run seed - levels are generated from (seed, world, level) and debris from its own
+        # stream, so a run is reproducible from its seed and inputs
+        self.seed = new_seed() if seed is None else seed
+
+        # Simulation clock in frames (snake sway and animations follow it, not wall time)
+        self.frames = 0  # Steps taken since the run started
+        self.time_ms = 0.0
+
+        # Blob properties
+        self.blob_x, self.blob_y = 100, 450
+        self.blob_radius = 20
+        self.blob_vel_x, self.blob_vel_y = 0, 0
+        self.prev_blob_x, self.prev_blob_y = self.blob_x, self.blob_y  # Position before the last step
+        self.dragging = False
+        self.flying = False
+        self.can_catch = False
+        self.launch_x, self.launch_y = self.blob_x, self.blob_y
+        self.collision_cooldown = 0  # Prevent multiple collisions in same frame
+
+        # Power bar and run progress
+        self.power = 100
+        self.max_power = 100
+        self.blobs_collected_run = 0  # Blobs collected in current game run (for power increase)
+        self.blobs_collected_level = 0  # Blobs collected in current level (for size increase)
+
+        # Character abilities (see set_character)
+        self.power_drain_rate = 0.5  # Power lost per frame (slow drain)
+        self.bounce_damping = 0.7  # Energy loss on bounce
+        self.can_pierce = False
+        self.magnetic = False
+        self.upgraded = False
+        self.pull_strength = 5.0  # Magnet pull per step (see set_character)
+
+        # Level contents
+        self.buildings = []
+        self.mini_blobs = []
+        self.gas_clouds = []  # Village gas clouds (moving hazards)
+        self.snakes = []  # Forest snakes (deadly hazards on trees)
+        self.gate = Gate(
+            x=250,
+            y=0,  # Start from top of screen
+            width=30,
+            height=600,  # Full screen height
+            open=False,
+            timer=0,
+            open_duration=120,  # Frames gate stays open
+            close_duration=90   # Frames gate stays closed
+        )
+
+        # Falling pieces of destroyed buildings (NumPy arrays, or an object pool without NumPy)
+        self.debris = make_debris(MAX_LIVE_DEBRIS, self.gravity, height)
+        self.debris.seed(make_rng(self.seed, "debris"))
+
+        # Spatial grids - collision queries only look at entities near the blob
+        self.grids = {name: SpatialGrid(width, height) for name in ("buildings", "mini_blobs", "gas_clouds", "snakes")}
+        # Crowds of mini blobs (with NumPy) are pulled and collected as packed arrays instead
+        self.mini_field = MiniBlobField() if np is not None else None
+
+        self.events = []  # What happened during the last step
+
+        # Drag preview - predicted path, recomputed only when the aim or the level changes
+        self.preview = {"key": None, "path": [], "computed": 0, "reused": 0}
+
+    def set_character(self, char):
+        """Apply a character's stats (with upgrades)"""
+        self.power_drain_rate = char["power_drain"]
+        self.bounce_damping = char["bounce"]
+        self.can_pierce = char["can_pierce"]
+        self.magnetic = char["magnetic"]
+        self.upgraded = char["upgraded"]
+
+        # Apply upgrades if purchased
+        if char["upgraded"]:
+            if char["name"] == "ALEX":
+                self.bounce_damping = 0.95  # Even bouncier
+            elif char["name"] == "LUCY":
+                self.power_drain_rate = 0.15  # Super efficient
+
+        # Magnet pull per step (Richard) - upgrade: even stronger magnetic pull
+        self.pull_strength = 7.5 if self.upgraded else 5.0
+
+    def reset_blob(self):
+        """Put the blob back on the launch spot"""
+        self.blob_x, self.blob_y = 100, 450
+        self.blob_vel_x, self.blob_vel_y = 0, 0
+        self.prev_blob_x, self.prev_blob_y = self.blob_x, self.blob_y  # Jump, don't slide back
+        self.flying = False
+        self.can_catch = False
+        self.collision_cooldown = 0
+
+    def remember_positions(self):
+        """Keep the current positions of everything that moves (the renderer interpolates from them)"""
+        self.prev_blob_x, self.prev_blob_y = self.blob_x, self.blob_y
+        if self.packed_mini_blobs() and self.mini_field.source is self.mini_blobs:
+            self.mini_field.remember_positions()
+            entity_lists = (self.gas_clouds, self.snakes)
+        else:
+            entity_lists = (self.mini_blobs, self.gas_clouds, self.snakes)
+        for entities in entity_lists:
+            for entity in entities:
+                entity.prev_x = entity.x
+                entity.prev_y = entity.y
+        self.debris.remember_positions()
+
+    def packed_mini_blobs(self):
+        """Whether the mini blobs are many enough to go through the packed MiniBlobField"""
+        return self.mini_field is not None and len(self.mini_blobs) >= GRID_MIN_ENTITIES
+
+    def sync_grids(self):
+        """Re-index any entity list that was replaced since the last step"""
+        for name, grid in self.grids.items():
+            if name == "mini_blobs" and self.packed_mini_blobs():
+                self.mini_field.sync(self.mini_blobs)
+            else:
+                grid.sync(getattr(self, name))
+
+    def impact_point(self, t):
+        """Where the blob was at time t (0-1) of this step"""
+        return (self.prev_blob_x + (self.blob_x - self.prev_blob_x) * t,
+                self.prev_blob_y + (self.blob_y - self.prev_blob_y) * t)
+
+    def sweep_query(self, grid):
+        """Entities of a grid that the blob may have touched anywhere along this step's path"""
+        reach = math.hypot(self.blob_x - self.prev_blob_x, self.blob_y - self.prev_blob_y) / 2
+        # + 2 covers the hazards' own drift this step (clouds move under 2px, snakes sway less)
+        return grid.query((self.prev_blob_x + self.blob_x) / 2, (self.prev_blob_y + self.blob_y) / 2,
+                          reach + self.blob_radius + 2)
+
+    def level_rng(self, name):
+        """Random stream of one level generator for the current world and level"""
+        return make_rng(self.seed, name, self.world, self.level)
+
+    def build_level(self, num_mini_blobs, with_snakes=True):
+        """Create the buildings, mini blobs and hazards of the current world and level"""
+        self.buildings = create_level_buildings(self.level, self.world, self.level_rng("buildings"))
+        self.debris.clear()
+        self.mini_blobs = spawn_mini_blobs(num_mini_blobs, self.level_rng("mini_blobs"))
+
+        # Spawn gas clouds for village
+        if self.world == "village":
+            self.gas_clouds = spawn_gas_clouds(self.level, self.level_rng("gas_clouds"))
+        else:
+            self.gas_clouds = []
+
+        # Spawn snakes for forest
+        if with_snakes:
+            if self.world == "forest":
+                self.snakes = spawn_snakes(self.buildings, self.level, self.level_rng("snakes"))
+            else:
+                self.snakes = []
+
+        # Reset gate
+        self.gate.open = False
+        self.gate.timer = 0
+        self.remember_positions()
+
+    def reset_run(self, world, char, num_mini_blobs=6, seed=None):
+        """Start a new run of a world from level 1 (with a fresh seed unless one is given)"""
+        self.seed = new_seed() if seed is None else seed
+        self.debris.seed(make_rng(self.seed, "debris"))
+        self.frames = 0
+        self.time_ms = 0.0
+        self.world = world
+        self.level = 1
+        self.blobs_collected_run = 0  # Reset run counter
+        self.blobs_collected_level = 0  # Reset level counter for size
+        self.power = 100
+        self.build_level(num_mini_blobs)
+        self.reset_blob()
+        self.dragging = False
+        self.set_character(char)
+
+    def retry_level(self, world, level_num, num_mini_blobs=6):
+        """Retry a level without losing progress"""
+        self.world = world
+        self.level = level_num
+
+        # Keep blobs_collected_run and blobs_collected_level (for size)
+        # Start at full health (based on blobs collected in this run)
+        self.max_power = 100 + (self.blobs_collected_run // 10) * 10
+        self.power = self.max_power
+        self.build_level(num_mini_blobs)
+        self.reset_blob()
+        self.dragging = False
+
+    def next_level(self, level_num, num_mini_blobs=6):
+        """Move on to the next level of the current world (snakes stay where they are)"""
+        self.level = level_num
+
+        # Reset blobs collected this level to 0 so character size goes back to 20
+        self.blobs_collected_level = 0
+
+        # Start at full health (based on blobs collected in this run)
+        self.max_power = 100 + (self.blobs_collected_run // 10) * 10
+        self.power = self.max_power
+        self.build_level(num_mini_blobs, with_snakes=False)
+        self.reset_blob()
+
+    def spawn_gas_clouds_at(self, points):
+        """Replace the gas clouds with ones drifting away from the given spawn points"""
+        rng = self.level_rng("intro_gas_clouds")
+        self.gas_clouds = []
+        for i, (gx, gy) in enumerate(points):
+            self.gas_clouds.append(GasCloud(
+                x=gx,
+                y=gy,
+                r=25,
+                vel_x=rng.choice([-1, 1]) * rng.uniform(0.8, 1.2),
+                vel_y=rng.choice([-1, 1]) * rng.uniform(0.8, 1.2)
+            ))
+        self.remember_positions()
+
+    def preview_path(self, steps=PREVIEW_STEPS):
+        """Positions after each of the next steps if the blob were released now (cached while nothing changes)"""
+        has_gate = self.level >= 10 and self.world == "city"
+        key = (self.blob_x, self.blob_y, self.launch_x, self.launch_y, self.blob_radius, self.bounce_damping,
+               self.can_pierce, self.upgraded, self.power, self.power_drain_rate, id(self.buildings),
+               tuple(building.alive for building in self.buildings), has_gate and not self.gate.open, steps)
+        if key == self.preview["key"]:
+            self.preview["reused"] += 1
+        else:
+            self.preview["key"] = key
+            self.preview["path"] = self.predict_path(steps, has_gate)
+            self.preview["computed"] += 1
+        return self.preview["path"]
+
+    def predict_path(self, steps, has_gate):
+        """Solve the flight after release in closed form, bouncing off walls, ceiling, buildings and a closed gate
+
+        Between hits the blob is on a parabola: after k steps from (x, y) with velocity (vx, vy)
+        it is at x + vx*k, y + vy*k + gravity*k*(k+1)/2 - exactly where step() puts it. The first
+        hit is found by intersecting that parabola with each surface, then the flight continues
+        from there with the same response step() gives it (bounce_damping, pierce, cooldown,
+        power drained by the time it reaches a boss). Snakes, gas clouds and the gate opening
+        or closing mid-flight are not predicted.
+        """
+        g = self.gravity
+        r = self.blob_radius
+        damping = self.bounce_damping
+        x, y = self.blob_x, self.blob_y
+        vx = (self.launch_x - self.blob_x) * 0.2
+        vy = (self.launch_y - self.blob_y) * 0.2
+
+        # Obstacles: [hit box grown by the radius, hit box, what happens on contact (power needed for a boss)]
+        obstacles = []
+        for building in self.buildings:
+            if building.alive:
+                if building.is_boss:
+                    required = building.required_power
+                    if self.can_pierce and self.upgraded:
+                        required = int(required * 0.7)
+                    response = required  # Smash or bounce off - decided by the power left when it gets there
+                else:
+                    response = "pierce" if self.can_pierce else "destroy"
+                box = (building.x, building.y, building.x + building.w, building.y + building.h)
+                obstacles.append([(box[0] - r, box[1] - r, box[2] + r, box[3] + r), box, response])
+        if has_gate and not self.gate.open:
+            gate = self.gate
+            box = (gate.x, gate.y, gate.x + gate.width, gate.y + gate.height)
+            obstacles.append([(box[0] - r, box[1] - r, box[2] + r, box[3] + r), box, "bounce_off"])
+
+        path = []
+        step = 0
+        cooldown_until = 0  # Buildings and the gate are ignored until this step (collision_cooldown)
+        while step < steps:
+            a = g / 2
+            b = vy + g / 2
+            limit = steps - step
+            boxes_active = step >= cooldown_until
+            if not boxes_active:
+                limit = min(limit, cooldown_until - step)
+
+            def position(k):
+                return (x + vx * k, y + b * k + a * k * k)
+
+            # Earliest contact along this parabola: (k, what, obstacle)
+            # (a blob dragged past an edge is pushed back at the end of the first step unless it gets back in)
+            hits = []
+            if x < r:
+                if x + vx < r:
+                    hits.append((1.0, "left", None))
+            elif vx < 0:
+                hits.append(((r - x) / vx, "left", None))
+            if x > self.width - r:
+                if x + vx > self.width - r:
+                    hits.append((1.0, "right", None))
+            elif vx > 0:
+                hits.append(((self.width - r - x) / vx, "right", None))
+            if y < r:
+                if y + b + a < r:
+                    hits.append((1.0, "ceiling", None))
+            else:
+                for k in quadratic_roots(a, b, y - r):
+                    if 2 * a * k + b < 0:  # Rising through the ceiling
+                        hits.append((k, "ceiling", None))
+            if y > self.height - r and y + b + a > self.height - r:
+                hits.append((1.0, "ground", None))
+            for k in quadratic_roots(a, b, y - (self.height - r)):
+                if 2 * a * k + b > 0:  # Falling onto the ground
+                    hits.append((k, "ground", None))
+            if boxes_active:
+                for obstacle in obstacles:
+                    left, top, right, bottom = obstacle[0]
+                    if left < x < right and top < y < bottom:
+                        hits.append((0.0, "box", obstacle))
+                        continue
+                    if vx:
+                        k = ((left if vx > 0 else right) - x) / vx
+                        if top < position(k)[1] < bottom:
+                            hits.append((k, "box", obstacle))
+                    for face, falling in ((top, True), (bottom, False)):
+                        for k in quadratic_roots(a, b, y - face):
+                            if (2 * a * k + b > 0) == falling and left < x + vx * k < right:
+                                hits.append((k, "box", obstacle))
+            hits = [hit for hit in hits if (hit[0] > 1e-9 or (hit[0] == 0 and hit[1] == "box")) and hit[0] <= limit]
+
+            if not hits:
+                for i in range(1, limit + 1):
+                    path.append(position(i))
+                x, y = position(limit)
+                vy += g * limit
+                step += limit
+                continue
+
+            k, what, obstacle = min(hits, key=lambda hit: hit[0])
+            n = max(1, math.ceil(k))  # step() reacts at the end of the step the contact happens in
+            for i in range(1, n):
+                path.append(position(i))
+            hit_x, hit_y = position(k)
+            vy += g * n
+
+            if what == "ground":
+                path.append((hit_x, hit_y))
+                break  # Blob lands and goes back to the launch spot
+            if what == "left":
+                vx = abs(vx) * damping
+                x, y = r, position(n)[1]
+            elif what == "right":
+                vx = -abs(vx) * damping
+                x, y = self.width - r, position(n)[1]
+            elif what == "ceiling":
+                vy = abs(vy) * damping
+                x, y = position(n)[0], r
+            else:
+                # A piercing blob goes through everything it touches during this step, in building order
+                touched = [obstacle]
+                if self.can_pierce:
+                    same_step = {id(hit[2]): hit[0] for hit in hits
+                                 if hit[1] == "box" and max(1, math.ceil(hit[0])) == n}
+                    touched = [item for item in obstacles if id(item) in same_step]
+                contacts = [position(same_step[id(item)] if self.can_pierce else k) for item in touched]
+                end = position(n)
+                x, y = end
+                cooldown_until = step + n + 14
+                smashed = False
+                power = max(0, self.power - self.power_drain_rate * (step + n))  # Power drains every step in flight
+                for obstacle, (hit_x, hit_y) in zip(touched, contacts):
+                    response = obstacle[2]
+                    if not isinstance(response, str):
+                        response = "smash" if power >= response else "bounce_off"
+                    box = obstacle[1]
+                    center_x = (box[0] + box[2]) / 2
+                    if response == "smash":
+                        smashed = True
+                        break  # Boss smashed - the level is over
+                    if response == "bounce_off":
+                        x = box[0] - r - 2 if hit_x < center_x else box[2] + r + 2
+                        y = hit_y
+                    else:
+                        # Destroyed on the way - gone for the rest of the flight
+                        obstacles.remove(obstacle)
+                        if response == "destroy":
+                            x, y = hit_x, hit_y
+                    if response != "pierce":
+                        vx = -abs(vx) * damping if hit_x < center_x else abs(vx) * damping
+                if smashed:
+                    path.append(end)
+                    break
+            path.append((x, y))
+            step += n
+        return path
+
+    def press(self, pos):
+        """Mouse press - catch the blob mid-flight or grab it for the initial launch"""
+        mouse_x, mouse_y = pos
+        dist = math.sqrt((mouse_x - self.blob_x)**2 + (mouse_y - self.blob_y)**2)
+        if self.can_catch and self.flying:
+            # Catch blob mid-flight - INCREASED CATCH RADIUS
+            if dist < self.blob_radius + 50:  # Much bigger catch zone
+                self.dragging = True
+                self.flying = False
+                self.can_catch = False
+                self.launch_x, self.launch_y = self.blob_x, self.blob_y
+                self.blob_vel_x, self.blob_vel_y = 0, 0
+        elif not self.flying and not self.dragging:
+            # Initial launch
+            if dist < self.blob_radius + 20:
+                self.dragging = True
+                self.launch_x, self.launch_y = self.blob_x, self.blob_y
+
+    def release(self):
+        """Mouse release - launch the blob if it is being dragged"""
+        if self.dragging:
+            self.dragging = False
+            self.flying = True
+            self.can_catch = True
+            self.blob_vel_x = (self.launch_x - self.blob_x) * 0.2
+            self.blob_vel_y = (self.launch_y - self.blob_y) * 0.2
+
+    def create_debris(self, building):
+        """Create falling pieces when building is destroyed"""
+        # Remember what the piece was part of, the renderer picks the color from it
+        if building.is_boss:
+            kind = "boss"
+        elif self.world == "forest":
+            kind = "tree"
+        else:
+            kind = "building"
+
+        piece_count = 12 if building.is_boss else 8
+        self.debris.emit(building.x, building.y, building.w, building.h, piece_count, kind)
+
+    def destroy_building(self, building, event):
+        """Knock a building down and record it in this step's events"""
+        building.alive = False
+        self.grids["buildings"].remove(building)
+        self.create_debris(building)
+        self.events.append((event, building))
+
+    def step(self, inputs=None):
+        """Advance the level by one frame and return the events that happened during it
+
+        inputs is a dict with "events" (a list of ("press", pos) and ("release", pos) in the
+        order they happened) and "pointer" (mouse position, followed while dragging).
+        Events are ("collected", mini),
+        ("destroyed", building), ("boss_smashed", building), ("power_out", None),
+        ("gas_hit", cloud) and ("snake_hit", snake).
+        """
+        inputs = inputs or {}
+        self.events = []
+        self.frames += 1
+        self.time_ms = self.frames * FRAME_MS
+        self.remember_positions()
+        self.sync_grids()
+
+        for kind, pos in inputs.get("events", ()):
+            if kind == "press":
+                self.press(pos)
+            elif kind == "release":
+                self.release()
+
+        # Update blob size based on blobs collected THIS level (resets each level)
+        self.blob_radius = 20 + (self.blobs_collected_level // 5) * 4
+
+        # Max power increases by 10 for every 10 blobs collected in current run
+        self.max_power = 100 + (self.blobs_collected_run // 10) * 10
+
+        # VILLAGE BONUS: Extra +10 max health for every 7 mini blobs collected in the run
+        # So at 7, 14, 21, 28... blobs you get +10 HP each time
+        if self.world == "village":
+            self.max_power += (self.blobs_collected_run // 7) * 10
+
+        # FOREST BONUS: Extra +10 max health for every 5 mini blobs collected in the run
+        # So at 5, 10, 15, 20... blobs you get +10 HP each time
+        if self.world == "forest":
+            self.max_power += (self.blobs_collected_run // 5) * 10
+
+        gate = self.gate
+        has_gate = self.level >= 10 and self.world == "city"
+
+        # Gate timer update (level 10+ in city only)
+        if has_gate:
+            gate.timer += 1
+            if gate.open:
+                if gate.timer >= gate.open_duration:
+                    gate.open = False
+                    gate.timer = 0
+            else:
+                if gate.timer >= gate.close_duration:
+                    gate.open = True
+                    gate.timer = 0
+
+        # Power drain
+        if self.flying:
+            self.power -= self.power_drain_rate
+            self.power = max(0, self.power)
+
+            # Check if power depleted
+            if self.power <= 0:
+                self.events.append(("power_out", None))
+
+        # Physics
+        if self.flying:
+            self.blob_vel_y += self.gravity
+            self.blob_x += self.blob_vel_x
+            self.blob_y += self.blob_vel_y
+            blob_radius = self.blob_radius
+
+            # The blob moved in a straight line from (prev_blob_x, prev_blob_y) this step - collisions
+            # are checked along that whole path (swept), so fast launches cannot skip over anything
+            sweep_x = (self.prev_blob_x + self.blob_x) / 2
+            sweep_y = (self.prev_blob_y + self.blob_y) / 2
+            sweep_reach = math.hypot(self.blob_x - self.prev_blob_x, self.blob_y - self.prev_blob_y) / 2
+
+            if self.packed_mini_blobs():
+                # Crowd of mini blobs - magnet and collection in one pass over the packed arrays
+                collected = [self.mini_blobs[index] for index in self.mini_field.pull_and_collect(self)]
+            else:
+                # Magnetic attraction (Richard's ability - STRONGER PULL!)
+                if self.magnetic:
+                    mini_grid = self.grids["mini_blobs"]
+                    for mini in mini_grid.query(self.blob_x, self.blob_y, MAGNET_RANGE):
+                        if mini.alive:
+                            dist = math.sqrt((self.blob_x - mini.x)**2 + (self.blob_y - mini.y)**2)
+                            if dist < MAGNET_RANGE and dist > 0:
+                                # Pull mini blobs toward player
+                                dx = (self.blob_x - mini.x) / dist
+                                dy = (self.blob_y - mini.y) / dist
+                                mini.x += dx * self.pull_strength
+                                mini.y += dy * self.pull_strength
+                                mini_grid.move(mini)
+
+                # Collect mini blobs - FIXED DISTANCE CHECK
+                collected = []
+                for mini in self.grids["mini_blobs"].query(sweep_x, sweep_y, sweep_reach + blob_radius + 5):
+                    if mini.alive:
+                        hit = sweep_circles(self.prev_blob_x, self.prev_blob_y, self.blob_x, self.blob_y,
+                                            mini.prev_x, mini.prev_y, mini.x, mini.y,
+                                            blob_radius + mini.r + 5)  # Added buffer
+                        if hit is not None:
+                            mini.alive = False
+                            self.grids["mini_blobs"].remove(mini)
+                            collected.append(mini)
+
+            for mini in collected:
+                self.blobs_collected_run += 1  # Counter for max power increase
+                self.blobs_collected_level += 1  # Counter for size increase this level
+                self.power = min(self.max_power, self.power + 15)  # Refill power
+                self.events.append(("collected", mini))
+
+            # Collision cooldown
+            if self.collision_cooldown > 0:
+                self.collision_cooldown -= 1
+
+            # Building collisions
+            if self.collision_cooldown == 0:
+                for building in self.grids["buildings"].query(sweep_x, sweep_y, sweep_reach + blob_radius):
+                    if building.alive:
+                        # Rectangle collision detection (swept - where along this step's path it first hits)
+                        hit = sweep_box(self.prev_blob_x, self.prev_blob_y, self.blob_x, self.blob_y, blob_radius,
+                                        building.x, building.y,
+                                        building.x + building.w, building.y + building.h)
+                        if hit is not None:
+                            hit_x, hit_y = self.impact_point(hit)
+
+                            self.collision_cooldown = 15  # Prevent rapid re-collision
+
+                            # Check if boss building
+                            if building.is_boss:
+                                required = building.required_power
+                                # Evil Mob upgrade: Smash bosses faster (30% less power needed)
+                                if self.can_pierce and self.upgraded:
+                                    required = int(required * 0.7)  # 30% reduction
+                                if self.power >= required:
+                                    # SMASH THE BOSS!
+                                    self.destroy_building(building, "boss_smashed")
+                                else:
+                                    # Bounce off - not enough power
+                                    center_x = building.x + building.w / 2
+                                    self.blob_y = hit_y
+
+                                    if hit_x < center_x:
+                                        self.blob_vel_x = -abs(self.blob_vel_x) * self.bounce_damping
+                                        self.blob_x = building.x - blob_radius - 2
+                                    else:
+                                        self.blob_vel_x = abs(self.blob_vel_x) * self.bounce_damping
+                                        self.blob_x = building.x + building.w + blob_radius + 2
+                            else:
+                                # Regular building - DESTROY ON HIT
+                                self.destroy_building(building, "destroyed")
+
+                                # Pierce or bounce based on character ability
+                                if not self.can_pierce:
+                                    # Bounce after destruction (from where it hit)
+                                    center_x = building.x + building.w / 2
+                                    self.blob_x, self.blob_y = hit_x, hit_y
+
+                                    if self.blob_x < center_x:
+                                        self.blob_vel_x = -abs(self.blob_vel_x) * self.bounce_damping
+                                    else:
+                                        self.blob_vel_x = abs(self.blob_vel_x) * self.bounce_damping
+                                # else: Red blob pierces through, no bounce!
+
+                            if not self.can_pierce:
+                                break  # Only break if not piercing
+
+            # Bounce off edges
+            if self.blob_x - blob_radius < 0:
+                self.blob_vel_x = abs(self.blob_vel_x) * self.bounce_damping
+                self.blob_x = blob_radius
+            elif self.blob_x + blob_radius > self.width:
+                self.blob_vel_x = -abs(self.blob_vel_x) * self.bounce_damping
+                self.blob_x = self.width - blob_radius
+
+            if self.blob_y - blob_radius < 0:
+                self.blob_vel_y = abs(self.blob_vel_y) * self.bounce_damping
+                self.blob_y = blob_radius
+
+            # Gate collision (level 10+ in city only)
+            if has_gate and self.collision_cooldown == 0:
+                if not gate.open:
+                    # Check collision with closed gate (swept, like the buildings)
+                    hit = sweep_box(self.prev_blob_x, self.prev_blob_y, self.blob_x, self.blob_y, blob_radius,
+                                    gate.x, gate.y, gate.x + gate.width, gate.y + gate.height)
+                    if hit is not None:
+                        # Bounce off closed gate
+                        self.collision_cooldown = 15
+                        hit_x, self.blob_y = self.impact_point(hit)
+                        if hit_x < gate.x + gate.width / 2:
+                            self.blob_vel_x = -abs(self.blob_vel_x) * self.bounce_damping
+                            self.blob_x = gate.x - blob_radius - 2
+                        else:
+                            self.blob_vel_x = abs(self.blob_vel_x) * self.bounce_damping
+                            self.blob_x = gate.x + gate.width + blob_radius + 2
+
+            # Hit ground - reset
+            if self.blob_y > self.height - blob_radius:
+                self.reset_blob()
+
+        # Dragged blob follows the mouse (directly, without interpolation)
+        if self.dragging and inputs.get("pointer") is not None:
+            self.blob_x, self.blob_y = inputs["pointer"]
+            self.prev_blob_x, self.prev_blob_y = self.blob_x, self.blob_y
+
+        # Update debris (pieces that fall off screen are freed for reuse)
+        self.debris.update()
+
+        # Update gas clouds (village only)
+        if self.world == "village":
+            cloud_grid = self.grids["gas_clouds"]
+            for cloud in self.gas_clouds:
+                # Move gas cloud (always moving)
+                cloud.x += cloud.vel_x
+                cloud.y += cloud.vel_y
+                cloud_grid.move(cloud)
+
+                # Bounce off walls
+                if cloud.x - cloud.r < 0 or cloud.x + cloud.r > self.width:
+                    cloud.vel_x *= -1
+                if cloud.y - cloud.r < 0 or cloud.y + cloud.r > self.height:
+                    cloud.vel_y *= -1
+
+            # Check collision with player (only when flying)
+            if self.flying:
+                for cloud in self.sweep_query(cloud_grid):
+                    hit = sweep_circles(self.prev_blob_x, self.prev_blob_y, self.blob_x, self.blob_y,
+                                        cloud.prev_x, cloud.prev_y, cloud.x, cloud.y,
+                                        self.blob_radius + cloud.r)
+                    if hit is not None:
+                        # Hit gas cloud - lose 20 power!
+                        self.power = max(0, self.power - 20)
+                        self.events.append(("gas_hit", cloud))
+
+        # Update snakes (forest only)
+        if self.world == "forest":
+            snake_grid = self.grids["snakes"]
+            for snake in self.snakes:
+                # Swaying animation - snake sways side to side
+                sway = math.sin((self.time_ms / 500) + snake.sway_offset) * 15
+                snake.x = snake.tree_x + sway
+                snake_grid.move(snake)
+
+            # Check collision with player (only when flying) - INSTANT DEATH!
+            if self.flying:
+                for snake in self.sweep_query(snake_grid):
+                    hit = sweep_circles(self.prev_blob_x, self.prev_blob_y, self.blob_x, self.blob_y,
+                                        snake.prev_x, snake.prev_y, snake.x, snake.y,
+                                        self.blob_radius + snake.r)
+                    if hit is not None:
+                        # Hit snake - instant death (power to 0)!
+                        self.power = 0
+                        self.events.append(("snake_hit", snake))
+
+        return self.events